@@ -0,0 +1,176 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmark of the import time of ZenML and the startup time of its CLI.
+
+Runs `import zenml`, `zenml --help` and `zenml version` in fresh Python
+processes with `-X importtime` enabled and reports the median wall time,
+the total import time and the modules that took the longest to import. The
+results can be written to a JSON file to track them over time.
+
+Usage:
+    python scripts/benchmark_cli_import_time.py --repetitions 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+CLI_SNIPPET = (
+    "import sys; from zenml.cli.cli import cli; "
+    "cli(sys.argv[1:], prog_name='zenml')"
+)
+
+BENCHMARKS: Dict[str, List[str]] = {
+    "import zenml": ["-c", "import zenml"],
+    "zenml --help": ["-c", CLI_SNIPPET, "--help"],
+    "zenml version": ["-c", CLI_SNIPPET, "version"],
+}
+
+
+def parse_import_times(stderr: str) -> List[Tuple[str, int, int]]:
+    """Parses the output of `python -X importtime`.
+
+    Args:
+        stderr: The stderr output of the Python process.
+
+    Returns:
+        The name, self import time and cumulative import time in
+        microseconds of each module that was imported. Names of modules that
+        were imported by another module are indented.
+    """
+    import_times = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, cumulative_time, module = line[len("import time:") :].split(
+            "|"
+        )
+        try:
+            # Remove the separating space but keep the nesting indentation
+            import_times.append(
+                (module[1:], int(self_time), int(cumulative_time))
+            )
+        except ValueError:
+            # Header line
+            continue
+    return import_times
+
+
+def run(arguments: List[str]) -> Tuple[float, List[Tuple[str, int, int]]]:
+    """Runs a Python process with import time logging enabled.
+
+    Args:
+        arguments: The arguments to pass to the Python interpreter.
+
+    Returns:
+        The wall time of the process in seconds and its import times.
+
+    Raises:
+        RuntimeError: If the process failed.
+    """
+    start_time = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *arguments],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    wall_time = time.perf_counter() - start_time
+    if process.returncode != 0:
+        raise RuntimeError(
+            f"Running `{' '.join(arguments)}` failed:\n{process.stderr}"
+        )
+    return wall_time, parse_import_times(process.stderr)
+
+
+def measure(arguments: List[str], repetitions: int, top: int) -> Dict[str, Any]:
+    """Measures the startup time of a Python process.
+
+    Args:
+        arguments: The arguments to pass to the Python interpreter.
+        repetitions: How often to run the process.
+        top: The number of slowest top-level imports to report.
+
+    Returns:
+        The median wall time and total import time in milliseconds, the
+        number of imported modules and the slowest top-level imports.
+    """
+    wall_times, total_import_times = [], []
+    import_times: List[Tuple[str, int, int]] = []
+    for _ in range(repetitions):
+        wall_time, import_times = run(arguments)
+        wall_times.append(wall_time * 1000)
+        total_import_times.append(
+            sum(self_time for _, self_time, _ in import_times) / 1000
+        )
+
+    slowest = sorted(
+        (
+            (module, cumulative_time / 1000)
+            for module, _, cumulative_time in import_times
+            if not module.startswith(" ")
+        ),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:top]
+    return {
+        "wall_time_ms": statistics.median(wall_times),
+        "import_time_ms": statistics.median(total_import_times),
+        "num_modules": len(import_times),
+        "slowest_imports_ms": dict(slowest),
+    }
+
+
+def main() -> None:
+    """Runs the benchmark and prints the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repetitions", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument(
+        "--output", help="Path of a JSON file to write the results to."
+    )
+    args = parser.parse_args()
+
+    # Warm up the bytecode cache so the first repetition isn't an outlier
+    run(BENCHMARKS["zenml --help"])
+
+    results = {
+        name: measure(arguments, repetitions=args.repetitions, top=args.top)
+        for name, arguments in BENCHMARKS.items()
+    }
+
+    print(
+        f"{'Command':<20}{'Wall (ms)':>12}{'Imports (ms)':>14}{'Modules':>10}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:<20}{result['wall_time_ms']:>12.1f}"
+            f"{result['import_time_ms']:>14.1f}{result['num_modules']:>10}"
+        )
+    for name, result in results.items():
+        print(f"\nSlowest top-level imports of `{name}`:")
+        for module, cumulative_time in result["slowest_imports_ms"].items():
+            print(f"  {module:<50}{cumulative_time:>10.1f} ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmark of the main SQL zen store queries on a large database.
+
+Populates a SQLite zen store with a large number of finished pipeline runs,
+steps and artifacts and measures the most common lookup queries twice: once
+with all secondary indexes dropped and once after the database migration
+recreated them.
+
+Usage:
+    python scripts/benchmark_sql_zen_store.py --num-runs 100000
+"""
+
+import argparse
+import random
+import tempfile
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+from uuid import UUID, uuid4
+
+from sqlalchemy import text
+from sqlmodel import SQLModel
+
+from zenml.config.pipeline_configurations import PipelineSpec
+from zenml.enums import ArtifactType, ExecutionStatus
+from zenml.models import PipelineModel
+from zenml.zen_stores.schemas import (
+    ArtifactSchema,
+    PipelineRunSchema,
+    StepRunSchema,
+)
+from zenml.zen_stores.sql_zen_store import (
+    SqlZenStore,
+    SqlZenStoreConfiguration,
+)
+
+NUM_PIPELINES = 10
+STEPS_PER_RUN = 3
+BATCH_SIZE = 10000
+
+
+def _insert(
+    store: SqlZenStore, schema: Any, rows: List[Dict[str, Any]]
+) -> None:
+    """Bulk inserts rows into the table of a schema.
+
+    Args:
+        store: The store to insert into.
+        schema: The schema class of the table.
+        rows: The rows to insert.
+    """
+    with store.engine.begin() as connection:
+        for i in range(0, len(rows), BATCH_SIZE):
+            connection.execute(
+                schema.__table__.insert(), rows[i : i + BATCH_SIZE]
+            )
+
+
+def populate(store: SqlZenStore, num_runs: int) -> Dict[str, Any]:
+    """Populates the store with finished runs, steps and artifacts.
+
+    Args:
+        store: The store to populate.
+        num_runs: The number of pipeline runs to create.
+
+    Returns:
+        Values to use as lookup keys for the benchmarked queries.
+    """
+    project = store.list_projects()[0]
+    user = store.list_users()[0]
+    stack = store.list_stacks()[0]
+    pipeline_ids = [
+        store.create_pipeline(
+            PipelineModel(
+                name=f"pipeline_{i}",
+                project=project.id,
+                user=user.id,
+                spec=PipelineSpec(steps=[]),
+            )
+        ).id
+        for i in range(NUM_PIPELINES)
+    ]
+
+    start = datetime.now() - timedelta(seconds=num_runs)
+    runs, steps, artifacts = [], [], []
+    for i in range(num_runs):
+        created = start + timedelta(seconds=i)
+        run_id = uuid4()
+        runs.append(
+            dict(
+                id=run_id,
+                name=f"run_{i}",
+                project_id=project.id,
+                user_id=user.id,
+                stack_id=stack.id,
+                pipeline_id=pipeline_ids[i % NUM_PIPELINES],
+                pipeline_configuration="{}",
+                num_steps=STEPS_PER_RUN,
+                zenml_version="0.20.2",
+                git_sha=None,
+                created=created,
+                updated=created,
+                mlmd_id=i + 1,
+                # Finished runs are never synced with MLMD again
+                status=ExecutionStatus.COMPLETED,
+            )
+        )
+        for j in range(STEPS_PER_RUN):
+            step_mlmd_id = i * STEPS_PER_RUN + j + 1
+            step_id = uuid4()
+            steps.append(
+                dict(
+                    id=step_id,
+                    name=f"step_{j}",
+                    pipeline_run_id=run_id,
+                    entrypoint_name=f"step_{j}",
+                    parameters="{}",
+                    step_configuration="{}",
+                    docstring=None,
+                    mlmd_id=step_mlmd_id,
+                    created=created,
+                    updated=created,
+                )
+            )
+            artifacts.append(
+                dict(
+                    id=uuid4(),
+                    name="output",
+                    parent_step_id=step_id,
+                    producer_step_id=step_id,
+                    type=ArtifactType.DATA,
+                    uri=f"/artifacts/{run_id}/{j}",
+                    materializer="materializer",
+                    data_type="data_type",
+                    is_cached=False,
+                    mlmd_id=step_mlmd_id,
+                    mlmd_parent_step_id=step_mlmd_id,
+                    mlmd_producer_step_id=step_mlmd_id,
+                    created=created,
+                    updated=created,
+                )
+            )
+
+    _insert(store, PipelineRunSchema, runs)
+    _insert(store, StepRunSchema, steps)
+    _insert(store, ArtifactSchema, artifacts)
+
+    sample = random.choice(steps)
+    return {
+        "pipeline_id": pipeline_ids[0],
+        "run_name": f"run_{num_runs // 2}",
+        "run_id": sample["pipeline_run_id"],
+        "step_mlmd_id": sample["mlmd_id"],
+        "artifact_uri": random.choice(artifacts)["uri"],
+    }
+
+
+def drop_secondary_indexes(store: SqlZenStore) -> None:
+    """Drops all indexes declared on the schemas.
+
+    Args:
+        store: The store for which to drop the indexes.
+    """
+    with store.engine.begin() as connection:
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+
+
+def get_queries(
+    store: SqlZenStore, keys: Dict[str, Any]
+) -> Dict[str, Callable[[], Any]]:
+    """Gets the queries to benchmark.
+
+    Args:
+        store: The store to query.
+        keys: The lookup keys returned by `populate`.
+
+    Returns:
+        Mapping of query names to functions running them.
+    """
+    run_id: UUID = keys["run_id"]
+    step_mlmd_id: int = keys["step_mlmd_id"]
+    return {
+        "list_runs(pipeline_id, limit=10)": lambda: store.list_runs(
+            pipeline_id=keys["pipeline_id"], sort_by="-created", limit=10
+        ),
+        "list_runs(run_name)": lambda: store.list_runs(
+            run_name=keys["run_name"]
+        ),
+        "count_runs(pipeline_id)": lambda: store.count_runs(
+            pipeline_id=keys["pipeline_id"]
+        ),
+        "list_run_steps(run_id)": lambda: store.list_run_steps(run_id),
+        "list_artifacts(artifact_uri)": lambda: store.list_artifacts(
+            artifact_uri=keys["artifact_uri"]
+        ),
+        "_resolve_mlmd_step_id": lambda: store._resolve_mlmd_step_id(
+            step_mlmd_id
+        ),
+        "_resolve_mlmd_artifact_id": lambda: store._resolve_mlmd_artifact_id(
+            step_mlmd_id, step_mlmd_id
+        ),
+    }
+
+
+def measure(
+    queries: Dict[str, Callable[[], Any]], repetitions: int
+) -> Dict[str, float]:
+    """Measures the average duration of each query.
+
+    Args:
+        queries: Mapping of query names to functions running them.
+        repetitions: How often to run each query.
+
+    Returns:
+        Mapping of query names to their average duration in milliseconds.
+    """
+    return {
+        name: timeit.timeit(query, number=repetitions) / repetitions * 1000
+        for name, query in queries.items()
+    }
+
+
+def main() -> None:
+    """Runs the benchmark and prints the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-runs", type=int, default=100000)
+    parser.add_argument("--repetitions", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = SqlZenStore(
+            config=SqlZenStoreConfiguration(
+                url=f"sqlite:///{Path(temp_dir) / 'store.db'}"
+            ),
+            track_analytics=False,
+        )
+        print(f"Populating store with {args.num_runs} runs...")
+        keys = populate(store, num_runs=args.num_runs)
+        queries = get_queries(store, keys)
+
+        drop_secondary_indexes(store)
+        before = measure(queries, repetitions=args.repetitions)
+
+        store._migrate_database()
+        after = measure(queries, repetitions=args.repetitions)
+
+    print(f"{'Query':<40}{'Before (ms)':>14}{'After (ms)':>14}")
+    for name in queries:
+        print(f"{name:<40}{before[name]:>14.2f}{after[name]:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Local disk cache for files of remote artifact stores.
+
+The cache is disabled by default and can be enabled by setting the
+`ZENML_ARTIFACT_CACHE_SIZE_MB` environment variable to the maximum size of
+the cache in megabytes. The cache is stored in the `artifact_cache`
+subdirectory of the global config directory unless a different directory is
+specified with the `ZENML_ARTIFACT_CACHE_PATH` environment variable.
+
+Files are only added to the cache when they are opened while reading whole
+files, e.g. inside the `reading_whole_files` context manager which wraps the
+`handle_input` calls of materializers. Other opens only read files that are
+already cached, so partial reads like Parquet footer reads never download
+whole files.
+"""
+
+import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from zenml.constants import (
+    ENV_ZENML_ARTIFACT_CACHE_PATH,
+    ENV_ZENML_ARTIFACT_CACHE_SIZE_MB,
+    handle_int_env_var,
+)
+from zenml.logger import get_logger
+from zenml.utils import io_utils
+
+logger = get_logger(__name__)
+
+ARTIFACT_CACHE_DIRECTORY_NAME = "artifact_cache"
+TEMPORARY_FILE_SUFFIX = ".tmp"
+
+_reading_whole_files: "ContextVar[bool]" = ContextVar(
+    "artifact_cache_reading_whole_files", default=False
+)
+
+
+class ArtifactCache:
+    """Size-bounded local disk cache with least-recently-used eviction.
+
+    Files are cached under a key computed from their URI and a fingerprint,
+    e.g. an ETag or the file size, so that a cached copy is never used once
+    the remote file changed. The modification time of each cached file is
+    updated whenever it is used, and the files that were used least recently
+    are evicted once the cache grows beyond its maximum size. As all state
+    lives in the cache directory, multiple processes can share a cache.
+    """
+
+    def __init__(self, directory: str, max_size: int) -> None:
+        """Initializes the cache.
+
+        Args:
+            directory: The local directory in which to store cached files.
+            max_size: The maximum size of the cache in bytes.
+        """
+        self.directory = directory
+        self.max_size = max_size
+
+    @staticmethod
+    def get_key(uri: str, fingerprint: str) -> str:
+        """Computes the cache key of a file.
+
+        Args:
+            uri: The URI of the file.
+            fingerprint: A string that changes whenever the file content
+                changes, e.g. its ETag.
+
+        Returns:
+            The cache key.
+        """
+        return hashlib.sha256(f"{uri}\0{fingerprint}".encode()).hexdigest()
+
+    def get(
+        self,
+        uri: str,
+        fingerprint: str,
+        size: int,
+        download: Callable[[str], None],
+    ) -> Optional[str]:
+        """Gets the local path of a cached file, downloading it on a miss.
+
+        Args:
+            uri: The URI of the file.
+            fingerprint: A string that changes whenever the file content
+                changes, e.g. its ETag.
+            size: The size of the file in bytes.
+            download: Function that downloads the file to the local path
+                passed to it.
+
+        Returns:
+            The local path of the cached file or `None` if the file is too
+            large to be cached.
+        """
+        if size > self.max_size:
+            return None
+
+        cached_path = self.lookup(uri, fingerprint)
+        if cached_path:
+            return cached_path
+
+        path = os.path.join(self.directory, self.get_key(uri, fingerprint))
+        os.makedirs(self.directory, exist_ok=True)
+        # Download to a temporary file first so that other processes never
+        # see partially written files
+        fd, temporary_path = tempfile.mkstemp(
+            dir=self.directory, suffix=TEMPORARY_FILE_SUFFIX
+        )
+        os.close(fd)
+        try:
+            download(temporary_path)
+            os.replace(temporary_path, path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+        logger.debug("Added `%s` to the artifact cache.", uri)
+        self.evict(keep=path)
+        return path
+
+    def lookup(self, uri: str, fingerprint: str) -> Optional[str]:
+        """Gets the local path of a cached file without downloading it.
+
+        Args:
+            uri: The URI of the file.
+            fingerprint: A string that changes whenever the file content
+                changes, e.g. its ETag.
+
+        Returns:
+            The local path of the cached file or `None` if the file is not
+            cached.
+        """
+        path = os.path.join(self.directory, self.get_key(uri, fingerprint))
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        logger.debug("Reading `%s` from the artifact cache.", uri)
+        return path
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """Removes the least recently used files until the cache fits.
+
+        Args:
+            keep: Optional path of a cached file that should not be removed.
+        """
+        entries: List[Tuple[float, int, str]] = []
+        total_size = 0
+        with os.scandir(self.directory) as iterator:
+            for entry in iterator:
+                if entry.name.endswith(TEMPORARY_FILE_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # Removed by another process
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+    def clear(self) -> None:
+        """Removes all files from the cache."""
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    pass
+
+
+def get_artifact_cache() -> Optional[ArtifactCache]:
+    """Gets the artifact cache configured through environment variables.
+
+    Returns:
+        The artifact cache or `None` if the cache is disabled.
+    """
+    max_size_mb = handle_int_env_var(ENV_ZENML_ARTIFACT_CACHE_SIZE_MB)
+    if max_size_mb <= 0:
+        return None
+
+    directory = os.getenv(ENV_ZENML_ARTIFACT_CACHE_PATH) or os.path.join(
+        io_utils.get_global_config_directory(), ARTIFACT_CACHE_DIRECTORY_NAME
+    )
+    return ArtifactCache(
+        directory=directory, max_size=max_size_mb * 1024 * 1024
+    )
+
+
+@contextmanager
+def reading_whole_files() -> Iterator[None]:
+    """Context manager to add files that are opened to the artifact cache.
+
+    Files opened for reading inside this context manager are downloaded into
+    the cache as a whole if they are not cached yet. It should only be used
+    around code that reads the complete files it opens.
+
+    Yields:
+        None.
+    """
+    token = _reading_whole_files.set(True)
+    try:
+        yield
+    finally:
+        _reading_whole_files.reset(token)
+
+
+def is_reading_whole_files() -> bool:
+    """Checks whether files are currently opened to be read as a whole.
+
+    Returns:
+        Whether the current code runs inside `reading_whole_files`.
+    """
+    return _reading_whole_files.get()
@@ -26,6 +26,9 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """The base interface to extend the ZenML artifact store."""
+import builtins
+import os
+import shutil
 import textwrap
 from abc import abstractmethod
 from typing import (
@@ -36,6 +39,7 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -43,16 +47,22 @@ from typing import (
     cast,
 )
 
-from pydantic import root_validator
+from pydantic import root_validator, validator
 from tfx.dsl.io.fileio import NotFoundError
 
+from zenml.artifact_stores import artifact_cache
 from zenml.enums import StackComponentType
 from zenml.exceptions import ArtifactStoreInterfaceError
+from zenml.io import fileio
 from zenml.stack import Flavor, StackComponent, StackComponentConfig
 from zenml.utils import io_utils
 
 PathType = Union[bytes, str]
 
+COPY_CHUNK_SIZE = 8 * 1024 * 1024
+CACHEABLE_READ_MODES = {"r", "rb", "rt"}
+ETAG_STAT_KEYS = ("ETag", "etag", "md5Hash")
+
 
 def _catch_not_found_error(_func: Callable[..., Any]) -> Callable[..., Any]:
     """Utility decorator used for catching a `FileNotFoundError`.
@@ -156,12 +166,36 @@ def _sanitize_paths(_func: Callable[..., Any]) -> Callable[..., Any]:
 
 
 class BaseArtifactStoreConfig(StackComponentConfig):
-    """Config class for `BaseArtifactStore`."""
+    """Config class for `BaseArtifactStore`.
+
+    Attributes:
+        path: The root path of the artifact store.
+        max_copy_workers: The maximum number of files to copy at the same
+            time when copying multiple files, e.g. entire directories.
+    """
 
     path: str
+    max_copy_workers: int = io_utils.DEFAULT_COPY_WORKERS
 
     SUPPORTED_SCHEMES: ClassVar[Set[str]]
 
+    @validator("max_copy_workers")
+    def _validate_max_copy_workers(cls, value: int) -> int:
+        """Validates that the number of copy workers is positive.
+
+        Args:
+            value: The number of copy workers.
+
+        Returns:
+            The number of copy workers.
+
+        Raises:
+            ValueError: If the number of copy workers is not positive.
+        """
+        if value < 1:
+            raise ValueError("The number of copy workers must be at least 1.")
+        return value
+
     @root_validator(skip_on_failure=True)
     def _ensure_artifact_store(cls, values: Dict[str, Any]) -> Any:
         """Validator function for the Artifact Stores.
@@ -374,6 +408,209 @@ class BaseArtifactStore(StackComponent):
             The iterator that walks the contents of the given directory.
         """
 
+    # --- Bulk interface ---
+    def copy_files(
+        self,
+        files: Sequence[Tuple[PathType, PathType]],
+        overwrite: bool = False,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[io_utils.CopyProgressCallback] = None,
+    ) -> None:
+        """Copies multiple files concurrently.
+
+        The source and destination of each file can be paths inside this
+        artifact store or local paths. Files are uploaded and downloaded with
+        `upload_file` and `download_file`, which subclasses can override to
+        use more efficient transfers, e.g. multipart uploads.
+
+        Args:
+            files: Tuples (source_path, destination_path) of the files to copy.
+            overwrite: Whether to overwrite existing destination files.
+            max_workers: The maximum number of files to copy at the same time.
+                Defaults to the `max_copy_workers` of the configuration.
+            progress_callback: Optional function which gets called with the
+                number of copied files and the total number of files after
+                each copied file.
+        """
+        io_utils.copy_files_concurrently(
+            [
+                (
+                    _sanitize_potential_path(source),
+                    _sanitize_potential_path(destination),
+                )
+                for source, destination in files
+            ],
+            copy_function=self._copy_file,
+            overwrite=overwrite,
+            max_workers=max_workers or self.config.max_copy_workers,
+            progress_callback=progress_callback,
+        )
+
+    def upload_file(self, local_path: str, path: str) -> None:
+        """Uploads a local file to the artifact store.
+
+        Args:
+            local_path: The local path of the file to upload.
+            path: The path inside the artifact store to upload the file to.
+        """
+        with builtins.open(local_path, "rb") as source:
+            with self.open(path, "wb") as destination:
+                shutil.copyfileobj(source, destination, COPY_CHUNK_SIZE)
+
+    def download_file(self, path: str, local_path: str) -> None:
+        """Downloads a file from the artifact store.
+
+        Args:
+            path: The path of the file inside the artifact store.
+            local_path: The local path to download the file to.
+        """
+        with self.open(path, "rb") as source:
+            with builtins.open(local_path, "wb") as destination:
+                shutil.copyfileobj(source, destination, COPY_CHUNK_SIZE)
+
+    def _is_artifact_store_path(self, path: str) -> bool:
+        """Checks whether a path is handled by this artifact store.
+
+        Args:
+            path: The path to check.
+
+        Returns:
+            `True` if the path is handled by this artifact store.
+        """
+        if not io_utils.is_remote(path):
+            return "" in self.config.SUPPORTED_SCHEMES
+
+        return any(
+            scheme and path.startswith(scheme)
+            for scheme in self.config.SUPPORTED_SCHEMES
+        )
+
+    def _copy_file(self, src: str, dst: str, overwrite: bool) -> None:
+        """Copies a single file as part of a bulk copy.
+
+        Args:
+            src: The source path.
+            dst: The destination path.
+            overwrite: Whether to overwrite the destination file if it exists.
+
+        Raises:
+            FileExistsError: If the destination file exists and overwrite is
+                not set to `True`.
+        """
+        src_in_store = self._is_artifact_store_path(src)
+        dst_in_store = self._is_artifact_store_path(dst)
+
+        if src_in_store and dst_in_store:
+            self.copyfile(src, dst, overwrite=overwrite)
+        elif dst_in_store and not io_utils.is_remote(src):
+            if not overwrite and self.exists(dst):
+                raise FileExistsError(
+                    f"Unable to copy to destination '{dst}', file already "
+                    "exists. Set `overwrite=True` to copy anyway."
+                )
+            self.upload_file(src, dst)
+        elif src_in_store and not io_utils.is_remote(dst):
+            if not overwrite and os.path.exists(dst):
+                raise FileExistsError(
+                    f"Unable to copy to destination '{dst}', file already "
+                    "exists. Set `overwrite=True` to copy anyway."
+                )
+            cached_path = self._get_cached_path(src, download=True)
+            if cached_path:
+                shutil.copyfile(cached_path, dst)
+            else:
+                self.download_file(src, dst)
+        else:
+            fileio.copy(src, dst, overwrite=overwrite)
+
+    # --- Local cache ---
+    def _get_cache_fingerprint(self, path: str) -> Optional[Tuple[str, int]]:
+        """Gets a fingerprint of a file to use as part of its cache key.
+
+        The default implementation uses the ETag and size contained in the
+        file info dictionaries returned by `fsspec` filesystems. Subclasses
+        can override this method to support other stat descriptors.
+
+        Args:
+            path: The path of the file.
+
+        Returns:
+            The fingerprint and size of the file or `None` if the file can't
+            be cached.
+        """
+        stat = self.stat(path)
+        if not isinstance(stat, dict) or stat.get("type", "file") != "file":
+            return None
+
+        size = stat.get("size")
+        if size is None:
+            return None
+        etag = next(
+            (stat[key] for key in ETAG_STAT_KEYS if stat.get(key)), None
+        )
+        # Artifacts are immutable once written, so the size is a sufficient
+        # fingerprint for filesystems that don't report an ETag
+        return f"{etag or ''}:{size}", int(size)
+
+    def _get_cached_path(self, path: str, download: bool) -> Optional[str]:
+        """Gets the path of a local cached copy of a file.
+
+        Files are only cached if the local artifact cache is enabled and
+        this artifact store is remote.
+
+        Args:
+            path: The path of the file inside the artifact store.
+            download: Whether to download the file into the cache if it is
+                not cached yet. This should only be done by callers that
+                need the whole file anyway.
+
+        Returns:
+            The local path of the cached copy or `None` if the file is not
+            cached.
+        """
+        cache = artifact_cache.get_artifact_cache()
+        if not cache or not io_utils.is_remote(self.path):
+            return None
+
+        fingerprint = self._get_cache_fingerprint(path)
+        if not fingerprint:
+            return None
+
+        if not download:
+            return cache.lookup(uri=path, fingerprint=fingerprint[0])
+        return cache.get(
+            uri=path,
+            fingerprint=fingerprint[0],
+            size=fingerprint[1],
+            download=lambda local_path: self.download_file(path, local_path),
+        )
+
+    def _open_cached(self, name: PathType, mode: str = "r") -> Any:
+        """Opens a file, reading it from the local artifact cache if enabled.
+
+        Files are only downloaded into the cache when they are opened inside
+        the `reading_whole_files` context manager of the artifact cache, e.g.
+        by materializers. Other callers often only read parts of a file, e.g.
+        the footer and some columns of a Parquet file, so they only read
+        files that are already cached.
+
+        Args:
+            name: The path of the file to open.
+            mode: The mode to open the file.
+
+        Returns:
+            The file object.
+        """
+        if mode in CACHEABLE_READ_MODES:
+            cached_path = self._get_cached_path(
+                io_utils.convert_to_str(name),
+                download=artifact_cache.is_reading_whole_files(),
+            )
+            if cached_path:
+                return builtins.open(cached_path, mode)
+
+        return self.open(name, mode)
+
     # --- Internal interface ---
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initiate the Pydantic object and register the corresponding filesystem.
@@ -400,7 +637,7 @@ class BaseArtifactStore(StackComponent):
             {
                 "SUPPORTED_SCHEMES": self.config.SUPPORTED_SCHEMES,
                 "open": staticmethod(
-                    _sanitize_paths(_catch_not_found_error(self.open))
+                    _sanitize_paths(_catch_not_found_error(self._open_cached))
                 ),
                 "copy": staticmethod(
                     _sanitize_paths(_catch_not_found_error(self.copyfile))
@@ -430,6 +667,9 @@ class BaseArtifactStore(StackComponent):
                 "walk": staticmethod(
                     _sanitize_paths(_catch_not_found_error(self.walk))
                 ),
+                "copy_files": staticmethod(
+                    _catch_not_found_error(self.copy_files)
+                ),
             },
         )
 
@@ -1070,19 +1070,53 @@ This deletes all the recipes from the default path where they were downloaded.
 
 """
 
-from zenml.cli.annotator import *  # noqa
-from zenml.cli.base import *  # noqa
-from zenml.cli.config import *  # noqa
-from zenml.cli.example import *  # noqa
-from zenml.cli.feature import *  # noqa
-from zenml.cli.integration import *  # noqa
-from zenml.cli.model import *  # noqa
-from zenml.cli.pipeline import *  # noqa
-from zenml.cli.profile import *  # noqa
-from zenml.cli.secret import *  # noqa
-from zenml.cli.server import *  # noqa
-from zenml.cli.stack import *  # noqa
-from zenml.cli.stack_components import *  # noqa
-from zenml.cli.stack_recipes import *  # noqa
-from zenml.cli.user_management import *  # noqa
-from zenml.cli.version import *  # noqa
+import importlib
+import importlib.util
+from typing import Any
+
+# The command modules are imported lazily by the CLI (see
+# `zenml.cli.cli.LAZY_COMMANDS`) to keep its startup time low. Their public
+# members are still accessible as attributes of this package.
+_COMMAND_MODULES = (
+    "zenml.cli.annotator",
+    "zenml.cli.base",
+    "zenml.cli.config",
+    "zenml.cli.example",
+    "zenml.cli.feature",
+    "zenml.cli.integration",
+    "zenml.cli.model",
+    "zenml.cli.pipeline",
+    "zenml.cli.profile",
+    "zenml.cli.secret",
+    "zenml.cli.server",
+    "zenml.cli.stack",
+    "zenml.cli.stack_components",
+    "zenml.cli.stack_recipes",
+    "zenml.cli.user_management",
+    "zenml.cli.version",
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Gets a public member of one of the CLI command modules.
+
+    Args:
+        name: The name of the member.
+
+    Returns:
+        The member.
+
+    Raises:
+        AttributeError: If no command module defines a member with this name.
+    """
+    # Submodules are imported by the regular import machinery once this
+    # raises an `AttributeError`
+    if name.startswith("_") or importlib.util.find_spec(f"{__name__}.{name}"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    for module_name in _COMMAND_MODULES:
+        module = importlib.import_module(module_name)
+        if hasattr(module, name):
+            return getattr(module, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,18 +13,155 @@
 #  permissions and limitations under the License.
 """Core CLI functionality."""
 
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import importlib
+from typing import (
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import click
 import rich
-from click import Command, Context, formatting
+from click import Context, formatting
+from click.utils import make_default_short_help
 
 from zenml import __version__
 from zenml.cli.formatter import ZenFormatter
-from zenml.enums import CliCategories
+from zenml.enums import CliCategories, StackComponentType
 from zenml.logger import set_root_verbosity
 
 
+class LazyCommand(NamedTuple):
+    """Top-level command that is only imported once it is used.
+
+    Attributes:
+        modules: The modules that need to be imported to register the command.
+        help: The help text that is shown for the command in the CLI help.
+        category: The category under which the command is shown in the CLI
+            help.
+        hidden: Whether the command is hidden from the CLI help.
+    """
+
+    modules: Tuple[str, ...]
+    help: str
+    category: CliCategories = CliCategories.OTHER_COMMANDS
+    hidden: bool = False
+
+
+_STACK_COMPONENT_COMMANDS = {
+    component_type.value.replace("_", "-"): LazyCommand(
+        ("zenml.cli.stack_components",),
+        "Commands to interact with "
+        f"{component_type.plural.replace('_', ' ')}.",
+        CliCategories.STACK_COMPONENTS,
+    )
+    for component_type in StackComponentType
+}
+
+# Maps the names of all top-level commands to the modules that need to be
+# imported to register them. The modules are only imported once the command
+# is actually used, which keeps the startup time of the CLI low. The help
+# text and category of each command are duplicated here so the CLI help can
+# list all commands without importing them.
+LAZY_COMMANDS: Dict[str, LazyCommand] = {
+    "init": LazyCommand(("zenml.cli.base",), "Initialize a ZenML repository."),
+    "clean": LazyCommand(
+        ("zenml.cli.base",),
+        "Delete all ZenML metadata, artifacts and stacks.",
+        hidden=True,
+    ),
+    "go": LazyCommand(
+        ("zenml.cli.base",), "Quickly explore ZenML with this walkthrough."
+    ),
+    "analytics": LazyCommand(
+        ("zenml.cli.config",),
+        "Analytics for opt-in and opt-out.",
+        CliCategories.MANAGEMENT_TOOLS,
+    ),
+    "logging": LazyCommand(
+        ("zenml.cli.config",),
+        "Configuration of logging for ZenML pipelines.",
+        CliCategories.MANAGEMENT_TOOLS,
+    ),
+    "example": LazyCommand(
+        ("zenml.cli.example",), "Access all ZenML examples."
+    ),
+    "integration": LazyCommand(
+        ("zenml.cli.integration",),
+        "Interact with the requirements of external integrations.",
+        CliCategories.INTEGRATIONS,
+    ),
+    "pipeline": LazyCommand(
+        ("zenml.cli.pipeline",),
+        "List, run, or delete pipelines.",
+        CliCategories.MANAGEMENT_TOOLS,
+    ),
+    "profile": LazyCommand(
+        ("zenml.cli.profile",),
+        "Manage legacy profiles",
+        CliCategories.MANAGEMENT_TOOLS,
+    ),
+    "up": LazyCommand(
+        ("zenml.cli.server",), "Start the ZenML dashboard locally."
+    ),
+    "down": LazyCommand(
+        ("zenml.cli.server",), "Shut down the local ZenML dashboard."
+    ),
+    "deploy": LazyCommand(("zenml.cli.server",), "Deploy ZenML in the cloud."),
+    "destroy": LazyCommand(
+        ("zenml.cli.server",),
+        "Tear down and clean up the cloud ZenML deployment.",
+    ),
+    "status": LazyCommand(
+        ("zenml.cli.server",),
+        "Show information about the current configuration.",
+    ),
+    "connect": LazyCommand(
+        ("zenml.cli.server",),
+        "Configure your client to connect to a remote ZenML server.",
+    ),
+    "disconnect": LazyCommand(
+        ("zenml.cli.server",), "Disconnect from a ZenML server."
+    ),
+    "logs": LazyCommand(
+        ("zenml.cli.server",),
+        "Show the logs for the local or cloud ZenML server.",
+    ),
+    "stack": LazyCommand(
+        ("zenml.cli.stack", "zenml.cli.stack_recipes"),
+        "Stacks to define various environments.",
+        CliCategories.MANAGEMENT_TOOLS,
+    ),
+    **_STACK_COMPONENT_COMMANDS,
+    "user": LazyCommand(
+        ("zenml.cli.user_management",),
+        "Commands for user management.",
+        CliCategories.IDENTITY_AND_SECURITY,
+    ),
+    "team": LazyCommand(
+        ("zenml.cli.user_management",),
+        "Commands for team management.",
+        CliCategories.IDENTITY_AND_SECURITY,
+    ),
+    "project": LazyCommand(
+        ("zenml.cli.user_management",),
+        "Commands for project management.",
+        CliCategories.MANAGEMENT_TOOLS,
+    ),
+    "role": LazyCommand(
+        ("zenml.cli.user_management",),
+        "Commands for role management.",
+        CliCategories.IDENTITY_AND_SECURITY,
+    ),
+    "version": LazyCommand(("zenml.cli.version",), "Version of ZenML."),
+}
+
+
 class TagGroup(click.Group):
     """Override the default click Group to add a tag.
 
@@ -60,10 +197,66 @@ class ZenContext(click.Context):
 
 
 class ZenMLCLI(click.Group):
-    """Override the default click Group to create a custom format command help output."""
+    """Override the default click Group to create a custom format command help output.
+
+    Commands can be registered lazily by passing a mapping of command names
+    to the modules that register them. These modules are only imported when
+    the command is requested, the help output is built from the help text and
+    category of the lazy commands without importing them.
+    """
 
     context_class = ZenContext
 
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        commands: Optional[
+            Union[Dict[str, click.Command], Sequence[click.Command]]
+        ] = None,
+        lazy_commands: Optional[Dict[str, LazyCommand]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the CLI group.
+
+        Args:
+            name: The name of the group.
+            commands: The commands of the group.
+            lazy_commands: Mapping of command names to the lazy commands
+                that are only imported once they are used.
+            kwargs: Additional keyword arguments.
+        """
+        super().__init__(name, commands, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """Returns the names of all commands without importing them.
+
+        Args:
+            ctx: The click context.
+
+        Returns:
+            The sorted names of all registered and lazy commands.
+        """
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(
+        self, ctx: click.Context, cmd_name: str
+    ) -> Optional[click.Command]:
+        """Returns a command and imports the modules registering it if needed.
+
+        Args:
+            ctx: The click context.
+            cmd_name: The name of the command.
+
+        Returns:
+            The command or `None` if no command with this name exists.
+        """
+        lazy_command = self.lazy_commands.get(cmd_name)
+        if lazy_command is not None:
+            for module in lazy_command.modules:
+                importlib.import_module(module)
+        return super().get_command(ctx, cmd_name)
+
     def get_help(self, ctx: Context) -> str:
         """Formats the help into a string and returns it.
 
@@ -94,8 +287,18 @@ class ZenMLCLI(click.Group):
             ctx: The click context.
             formatter: The click formatter.
         """
-        commands: List[Tuple[CliCategories, str, Union[Command, TagGroup]]] = []
+        commands: List[Tuple[CliCategories, str, str]] = []
         for subcommand in self.list_commands(ctx):
+            lazy_command = self.lazy_commands.get(subcommand)
+            if lazy_command is not None and subcommand not in self.commands:
+                # List the command without importing it
+                if not lazy_command.hidden:
+                    help = make_default_short_help(
+                        lazy_command.help, formatter.width
+                    )
+                    commands.append((lazy_command.category, subcommand, help))
+                continue
+
             cmd = self.get_command(ctx, subcommand)
             # What is this, the tool lied about a command.  Ignore it
             if cmd is None or cmd.hidden:
@@ -109,7 +312,7 @@ class ZenMLCLI(click.Group):
                 (
                     category,
                     subcommand,
-                    cmd,
+                    cmd.get_short_help_str(limit=formatter.width),
                 )
             )
 
@@ -126,8 +329,7 @@ class ZenMLCLI(click.Group):
                 )
             )
             rows: List[Tuple[str, str, str]] = []
-            for (tag, subcommand, cmd) in commands:
-                help = cmd.get_short_help_str(limit=formatter.width)
+            for (tag, subcommand, help) in commands:
                 rows.append((tag.value, subcommand, help))
             if rows:
                 colored_section_title = (
@@ -137,7 +339,7 @@ class ZenMLCLI(click.Group):
                     formatter.write_dl(rows)  # type: ignore[arg-type]
 
 
-@click.group(cls=ZenMLCLI)
+@click.group(cls=ZenMLCLI, lazy_commands=LAZY_COMMANDS)
 @click.version_option(__version__, "--version", "-v")
 def cli() -> None:
     """CLI base command for ZenML."""
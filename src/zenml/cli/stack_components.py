@@ -31,7 +31,7 @@ from zenml.client import Client
 from zenml.console import console
 from zenml.enums import CliCategories, StackComponentType
 from zenml.io import fileio
-from zenml.models import ComponentModel, FlavorModel
+from zenml.models import ComponentModel, FlavorModel, HydratedComponentModel
 from zenml.utils.analytics_utils import AnalyticsEvent, track_event
 
 if TYPE_CHECKING:
@@ -150,7 +150,7 @@ def generate_stack_component_list_command(
         client = Client()
 
         components = client.list_stack_components_by_type(type=component_type)
-        hydrated_comps = [s.to_hydrated_model() for s in components]
+        hydrated_comps = HydratedComponentModel.from_models(components)
 
         cli_utils.print_components_table(
             client=client,
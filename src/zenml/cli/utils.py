@@ -49,6 +49,7 @@ from zenml.console import console, zenml_style_defaults
 from zenml.constants import IS_DEBUG_ENV
 from zenml.enums import StackComponentType, StoreType
 from zenml.logger import get_logger
+from zenml.models.component_model import HydratedComponentModel
 from zenml.models.stack_models import HydratedStackModel
 
 logger = get_logger(__name__)
@@ -60,7 +61,6 @@ if TYPE_CHECKING:
     from zenml.models import (
         ComponentModel,
         FlavorModel,
-        HydratedComponentModel,
         PipelineRunModel,
         StackModel,
     )
@@ -849,7 +849,7 @@ def get_stack_by_id_or_name_or_prefix(
     stacks = user_only_stacks + shared_stacks
 
     if len(stacks) > 1:
-        hydrated_stacks = [s.to_hydrated_model() for s in stacks]
+        hydrated_stacks = HydratedStackModel.from_models(stacks)
         print_stacks_table(client=client, stacks=hydrated_stacks)
         error(
             f"Multiple stacks have been found for name "
@@ -885,7 +885,7 @@ def get_stack_by_id_or_name_or_prefix(
             if str(stack.id).startswith(id_or_name_or_prefix)
         ]
         if len(filtered_stacks) > 1:
-            hydrated_stacks = [s.to_hydrated_model() for s in filtered_stacks]
+            hydrated_stacks = HydratedStackModel.from_models(filtered_stacks)
             print_stacks_table(client=client, stacks=hydrated_stacks)
             error(
                 f"The stacks listed above all share the provided prefix "
@@ -1049,7 +1049,7 @@ def get_component_by_id_or_name_or_prefix(
     components = user_only_components + shared_components
 
     if len(components) > 1:
-        hydrated_components = [c.to_hydrated_model() for c in components]
+        hydrated_components = HydratedComponentModel.from_models(components)
         print_components_table(
             client=client,
             component_type=component_type,
@@ -1091,7 +1091,7 @@ def get_component_by_id_or_name_or_prefix(
             if str(component.id).startswith(id_or_name_or_prefix)
         ]
         if len(filtered_comps) > 1:
-            hydrated_comps = [s.to_hydrated_model() for s in filtered_comps]
+            hydrated_comps = HydratedComponentModel.from_models(filtered_comps)
             print_components_table(
                 client=client,
                 component_type=component_type,
@@ -16,7 +16,7 @@
 import os
 from abc import ABCMeta
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Union, cast
 from uuid import UUID
 
 from zenml.config.global_config import GlobalConfiguration
@@ -37,17 +37,28 @@ from zenml.exceptions import (
 )
 from zenml.io import fileio
 from zenml.logger import get_logger
-from zenml.models import ComponentModel, FlavorModel, ProjectModel, StackModel
-from zenml.models.pipeline_models import PipelineModel
+from zenml.models import (
+    ComponentModel,
+    FlavorModel,
+    HydratedStackModel,
+    ProjectModel,
+    StackModel,
+)
+from zenml.models.pipeline_models import (
+    ArtifactModel,
+    PipelineModel,
+    PipelineRunModel,
+)
 from zenml.stack import Flavor
 from zenml.stack.stack_component import StackComponentConfig
 from zenml.utils import io_utils
 from zenml.utils.analytics_utils import AnalyticsEvent, track
 from zenml.utils.filesync_model import FileSyncModel
+from zenml.utils.pagination_utils import DEFAULT_PAGE_SIZE, iterate_pages
 from zenml.zen_stores.base_zen_store import DEFAULT_PROJECT_NAME, BaseZenStore
 
 if TYPE_CHECKING:
-    from zenml.models import HydratedStackModel, UserModel
+    from zenml.models import UserModel
     from zenml.stack import Stack
 
 
@@ -588,9 +599,9 @@ class Client(metaclass=ClientMetaClass):
             is_shared=True,
         )
 
-        return [
-            s.to_hydrated_model() for s in set(owned_stacks + shared_stacks)
-        ]
+        return HydratedStackModel.from_models(
+            list(set(owned_stacks + shared_stacks))
+        )
 
     @property
     def active_stack_model(self) -> "HydratedStackModel":
@@ -1215,6 +1226,46 @@ class Client(metaclass=ClientMetaClass):
         )
         raise AlreadyExistsException(error_msg)
 
+    def iterate_runs(
+        self, page_size: int = DEFAULT_PAGE_SIZE, **filters: Any
+    ) -> Iterator[PipelineRunModel]:
+        """Lazily iterates over all pipeline runs matching some filters.
+
+        The runs are fetched from the ZenStore page by page, so the size of
+        each individual request stays bounded no matter how many runs exist.
+
+        Args:
+            page_size: The number of runs to fetch per request.
+            **filters: Filters to apply, see `ZenStoreInterface.list_runs`.
+
+        Returns:
+            An iterator over all pipeline runs matching the filters.
+        """
+        return iterate_pages(
+            self.zen_store.list_runs, page_size=page_size, **filters
+        )
+
+    def iterate_artifacts(
+        self, page_size: int = DEFAULT_PAGE_SIZE, **filters: Any
+    ) -> Iterator[ArtifactModel]:
+        """Lazily iterates over all artifacts matching some filters.
+
+        The artifacts are fetched from the ZenStore page by page, so the size
+        of each individual request stays bounded no matter how many artifacts
+        exist.
+
+        Args:
+            page_size: The number of artifacts to fetch per request.
+            **filters: Filters to apply, see
+                `ZenStoreInterface.list_artifacts`.
+
+        Returns:
+            An iterator over all artifacts matching the filters.
+        """
+        return iterate_pages(
+            self.zen_store.list_artifacts, page_size=page_size, **filters
+        )
+
     def delete_user(self, user_name_or_id: str) -> None:
         """Delete a user.
 
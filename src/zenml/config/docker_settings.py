@@ -141,6 +141,9 @@ class DockerSettings(BaseSettings):
             run the commands of the dockerfile as `user` instead of root.
             Specifically,  the specified user is used for RUN instructions
             and at runtime, runs the relevant ENTRYPOINT and CMD commands.
+        prevent_build_reuse: If `True`, ZenML will always build a new image
+            instead of reusing a previously built image with identical
+            Dockerfile, requirements, build context files and parent image.
     """
 
     LEVEL = ConfigurationLevel.PIPELINE
@@ -164,6 +167,7 @@ class DockerSettings(BaseSettings):
     copy_files: bool = True
     copy_global_config: bool = True
     user: Optional[str] = None
+    prevent_build_reuse: bool = False
 
     class Config:
         """Pydantic configuration class."""
@@ -79,6 +79,8 @@ ENV_ZENML_STORE_PREFIX = "ZENML_STORE_"
 ENV_ZENML_SKIP_PIPELINE_REGISTRATION = "ZENML_SKIP_PIPELINE_REGISTRATION"
 ENV_ZENML_SERVER_ROOT_URL_PATH = "ZENML_SERVER_ROOT_URL_PATH"
 ENV_ZENML_SERVER_DEPLOYMENT_TYPE = "ZENML_SERVER_DEPLOYMENT_TYPE"
+ENV_ZENML_ARTIFACT_CACHE_SIZE_MB = "ZENML_ARTIFACT_CACHE_SIZE_MB"
+ENV_ZENML_ARTIFACT_CACHE_PATH = "ZENML_ARTIFACT_CACHE_PATH"
 # Logging variables
 IS_DEBUG_ENV: bool = handle_bool_env_var(ENV_ZENML_DEBUG, default=False)
 
@@ -167,6 +169,7 @@ STEP_CONFIGURATION = "/step-configuration"
 GRAPH = "/graph"
 STEPS = "/steps"
 ARTIFACTS = "/artifacts"
+COUNT = "/count"
 INPUTS = "/inputs"
 OUTPUTS = "/outputs"
 COMPONENT_TYPES = "/component-types"
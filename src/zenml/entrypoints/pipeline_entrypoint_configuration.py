@@ -19,7 +19,6 @@ from zenml.entrypoints import utils as entrypoint_utils
 from zenml.entrypoints.base_entrypoint_configuration import (
     BaseEntrypointConfiguration,
 )
-from zenml.integrations.registry import integration_registry
 
 
 class PipelineEntrypointConfiguration(BaseEntrypointConfiguration):
@@ -29,11 +28,15 @@ class PipelineEntrypointConfiguration(BaseEntrypointConfiguration):
         """Prepares the environment and runs the configured pipeline."""
         deployment_config = self.load_deployment_config()
 
-        # Activate all the integrations. This makes sure that all materializers
-        # and stack component flavors are registered.
-        integration_registry.activate_integrations()
+        # Activate only the integrations the pipeline needs. This makes sure
+        # that its materializers and stack component flavors are registered
+        # without importing the libraries of all other integrations.
+        stack = Client().active_stack
+        entrypoint_utils.activate_integrations_for_steps(
+            deployment_config.steps.values(), stack=stack
+        )
 
-        orchestrator = Client().active_stack.orchestrator
+        orchestrator = stack.orchestrator
         orchestrator._prepare_run(deployment=deployment_config)
 
         for step in deployment_config.steps.values():
@@ -22,7 +22,6 @@ from zenml.entrypoints import utils as entrypoint_utils
 from zenml.entrypoints.base_entrypoint_configuration import (
     BaseEntrypointConfiguration,
 )
-from zenml.integrations.registry import integration_registry
 
 if TYPE_CHECKING:
     from zenml.config.pipeline_deployment import PipelineDeployment
@@ -158,11 +157,14 @@ class StepEntrypointConfiguration(BaseEntrypointConfiguration):
         step_name = self.entrypoint_args[STEP_NAME_OPTION]
         pipeline_name = deployment_config.pipeline.name
 
-        # Activate all the integrations. This makes sure that all materializers
-        # and stack component flavors are registered.
-        integration_registry.activate_integrations()
-
+        # Activate only the integrations this step needs. This makes sure
+        # that its materializers and stack component flavors are registered
+        # without importing the libraries of all other integrations.
         step = deployment_config.steps[step_name]
+        entrypoint_utils.activate_integrations_for_steps(
+            [step], stack=Client().active_stack
+        )
+
         entrypoint_utils.load_and_configure_step(step)
         execution_info = self._run_step(step, deployment=deployment_config)
 
@@ -12,14 +12,19 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """Utility functions for ZenML entrypoints."""
-from typing import TYPE_CHECKING, Type
+from typing import TYPE_CHECKING, Iterable, Set, Type
 
+from zenml.integrations.registry import integration_registry
+from zenml.materializers.built_in_materializer import (
+    BuiltInContainerMaterializer,
+)
 from zenml.steps import BaseStep
 from zenml.steps import utils as step_utils
 from zenml.utils import source_utils
 
 if TYPE_CHECKING:
     from zenml.config.step_configurations import Step
+    from zenml.stack import Stack
 
 
 def load_and_configure_step(step: "Step") -> "BaseStep":
@@ -43,3 +48,44 @@ def load_and_configure_step(step: "Step") -> "BaseStep":
     step_utils.create_executor_class(step=step_instance)
 
     return step_instance
+
+
+def activate_integrations_for_steps(
+    steps: Iterable["Step"], stack: "Stack"
+) -> None:
+    """Activates the integrations required to run steps on a stack.
+
+    Activating all installed integrations imports all their materializers and
+    flavors, including heavy libraries like TensorFlow or PyTorch. This only
+    activates the integrations that contain the steps, their artifact and
+    materializer classes or the stack component implementations.
+
+    Steps with container artifacts like `List[pd.DataFrame]` resolve the
+    materializers of their elements only at runtime, so all integrations are
+    activated if any step uses the built-in container materializer.
+
+    Args:
+        steps: The steps to run.
+        stack: The stack on which the steps run.
+    """
+    container_materializer_source = source_utils.resolve_class(
+        BuiltInContainerMaterializer
+    )
+    sources: Set[str] = {
+        type(component).__module__ for component in stack.components.values()
+    }
+    for step in steps:
+        sources.add(step.spec.source)
+        for artifact in [
+            *step.config.inputs.values(),
+            *step.config.outputs.values(),
+        ]:
+            if artifact.materializer_source == container_materializer_source:
+                integration_registry.activate_integrations()
+                return
+            sources.add(artifact.artifact_source)
+            sources.add(artifact.materializer_source)
+
+    integration_registry.activate_integrations(
+        integration_registry.get_integrations_for_sources(sources)
+    )
@@ -15,6 +15,8 @@
 
 import os
 import platform
+import threading
+from contextvars import ContextVar
 from importlib.util import find_spec
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type, cast
@@ -78,7 +80,14 @@ class Environment(metaclass=SingletonMetaClass):
 
     Individual environment components can be registered separately to extend
     the global Environment object with additional information (see
-    `BaseEnvironmentComponent`).
+    `BaseEnvironmentComponent`). Components registered in the main thread are
+    visible everywhere. Components registered in any other thread are stored
+    in a context variable, so that steps running in parallel threads each see
+    their own step environment. Threads started by such a step only see its
+    components if they run in a copy of its context, e.g. by submitting
+    `contextvars.copy_context().run` to a thread pool. Otherwise, they only
+    see the components registered in the main thread, which includes the
+    step environment of steps that are run sequentially.
     """
 
     def __init__(self) -> None:
@@ -89,6 +98,9 @@ class Environment(metaclass=SingletonMetaClass):
         the previously initialized instance.
         """
         self._components: Dict[str, "BaseEnvironmentComponent"] = {}
+        self._context_components: ContextVar[
+            Optional[Dict[str, "BaseEnvironmentComponent"]]
+        ] = ContextVar("environment_components", default=None)
 
     @property
     def step_is_running(self) -> bool:
@@ -206,6 +218,23 @@ class Environment(metaclass=SingletonMetaClass):
         """
         return "PAPERSPACE_NOTEBOOK_REPO_ID" in os.environ
 
+    def _get_context_components(
+        self,
+    ) -> Dict[str, "BaseEnvironmentComponent"]:
+        """Get the components registered in the current context.
+
+        Returns:
+            The global components when called from the main thread, otherwise
+            the components registered in the current context.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return self._components
+        components = self._context_components.get()
+        if components is None:
+            components = {}
+            self._context_components.set(components)
+        return components
+
     def register_component(
         self, component: "BaseEnvironmentComponent"
     ) -> "BaseEnvironmentComponent":
@@ -218,8 +247,9 @@ class Environment(metaclass=SingletonMetaClass):
             The newly registered environment component, or the environment
             component that was already registered under the given name.
         """
-        if component.NAME not in self._components:
-            self._components[component.NAME] = component
+        components = self._get_context_components()
+        if component.NAME not in components:
+            components[component.NAME] = component
             logger.debug(f"Registered environment component {component.NAME}")
             return component
         else:
@@ -227,7 +257,7 @@ class Environment(metaclass=SingletonMetaClass):
                 f"Ignoring attempt to overwrite an existing Environment "
                 f"component registered under the name {component.NAME}."
             )
-            return self._components[component.NAME]
+            return components[component.NAME]
 
     def deregister_component(
         self, component: "BaseEnvironmentComponent"
@@ -237,8 +267,9 @@ class Environment(metaclass=SingletonMetaClass):
         Args:
             component: a BaseEnvironmentComponent instance.
         """
-        if self._components.get(component.NAME) is component:
-            del self._components[component.NAME]
+        components = self._get_context_components()
+        if components.get(component.NAME) is component:
+            del components[component.NAME]
             logger.debug(f"Deregistered environment component {component.NAME}")
 
         else:
@@ -257,7 +288,9 @@ class Environment(metaclass=SingletonMetaClass):
             The environment component that is registered under the given name,
             or None if no such component is registered.
         """
-        return self._components.get(name)
+        return self._get_context_components().get(
+            name, self._components.get(name)
+        )
 
     def get_components(
         self,
@@ -267,7 +300,7 @@ class Environment(metaclass=SingletonMetaClass):
         Returns:
             A dictionary containing all registered environment components.
         """
-        return self._components.copy()
+        return {**self._components, **self._get_context_components()}
 
     def has_component(self, name: str) -> bool:
         """Check if the environment component with a known name is currently available.
@@ -279,7 +312,7 @@ class Environment(metaclass=SingletonMetaClass):
             `True` if an environment component with the given name is
             currently registered for the given name, `False` otherwise.
         """
-        return name in self._components
+        return self.get_component(name) is not None
 
     def __getitem__(self, name: str) -> "BaseEnvironmentComponent":
         """Get the environment component with the given name.
@@ -294,8 +327,9 @@ class Environment(metaclass=SingletonMetaClass):
         Raises:
             KeyError: if no environment component is registered for the given name.
         """
-        if name in self._components:
-            return self._components[name]
+        component = self.get_component(name)
+        if component is not None:
+            return component
         else:
             raise KeyError(
                 f"No environment component with name {name} is currently "
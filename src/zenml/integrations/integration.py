@@ -13,18 +13,68 @@
 #  permissions and limitations under the License.
 """Base and meta classes for ZenML integrations."""
 
+import functools
 import shutil
+import sys
 from typing import Any, Dict, List, Tuple, Type, cast
 
-import pkg_resources
+from packaging.requirements import InvalidRequirement, Requirement
 
 from zenml.integrations.registry import integration_registry
 from zenml.logger import get_logger
 from zenml.stack.flavor import Flavor
 
+if sys.version_info >= (3, 8):
+    from importlib import metadata as importlib_metadata
+else:
+    import importlib_metadata
+
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def requirement_is_installed(requirement: str) -> bool:
+    """Checks whether a Python package requirement is installed.
+
+    Only the distribution itself is checked, not the requirements of the
+    distribution. The result is cached as the installed packages don't change
+    while ZenML is running.
+
+    Args:
+        requirement: The requirement string, e.g. `scikit-learn>=1.0`.
+
+    Returns:
+        True if the requirement is installed in a matching version, False
+        otherwise.
+    """
+    try:
+        parsed_requirement = Requirement(requirement)
+    except InvalidRequirement:
+        logger.debug("Unable to parse requirement '%s'.", requirement)
+        return False
+
+    if parsed_requirement.marker and not parsed_requirement.marker.evaluate():
+        # The requirement doesn't apply to this environment.
+        return True
+
+    try:
+        version = importlib_metadata.version(parsed_requirement.name)
+    except importlib_metadata.PackageNotFoundError:
+        logger.debug("Unable to find required package '%s'.", requirement)
+        return False
+
+    if not parsed_requirement.specifier.contains(version, prereleases=True):
+        logger.debug(
+            "Found package '%s' in version %s which doesn't match the "
+            "requirement '%s'.",
+            parsed_requirement.name,
+            version,
+            requirement,
+        )
+        return False
+    return True
+
+
 class IntegrationMeta(type):
     """Metaclass responsible for registering different Integration subclasses."""
 
@@ -63,38 +113,31 @@ class Integration(metaclass=IntegrationMeta):
         Returns:
             True if all required packages are installed, False otherwise.
         """
-        try:
-            for requirement, command in cls.SYSTEM_REQUIREMENTS.items():
-                result = shutil.which(command)
-
-                if result is None:
-                    logger.debug(
-                        "Unable to find the required packages for %s on your "
-                        "system. Please install the packages on your system "
-                        "and try again.",
-                        requirement,
-                    )
-                    return False
-
-            for r in cls.REQUIREMENTS:
-                pkg_resources.get_distribution(r)
-            logger.debug(
-                f"Integration {cls.NAME} is installed correctly with "
-                f"requirements {cls.REQUIREMENTS}."
-            )
-            return True
-        except pkg_resources.DistributionNotFound as e:
-            logger.debug(
-                f"Unable to find required package '{e.req}' for "
-                f"integration {cls.NAME}."
-            )
-            return False
-        except pkg_resources.VersionConflict as e:
-            logger.debug(
-                f"VersionConflict error when loading installation {cls.NAME}: "
-                f"{str(e)}"
-            )
-            return False
+        for requirement, command in cls.SYSTEM_REQUIREMENTS.items():
+            result = shutil.which(command)
+
+            if result is None:
+                logger.debug(
+                    "Unable to find the required packages for %s on your "
+                    "system. Please install the packages on your system "
+                    "and try again.",
+                    requirement,
+                )
+                return False
+
+        for r in cls.REQUIREMENTS:
+            if not requirement_is_installed(r):
+                logger.debug(
+                    f"Unable to find required package '{r}' for "
+                    f"integration {cls.NAME}."
+                )
+                return False
+
+        logger.debug(
+            f"Integration {cls.NAME} is installed correctly with "
+            f"requirements {cls.REQUIREMENTS}."
+        )
+        return True
 
     @classmethod
     def activate(cls) -> None:
@@ -15,6 +15,8 @@
 
 from typing import TYPE_CHECKING, Optional, Type
 
+from pydantic import validator
+
 from zenml.integrations.kubernetes import KUBERNETES_ORCHESTRATOR_FLAVOR
 from zenml.orchestrators import BaseOrchestratorConfig, BaseOrchestratorFlavor
 
@@ -38,12 +40,63 @@ class KubernetesOrchestratorConfig(BaseOrchestratorConfig):
             block until all steps finished running on Kubernetes.
         skip_config_loading: If `True`, don't load the Kubernetes context and
             clients. This is only useful for unit testing.
+        max_parallelism: The maximum number of step pods that run at the same
+            time. If not set, all steps that can run are started at once.
+        fail_fast: If `True`, no new step pods are started once a step failed.
+            Step pods that are already running still finish.
+        max_step_retries: How often a failed step pod is retried.
+        step_retry_backoff: Seconds to wait before the first retry of a failed
+            step pod. The wait time doubles with every further retry.
     """
 
     kubernetes_context: Optional[str] = None
     kubernetes_namespace: str = "zenml"
     synchronous: bool = False
     skip_config_loading: bool = False
+    max_parallelism: Optional[int] = None
+    fail_fast: bool = False
+    max_step_retries: int = 0
+    step_retry_backoff: float = 10.0
+
+    @validator("max_parallelism")
+    def _validate_max_parallelism(
+        cls, max_parallelism: Optional[int]
+    ) -> Optional[int]:
+        """Validates that the maximum parallelism is positive.
+
+        Args:
+            max_parallelism: The maximum parallelism to be validated.
+
+        Returns:
+            The validated maximum parallelism.
+
+        Raises:
+            ValueError: If the maximum parallelism is not positive.
+        """
+        if max_parallelism is not None and max_parallelism < 1:
+            raise ValueError(
+                f"Maximum parallelism must be positive, got {max_parallelism}."
+            )
+        return max_parallelism
+
+    @validator("max_step_retries", "step_retry_backoff")
+    def _validate_retry_settings(cls, value: float) -> float:
+        """Validates that the retry settings are not negative.
+
+        Args:
+            value: The retry setting to be validated.
+
+        Returns:
+            The validated retry setting.
+
+        Raises:
+            ValueError: If the retry setting is negative.
+        """
+        if value < 0:
+            raise ValueError(
+                f"Retry settings must not be negative, got {value}."
+            )
+        return value
 
     @property
     def is_remote(self) -> bool:
@@ -34,11 +34,13 @@ Adjusted from https://github.com/tensorflow/tfx/blob/master/tfx/utils/kube_utils
 import datetime
 import enum
 import re
+import threading
 import time
-from typing import Any, Callable, Optional, TypeVar, cast
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, cast
 
 from kubernetes import client as k8s_client
 from kubernetes import config as k8s_config
+from kubernetes import watch as k8s_watch
 from kubernetes.client.rest import ApiException
 
 from zenml.integrations.kubernetes.orchestrators.manifest_utils import (
@@ -173,14 +175,308 @@ def get_pod(
         raise RuntimeError from e
 
 
+# Server-side timeout of a single watch request. The watch is restarted
+# afterwards, which guards against connections silently dropped by proxies.
+WATCH_TIMEOUT_SECONDS = 300
+# Server-side timeout of the watch of a single pod in `wait_pod`. A stopped
+# watch only ends with the next event or its timeout, so this bounds how long
+# the watch thread and its connection outlive the wait.
+SINGLE_POD_WATCH_TIMEOUT_SECONDS = 5
+# Seconds to wait before reconnecting after a watch or log stream failed.
+RECONNECT_INTERVAL_SECONDS = 1
+
+
+class PodWatcher:
+    """Tracks the state of pods using the Kubernetes watch API.
+
+    A single background thread watches all pods matching the given selectors,
+    so any number of threads can wait for different pods without each of them
+    polling the Kubernetes API server.
+
+    Example:
+        with PodWatcher(core_api, namespace, label_selector="run=my-run") as w:
+            w.wait(pod_name="my-run-step", exit_condition_lambda=pod_is_done)
+    """
+
+    def __init__(
+        self,
+        core_api: k8s_client.CoreV1Api,
+        namespace: str,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        watch_timeout_seconds: int = WATCH_TIMEOUT_SECONDS,
+    ) -> None:
+        """Initializes the pod watcher.
+
+        Args:
+            core_api: Client of `CoreV1Api` of Kubernetes API.
+            namespace: The namespace of the pods to watch.
+            label_selector: Optional label selector of the pods to watch.
+            field_selector: Optional field selector of the pods to watch.
+            watch_timeout_seconds: Server-side timeout of a single watch
+                request. After the watcher was stopped, its thread and
+                connection stay alive until the next event or this timeout.
+        """
+        self._core_api = core_api
+        self._namespace = namespace
+        self._watch_timeout_seconds = watch_timeout_seconds
+        self._selectors = {
+            key: value
+            for key, value in (
+                ("label_selector", label_selector),
+                ("field_selector", field_selector),
+            )
+            if value is not None
+        }
+        self._pods: Dict[str, k8s_client.V1Pod] = {}
+        self._condition = threading.Condition()
+        self._watch = k8s_watch.Watch()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "PodWatcher":
+        """Starts watching the pods.
+
+        Returns:
+            The pod watcher.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stops watching the pods.
+
+        Args:
+            *args: The exception info, if any.
+        """
+        self.stop()
+
+    def start(self) -> None:
+        """Starts watching the pods in a background thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops watching the pods."""
+        self._stopped.set()
+        self._watch.stop()
+
+    def _update_pod(self, pod: k8s_client.V1Pod, deleted: bool) -> None:
+        """Updates the state of a pod and notifies all waiting threads.
+
+        Args:
+            pod: The pod.
+            deleted: Whether the pod was deleted.
+        """
+        with self._condition:
+            if deleted:
+                self._pods.pop(pod.metadata.name, None)
+            else:
+                self._pods[pod.metadata.name] = pod
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        """Lists the pods and watches them for changes until stopped."""
+        resource_version = None
+        while not self._stopped.is_set():
+            try:
+                if resource_version is None:
+                    pod_list = self._core_api.list_namespaced_pod(
+                        namespace=self._namespace, **self._selectors
+                    )
+                    for pod in pod_list.items:
+                        self._update_pod(pod, deleted=False)
+                    resource_version = pod_list.metadata.resource_version
+
+                watch_start_time = time.monotonic()
+                for event in self._watch.stream(
+                    self._core_api.list_namespaced_pod,
+                    namespace=self._namespace,
+                    resource_version=resource_version,
+                    timeout_seconds=self._watch_timeout_seconds,
+                    **self._selectors,
+                ):
+                    pod = event["object"]
+                    resource_version = pod.metadata.resource_version
+                    self._update_pod(pod, deleted=event["type"] == "DELETED")
+
+                watch_duration = time.monotonic() - watch_start_time
+                if (
+                    not self._stopped.is_set()
+                    and watch_duration < self._watch_timeout_seconds
+                ):
+                    # The watch ended before its timeout. When the resource
+                    # version expired, the Kubernetes client ends the watch
+                    # without raising an error, so list the pods again.
+                    logger.debug("Watching pods ended early, relisting.")
+                    resource_version = None
+                    self._stopped.wait(RECONNECT_INTERVAL_SECONDS)
+            except ApiException as e:
+                if e.status == 410:
+                    # The resource version is too old, list the pods again.
+                    resource_version = None
+                    continue
+                logger.debug("Watching pods failed, reconnecting: %s", e)
+                self._stopped.wait(RECONNECT_INTERVAL_SECONDS)
+            except Exception as e:
+                # Connection errors, e.g. when the API server restarts.
+                logger.debug("Watching pods failed, reconnecting: %s", e)
+                self._stopped.wait(RECONNECT_INTERVAL_SECONDS)
+
+    def get_pod(self, pod_name: str) -> Optional[k8s_client.V1Pod]:
+        """Gets the latest state of a pod.
+
+        Args:
+            pod_name: The name of the pod.
+
+        Returns:
+            The pod or None if the pod wasn't seen yet.
+        """
+        with self._condition:
+            return self._pods.get(pod_name)
+
+    def wait(
+        self,
+        pod_name: str,
+        exit_condition_lambda: Callable[[k8s_client.V1Pod], bool],
+        timeout_sec: float = 0,
+    ) -> k8s_client.V1Pod:
+        """Waits for a pod to meet an exit condition.
+
+        Args:
+            pod_name: The name of the pod.
+            exit_condition_lambda: A lambda which will be called on every
+                change of the pod. The function returns True to exit.
+            timeout_sec: Timeout in seconds to wait for pod to reach exit
+                condition, or 0 to wait for an unlimited duration.
+
+        Raises:
+            RuntimeError: If the pod failed or the function times out.
+
+        Returns:
+            The pod object which meets the exit condition.
+        """
+        deadline = time.monotonic() + timeout_sec if timeout_sec else None
+        with self._condition:
+            while True:
+                pod = self._pods.get(pod_name)
+                if pod is not None:
+                    # Raise an error if the pod failed.
+                    if pod_failed(pod):
+                        raise RuntimeError(
+                            f"Pod `{self._namespace}:{pod_name}` failed."
+                        )
+                    # Check if pod is in desired state (e.g. finished).
+                    if exit_condition_lambda(pod):
+                        return pod
+
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise RuntimeError(
+                            f"Waiting for pod `{self._namespace}:{pod_name}` "
+                            f"timed out after {timeout_sec} seconds."
+                        )
+                self._condition.wait(timeout=remaining)
+
+
+def _parse_log_line(line: str) -> Tuple[Optional[str], str]:
+    """Splits a pod log line into its timestamp and message.
+
+    Args:
+        line: A log line requested with `timestamps=True`.
+
+    Returns:
+        The timestamp normalized to nanosecond precision so timestamps can be
+        compared as strings, and the log message.
+    """
+    timestamp, _, message = line.partition(" ")
+    match = re.fullmatch(r"([0-9T:-]+)(?:\.([0-9]+))?Z", timestamp)
+    if not match:
+        return None, line
+    seconds, fraction = match.groups()
+    return f"{seconds}.{(fraction or '').ljust(9, '0')}", message
+
+
+def _get_timestamp_age(timestamp: str) -> float:
+    """Gets the seconds passed since a normalized log timestamp.
+
+    Args:
+        timestamp: The normalized log timestamp.
+
+    Returns:
+        The seconds passed since the timestamp.
+    """
+    log_time = datetime.datetime.strptime(
+        timestamp[:19], "%Y-%m-%dT%H:%M:%S"
+    ).replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return (now - log_time).total_seconds()
+
+
+def follow_pod_logs(
+    core_api: k8s_client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    is_finished: Callable[[], bool],
+) -> None:
+    """Streams the logs of a pod to `zenml.logger.info()` as they are written.
+
+    The logs are followed with a single streaming request. If the stream ends
+    before the pod finished, e.g. because the connection dropped, it is
+    resumed with `since_seconds` and all lines that were already logged are
+    skipped based on their timestamp.
+
+    Args:
+        core_api: Client of `CoreV1Api` of Kubernetes API.
+        pod_name: The name of the pod.
+        namespace: The namespace of the pod.
+        is_finished: Function that returns whether the pod finished, in which
+            case no more logs will be written.
+    """
+    last_timestamp: Optional[str] = None
+    while True:
+        since_seconds = None
+        if last_timestamp is not None:
+            # Request some more logs than needed to account for clock skew,
+            # the duplicate lines are skipped below.
+            since_seconds = int(_get_timestamp_age(last_timestamp)) + 10
+
+        try:
+            for line in k8s_watch.Watch().stream(
+                core_api.read_namespaced_pod_log,
+                name=pod_name,
+                namespace=namespace,
+                follow=True,
+                timestamps=True,
+                since_seconds=since_seconds,
+            ):
+                timestamp, message = _parse_log_line(line)
+                if timestamp is not None:
+                    if (
+                        last_timestamp is not None
+                        and timestamp <= last_timestamp
+                    ):
+                        continue
+                    last_timestamp = timestamp
+                logger.info(message)
+        except Exception as e:
+            # E.g. the container is not started yet or the connection dropped.
+            logger.debug("Streaming logs of pod `%s` failed: %s", pod_name, e)
+
+        if is_finished():
+            return
+        time.sleep(RECONNECT_INTERVAL_SECONDS)
+
+
 def wait_pod(
     core_api: k8s_client.CoreV1Api,
     pod_name: str,
     namespace: str,
     exit_condition_lambda: Callable[[k8s_client.V1Pod], bool],
     timeout_sec: int = 0,
-    exponential_backoff: bool = False,
     stream_logs: bool = False,
+    pod_watcher: Optional[PodWatcher] = None,
 ) -> k8s_client.V1Pod:
     """Wait for a pod to meet an exit condition.
 
@@ -189,67 +485,86 @@ def wait_pod(
         pod_name: The name of the pod.
         namespace: The namespace of the pod.
         exit_condition_lambda: A lambda
-            which will be called periodically to wait for a pod to exit. The
-            function returns True to exit.
+            which will be called on every change of the pod to wait for a pod
+            to exit. The function returns True to exit.
         timeout_sec: Timeout in seconds to wait for pod to reach exit
             condition, or 0 to wait for an unlimited duration.
-            Defaults to unlimited.
-        exponential_backoff: Whether to use exponential back off for polling.
-            Defaults to False.
+            Defaults to unlimited. While logs are streamed, the timeout is
+            only checked once the log stream ended.
         stream_logs: Whether to stream the pod logs to
             `zenml.logger.info()`. Defaults to False.
-
-    Raises:
-        RuntimeError: when the function times out.
+        pod_watcher: Optional running watcher of the pod. Pass a shared
+            watcher when waiting for many pods at the same time. If not given,
+            a watcher for this pod is started while waiting.
 
     Returns:
         The pod object which meets the exit condition.
     """
-    start_time = datetime.datetime.utcnow()
+    if pod_watcher is None:
+        with PodWatcher(
+            core_api=core_api,
+            namespace=namespace,
+            field_selector=f"metadata.name={pod_name}",
+            watch_timeout_seconds=SINGLE_POD_WATCH_TIMEOUT_SECONDS,
+        ) as pod_watcher:
+            return wait_pod(
+                core_api=core_api,
+                pod_name=pod_name,
+                namespace=namespace,
+                exit_condition_lambda=exit_condition_lambda,
+                timeout_sec=timeout_sec,
+                stream_logs=stream_logs,
+                pod_watcher=pod_watcher,
+            )
 
-    # Link to exponential back-off algorithm used here:
-    # https://cloud.google.com/storage/docs/exponential-backoff
-    backoff_interval = 1
-    maximum_backoff = 32
+    watcher = pod_watcher
+    start_time = time.monotonic()
 
-    logged_lines = 0
+    def _get_remaining_timeout() -> float:
+        """Gets the remaining timeout.
 
-    while True:
-        resp = get_pod(core_api, pod_name, namespace)
+        Returns:
+            The remaining timeout in seconds or 0 if there is no timeout.
 
-        # Stream logs to `zenml.logger.info()`.
-        # TODO: can we do this without parsing all logs every time?
-        if stream_logs and pod_is_not_pending(resp):
-            response = core_api.read_namespaced_pod_log(
-                name=pod_name,
-                namespace=namespace,
-            )
-            logs = response.splitlines()
-            if len(logs) > logged_lines:
-                for line in logs[logged_lines:]:
-                    logger.info(line)
-                logged_lines = len(logs)
-
-        # Raise an error if the pod failed.
-        if pod_failed(resp):
-            raise RuntimeError(f"Pod `{namespace}:{pod_name}` failed.")
-
-        # Check if pod is in desired state (e.g. finished / running / ...).
-        if exit_condition_lambda(resp):
-            return resp
-
-        # Check if wait timed out.
-        elapse_time = datetime.datetime.utcnow() - start_time
-        if elapse_time.seconds >= timeout_sec and timeout_sec != 0:
+        Raises:
+            RuntimeError: If the timeout passed.
+        """
+        if not timeout_sec:
+            return 0
+        remaining = timeout_sec - (time.monotonic() - start_time)
+        if remaining <= 0:
             raise RuntimeError(
                 f"Waiting for pod `{namespace}:{pod_name}` timed out after "
                 f"{timeout_sec} seconds."
             )
-
-        # Wait (using exponential backoff).
-        time.sleep(backoff_interval)
-        if exponential_backoff and backoff_interval < maximum_backoff:
-            backoff_interval *= 2
+        return remaining
+
+    if stream_logs:
+        pod = watcher.wait(
+            pod_name=pod_name,
+            exit_condition_lambda=lambda pod: pod_is_not_pending(pod)
+            or exit_condition_lambda(pod),
+            timeout_sec=_get_remaining_timeout(),
+        )
+        if exit_condition_lambda(pod):
+            return pod
+
+        def _is_finished() -> bool:
+            pod = watcher.get_pod(pod_name)
+            return pod is not None and (pod_is_done(pod) or pod_failed(pod))
+
+        follow_pod_logs(
+            core_api=core_api,
+            pod_name=pod_name,
+            namespace=namespace,
+            is_finished=_is_finished,
+        )
+
+    return watcher.wait(
+        pod_name=pod_name,
+        exit_condition_lambda=exit_condition_lambda,
+        timeout_sec=_get_remaining_timeout(),
+    )
 
 
 FuncT = TypeVar("FuncT", bound=Callable[..., Any])
@@ -269,6 +269,10 @@ class KubernetesOrchestrator(BaseOrchestrator):
             run_name=run_name,
             image_name=image_name,
             kubernetes_namespace=self.config.kubernetes_namespace,
+            max_parallelism=self.config.max_parallelism,
+            fail_fast=self.config.fail_fast,
+            max_step_retries=self.config.max_step_retries,
+            step_retry_backoff=self.config.step_retry_backoff,
         )
 
         # Authorize pod to run Kubernetes commands inside the cluster.
@@ -15,38 +15,61 @@
 
 import argparse
 import socket
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
 
 from kubernetes import client as k8s_client
 
+from zenml.client import Client
 from zenml.config.pipeline_deployment import PipelineDeployment
 from zenml.constants import DOCKER_IMAGE_DEPLOYMENT_CONFIG_FILE
 from zenml.integrations.kubernetes.orchestrators import kube_utils
-from zenml.integrations.kubernetes.orchestrators.dag_runner import (
-    ThreadedDagRunner,
+from zenml.integrations.kubernetes.orchestrators.kubernetes_orchestrator_entrypoint_configuration import (
+    FAIL_FAST_OPTION,
+    IMAGE_NAME_OPTION,
+    MAX_PARALLELISM_OPTION,
+    MAX_STEP_RETRIES_OPTION,
+    NAMESPACE_OPTION,
+    STEP_RETRY_BACKOFF_OPTION,
 )
 from zenml.integrations.kubernetes.orchestrators.kubernetes_step_entrypoint_configuration import (
+    RUN_NAME_OPTION,
     KubernetesStepEntrypointConfiguration,
 )
 from zenml.integrations.kubernetes.orchestrators.manifest_utils import (
     build_pod_manifest,
 )
 from zenml.logger import get_logger
+from zenml.orchestrators.dag_runner import ThreadedDagRunner
 from zenml.utils import yaml_utils
+from zenml.zen_stores.metadata_store import MetadataStore
 
 logger = get_logger(__name__)
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     """Parse entrypoint arguments.
 
+    Args:
+        args: The arguments to parse. If not given, the command line arguments
+            are parsed.
+
     Returns:
         Parsed args.
     """
     parser = argparse.ArgumentParser()
-    parser.add_argument("--run_name", type=str, required=True)
-    parser.add_argument("--image_name", type=str, required=True)
-    parser.add_argument("--kubernetes_namespace", type=str, required=True)
-    return parser.parse_args()
+    parser.add_argument(f"--{RUN_NAME_OPTION}", type=str, required=True)
+    parser.add_argument(f"--{IMAGE_NAME_OPTION}", type=str, required=True)
+    parser.add_argument(f"--{NAMESPACE_OPTION}", type=str, required=True)
+    parser.add_argument(f"--{MAX_PARALLELISM_OPTION}", type=int, default=None)
+    parser.add_argument(f"--{FAIL_FAST_OPTION}", action="store_true")
+    parser.add_argument(f"--{MAX_STEP_RETRIES_OPTION}", type=int, default=0)
+    parser.add_argument(
+        f"--{STEP_RETRY_BACKOFF_OPTION}", type=float, default=10.0
+    )
+    return parser.parse_args(args)
 
 
 def patch_run_name_for_cron_scheduling(run_name: str) -> str:
@@ -102,6 +125,7 @@ def main() -> None:
     step_command = (
         KubernetesStepEntrypointConfiguration.get_entrypoint_command()
     )
+    attempts: Dict[str, int] = defaultdict(int)
 
     def run_step_on_kubernetes(step_name: str) -> None:
         """Run a pipeline step in a separate Kubernetes pod.
@@ -109,8 +133,12 @@ def main() -> None:
         Args:
             step_name: Name of the step.
         """
-        # Define Kubernetes pod name.
+        # Define Kubernetes pod name. Retries get a new pod, so the pods of
+        # failed attempts can still be inspected.
+        attempts[step_name] += 1
         pod_name = f"{run_name}-{step_name}"
+        if attempts[step_name] > 1:
+            pod_name += f"-retry-{attempts[step_name] - 1}"
         pod_name = kube_utils.sanitize_pod_name(pod_name)
 
         pipeline_step_name = step_name_to_pipeline_step_name[step_name]
@@ -144,10 +172,50 @@ def main() -> None:
             namespace=args.kubernetes_namespace,
             exit_condition_lambda=kube_utils.pod_is_done,
             stream_logs=True,
+            pod_watcher=pod_watcher,
         )
         logger.info(f"Pod of step `{step_name}` completed.")
 
-    ThreadedDagRunner(dag=pipeline_dag, run_fn=run_step_on_kubernetes).run()
+    metadata_store: Optional[MetadataStore] = None
+    metadata_store_lock = threading.Lock()
+
+    def record_step_retry(step_name: str, backoff: float) -> None:
+        """Records in the metadata store that a failed step will be retried.
+
+        Without this, the failed attempt of the step would make the run
+        look failed until the retry started.
+
+        Args:
+            step_name: Name of the step.
+            backoff: Seconds until the step is retried.
+        """
+        nonlocal metadata_store
+        with metadata_store_lock:
+            if metadata_store is None:
+                metadata_store = MetadataStore(
+                    Client().zen_store.get_metadata_config()
+                )
+            metadata_store.record_step_retry(
+                run_name=run_name,
+                step_name=step_name_to_pipeline_step_name[step_name],
+                retry_time=time.time() + backoff,
+            )
+
+    # Track the status of all step pods of this run with a single watch.
+    with kube_utils.PodWatcher(
+        core_api=core_api,
+        namespace=args.kubernetes_namespace,
+        label_selector=f"run={run_name}",
+    ) as pod_watcher:
+        ThreadedDagRunner(
+            dag=pipeline_dag,
+            run_fn=run_step_on_kubernetes,
+            max_parallelism=args.max_parallelism,
+            fail_fast=args.fail_fast,
+            max_retries=args.max_step_retries,
+            retry_backoff=args.step_retry_backoff,
+            on_retry=record_step_retry,
+        ).run()
 
     logger.info("Orchestration pod completed.")
 
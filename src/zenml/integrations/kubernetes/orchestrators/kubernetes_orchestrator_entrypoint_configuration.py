@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """Entrypoint configuration for the Kubernetes master/orchestrator pod."""
 
-from typing import List, Set
+from typing import List, Optional, Set
 
 from zenml.integrations.kubernetes.orchestrators.kubernetes_step_entrypoint_configuration import (
     RUN_NAME_OPTION,
@@ -21,6 +21,10 @@ from zenml.integrations.kubernetes.orchestrators.kubernetes_step_entrypoint_conf
 
 IMAGE_NAME_OPTION = "image_name"
 NAMESPACE_OPTION = "kubernetes_namespace"
+MAX_PARALLELISM_OPTION = "max_parallelism"
+FAIL_FAST_OPTION = "fail_fast"
+MAX_STEP_RETRIES_OPTION = "max_step_retries"
+STEP_RETRY_BACKOFF_OPTION = "step_retry_backoff"
 
 
 class KubernetesOrchestratorEntrypointConfiguration:
@@ -37,6 +41,10 @@ class KubernetesOrchestratorEntrypointConfiguration:
             RUN_NAME_OPTION,
             IMAGE_NAME_OPTION,
             NAMESPACE_OPTION,
+            MAX_PARALLELISM_OPTION,
+            FAIL_FAST_OPTION,
+            MAX_STEP_RETRIES_OPTION,
+            STEP_RETRY_BACKOFF_OPTION,
         }
         return options
 
@@ -60,6 +68,10 @@ class KubernetesOrchestratorEntrypointConfiguration:
         run_name: str,
         image_name: str,
         kubernetes_namespace: str,
+        max_parallelism: Optional[int] = None,
+        fail_fast: bool = False,
+        max_step_retries: int = 0,
+        step_retry_backoff: float = 10.0,
     ) -> List[str]:
         """Gets all arguments that the entrypoint command should be called with.
 
@@ -67,6 +79,12 @@ class KubernetesOrchestratorEntrypointConfiguration:
             run_name: Name of the ZenML run.
             image_name: Name of the Docker image.
             kubernetes_namespace: Name of the Kubernetes namespace.
+            max_parallelism: The maximum number of step pods that run at the
+                same time.
+            fail_fast: Whether to stop starting step pods once a step failed.
+            max_step_retries: How often a failed step pod is retried.
+            step_retry_backoff: Seconds to wait before the first retry of a
+                failed step pod.
 
         Returns:
             List of entrypoint arguments.
@@ -78,6 +96,14 @@ class KubernetesOrchestratorEntrypointConfiguration:
             image_name,
             f"--{NAMESPACE_OPTION}",
             kubernetes_namespace,
+            f"--{MAX_STEP_RETRIES_OPTION}",
+            str(max_step_retries),
+            f"--{STEP_RETRY_BACKOFF_OPTION}",
+            str(step_retry_backoff),
         ]
+        if max_parallelism is not None:
+            args += [f"--{MAX_PARALLELISM_OPTION}", str(max_parallelism)]
+        if fail_fast:
+            args.append(f"--{FAIL_FAST_OPTION}")
 
         return args
@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """Implementation of a registry to track ZenML integrations."""
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Type
 
 from zenml.exceptions import IntegrationError
 from zenml.logger import get_logger
@@ -30,6 +30,7 @@ class IntegrationRegistry(object):
     def __init__(self) -> None:
         """Initializing the integration registry."""
         self._integrations: Dict[str, Type["Integration"]] = {}
+        self._activated_integrations: Set[str] = set()
 
     @property
     def integrations(self) -> Dict[str, Type["Integration"]]:
@@ -68,15 +69,52 @@ class IntegrationRegistry(object):
         """
         self._integrations[key] = type_
 
-    def activate_integrations(self) -> None:
-        """Method to activate the integrations with are registered in the registry."""
-        for name, integration in self._integrations.items():
+    def activate_integrations(
+        self, integration_names: Optional[Iterable[str]] = None
+    ) -> None:
+        """Method to activate the integrations with are registered in the registry.
+
+        Integrations that were already activated are skipped.
+
+        Args:
+            integration_names: Names of the integrations to activate. If not
+                given, all registered integrations are activated.
+        """
+        if integration_names is None:
+            integration_names = list(self._integrations)
+
+        for name in integration_names:
+            if name in self._activated_integrations:
+                continue
+            integration = self._integrations[name]
             if integration.check_installation():
                 integration.activate()
+                self._activated_integrations.add(name)
                 logger.debug(f"Integration `{name}` is activated.")
             else:
                 logger.debug(f"Integration `{name}` could not be activated.")
 
+    def get_integrations_for_sources(self, sources: Iterable[str]) -> Set[str]:
+        """Gets the integrations that the given sources belong to.
+
+        Args:
+            sources: Sources of classes or functions, e.g. materializer
+                sources of a step.
+
+        Returns:
+            The names of the integrations that contain any of the sources.
+        """
+        integration_modules = {
+            integration.__module__: name
+            for name, integration in self._integrations.items()
+        }
+        integration_names = set()
+        for source in sources:
+            for module, name in integration_modules.items():
+                if source == module or source.startswith(f"{module}."):
+                    integration_names.add(name)
+        return integration_names
+
     @property
     def list_integration_names(self) -> List[str]:
         """Get a list of all possible integrations.
@@ -136,6 +136,27 @@ class S3ArtifactStore(BaseArtifactStore, AuthenticationMixin):
         #  manually remove it first
         self.filesystem.copy(path1=src, path2=dst)
 
+    def upload_file(self, local_path: str, path: str) -> None:
+        """Uploads a local file to the artifact store.
+
+        Files larger than the chunk size of the S3 filesystem are uploaded
+        in multiple parts.
+
+        Args:
+            local_path: The local path of the file to upload.
+            path: The path inside the artifact store to upload the file to.
+        """
+        self.filesystem.put_file(local_path, path)
+
+    def download_file(self, path: str, local_path: str) -> None:
+        """Downloads a file from the artifact store.
+
+        Args:
+            path: The path of the file inside the artifact store.
+            local_path: The local path to download the file to.
+        """
+        self.filesystem.get_file(path, local_path)
+
     def exists(self, path: PathType) -> bool:
         """Check whether a path exists.
 
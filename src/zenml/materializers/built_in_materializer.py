@@ -13,8 +13,24 @@
 #  permissions and limitations under the License.
 """Implementation of ZenML's builtin materializer."""
 
+import base64
+import contextvars
+import functools
 import os
-from typing import Any, Iterable, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    Type,
+    Union,
+    overload,
+)
 
 from zenml.artifacts import DataAnalysisArtifact, DataArtifact
 from zenml.artifacts.base_artifact import BaseArtifact
@@ -30,7 +46,13 @@ logger = get_logger(__name__)
 DEFAULT_FILENAME = "data.json"
 DEFAULT_BYTES_FILENAME = "data.txt"
 DEFAULT_METADATA_FILENAME = "metadata.json"
+DEFAULT_CHUNK_FILENAME = "chunk_{}.json"
 BASIC_TYPES = (bool, float, int, str)  # complex/bytes are not JSON serializable
+# Elements of these types are packed into chunk files instead of being
+# materialized into their own subdirectories
+PACKABLE_TYPES = (*BASIC_TYPES, bytes, type(None))
+ELEMENT_CHUNK_SIZE = 1000
+MAX_ELEMENT_WORKERS = 8
 
 
 class BuiltInMaterializer(BaseMaterializer):
@@ -177,10 +199,322 @@ def find_type_by_str(type_str: str) -> Type[Any]:
     raise RuntimeError(f"Cannot resolve type '{type_str}'.")
 
 
+class LazySequence(Sequence[Any]):
+    """Read-only sequence that loads its elements when they are accessed.
+
+    Use this as the input type of a step to read a `list`, `tuple` or `set`
+    output of another step without loading all its elements into memory.
+    Elements are not kept in memory once they were accessed, so accessing an
+    element multiple times loads it multiple times.
+    """
+
+    def __init__(self, length: int, load_element: Callable[[int], Any]):
+        """Initializes the sequence.
+
+        Args:
+            length: The number of elements.
+            load_element: Function that loads the element at an index.
+        """
+        self._length = length
+        self._load_element = load_element
+
+    def __len__(self) -> int:
+        """Returns the number of elements.
+
+        Returns:
+            The number of elements.
+        """
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Any]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Loads the element at an index or the elements of a slice.
+
+        Args:
+            index: The index or slice.
+
+        Returns:
+            The element or a list of the elements of the slice.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, slice):
+            return [
+                self._load_element(i)
+                for i in range(*index.indices(self._length))
+            ]
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("LazySequence index out of range.")
+        return self._load_element(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Loads the elements one after another.
+
+        Yields:
+            The elements.
+        """
+        for index in range(self._length):
+            yield self._load_element(index)
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the sequence.
+
+        Returns:
+            A string representation of the sequence.
+        """
+        return f"{self.__class__.__name__}(length={self._length})"
+
+
+class LazyMapping(Mapping[Any, Any]):
+    """Read-only mapping that loads its values when they are accessed.
+
+    Use this as the input type of a step to read a `dict` output of another
+    step without loading all its values into memory. The keys are loaded
+    right away.
+    """
+
+    def __init__(self, keys: Iterable[Any], values: Sequence[Any]):
+        """Initializes the mapping.
+
+        Args:
+            keys: The keys of the mapping.
+            values: The values of the mapping in the same order as the keys.
+        """
+        self._keys = list(keys)
+        self._positions = {key: i for i, key in enumerate(self._keys)}
+        self._values = values
+
+    def __getitem__(self, key: Any) -> Any:
+        """Loads the value of a key.
+
+        Args:
+            key: The key.
+
+        Returns:
+            The value.
+        """
+        return self._values[self._positions[key]]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the keys.
+
+        Returns:
+            An iterator over the keys.
+        """
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        """Returns the number of keys.
+
+        Returns:
+            The number of keys.
+        """
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the mapping.
+
+        Returns:
+            A string representation of the mapping.
+        """
+        return f"{self.__class__.__name__}(keys={self._keys})"
+
+
+def _get_element_materializer(type_: Type[Any], uri: str) -> BaseMaterializer:
+    """Gets a materializer for an element of a container.
+
+    Args:
+        type_: The type of the element.
+        uri: The URI of the directory in which the element is stored.
+
+    Returns:
+        The materializer for the element.
+    """
+    materializer_class = default_materializer_registry[type_]
+    mock_artifact = DataArtifact()
+    mock_artifact.uri = uri
+    return materializer_class(mock_artifact)
+
+
+def _pack_element(element: Any) -> Any:
+    """Converts an element to a value that can be stored in a chunk file.
+
+    Args:
+        element: The element to pack.
+
+    Returns:
+        The JSON-serializable value.
+    """
+    if isinstance(element, bytes):
+        return base64.b64encode(element).decode("ascii")
+    return element
+
+
+def _unpack_element(value: Any, type_str: str) -> Any:
+    """Converts a value that was stored in a chunk file back to an element.
+
+    Args:
+        value: The value read from the chunk file.
+        type_str: The string representation of the type of the element.
+
+    Returns:
+        The element.
+    """
+    if type_str == str(bytes):
+        return base64.b64decode(value)
+    return value
+
+
+def _run_concurrently(functions: Sequence[Callable[[], Any]]) -> List[Any]:
+    """Runs functions in a thread pool.
+
+    Args:
+        functions: The functions to run.
+
+    Returns:
+        The return values of the functions in the same order.
+
+    Raises:
+        BaseException: If any of the functions failed.
+    """
+    if len(functions) <= 1:
+        return [function() for function in functions]
+
+    with ThreadPoolExecutor(max_workers=MAX_ELEMENT_WORKERS) as executor:
+        # Run each function in a copy of the current context so the
+        # environment of the running step is available in the worker threads
+        futures = [
+            executor.submit(contextvars.copy_context().run, function)
+            for function in functions
+        ]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def _write_element(
+    materializer: BaseMaterializer, element: Any, element_path: str
+) -> None:
+    """Materializes a container element into its own subdirectory.
+
+    Args:
+        materializer: The materializer of the element.
+        element: The element to materialize.
+        element_path: The path of the subdirectory.
+    """
+    fileio.mkdir(element_path)
+    materializer.handle_return(element)
+
+
+class _ElementLoader:
+    """Loads the elements of a container that was not serialized to JSON."""
+
+    def __init__(self, metadata: Dict[str, Any]):
+        """Initializes the loader.
+
+        Args:
+            metadata: The metadata of the materialized container.
+        """
+        self._paths: List[str] = metadata["paths"]
+        self._types: List[str] = metadata["types"]
+        # Artifacts of older versions don't contain packed elements
+        self._packed: List[bool] = metadata.get("packed") or [False] * len(
+            self._paths
+        )
+        self._chunks: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of elements.
+
+        Returns:
+            The number of elements.
+        """
+        return len(self._paths)
+
+    def load(self, index: int) -> Any:
+        """Loads an element.
+
+        Args:
+            index: The index of the element.
+
+        Returns:
+            The element.
+        """
+        path, type_str = self._paths[index], self._types[index]
+        if self._packed[index]:
+            return _unpack_element(self._read_chunk(path)[str(index)], type_str)
+
+        type_ = find_type_by_str(type_str)
+        return _get_element_materializer(type_, path).handle_input(type_)
+
+    def load_lazily(self, index: int) -> Any:
+        """Loads an element, using a `LazySequence` for nested containers.
+
+        Args:
+            index: The index of the element.
+
+        Returns:
+            The element.
+        """
+        if not self._packed[index]:
+            type_ = find_type_by_str(self._types[index])
+            materializer = _get_element_materializer(type_, self._paths[index])
+            if isinstance(materializer, BuiltInContainerMaterializer):
+                return materializer.handle_input(LazySequence)
+
+        return self.load(index)
+
+    def load_all(self) -> List[Any]:
+        """Loads all elements concurrently.
+
+        Returns:
+            The elements.
+        """
+        # Read each chunk only once instead of in every thread
+        for path, packed in zip(self._paths, self._packed):
+            if packed:
+                self._read_chunk(path)
+
+        return _run_concurrently(
+            [functools.partial(self.load, i) for i in range(len(self))]
+        )
+
+    def _read_chunk(self, path: str) -> Dict[str, Any]:
+        """Reads a chunk file of packed elements.
+
+        Args:
+            path: The path of the chunk file.
+
+        Returns:
+            The packed elements of the chunk by their index.
+        """
+        if path not in self._chunks:
+            self._chunks[path] = yaml_utils.read_json(path)
+        return self._chunks[path]
+
+
 class BuiltInContainerMaterializer(BaseMaterializer):
-    """Handle built-in container types (dict, list, set, tuple)."""
+    """Handle built-in container types (dict, list, set, tuple).
 
-    ASSOCIATED_TYPES = (dict, list, set, tuple)
+    Steps can use `LazySequence` or `LazyMapping` as input type to load the
+    elements of a container only when they are accessed.
+    """
+
+    ASSOCIATED_TYPES = (dict, list, set, tuple, LazySequence, LazyMapping)
 
     def __init__(self, artifact: "BaseArtifact"):
         """Define `self.data_path` and `self.metadata_path`.
@@ -199,13 +533,18 @@ class BuiltInContainerMaterializer(BaseMaterializer):
 
         If the data was serialized to JSON, deserialize it.
 
-        Otherwise, reconstruct all elements according to the metadata file:
+        Otherwise, reconstruct all elements according to the metadata file.
+        Elements of basic types and bytes are read from the chunk files they
+        were packed into. All other elements are loaded concurrently:
             1. Resolve the data type using `find_type_by_str()`,
             2. Get the materializer via the `default_materializer_registry`,
             3. Initialize the materializer with a mock `DataArtifact`, whose
                 `uri` attribute is overwritten to point to the desired path,
             4. Use `handle_input()` of that materializer to load the element.
 
+        If `data_type` is `LazySequence` or `LazyMapping`, the elements are
+        only loaded when they are accessed.
+
         Args:
             data_type: The type of the data to read.
 
@@ -229,19 +568,22 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         # If the data was serialized as JSON, deserialize it.
         if fileio.exists(self.data_path):
             outputs = yaml_utils.read_json(self.data_path)
+            if issubclass(data_type, LazyMapping):
+                if isinstance(outputs, dict):
+                    return LazyMapping(outputs.keys(), list(outputs.values()))
+                keys, values = outputs
+                return LazyMapping(keys, values)
+            if issubclass(data_type, LazySequence):
+                return LazySequence(len(outputs), outputs.__getitem__)
 
         # Otherwise, use the metadata to reconstruct the data as a list.
         else:
-            metadata = yaml_utils.read_json(self.metadata_path)
-            outputs = []
-            for path_, type_str in zip(metadata["paths"], metadata["types"]):
-                type_ = find_type_by_str(type_str)
-                materializer_class = default_materializer_registry[type_]
-                mock_artifact = DataArtifact()
-                mock_artifact.uri = path_
-                materializer = materializer_class(mock_artifact)
-                element = materializer.handle_input(type_)
-                outputs.append(element)
+            loader = _ElementLoader(yaml_utils.read_json(self.metadata_path))
+            if issubclass(data_type, LazyMapping):
+                return LazyMapping(loader.load(0), loader.load_lazily(1))
+            if issubclass(data_type, LazySequence):
+                return LazySequence(len(loader), loader.load)
+            outputs = loader.load_all()
 
         # Cast the data to the correct type.
         if issubclass(data_type, dict) and not isinstance(outputs, dict):
@@ -258,11 +600,14 @@ class BuiltInContainerMaterializer(BaseMaterializer):
 
         If the object can be serialized to JSON, serialize it.
 
-        Otherwise, use the `default_materializer_registry` to find the correct
-        materializer for each element and materialize each element into a
-        subdirectory.
+        Otherwise, pack all elements of basic types and bytes into chunk files
+        of up to `ELEMENT_CHUNK_SIZE` elements. For all other elements, use the
+        `default_materializer_registry` to find the correct materializer and
+        materialize the element into a subdirectory. The chunk files and
+        elements are written concurrently.
 
-        Tuples and sets are cast to list before materialization.
+        Tuples, sets and lazy sequences are cast to list before
+        materialization.
 
         For non-serializable dicts, materialize keys/values as separate lists.
 
@@ -274,8 +619,10 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         """
         super().handle_return(data)
 
-        # tuple and set: handle as list.
-        if isinstance(data, tuple) or isinstance(data, set):
+        # tuple, set and lazy containers: handle as list or dict.
+        if isinstance(data, LazyMapping):
+            data = dict(data)
+        if isinstance(data, (tuple, set, LazySequence)):
             data = list(data)
 
         # If the data is serializable, just write it into a single JSON file.
@@ -287,33 +634,65 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         if isinstance(data, dict):
             data = [list(data.keys()), list(data.values())]
 
-        # non-serializable list: Materialize each element into a subfolder.
-        # Get path, type, and corresponding materializer for each element.
-        paths, types, materializers = [], [], []
+        # non-serializable list: Pack small elements into chunk files and
+        # materialize each other element into a subfolder.
+        paths: List[str] = []
+        types: List[str] = []
+        packed: List[bool] = []
+        chunks: Dict[str, Dict[str, Any]] = {}
+        write_functions: List[Callable[[], None]] = []
+        num_packed = 0
         for i, element in enumerate(data):
-            element_path = os.path.join(self.artifact.uri, str(i))
-            fileio.mkdir(element_path)
             type_ = type(element)
-            paths.append(element_path)
             types.append(str(type_))
-            materializer_class = default_materializer_registry[type_]
-            mock_artifact = DataArtifact()
-            mock_artifact.uri = element_path
-            materializer = materializer_class(mock_artifact)
-            materializers.append(materializer)
+            if type_ in PACKABLE_TYPES:
+                chunk_path = os.path.join(
+                    self.artifact.uri,
+                    DEFAULT_CHUNK_FILENAME.format(
+                        num_packed // ELEMENT_CHUNK_SIZE
+                    ),
+                )
+                num_packed += 1
+                chunks.setdefault(chunk_path, {})[str(i)] = _pack_element(
+                    element
+                )
+                paths.append(chunk_path)
+                packed.append(True)
+            else:
+                element_path = os.path.join(self.artifact.uri, str(i))
+                materializer = _get_element_materializer(type_, element_path)
+                write_functions.append(
+                    functools.partial(
+                        _write_element, materializer, element, element_path
+                    )
+                )
+                paths.append(element_path)
+                packed.append(False)
+
+        for chunk_path, chunk in chunks.items():
+            write_functions.append(
+                functools.partial(yaml_utils.write_json, chunk_path, chunk)
+            )
         try:
             # Write metadata as JSON.
-            metadata = {"length": len(data), "paths": paths, "types": types}
+            metadata = {
+                "length": len(data),
+                "paths": paths,
+                "types": types,
+                "packed": packed,
+            }
             yaml_utils.write_json(self.metadata_path, metadata)
-            # Materialize each element.
-            for element, materializer in zip(data, materializers):
-                materializer.handle_return(element)
+            # Write chunks and materialize the other elements.
+            _run_concurrently(write_functions)
         # If an error occurs, delete all created files.
         except Exception as e:
             # Delete metadata
             if fileio.exists(self.metadata_path):
                 fileio.remove(self.metadata_path)
-            # Delete all elements that were already saved.
-            for element_path in paths:
-                fileio.rmtree(element_path)
+            # Delete all chunks and elements that were already saved.
+            for path in dict.fromkeys(paths):
+                if fileio.isdir(path):
+                    fileio.rmtree(path)
+                elif fileio.exists(path):
+                    fileio.remove(path)
             raise e
@@ -23,24 +23,30 @@ import pyarrow.parquet as pq
 from zenml.artifacts import DataArtifact
 from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.utils import yaml_utils
+from zenml.utils import io_utils, yaml_utils
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
+NUMPY_FILENAME = "data.npy"
+
 DATA_FILENAME = "data.parquet"
 SHAPE_FILENAME = "shape.json"
 DATA_VAR = "data_var"
 
 
 class NumpyMaterializer(BaseMaterializer):
-    """Materializer to read data to and from pandas."""
+    """Materializer to read and write numpy arrays."""
 
     ASSOCIATED_TYPES = (np.ndarray,)
     ASSOCIATED_ARTIFACT_TYPES = (DataArtifact,)
 
     def handle_input(self, data_type: Type[Any]) -> "NDArray[Any]":
-        """Reads numpy array from parquet file.
+        """Reads a numpy array from a `.npy` or parquet file.
+
+        Arrays stored in the native `.npy` format are memory-mapped if the
+        artifact store is local, otherwise they are streamed from the
+        artifact store.
 
         Args:
             data_type: The type of the data to read.
@@ -49,6 +55,18 @@ class NumpyMaterializer(BaseMaterializer):
             The numpy array.
         """
         super().handle_input(data_type)
+        numpy_file = os.path.join(self.artifact.uri, NUMPY_FILENAME)
+        if fileio.exists(numpy_file):
+            if not io_utils.is_remote(numpy_file):
+                # Copy-on-write, so in-place modifications in a step don't
+                # change the stored artifact
+                return np.load(numpy_file, mmap_mode="c", allow_pickle=False)
+
+            with fileio.open(numpy_file, "rb") as f:
+                return np.load(f, allow_pickle=False)
+
+        # Arrays with object dtype and arrays written by older ZenML versions
+        # are stored as parquet
         shape_dict = yaml_utils.read_json(
             os.path.join(self.artifact.uri, SHAPE_FILENAME)
         )
@@ -58,16 +76,27 @@ class NumpyMaterializer(BaseMaterializer):
         ) as f:
             input_stream = pa.input_stream(f)
             data = pq.read_table(input_stream)
-        vals = getattr(data.to_pandas(), DATA_VAR).values
+        vals = getattr(data.to_pandas(), DATA_VAR).to_numpy()
         return np.reshape(vals, shape_tuple)
 
     def handle_return(self, arr: "NDArray[Any]") -> None:
-        """Writes a np.ndarray to the artifact store as a parquet file.
+        """Writes a np.ndarray to the artifact store.
+
+        Arrays are stored in the native `.npy` format, which preserves their
+        dtype and shape. Arrays with object dtype can't be stored without
+        pickling and are written as a parquet file instead.
 
         Args:
             arr: The numpy array to write.
         """
         super().handle_return(arr)
+        if not arr.dtype.hasobject:
+            with fileio.open(
+                os.path.join(self.artifact.uri, NUMPY_FILENAME), "wb"
+            ) as f:
+                np.save(f, arr, allow_pickle=False)
+            return
+
         yaml_utils.write_json(
             os.path.join(self.artifact.uri, SHAPE_FILENAME),
             {str(i): x for i, x in enumerate(arr.shape)},
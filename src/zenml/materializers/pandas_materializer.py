@@ -14,10 +14,10 @@
 """Materializer for Pandas."""
 
 import os
-import tempfile
-from typing import Any, Type, Union
+from typing import Any, Iterator, List, Optional, Sequence, Type, Union
 
 import pandas as pd
+import pyarrow.parquet as pq
 
 from zenml.artifacts import DataArtifact, SchemaArtifact, StatisticsArtifact
 from zenml.io import fileio
@@ -25,12 +25,146 @@ from zenml.materializers.base_materializer import BaseMaterializer
 
 DEFAULT_FILENAME = "df.parquet.gzip"
 COMPRESSION_TYPE = "gzip"
+ROW_GROUP_SIZE = 1024 * 1024
+DEFAULT_BATCH_SIZE = 64 * 1024
+
+
+class DataFrameReader:
+    """Reads a pandas dataframe artifact partially or in batches.
+
+    Use this as the type of a step input to avoid loading the entire
+    dataframe into memory:
+
+    ```python
+    @step
+    def my_step(data: DataFrameReader) -> int:
+        df = data.read(columns=["a"], filters=[("b", ">", 0)])
+        ...
+    ```
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initializes the reader.
+
+        Args:
+            path: Path of the parquet file in the artifact store.
+        """
+        self.path = path
+        self._metadata: Optional[pq.FileMetaData] = None
+
+    @property
+    def metadata(self) -> pq.FileMetaData:
+        """The parquet metadata of the dataframe.
+
+        Returns:
+            The parquet metadata.
+        """
+        if self._metadata is None:
+            with fileio.open(self.path, "rb") as f:
+                self._metadata = pq.read_metadata(f)
+        return self._metadata
+
+    @property
+    def columns(self) -> List[str]:
+        """The column names of the dataframe.
+
+        Returns:
+            The column names, including the names of stored index columns.
+        """
+        return list(self.metadata.schema.names)
+
+    @property
+    def num_rows(self) -> int:
+        """The number of rows of the dataframe.
+
+        Returns:
+            The number of rows.
+        """
+        return int(self.metadata.num_rows)
+
+    @property
+    def num_row_groups(self) -> int:
+        """The number of row groups in which the dataframe is stored.
+
+        Returns:
+            The number of row groups.
+        """
+        return int(self.metadata.num_row_groups)
+
+    def read(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        row_groups: Optional[Sequence[int]] = None,
+        filters: Optional[List[Any]] = None,
+    ) -> pd.DataFrame:
+        """Reads the dataframe or a subset of it.
+
+        Only the requested columns and row groups are read from the artifact
+        store. Filters additionally skip all row groups whose statistics
+        show that they don't contain any matching rows.
+
+        Args:
+            columns: Names of the columns to read. Reads all columns if not
+                given.
+            row_groups: Indices of the row groups to read. Reads all row
+                groups if not given.
+            filters: Rows which don't match these filters are removed. See
+                the `filters` argument of `pyarrow.parquet.read_table` for
+                the supported syntax, e.g. `[("column", ">", 0)]`.
+
+        Returns:
+            The dataframe.
+
+        Raises:
+            ValueError: If both row groups and filters are given.
+        """
+        with fileio.open(self.path, "rb") as f:
+            if row_groups is not None:
+                if filters is not None:
+                    raise ValueError(
+                        "Reading specific row groups with filters is not "
+                        "supported."
+                    )
+                table = pq.ParquetFile(f).read_row_groups(
+                    row_groups, columns=columns, use_pandas_metadata=True
+                )
+            else:
+                table = pq.read_table(
+                    f,
+                    columns=columns,
+                    filters=filters,
+                    use_pandas_metadata=True,
+                )
+        return table.to_pandas()
+
+    def iter_batches(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Reads the dataframe in batches.
+
+        Args:
+            batch_size: The maximum number of rows of each batch.
+            columns: Names of the columns to read. Reads all columns if not
+                given.
+
+        Yields:
+            The batches of the dataframe.
+        """
+        with fileio.open(self.path, "rb") as f:
+            for batch in pq.ParquetFile(f).iter_batches(
+                batch_size=batch_size,
+                columns=columns,
+                use_pandas_metadata=True,
+            ):
+                yield batch.to_pandas()
 
 
 class PandasMaterializer(BaseMaterializer):
     """Materializer to read data to and from pandas."""
 
-    ASSOCIATED_TYPES = (pd.DataFrame, pd.Series)
+    ASSOCIATED_TYPES = (pd.DataFrame, pd.Series, DataFrameReader)
     ASSOCIATED_ARTIFACT_TYPES = (
         DataArtifact,
         StatisticsArtifact,
@@ -39,30 +173,24 @@ class PandasMaterializer(BaseMaterializer):
 
     def handle_input(
         self, data_type: Type[Any]
-    ) -> Union[pd.DataFrame, pd.Series]:
+    ) -> Union[pd.DataFrame, pd.Series, DataFrameReader]:
         """Reads pd.DataFrame or pd.Series from a parquet file.
 
         Args:
             data_type: The type of the data to read.
 
         Returns:
-            The pandas dataframe or series.
+            The pandas dataframe or series, or a reader to load parts of the
+            dataframe if requested.
         """
         super().handle_input(data_type)
-        filepath = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
+        reader = DataFrameReader(
+            os.path.join(self.artifact.uri, DEFAULT_FILENAME)
+        )
+        if issubclass(data_type, DataFrameReader):
+            return reader
 
-        # Create a temporary folder
-        temp_dir = tempfile.mkdtemp(prefix="zenml-temp-")
-        temp_file = os.path.join(str(temp_dir), DEFAULT_FILENAME)
-
-        # Copy from artifact store to temporary file
-        fileio.copy(filepath, temp_file)
-
-        # Load the model from the temporary file
-        df = pd.read_parquet(temp_file)
-
-        # Cleanup and return
-        fileio.rmtree(temp_dir)
+        df = reader.read()
 
         if issubclass(data_type, pd.Series):
             # Taking the first column if its a series as the assumption
@@ -72,25 +200,28 @@ class PandasMaterializer(BaseMaterializer):
 
         return df
 
-    def handle_return(self, df: Union[pd.DataFrame, pd.Series]) -> None:
+    def handle_return(
+        self, df: Union[pd.DataFrame, pd.Series, DataFrameReader]
+    ) -> None:
         """Writes a pandas dataframe or series to the specified filename.
 
         Args:
-            df: The pandas dataframe or series to write.
+            df: The pandas dataframe or series to write. If a reader is
+                given, the dataframe it reads is copied.
         """
         super().handle_return(df)
         filepath = os.path.join(self.artifact.uri, DEFAULT_FILENAME)
 
+        if isinstance(df, DataFrameReader):
+            fileio.copy(df.path, filepath)
+            return
+
         if isinstance(df, pd.Series):
             df = df.to_frame(name="series")
 
-        # Create a temporary file to store the model
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".gzip", delete=False
-        ) as f:
-            df.to_parquet(f.name, compression=COMPRESSION_TYPE)
-            fileio.copy(f.name, filepath)
-
-        # Close and remove the temporary file
-        f.close()
-        fileio.remove(f.name)
+        with fileio.open(filepath, "wb") as f:
+            df.to_parquet(
+                f,
+                compression=COMPRESSION_TYPE,
+                row_group_size=ROW_GROUP_SIZE,
+            )
@@ -86,23 +86,7 @@ class ComponentModel(
         Returns:
             The hydrated component model.
         """
-        zen_store = GlobalConfiguration().zen_store
-
-        project = zen_store.get_project(self.project)
-        user = zen_store.get_user(self.user)
-
-        return HydratedComponentModel(
-            id=self.id,
-            name=self.name,
-            type=self.type,
-            flavor=self.flavor,
-            configuration=self.configuration,
-            project=project,
-            user=user,
-            is_shared=self.is_shared,
-            created=self.created,
-            updated=self.updated,
-        )
+        return HydratedComponentModel.from_models([self])[0]
 
 
 class HydratedComponentModel(ComponentModel):
@@ -114,6 +98,46 @@ class HydratedComponentModel(ComponentModel):
         title="The user that created this stack.",
     )
 
+    @classmethod
+    def from_models(
+        cls, components: List[ComponentModel]
+    ) -> List["HydratedComponentModel"]:
+        """Hydrates multiple components at once.
+
+        The projects and users of all components are fetched in bulk instead
+        of once per component.
+
+        Args:
+            components: The components to hydrate.
+
+        Returns:
+            The hydrated components, in the same order as the given ones.
+        """
+        zen_store = GlobalConfiguration().zen_store
+
+        projects = zen_store.get_projects_by_ids(
+            {component.project for component in components}
+        )
+        users = zen_store.get_users_by_ids(
+            {component.user for component in components}
+        )
+
+        return [
+            cls(
+                id=component.id,
+                name=component.name,
+                type=component.type,
+                flavor=component.flavor,
+                configuration=component.configuration,
+                project=projects[component.project],
+                user=users[component.user],
+                is_shared=component.is_shared,
+                created=component.created,
+                updated=component.updated,
+            )
+            for component in components
+        ]
+
     class Config:
         """Example of a json-serialized instance."""
 
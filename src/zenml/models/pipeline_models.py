@@ -105,6 +105,13 @@ class StepRunModel(DomainModel):
     parameters: Dict[str, str]
     step_configuration: Dict[str, Any]
     docstring: Optional[str]
+    metrics: Dict[str, float] = Field(
+        default_factory=dict,
+        title=(
+            "Durations of the step run phases in seconds and resource usage "
+            "of the step run."
+        ),
+    )
 
     # IDs in MLMD - needed for some metadata store methods
     mlmd_id: int
@@ -98,28 +98,7 @@ class StackModel(ShareableProjectScopedDomainModel, AnalyticsTrackedModelMixin):
         Returns:
             A hydrated version of the stack model.
         """
-        zen_store = GlobalConfiguration().zen_store
-
-        components = {}
-        for comp_type, comp_id_list in self.components.items():
-            components[comp_type] = [
-                zen_store.get_stack_component(c_id) for c_id in comp_id_list
-            ]
-
-        project = zen_store.get_project(self.project)
-        user = zen_store.get_user(self.user)
-
-        return HydratedStackModel(
-            id=self.id,
-            name=self.name,
-            description=self.description,
-            components=components,
-            project=project,
-            user=user,
-            is_shared=self.is_shared,
-            created=self.created,
-            updated=self.updated,
-        )
+        return HydratedStackModel.from_models([self])[0]
 
     def get_analytics_metadata(self) -> Dict[str, Any]:
         """Add the stack components to the stack analytics metadata.
@@ -144,6 +123,57 @@ class HydratedStackModel(StackModel):
         title="The user that created this stack.",
     )
 
+    @classmethod
+    def from_models(
+        cls, stacks: List[StackModel]
+    ) -> List["HydratedStackModel"]:
+        """Hydrates multiple stacks at once.
+
+        The components, projects and users of all stacks are fetched in bulk
+        instead of once per stack.
+
+        Args:
+            stacks: The stacks to hydrate.
+
+        Returns:
+            The hydrated stacks, in the same order as the given ones.
+        """
+        zen_store = GlobalConfiguration().zen_store
+
+        components_by_id = zen_store.get_stack_components_by_ids(
+            {
+                component_id
+                for stack in stacks
+                for component_ids in stack.components.values()
+                for component_id in component_ids
+            }
+        )
+        projects = zen_store.get_projects_by_ids(
+            {stack.project for stack in stacks}
+        )
+        users = zen_store.get_users_by_ids({stack.user for stack in stacks})
+
+        return [
+            cls(
+                id=stack.id,
+                name=stack.name,
+                description=stack.description,
+                components={
+                    component_type: [
+                        components_by_id[component_id]
+                        for component_id in component_ids
+                    ]
+                    for component_type, component_ids in stack.components.items()
+                },
+                project=projects[stack.project],
+                user=users[stack.user],
+                is_shared=stack.is_shared,
+                created=stack.created,
+                updated=stack.updated,
+            )
+            for stack in stacks
+        ]
+
     class Config:
         """Example of a json-serialized instance."""
 
@@ -30,20 +30,26 @@
 # runner implementation of tfx
 """Base orchestrator class."""
 import os
+import threading
 import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
     Dict,
+    Iterator,
     List,
     Optional,
+    Set,
     Type,
     cast,
 )
 
 from google.protobuf import json_format
+from google.protobuf.message import Message
+from ml_metadata.proto.metadata_store_pb2 import ConnectionConfig
 from pydantic import root_validator
 from tfx.dsl.compiler.constants import PIPELINE_RUN_ID_PARAMETER_NAME
 from tfx.dsl.io.fileio import NotFoundError
@@ -82,6 +88,10 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Preparing a step modifies the shared pipeline proto and stack, so steps that
+# run in parallel threads need to be prepared one after another
+_STEP_PREPARATION_LOCK = threading.Lock()
+
 
 # TFX PATCH ####################################################################
 # The following code patches a function in tfx which leads to an OSError on
@@ -149,6 +159,182 @@ setattr(
 # END OF TFX PATCH #############################################################
 
 
+class _PersistentMetadata(metadata.Metadata):
+    """MLMD connection that stays open between `with` blocks.
+
+    The TFX launcher enters the connection several times per step, and each
+    time the default implementation opens a new connection to the metadata
+    store. This connection is opened once and only closed by calling
+    `close()`.
+    """
+
+    def __enter__(self) -> "_PersistentMetadata":
+        """Opens the connection if it isn't open yet.
+
+        Returns:
+            The open connection.
+        """
+        if self._store is None:
+            super().__enter__()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Keeps the connection open.
+
+        Args:
+            *args: The arguments passed to the context exit point.
+        """
+
+    def close(self) -> None:
+        """Closes the connection."""
+        super().__exit__(None, None, None)
+
+
+class RunExecutionContext:
+    """Resources that are shared by all steps of a pipeline run.
+
+    All resources are resolved lazily the first time a step needs them, so
+    orchestrators that don't run any steps themselves don't pay for them.
+    Everything derived from the pipeline proto is computed once per run
+    instead of once per step.
+    """
+
+    def __init__(
+        self, pb2_pipeline: Pb2Pipeline, stack: Optional[Stack] = None
+    ) -> None:
+        """Initializes the context.
+
+        Args:
+            pb2_pipeline: The pipeline proto of the run.
+            stack: The stack on which the pipeline runs. If not given, the
+                active stack is used.
+        """
+        self.pb2_pipeline = pb2_pipeline
+        self.validated_artifact_sources: Set[str] = set()
+        self._stack = stack
+        self._metadata_connection_config: Optional[ConnectionConfig] = None
+        self._mlmd_connections: List[_PersistentMetadata] = []
+        self._idle_mlmd_connections: List[_PersistentMetadata] = []
+        self._step_nodes: Optional[Dict[str, PipelineNode]] = None
+        self._deployment_config: Optional[Message] = None
+        self._run_name: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def step_nodes(self) -> Dict[str, PipelineNode]:
+        """The nodes of the pipeline proto by step name.
+
+        Returns:
+            The pipeline nodes.
+        """
+        with self._lock:
+            if self._step_nodes is None:
+                self._step_nodes = {
+                    node.pipeline_node.node_info.id: node.pipeline_node
+                    for node in self.pb2_pipeline.nodes
+                    if node.WhichOneof("node") == "pipeline_node"
+                }
+            return self._step_nodes
+
+    @property
+    def deployment_config(self) -> Message:
+        """The local deployment config extracted from the pipeline proto.
+
+        Returns:
+            The deployment config.
+        """
+        with self._lock:
+            if self._deployment_config is None:
+                self._deployment_config = (
+                    runner_utils.extract_local_deployment_config(
+                        self.pb2_pipeline
+                    )
+                )
+            return self._deployment_config
+
+    def substitute_run_name(self, run_name: str) -> None:
+        """Substitutes the run name runtime parameter in the pipeline proto.
+
+        The substitution replaces the runtime parameter in place, so only the
+        first substitution has any effect. Later calls are skipped.
+
+        Args:
+            run_name: The run name to substitute.
+        """
+        with self._lock:
+            if self._run_name is not None:
+                return
+            # Substitute the runtime parameter to be a concrete run_id, it is
+            # important for this to be unique for each run.
+            runtime_parameter_utils.substitute_runtime_parameter(
+                self.pb2_pipeline,
+                {PIPELINE_RUN_ID_PARAMETER_NAME: run_name},
+            )
+            self._run_name = run_name
+
+    @property
+    def stack(self) -> Stack:
+        """The stack on which the pipeline runs.
+
+        Returns:
+            The stack.
+        """
+        with self._lock:
+            if self._stack is None:
+                self._stack = Client().active_stack
+            return self._stack
+
+    @property
+    def metadata_connection_config(self) -> ConnectionConfig:
+        """The config to connect to the metadata store.
+
+        Returns:
+            The metadata connection config.
+        """
+        with self._lock:
+            if self._metadata_connection_config is None:
+                self._metadata_connection_config = (
+                    Client().zen_store.get_metadata_config()
+                )
+            return self._metadata_connection_config
+
+    @contextmanager
+    def borrow_mlmd_connection(self) -> Iterator[metadata.Metadata]:
+        """Borrows an MLMD connection for running a step.
+
+        MLMD connections can't be used by multiple threads at the same time,
+        so each step borrows a connection for as long as it runs. Connections
+        are returned to a pool afterwards and reused by later steps, so a run
+        never opens more connections than it runs steps in parallel.
+
+        Yields:
+            The MLMD connection.
+        """
+        with self._lock:
+            connection = (
+                self._idle_mlmd_connections.pop()
+                if self._idle_mlmd_connections
+                else None
+            )
+        if connection is None:
+            connection = _PersistentMetadata(self.metadata_connection_config)
+            with self._lock:
+                self._mlmd_connections.append(connection)
+        try:
+            yield connection
+        finally:
+            with self._lock:
+                self._idle_mlmd_connections.append(connection)
+
+    def close(self) -> None:
+        """Closes all MLMD connections of the context."""
+        with self._lock:
+            for connection in self._mlmd_connections:
+                connection.close()
+            self._mlmd_connections = []
+            self._idle_mlmd_connections = []
+
+
 class BaseOrchestratorConfig(StackComponentConfig):
     """Base orchestrator config."""
 
@@ -197,6 +383,7 @@ class BaseOrchestrator(StackComponent, ABC):
     TYPE: ClassVar[StackComponentType] = StackComponentType.ORCHESTRATOR
     _active_deployment: Optional["PipelineDeployment"] = None
     _active_pb2_pipeline: Optional[Pb2Pipeline] = None
+    _active_context: Optional[RunExecutionContext] = None
 
     @property
     def config(self) -> BaseOrchestratorConfig:
@@ -261,13 +448,14 @@ class BaseOrchestrator(StackComponent, ABC):
         Returns:
             Orchestrator-specific return value.
         """
-        self._prepare_run(deployment=deployment)
+        self._prepare_run(deployment=deployment, stack=stack)
 
-        result = self.prepare_or_run_pipeline(
-            deployment=deployment, stack=stack
-        )
-
-        self._cleanup_run()
+        try:
+            result = self.prepare_or_run_pipeline(
+                deployment=deployment, stack=stack
+            )
+        finally:
+            self._cleanup_run()
 
         return result
 
@@ -280,74 +468,88 @@ class BaseOrchestrator(StackComponent, ABC):
             step: The step to be executed
             run_name: The unique run name
 
+        Returns:
+            The execution info of the step.
+        """
+        assert self._active_context
+
+        with self._active_context.borrow_mlmd_connection() as mlmd_connection:
+            return self._run_step(
+                step, run_name=run_name, mlmd_connection=mlmd_connection
+            )
+
+    def _run_step(
+        self,
+        step: "Step",
+        run_name: Optional[str],
+        mlmd_connection: metadata.Metadata,
+    ) -> Optional[data_types.ExecutionInfo]:
+        """Sets up a component launcher and executes the given step.
+
+        Args:
+            step: The step to be executed
+            run_name: The unique run name
+            mlmd_connection: The MLMD connection to use for the step.
+
         Returns:
             The execution info of the step.
         """
         assert self._active_deployment
         assert self._active_pb2_pipeline
+        assert self._active_context
 
-        self._ensure_artifact_classes_loaded(step.config)
+        with _STEP_PREPARATION_LOCK:
+            self._ensure_artifact_classes_loaded(step.config)
 
-        step_name = step.config.name
-        pb2_pipeline = self._active_pb2_pipeline
+            step_name = step.config.name
+            pb2_pipeline = self._active_pb2_pipeline
 
-        run_name = run_name or self._active_deployment.run_name
-        # Substitute the runtime parameter to be a concrete run_id, it is
-        # important for this to be unique for each run.
-        runtime_parameter_utils.substitute_runtime_parameter(
-            pb2_pipeline,
-            {PIPELINE_RUN_ID_PARAMETER_NAME: run_name},
-        )
+            run_name = run_name or self._active_deployment.run_name
+            self._active_context.substitute_run_name(run_name)
 
-        # Extract the deployment_configs and use it to access the executor and
-        # custom driver spec
-        deployment_config = runner_utils.extract_local_deployment_config(
-            pb2_pipeline
-        )
-        executor_spec = runner_utils.extract_executor_spec(
-            deployment_config, step_name
-        )
-        custom_driver_spec = runner_utils.extract_custom_driver_spec(
-            deployment_config, step_name
-        )
-
-        metadata_connection_cfg = Client().zen_store.get_metadata_config()
+            # Use the deployment config to access the executor and custom
+            # driver spec
+            deployment_config = self._active_context.deployment_config
+            executor_spec = runner_utils.extract_executor_spec(
+                deployment_config, step_name
+            )
+            custom_driver_spec = runner_utils.extract_custom_driver_spec(
+                deployment_config, step_name
+            )
 
-        # At this point the active metadata store is queried for the
-        # metadata_connection
-        stack = Client().active_stack
-        executor_operator = self._get_executor_operator(
-            step_operator=step.config.step_operator
-        )
-        custom_executor_operators = {
-            executable_spec_pb2.PythonClassExecutableSpec: executor_operator
-        }
-
-        step_run_info = StepRunInfo(
-            config=step.config,
-            pipeline=self._active_deployment.pipeline,
-            run_name=run_name,
-        )
+            stack = self._active_context.stack
+            executor_operator = self._get_executor_operator(
+                step_operator=step.config.step_operator
+            )
+            custom_executor_operators = {
+                executable_spec_pb2.PythonClassExecutableSpec: executor_operator
+            }
+
+            step_run_info = StepRunInfo(
+                config=step.config,
+                pipeline=self._active_deployment.pipeline,
+                run_name=run_name,
+            )
 
-        # The protobuf node for the current step is loaded here.
-        pipeline_node = self._get_node_with_step_name(step_name)
+            # The protobuf node for the current step is loaded here.
+            pipeline_node = self._get_node_with_step_name(step_name)
 
-        proto_utils.add_mlmd_contexts(
-            pipeline_node=pipeline_node,
-            step=step,
-            deployment=self._active_deployment,
-            stack=stack,
-        )
+            proto_utils.add_mlmd_contexts(
+                pipeline_node=pipeline_node,
+                step=step,
+                deployment=self._active_deployment,
+                stack=stack,
+            )
 
-        component_launcher = launcher.Launcher(
-            pipeline_node=pipeline_node,
-            mlmd_connection=metadata.Metadata(metadata_connection_cfg),
-            pipeline_info=pb2_pipeline.pipeline_info,
-            pipeline_runtime_spec=pb2_pipeline.runtime_spec,
-            executor_spec=executor_spec,
-            custom_driver_spec=custom_driver_spec,
-            custom_executor_operators=custom_executor_operators,
-        )
+            component_launcher = launcher.Launcher(
+                pipeline_node=pipeline_node,
+                mlmd_connection=mlmd_connection,
+                pipeline_info=pb2_pipeline.pipeline_info,
+                pipeline_runtime_spec=pb2_pipeline.runtime_spec,
+                executor_spec=executor_spec,
+                custom_driver_spec=custom_driver_spec,
+                custom_executor_operators=custom_executor_operators,
+            )
 
         # If a step operator is used, the current environment will not be the
         # one executing the step function code and therefore we don't need to
@@ -355,11 +557,25 @@ class BaseOrchestrator(StackComponent, ABC):
         if step.config.step_operator:
             execution_info = self._execute_step(component_launcher)
         else:
-            stack.prepare_step_run(info=step_run_info)
+            from zenml.steps.step_metrics import (
+                STACK_PREPARATION_PHASE,
+                record_pending_phase,
+            )
+
+            # The stack is shared by all steps of the run, so steps running in
+            # parallel threads prepare and clean it up one at a time
+            with _STEP_PREPARATION_LOCK:
+                start_time = time.perf_counter()
+                stack.prepare_step_run(info=step_run_info)
+                duration = time.perf_counter() - start_time
+            # The step executor runs in this thread and picks up the duration
+            # to store it with the other step metrics
+            record_pending_phase(STACK_PREPARATION_PHASE, duration)
             try:
                 execution_info = self._execute_step(component_launcher)
             finally:
-                stack.cleanup_step_run(info=step_run_info)
+                with _STEP_PREPARATION_LOCK:
+                    stack.cleanup_step_run(info=step_run_info)
 
         return execution_info
 
@@ -384,11 +600,15 @@ class BaseOrchestrator(StackComponent, ABC):
 
         return not step.config.resource_settings.empty
 
-    def _prepare_run(self, deployment: "PipelineDeployment") -> None:
+    def _prepare_run(
+        self, deployment: "PipelineDeployment", stack: Optional[Stack] = None
+    ) -> None:
         """Prepares a run.
 
         Args:
             deployment: The deployment to prepare.
+            stack: The stack on which the pipeline runs. If not given, the
+                active stack is used.
         """
         self._active_deployment = deployment
 
@@ -398,21 +618,31 @@ class BaseOrchestrator(StackComponent, ABC):
         )
         json_format.Parse(pb2_pipeline_json, pb2_pipeline)
         self._active_pb2_pipeline = pb2_pipeline
+        self._active_context = RunExecutionContext(
+            pb2_pipeline=pb2_pipeline, stack=stack
+        )
 
     def _cleanup_run(self) -> None:
         """Cleans up the active run."""
+        if self._active_context:
+            self._active_context.close()
         self._active_deployment = None
         self._active_pb2_pipeline = None
+        self._active_context = None
 
-    @staticmethod
     def _ensure_artifact_classes_loaded(
+        self,
         step_configuration: "StepConfiguration",
     ) -> None:
         """Ensures that all artifact classes for a step are loaded.
 
+        Sources that were already validated for another step of the same run
+        are skipped.
+
         Args:
             step_configuration: A step configuration.
         """
+        assert self._active_context
         artifact_class_sources = set(
             input_.artifact_source
             for input_ in step_configuration.inputs.values()
@@ -421,12 +651,14 @@ class BaseOrchestrator(StackComponent, ABC):
             for output in step_configuration.outputs.values()
         )
 
-        for source in artifact_class_sources:
+        validated_sources = self._active_context.validated_artifact_sources
+        for source in artifact_class_sources - validated_sources:
             # Tfx depends on these classes being loaded so it can detect the
             # correct artifact class
-            source_utils.validate_source_class(
+            if source_utils.validate_source_class(
                 source, expected_class=BaseArtifact
-            )
+            ):
+                validated_sources.add(source)
 
     @staticmethod
     def _execute_step(
@@ -488,13 +720,11 @@ class BaseOrchestrator(StackComponent, ABC):
             KeyError: If the step name is not found in the pipeline.
         """
         assert self._active_pb2_pipeline
+        assert self._active_context
 
-        for node in self._active_pb2_pipeline.nodes:
-            if (
-                node.WhichOneof("node") == "pipeline_node"
-                and node.pipeline_node.node_info.id == step_name
-            ):
-                return node.pipeline_node
+        node = self._active_context.step_nodes.get(step_name)
+        if node is not None:
+            return node
 
         raise KeyError(
             f"Step {step_name} not found in Pipeline "
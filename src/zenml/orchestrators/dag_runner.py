@@ -0,0 +1,357 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""DAG (Directed Acyclic Graph) Runners."""
+
+import threading
+import time
+from collections import defaultdict
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def reverse_dag(dag: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Reverse a DAG.
+
+    Args:
+        dag: Adjacency list representation of a DAG.
+
+    Returns:
+        Adjacency list representation of the reversed DAG.
+    """
+    reversed_dag = defaultdict(list)
+
+    # Reverse all edges in the graph.
+    for node, upstream_nodes in dag.items():
+        for upstream_node in upstream_nodes:
+            reversed_dag[upstream_node].append(node)
+
+    # Add nodes without incoming edges back in.
+    for node in dag:
+        if node not in reversed_dag:
+            reversed_dag[node] = []
+
+    return reversed_dag
+
+
+class NodeStatus(Enum):
+    """Status of the execution of a node."""
+
+    WAITING = "Waiting"
+    RUNNING = "Running"
+    COMPLETED = "Completed"
+    FAILED = "Failed"
+
+
+def get_critical_path_lengths(dag: Dict[str, List[str]]) -> Dict[str, int]:
+    """Computes the length of the longest path from each node to a leaf.
+
+    Args:
+        dag: Adjacency list representation of a DAG.
+
+    Returns:
+        The number of nodes on the longest downstream path of each node,
+        including the node itself. Nodes that are part of a cycle are
+        omitted.
+    """
+    reversed_dag = reverse_dag(dag)
+    lengths: Dict[str, int] = {}
+
+    # Process the nodes in reverse topological order, starting at the leaves.
+    remaining_downstream = {
+        node: len(downstream_nodes)
+        for node, downstream_nodes in reversed_dag.items()
+    }
+    leaves = [node for node, count in remaining_downstream.items() if not count]
+    while leaves:
+        node = leaves.pop()
+        lengths[node] = 1 + max(
+            (lengths[downstream] for downstream in reversed_dag[node]),
+            default=0,
+        )
+        for upstream_node in dag.get(node, []):
+            remaining_downstream[upstream_node] -= 1
+            if not remaining_downstream[upstream_node]:
+                leaves.append(upstream_node)
+
+    return lengths
+
+
+class ThreadedDagRunner:
+    """Multi-threaded DAG Runner.
+
+    This class expects a DAG of strings in adjacency list representation, as
+    well as a custom `run_fn` as input, then calls `run_fn(node)` for each
+    string node in the DAG.
+
+    Steps that can be executed in parallel will be started in separate threads.
+    If more nodes can run than allowed by the maximum parallelism, the nodes
+    with the longest downstream path are started first, since they determine
+    how long the whole DAG takes to run.
+
+    Failed nodes are retried with an exponential backoff. If a node fails
+    permanently, none of its downstream nodes are run. Unless the runner
+    fails fast, all other nodes still run, and the first error is raised once
+    they finished.
+    """
+
+    def __init__(
+        self,
+        dag: Dict[str, List[str]],
+        run_fn: Callable[[str], Any],
+        max_parallelism: Optional[int] = None,
+        fail_fast: bool = False,
+        max_retries: int = 0,
+        retry_backoff: float = 1.0,
+        on_retry: Optional[Callable[[str, float], Any]] = None,
+    ) -> None:
+        """Define attributes and initialize all nodes in waiting state.
+
+        Args:
+            dag: Adjacency list representation of a DAG.
+                E.g.: [(1->2), (1->3), (2->4), (3->4)] should be represented as
+                `dag={2: [1], 3: [1], 4: [2, 3]}`
+            run_fn: A function `run_fn(node)` that runs a single node
+            max_parallelism: The maximum number of nodes that run at the same
+                time. If not set, all nodes that can run are run at once.
+            fail_fast: If True, no new nodes are started once a node failed
+                permanently. Nodes that are already running still finish.
+            max_retries: How often a failed node is retried.
+            retry_backoff: Seconds to wait before the first retry of a failed
+                node. The wait time doubles with every further retry.
+            on_retry: A function `on_retry(node, backoff)` that is called
+                once a failed node is scheduled to be retried after `backoff`
+                seconds.
+
+        Raises:
+            ValueError: If the maximum parallelism is not positive or the
+                retry settings are negative.
+        """
+        if max_parallelism is not None and max_parallelism < 1:
+            raise ValueError(
+                f"Maximum parallelism must be positive, got {max_parallelism}."
+            )
+        if max_retries < 0 or retry_backoff < 0:
+            raise ValueError(
+                f"Retry settings must not be negative, got "
+                f"max_retries={max_retries} and retry_backoff={retry_backoff}."
+            )
+        self.dag = dag
+        self.reversed_dag = reverse_dag(dag)
+        self.run_fn = run_fn
+        self.nodes = dag.keys()
+        self.node_states = {node: NodeStatus.WAITING for node in self.nodes}
+        self.max_parallelism = max_parallelism
+        self.fail_fast = fail_fast
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.on_retry = on_retry
+
+        critical_path_lengths = get_critical_path_lengths(dag)
+        # Longest downstream path first, ties are broken by the DAG order
+        self._priorities = {
+            node: (-critical_path_lengths.get(node, 0), index)
+            for index, node in enumerate(self.nodes)
+        }
+        self._condition = threading.Condition()
+        self._attempts: Dict[str, int] = defaultdict(int)
+        self._not_before: Dict[str, float] = {}
+        self._errors: List[BaseException] = []
+
+    def _can_run(self, node: str) -> bool:
+        """Determine whether a node is ready to be run.
+
+        This is the case if the node has not run yet, all of its upstream
+        node have already completed and it is not waiting for a retry.
+
+        Args:
+            node: The node.
+
+        Returns:
+            True if the node can run else False.
+        """
+        # Check that node has not run yet.
+        if not self.node_states[node] == NodeStatus.WAITING:
+            return False
+
+        # Check that all upstream nodes of this node have already completed.
+        for upstream_node in self.dag[node]:
+            if not self.node_states[upstream_node] == NodeStatus.COMPLETED:
+                return False
+
+        return time.monotonic() >= self._not_before.get(node, 0.0)
+
+    def _run_node(self, node: str) -> None:
+        """Run a single node.
+
+        Calls the user-defined run_fn and updates the node status afterwards.
+        If the node failed and has retries left, it is scheduled to run again
+        after the backoff time.
+
+        Args:
+            node: The node.
+        """
+        try:
+            self.run_fn(node)
+        except Exception as e:
+            with self._condition:
+                self._attempts[node] += 1
+                attempts = self._attempts[node]
+                if attempts <= self.max_retries and not self._is_stopped:
+                    backoff = self.retry_backoff * 2 ** (attempts - 1)
+                    if self.on_retry is not None:
+                        self._notify_retry(node, backoff)
+                    logger.warning(
+                        f"Node `{node}` failed: {e}. Retrying in "
+                        f"{backoff:.1f}s (retry {attempts}/"
+                        f"{self.max_retries})."
+                    )
+                    self._not_before[node] = time.monotonic() + backoff
+                    self.node_states[node] = NodeStatus.WAITING
+                else:
+                    logger.error(f"Node `{node}` failed: {e}")
+                    self.node_states[node] = NodeStatus.FAILED
+                    self._errors.append(e)
+                self._condition.notify_all()
+            return
+
+        with self._condition:
+            self.node_states[node] = NodeStatus.COMPLETED
+            self._condition.notify_all()
+
+    def _notify_retry(self, node: str, backoff: float) -> None:
+        """Calls the `on_retry` function for a node that will be retried.
+
+        Failures are only logged, as they must not stop the retry.
+
+        Args:
+            node: The node.
+            backoff: Seconds until the node is retried.
+        """
+        assert self.on_retry is not None
+        try:
+            self.on_retry(node, backoff)
+        except Exception as e:
+            logger.warning(f"Failed to record retry of node `{node}`: {e}")
+
+    def _run_node_in_thread(self, node: str) -> threading.Thread:
+        """Run a single node in a separate thread.
+
+        First updates the node status to running.
+        Then calls self._run_node() in a new thread and returns the thread.
+
+        Args:
+            node: The node.
+
+        Returns:
+            The thread in which the node was run.
+        """
+        # Update node status to running.
+        assert self.node_states[node] == NodeStatus.WAITING
+        self.node_states[node] = NodeStatus.RUNNING
+
+        # Run node in new thread.
+        thread = threading.Thread(target=self._run_node, args=(node,))
+        thread.start()
+        return thread
+
+    @property
+    def _is_stopped(self) -> bool:
+        """Whether no new nodes should be started anymore.
+
+        Returns:
+            True if the runner fails fast and a node failed permanently.
+        """
+        return self.fail_fast and bool(self._errors)
+
+    def _get_wait_timeout(self) -> Optional[float]:
+        """Gets the time until the next node waiting for a retry can run.
+
+        Returns:
+            The time in seconds or None if no node is waiting for a retry.
+        """
+        now = time.monotonic()
+        retry_times = [
+            not_before
+            for node, not_before in self._not_before.items()
+            if self.node_states[node] == NodeStatus.WAITING and not_before > now
+        ]
+        if not retry_times:
+            return None
+        return min(retry_times) - now
+
+    def run(self) -> None:
+        """Call `self.run_fn` on all nodes in `self.dag`.
+
+        The order of execution is determined using topological sort.
+        Each node is run in a separate thread to enable parallelism.
+
+        Raises:
+            Exception: The first error raised by the `run_fn` of a failed node.
+        """
+        threads = []
+        with self._condition:
+            while True:
+                num_running = sum(
+                    state == NodeStatus.RUNNING
+                    for state in self.node_states.values()
+                )
+                if not self._is_stopped:
+                    ready_nodes = sorted(
+                        (node for node in self.nodes if self._can_run(node)),
+                        key=self._priorities.__getitem__,
+                    )
+                    for node in ready_nodes:
+                        if (
+                            self.max_parallelism is not None
+                            and num_running >= self.max_parallelism
+                        ):
+                            break
+                        threads.append(self._run_node_in_thread(node))
+                        num_running += 1
+
+                wait_timeout = (
+                    None if self._is_stopped else self._get_wait_timeout()
+                )
+                if num_running == 0 and wait_timeout is None:
+                    break
+                # Wait until a node finished or a retry is due.
+                self._condition.wait(timeout=wait_timeout)
+
+        # Wait till all threads have finished.
+        for thread in threads:
+            thread.join()
+
+        # Make sure all nodes were run, otherwise print a warning.
+        for node in self.nodes:
+            if self.node_states[node] != NodeStatus.WAITING:
+                continue
+            if self._is_stopped:
+                logger.warning(
+                    f"Node `{node}` was never run, because the run was "
+                    f"stopped after a node failed."
+                )
+            else:
+                upstream_nodes = self.dag[node]
+                logger.warning(
+                    f"Node `{node}` was never run, because it was still"
+                    f" waiting for the following nodes: `{upstream_nodes}`."
+                )
+
+        # Raise the first error of all failed nodes.
+        if self._errors:
+            raise self._errors[0]
@@ -13,7 +13,9 @@
 #  permissions and limitations under the License.
 """Implementation of the ZenML local orchestrator."""
 
-from typing import TYPE_CHECKING, Any, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Type, cast
+
+from pydantic import validator
 
 from zenml.logger import get_logger
 from zenml.orchestrators import BaseOrchestrator
@@ -21,6 +23,7 @@ from zenml.orchestrators.base_orchestrator import (
     BaseOrchestratorConfig,
     BaseOrchestratorFlavor,
 )
+from zenml.orchestrators.dag_runner import ThreadedDagRunner
 from zenml.stack import Stack
 
 if TYPE_CHECKING:
@@ -32,16 +35,27 @@ logger = get_logger(__name__)
 class LocalOrchestrator(BaseOrchestrator):
     """Orchestrator responsible for running pipelines locally.
 
-    This orchestrator does not allow for concurrent execution of steps and also
-    does not support running on a schedule.
+    By default, this orchestrator runs the steps of a pipeline one after
+    another. If the `max_parallelism` of its config is larger than one,
+    independent steps run in parallel threads instead. This orchestrator does
+    not support running on a schedule.
     """
 
+    @property
+    def config(self) -> "LocalOrchestratorConfig":
+        """Returns the `LocalOrchestratorConfig` config.
+
+        Returns:
+            The configuration.
+        """
+        return cast(LocalOrchestratorConfig, self._config)
+
     def prepare_or_run_pipeline(
         self,
         deployment: "PipelineDeployment",
         stack: "Stack",
     ) -> Any:
-        """Iterates through all steps and executes them sequentially.
+        """Iterates through all steps and executes them.
 
         Args:
             deployment: The pipeline deployment to prepare or run.
@@ -54,7 +68,6 @@ class LocalOrchestrator(BaseOrchestrator):
                 "and the pipeline will be run immediately."
             )
 
-        # Run each step
         for step in deployment.steps.values():
             if self.requires_resources_in_orchestration_environment(step):
                 logger.warning(
@@ -64,13 +77,56 @@ class LocalOrchestrator(BaseOrchestrator):
                     step.config.name,
                 )
 
-            self.run_step(
-                step=step,
-            )
+        if self.config.max_parallelism == 1:
+            # Run each step
+            for step in deployment.steps.values():
+                self.run_step(
+                    step=step,
+                )
+            return
+
+        steps = {step.config.name: step for step in deployment.steps.values()}
+        pipeline_dag: Dict[str, List[str]] = {
+            step_name: step.spec.upstream_steps
+            for step_name, step in steps.items()
+        }
+        ThreadedDagRunner(
+            dag=pipeline_dag,
+            run_fn=lambda step_name: self.run_step(step=steps[step_name]),
+            max_parallelism=self.config.max_parallelism,
+        ).run()
 
 
 class LocalOrchestratorConfig(BaseOrchestratorConfig):
-    """Local orchestrator config."""
+    """Local orchestrator config.
+
+    Attributes:
+        max_parallelism: The maximum number of steps that run at the same
+            time. Steps only run in parallel if none of them depends on the
+            outputs of another one. Running steps in parallel requires all
+            stack components to support concurrent steps in a single process.
+    """
+
+    max_parallelism: int = 1
+
+    @validator("max_parallelism")
+    def _validate_max_parallelism(cls, max_parallelism: int) -> int:
+        """Validates that the maximum parallelism is positive.
+
+        Args:
+            max_parallelism: The maximum parallelism to be validated.
+
+        Returns:
+            The validated maximum parallelism.
+
+        Raises:
+            ValueError: If the maximum parallelism is not positive.
+        """
+        if max_parallelism < 1:
+            raise ValueError(
+                f"Maximum parallelism must be positive, got {max_parallelism}."
+            )
+        return max_parallelism
 
     @property
     def is_local(self) -> bool:
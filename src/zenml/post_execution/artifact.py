@@ -16,6 +16,7 @@
 from typing import TYPE_CHECKING, Any, Optional, Type
 from uuid import UUID
 
+from zenml.artifact_stores.artifact_cache import reading_whole_files
 from zenml.logger import get_logger
 from zenml.models.pipeline_models import ArtifactModel
 from zenml.utils import source_utils
@@ -188,7 +189,8 @@ class ArtifactView:
         #  works because materializers only require a `.uri` property at the
         #  moment.
         materializer = materializer_class(self)  # type: ignore[arg-type]
-        return materializer.handle_input(output_data_type)
+        with reading_whole_files():
+            return materializer.handle_input(output_data_type)
 
     def __repr__(self) -> str:
         """Returns a string representation of this artifact.
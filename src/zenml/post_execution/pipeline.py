@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """Implementation of the post-execution pipeline."""
 
-from typing import TYPE_CHECKING, Any, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Type, Union
 from uuid import UUID
 
 from zenml.client import Client
@@ -195,11 +195,42 @@ class PipelineView:
         """
         # Do not cache runs as new runs might appear during this objects
         # lifecycle
-        runs = Client().zen_store.list_runs(
+        return list(self.iterate_runs())
+
+    @property
+    def num_runs(self) -> int:
+        """Returns the number of stored runs of this pipeline.
+
+        Returns:
+            The number of stored runs of this pipeline.
+        """
+        return Client().zen_store.count_runs(
+            project_name_or_id=self._model.project,
+            pipeline_id=self._model.id,
+        )
+
+    def iterate_runs(
+        self, latest_first: bool = False
+    ) -> Iterator["PipelineRunView"]:
+        """Lazily iterates over all stored runs of this pipeline.
+
+        The runs are fetched page by page while iterating, so stopping the
+        iteration early avoids loading the remaining runs.
+
+        Args:
+            latest_first: If True, the runs are returned in reverse
+                chronological order.
+
+        Yields:
+            The stored runs of this pipeline.
+        """
+        runs = Client().iterate_runs(
             project_name_or_id=self._model.project,
             pipeline_id=self._model.id,
+            sort_by="-created" if latest_first else "created",
         )
-        return [PipelineRunView(run) for run in runs]
+        for run in runs:
+            yield PipelineRunView(run)
 
     def get_run_for_completed_step(self, step_name: str) -> "PipelineRunView":
         """Ascertains which pipeline run produced the cached artifact of a given step.
@@ -216,7 +247,7 @@ class PipelineView:
         """
         orig_pipeline_run = None
 
-        for run in reversed(self.runs):
+        for run in self.iterate_runs(latest_first=True):
             try:
                 step = run.get_step(step_name)
                 if step.is_completed:
@@ -65,7 +65,7 @@ def get_unlisted_runs() -> List["PipelineRunView"]:
         A list of post-execution run views.
     """
     client = Client()
-    runs = client.zen_store.list_runs(
+    runs = client.iterate_runs(
         project_name_or_id=client.active_project.id,
         unlisted=True,
     )
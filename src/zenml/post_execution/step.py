@@ -125,6 +125,23 @@ class StepView:
         """
         return self._model.parameters
 
+    @property
+    def metrics(self) -> Dict[str, float]:
+        """Timing and resource usage metrics of this step.
+
+        The metrics contain the duration in seconds of each phase of the step
+        run (e.g. `step_function_duration` or
+        `output_materialization_duration`), the peak resident set size of the
+        step process in bytes and the number of bytes the step process read
+        and wrote. Resource usage metrics that aren't available on the
+        platform the step ran on are missing. Cached and unfinished steps
+        don't have any metrics.
+
+        Returns:
+            The metrics of this step.
+        """
+        return self._model.metrics
+
     @property
     def step_configuration(self) -> Dict[str, Any]:
         """Returns the step configuration.
@@ -0,0 +1,161 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Timing and resource usage metrics of step runs."""
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+STACK_PREPARATION_PHASE = "stack_preparation"
+INPUT_MATERIALIZATION_PHASE = "input_materialization"
+STEP_FUNCTION_PHASE = "step_function"
+OUTPUT_MATERIALIZATION_PHASE = "output_materialization"
+
+PEAK_RSS_METRIC = "peak_rss_bytes"
+READ_BYTES_METRIC = "read_bytes"
+WRITE_BYTES_METRIC = "write_bytes"
+
+_pending_phases = threading.local()
+
+
+def record_pending_phase(phase: str, duration: float) -> None:
+    """Records the duration of a phase that happened before a step started.
+
+    Some phases of a step run, like preparing the stack, happen in the
+    orchestrator before the step executor starts. Their durations are handed
+    over to the next `StepMetricsRecorder` created in the same thread.
+
+    Args:
+        phase: The name of the phase.
+        duration: The duration of the phase in seconds.
+    """
+    if not hasattr(_pending_phases, "durations"):
+        _pending_phases.durations = {}
+    _pending_phases.durations[phase] = duration
+
+
+def _pop_pending_phases() -> Dict[str, float]:
+    """Gets and removes the pending phase durations of the current thread.
+
+    Returns:
+        The pending phase durations.
+    """
+    durations: Dict[str, float] = getattr(_pending_phases, "durations", {})
+    _pending_phases.durations = {}
+    return durations
+
+
+def _get_peak_rss_bytes() -> Optional[int]:
+    """Gets the peak resident set size of the current process.
+
+    Returns:
+        The peak resident set size in bytes or `None` if it is not available
+        on this platform.
+    """
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return int(peak_rss) if sys.platform == "darwin" else int(peak_rss) * 1024
+
+
+def _get_io_bytes() -> Optional[Tuple[int, int]]:
+    """Gets the number of bytes the current process read and wrote so far.
+
+    This includes network I/O, e.g. when reading from or writing to a remote
+    artifact store.
+
+    Returns:
+        The number of bytes read and written or `None` if the counters are
+        not available on this platform.
+    """
+    try:
+        with open("/proc/self/io", "r") as f:
+            counters = dict(
+                line.split(":", maxsplit=1) for line in f.read().splitlines()
+            )
+        return int(counters["rchar"]), int(counters["wchar"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+class StepMetricsRecorder:
+    """Records the timing and resource usage of a step run.
+
+    The resource usage is measured for the whole process. If multiple steps
+    run in parallel threads of the same process, their resource usage is
+    therefore attributed to all of them.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the recorder and takes over pending phase durations."""
+        self.durations: Dict[str, float] = _pop_pending_phases()
+        self._start_io_bytes = _get_io_bytes()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Context manager that records the duration of a phase.
+
+        Durations of phases that are entered multiple times are summed up.
+
+        Args:
+            name: The name of the phase.
+
+        Yields:
+            Nothing.
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start_time
+            self.durations[name] = self.durations.get(name, 0.0) + duration
+
+    def get_metrics(self) -> Dict[str, float]:
+        """Gets all metrics recorded so far.
+
+        Returns:
+            The phase durations in seconds, suffixed with `_duration`, and the
+            resource usage metrics that are available on this platform.
+        """
+        metrics = {
+            f"{phase}_duration": duration
+            for phase, duration in self.durations.items()
+        }
+
+        peak_rss = _get_peak_rss_bytes()
+        if peak_rss is not None:
+            metrics[PEAK_RSS_METRIC] = float(peak_rss)
+
+        io_bytes = _get_io_bytes()
+        if io_bytes is not None and self._start_io_bytes is not None:
+            metrics[READ_BYTES_METRIC] = float(
+                io_bytes[0] - self._start_io_bytes[0]
+            )
+            metrics[WRITE_BYTES_METRIC] = float(
+                io_bytes[1] - self._start_io_bytes[1]
+            )
+
+        logger.debug("Step metrics: %s", metrics)
+        return metrics
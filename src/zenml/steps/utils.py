@@ -50,6 +50,7 @@ from tfx.orchestration.portable import outputs_utils
 from tfx.proto.orchestration import execution_result_pb2
 from tfx.types import component_spec
 
+from zenml.artifact_stores.artifact_cache import reading_whole_files
 from zenml.artifacts.base_artifact import BaseArtifact
 from zenml.config.step_configurations import StepConfiguration
 from zenml.config.step_run_info import StepRunInfo
@@ -59,13 +60,22 @@ from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.steps.step_context import StepContext
 from zenml.steps.step_environment import StepEnvironment
+from zenml.steps.step_metrics import (
+    INPUT_MATERIALIZATION_PHASE,
+    OUTPUT_MATERIALIZATION_PHASE,
+    STEP_FUNCTION_PHASE,
+    StepMetricsRecorder,
+)
 from zenml.steps.step_output import Output
 from zenml.utils import proto_utils, source_utils
 
 if TYPE_CHECKING:
     from tfx.dsl.component.experimental.decorators import _SimpleComponent
 
-    from zenml.config.step_configurations import ArtifactConfiguration
+    from zenml.config.step_configurations import (
+        ArtifactConfiguration,
+        PartialStepConfiguration,
+    )
     from zenml.steps.base_step import BaseStep
 
 logger = get_logger(__name__)
@@ -79,6 +89,9 @@ PARAM_CREATED_BY_FUNCTIONAL_API = "created_by_functional_api"
 PARAM_STEP_OPERATOR = "step_operator"
 PARAM_EXPERIMENT_TRACKER = "experiment_tracker"
 INTERNAL_EXECUTION_PARAMETER_PREFIX = "zenml-"
+STEP_METRICS_PROPERTY_NAME = (
+    INTERNAL_EXECUTION_PARAMETER_PREFIX + "step_metrics"
+)
 INSTANCE_CONFIGURATION = "INSTANCE_CONFIGURATION"
 PARAM_OUTPUT_ARTIFACTS = "output_artifacts"
 PARAM_OUTPUT_MATERIALIZERS = "output_materializers"
@@ -118,7 +131,7 @@ def parse_return_type_annotations(
     """Parse the returns of a step function into a dict of resolved types.
 
     Called within `BaseStepMeta.__new__()` to define `cls.OUTPUT_SIGNATURE`.
-    Called within `Do()` to resolve type annotations.
+    Called within `create_executor_class()` to resolve type annotations.
 
     Args:
         step_annotations: Type annotations of the step function.
@@ -241,11 +254,30 @@ def create_executor_class(
         The executor class.
     """
     executor_class_name = _get_executor_class_name(step.configuration.name)
+
+    # Parse the step function signature once here instead of on every
+    # execution of the step
+    spec = inspect.getfullargspec(inspect.unwrap(step.entrypoint))
+    args = spec.args
+    if args and args[0] == "self":
+        args.pop(0)
+    input_types = {
+        arg: resolve_type_annotation(spec.annotations.get(arg, None))
+        for arg in args
+    }
+    output_types = parse_return_type_annotations(spec.annotations)
+
     executor_class = type(
         executor_class_name,
         (_ZenMLStepExecutor,),
-        {"_STEP": step, "__module__": __name__},
+        {
+            "_STEP": step,
+            "_INPUT_TYPES": input_types,
+            "_OUTPUT_TYPES": output_types,
+            "__module__": __name__,
+        },
     )
+    executor_class._get_cached_configuration()
 
     # Add the executor class to the current module, so tfx can load it
     module = sys.modules[__name__]
@@ -286,6 +318,39 @@ class _ZenMLStepExecutor(BaseExecutor):
     if TYPE_CHECKING:
         _STEP: ClassVar["BaseStep"]
 
+    # Resolved types of the step function inputs and outputs
+    _INPUT_TYPES: ClassVar[Dict[str, Any]] = {}
+    _OUTPUT_TYPES: ClassVar[Dict[str, Any]] = {}
+
+    # The step configuration is parsed once and only parsed again if the
+    # step gets reconfigured after the executor class was created, e.g. when
+    # the compiler applies the run configuration
+    _CACHED_CONFIGURATION_SOURCE: ClassVar[
+        Optional["PartialStepConfiguration"]
+    ] = None
+    _CACHED_CONFIGURATION: ClassVar[Optional[StepConfiguration]] = None
+    _CACHED_OUTPUT_MATERIALIZERS: ClassVar[
+        Optional[Dict[str, Type[BaseMaterializer]]]
+    ] = None
+
+    @classmethod
+    def _get_cached_configuration(cls) -> StepConfiguration:
+        """Gets the parsed configuration of the step to execute.
+
+        Returns:
+            The step configuration.
+        """
+        if (
+            cls._CACHED_CONFIGURATION is None
+            or cls._CACHED_CONFIGURATION_SOURCE is not cls._STEP.configuration
+        ):
+            cls._CACHED_CONFIGURATION_SOURCE = cls._STEP.configuration
+            cls._CACHED_CONFIGURATION = StepConfiguration.parse_obj(
+                cls._STEP.configuration
+            )
+            cls._CACHED_OUTPUT_MATERIALIZERS = None
+        return cls._CACHED_CONFIGURATION
+
     @property
     def configuration(self) -> StepConfiguration:
         """Configuration of the step to execute.
@@ -293,23 +358,32 @@ class _ZenMLStepExecutor(BaseExecutor):
         Returns:
             The step configuration.
         """
-        return StepConfiguration.parse_obj(self._STEP.configuration)
+        return self._get_cached_configuration()
 
     def _load_output_materializers(self) -> Dict[str, Type[BaseMaterializer]]:
         """Loads the output materializers for the step.
 
+        The materializer classes are only loaded on the first execution of the
+        step, so environments that never execute the step (e.g. orchestrators
+        running the step with a step operator) don't need to be able to import
+        them.
+
         Returns:
             The step output materializers.
         """
-        materializers = {}
-        for name, output in self.configuration.outputs.items():
-            materializer_class: Type[
-                BaseMaterializer
-            ] = source_utils.load_and_validate_class(
-                output.materializer_source, expected_class=BaseMaterializer
-            )
-            materializers[name] = materializer_class
-        return materializers
+        configuration = self.configuration
+        cls = type(self)
+        if cls._CACHED_OUTPUT_MATERIALIZERS is None:
+            materializers = {}
+            for name, output in configuration.outputs.items():
+                materializer_class: Type[
+                    BaseMaterializer
+                ] = source_utils.load_and_validate_class(
+                    output.materializer_source, expected_class=BaseMaterializer
+                )
+                materializers[name] = materializer_class
+            cls._CACHED_OUTPUT_MATERIALIZERS = materializers
+        return cls._CACHED_OUTPUT_MATERIALIZERS
 
     def _load_input_artifact(
         self, artifact: BaseArtifact, data_type: Type[Any]
@@ -338,7 +412,8 @@ class _ZenMLStepExecutor(BaseExecutor):
             artifact.materializer
         )
         materializer = materializer_class(artifact)
-        return materializer.handle_input(data_type=data_type)
+        with reading_whole_files():
+            return materializer.handle_input(data_type=data_type)
 
     def _store_output_artifact(
         self,
@@ -379,8 +454,10 @@ class _ZenMLStepExecutor(BaseExecutor):
         """
         from zenml.steps import BaseParameters
 
-        step_name = self.configuration.name
+        configuration = self.configuration
+        step_name = configuration.name
         step_function = self._STEP.entrypoint
+        metrics_recorder = StepMetricsRecorder()
         output_materializers = self._load_output_materializers()
 
         # remove all ZenML internal execution properties
@@ -394,16 +471,7 @@ class _ZenMLStepExecutor(BaseExecutor):
         function_params = {}
 
         # First, we parse the inputs, i.e., params and input artifacts.
-        spec = inspect.getfullargspec(inspect.unwrap(step_function))
-        args = spec.args
-
-        if args and args[0] == "self":
-            args.pop(0)
-
-        for arg in args:
-            arg_type = spec.annotations.get(arg, None)
-            arg_type = resolve_type_annotation(arg_type)
-
+        for arg, arg_type in self._INPUT_TYPES.items():
             if issubclass(arg_type, BaseParameters):
                 try:
                     config_object = arg_type.parse_obj(exec_properties)
@@ -430,9 +498,10 @@ class _ZenMLStepExecutor(BaseExecutor):
                 function_params[arg] = context
             else:
                 # At this point, it has to be an artifact, so we resolve
-                function_params[arg] = self._load_input_artifact(
-                    input_dict[arg][0], arg_type
-                )
+                with metrics_recorder.phase(INPUT_MATERIALIZATION_PHASE):
+                    function_params[arg] = self._load_input_artifact(
+                        input_dict[arg][0], arg_type
+                    )
 
         if self._context is None:
             raise RuntimeError(
@@ -444,7 +513,7 @@ class _ZenMLStepExecutor(BaseExecutor):
             self._context.pipeline_node
         )
         step_run_info = StepRunInfo(
-            config=self.configuration,
+            config=configuration,
             pipeline=pipeline_config,
             run_name=self._context.pipeline_run_id,
         )
@@ -457,11 +526,11 @@ class _ZenMLStepExecutor(BaseExecutor):
             pipeline_run_id=self._context.pipeline_run_id,
             step_name=step_name,
             step_run_info=step_run_info,
-            cache_enabled=self.configuration.enable_cache,
-        ):
+            cache_enabled=configuration.enable_cache,
+        ), metrics_recorder.phase(STEP_FUNCTION_PHASE):
             return_values = step_function(**function_params)
 
-        output_annotations = parse_return_type_annotations(spec.annotations)
+        output_annotations = self._OUTPUT_TYPES
         if len(output_annotations) > 0:
             # if there is only one output annotation (either directly specified
             # or contained in an `Output` tuple) we treat the step function
@@ -498,22 +567,28 @@ class _ZenMLStepExecutor(BaseExecutor):
                     )
 
                 materializer_class = output_materializers[output_name]
-                materializer_source = self.configuration.outputs[
+                materializer_source = configuration.outputs[
                     output_name
                 ].materializer_source
 
-                self._store_output_artifact(
-                    materializer_class=materializer_class,
-                    materializer_source=materializer_source,
-                    artifact=output_dict[output_name][0],
-                    data=return_value,
-                )
+                with metrics_recorder.phase(OUTPUT_MATERIALIZATION_PHASE):
+                    self._store_output_artifact(
+                        materializer_class=materializer_class,
+                        materializer_source=materializer_source,
+                        artifact=output_dict[output_name][0],
+                        data=return_value,
+                    )
 
         # Write the executor output to the artifact store so the executor
         # operator (potentially not running on the same machine) can read it
         # to populate the metadata store
         executor_output = execution_result_pb2.ExecutorOutput()
         outputs_utils.populate_output_artifact(executor_output, output_dict)
+        # Store the step metrics as execution property so they get published
+        # to the metadata store together with the step outputs
+        executor_output.execution_properties[
+            STEP_METRICS_PROPERTY_NAME
+        ].string_value = json.dumps(metrics_recorder.get_metrics())
 
         logger.debug(
             "Writing executor output to '%s'.",
@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Utility functions relating to Docker."""
 
+import hashlib
 import json
 import os
 import re
@@ -28,6 +29,7 @@ from typing import (
     cast,
 )
 
+import docker.errors as docker_errors
 from docker.client import DockerClient
 from docker.utils import build as docker_build_utils
 
@@ -64,6 +66,73 @@ def _parse_dockerignore(dockerignore_path: str) -> List[str]:
     return exclude_patterns
 
 
+def _get_dockerignore_path(
+    build_context_root: str, dockerignore: Optional[str] = None
+) -> Optional[str]:
+    """Gets the path of the dockerignore file to use for a build context.
+
+    Args:
+        build_context_root: Path to the build context root directory.
+        dockerignore: Optional path to a custom dockerignore file.
+
+    Returns:
+        The custom dockerignore path if given, otherwise the path of the
+        `.dockerignore` in the root of the build context if it exists.
+    """
+    if dockerignore:
+        return dockerignore
+
+    default_dockerignore_path = os.path.join(
+        build_context_root, ".dockerignore"
+    )
+    if fileio.exists(default_dockerignore_path):
+        return default_dockerignore_path
+
+    return None
+
+
+def get_build_context_digest(
+    build_context_root: str, dockerignore: Optional[str] = None
+) -> str:
+    """Computes a digest of the files that are part of a build context.
+
+    The digest includes the path, permissions and contents of all files that
+    are not excluded by the dockerignore file, so it changes whenever the
+    build context that would be sent to the Docker daemon changes.
+
+    Args:
+        build_context_root: Path to the build context root directory.
+        dockerignore: Optional path to a dockerignore file. If no value is
+            given, the .dockerignore in the root of the build context will be
+            used if it exists.
+
+    Returns:
+        The hex digest of the build context.
+    """
+    dockerignore = _get_dockerignore_path(
+        build_context_root=build_context_root, dockerignore=dockerignore
+    )
+    exclude_patterns = _parse_dockerignore(dockerignore) if dockerignore else []
+    files = docker_build_utils.exclude_paths(
+        build_context_root, patterns=exclude_patterns
+    )
+
+    digest = hashlib.sha256()
+    for file in sorted(files):
+        path = os.path.join(build_context_root, file)
+        digest.update(file.encode())
+        if os.path.islink(path):
+            digest.update(os.readlink(path).encode())
+        elif os.path.isfile(path):
+            digest.update(oct(os.stat(path).st_mode & 0o777).encode())
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
 def _create_custom_build_context(
     dockerfile_contents: str,
     build_context_root: Optional[str] = None,
@@ -98,9 +167,10 @@ def _create_custom_build_context(
         default_dockerignore_path = os.path.join(
             build_context_root, ".dockerignore"
         )
-        if dockerignore or fileio.exists(default_dockerignore_path):
-            if not dockerignore:
-                dockerignore = default_dockerignore_path
+        dockerignore = _get_dockerignore_path(
+            build_context_root=build_context_root, dockerignore=dockerignore
+        )
+        if dockerignore:
             logger.info(
                 "Using dockerignore file `%s` to create docker build context.",
                 dockerignore,
@@ -290,6 +360,59 @@ def get_image_digest(image_name: str) -> Optional[str]:
         return None
 
 
+def get_image_id(image_name: str) -> Optional[str]:
+    """Gets the ID of a local image.
+
+    Args:
+        image_name: Name of the image to get the ID for.
+
+    Returns:
+        The ID of the image or `None` if it doesn't exist locally.
+    """
+    docker_client = DockerClient.from_env()
+    try:
+        return cast(str, docker_client.images.get(image_name).id)
+    except docker_errors.ImageNotFound:
+        return None
+
+
+def get_registry_digest(image_name: str) -> Optional[str]:
+    """Gets the digest of an image in its registry without pulling it.
+
+    Args:
+        image_name: Name of the image to get the digest for.
+
+    Returns:
+        The digest of the image or `None` if the image doesn't exist in the
+        registry or the registry can't be reached.
+    """
+    docker_client = DockerClient.from_env()
+    try:
+        return cast(str, docker_client.images.get_registry_data(image_name).id)
+    except docker_errors.APIError as e:
+        logger.debug(
+            "Unable to get registry digest for image `%s`: %s", image_name, e
+        )
+        return None
+
+
+def image_exists(image_name: str, check_registry: bool = False) -> bool:
+    """Checks whether an image exists.
+
+    Args:
+        image_name: Name of the image to check.
+        check_registry: If `True`, also checks whether the image exists in
+            its registry if it doesn't exist locally.
+
+    Returns:
+        `True` if the image exists, `False` otherwise.
+    """
+    if get_image_id(image_name):
+        return True
+
+    return check_registry and get_registry_digest(image_name) is not None
+
+
 def is_local_image(image_name: str) -> bool:
     """Returns whether an image was pulled from a registry or not.
 
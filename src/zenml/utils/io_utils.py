@@ -15,8 +15,10 @@
 
 import fnmatch
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
 
 import click
 from tfx.dsl.io.filesystem import PathType
@@ -32,6 +34,14 @@ from zenml.io.fileio import (
     open,
     walk,
 )
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_COPY_WORKERS = 8
+
+# Called with the number of copied files and the total number of files
+CopyProgressCallback = Callable[[int, int], None]
 
 
 def get_global_config_directory() -> str:
@@ -156,16 +166,113 @@ def resolve_relative_path(path: str) -> str:
     return str(Path(path).resolve())
 
 
-def copy_dir(
-    source_dir: str, destination_dir: str, overwrite: bool = False
+def copy_files_concurrently(
+    files: Sequence[Tuple[str, str]],
+    copy_function: Callable[[str, str, bool], None],
+    overwrite: bool = False,
+    max_workers: int = DEFAULT_COPY_WORKERS,
+    progress_callback: Optional[CopyProgressCallback] = None,
 ) -> None:
-    """Copies dir from source to destination.
+    """Copies files concurrently using a thread pool.
 
     Args:
-        source_dir: Path to copy from.
-        destination_dir: Path to copy to.
-        overwrite: Boolean. If false, function throws an error before overwrite.
+        files: Tuples (source_path, destination_path) of the files to copy.
+        copy_function: Function that copies a single file. It gets called
+            with the source path, destination path and overwrite flag.
+        overwrite: Whether to overwrite existing destination files.
+        max_workers: The maximum number of files to copy at the same time.
+        progress_callback: Optional function which gets called with the
+            number of copied files and the total number of files after each
+            copied file.
+
+    Raises:
+        Exception: The first exception raised while copying a file. Files
+            which haven't started copying at that point are skipped.
     """
+    start_time = time.time()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(copy_function, source, destination, overwrite)
+            for source, destination in files
+        ]
+        for num_copied, future in enumerate(as_completed(futures), start=1):
+            try:
+                future.result()
+            except Exception:
+                for pending_future in futures:
+                    pending_future.cancel()
+                raise
+
+            if progress_callback:
+                progress_callback(num_copied, len(files))
+
+    logger.debug(
+        "Copied %d files in %.2f seconds.", len(files), time.time() - start_time
+    )
+
+
+def copy_files(
+    files: Sequence[Tuple[str, str]],
+    overwrite: bool = False,
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[CopyProgressCallback] = None,
+) -> None:
+    """Copies multiple files concurrently.
+
+    If an artifact store is responsible for any of the paths, its bulk copy
+    implementation is used.
+
+    Args:
+        files: Tuples (source_path, destination_path) of the files to copy.
+        overwrite: Whether to overwrite existing destination files.
+        max_workers: The maximum number of files to copy at the same time.
+            Defaults to the value configured for the artifact store.
+        progress_callback: Optional function which gets called with the
+            number of copied files and the total number of files after each
+            copied file.
+    """
+    if not files:
+        return
+
+    from tfx.dsl.io.filesystem_registry import DEFAULT_FILESYSTEM_REGISTRY
+
+    # Prefer the filesystem of a remote path, as copying to and from remote
+    # filesystems is what benefits from bulk implementations
+    paths = [path for file in files for path in file]
+    path = next((path for path in paths if is_remote(path)), paths[0])
+    filesystem = DEFAULT_FILESYSTEM_REGISTRY.get_filesystem_for_path(path)
+    bulk_copy_function = getattr(filesystem, "copy_files", None)
+
+    if bulk_copy_function:
+        bulk_copy_function(
+            files,
+            overwrite=overwrite,
+            max_workers=max_workers,
+            progress_callback=progress_callback,
+        )
+    else:
+        copy_files_concurrently(
+            files,
+            copy_function=copy,
+            overwrite=overwrite,
+            max_workers=max_workers or DEFAULT_COPY_WORKERS,
+            progress_callback=progress_callback,
+        )
+
+
+def _list_files_to_copy(
+    source_dir: str, destination_dir: str
+) -> List[Tuple[str, str]]:
+    """Recursively lists all files of a directory with their copy destination.
+
+    Args:
+        source_dir: Path of the directory to copy.
+        destination_dir: Path to copy the directory to.
+
+    Returns:
+        Tuples (source_path, destination_path) of all files to copy.
+    """
+    files = []
     for source_file in listdir(source_dir):
         source_path = os.path.join(source_dir, convert_to_str(source_file))
         destination_path = os.path.join(
@@ -175,13 +282,44 @@ def copy_dir(
             if source_path == destination_dir:
                 # if the destination is a subdirectory of the source, we skip
                 # copying it to avoid an infinite loop.
-                return
-            copy_dir(source_path, destination_path, overwrite)
+                continue
+            files.extend(_list_files_to_copy(source_path, destination_path))
         else:
-            create_dir_recursive_if_not_exists(
-                os.path.dirname(destination_path)
-            )
-            copy(str(source_path), str(destination_path), overwrite)
+            files.append((str(source_path), str(destination_path)))
+    return files
+
+
+def copy_dir(
+    source_dir: str,
+    destination_dir: str,
+    overwrite: bool = False,
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[CopyProgressCallback] = None,
+) -> None:
+    """Copies dir from source to destination.
+
+    The files inside the directory are copied concurrently.
+
+    Args:
+        source_dir: Path to copy from.
+        destination_dir: Path to copy to.
+        overwrite: Boolean. If false, function throws an error before overwrite.
+        max_workers: The maximum number of files to copy at the same time.
+            Defaults to the value configured for the artifact store.
+        progress_callback: Optional function which gets called with the
+            number of copied files and the total number of files after each
+            copied file.
+    """
+    files = _list_files_to_copy(source_dir, destination_dir)
+    for directory in sorted({os.path.dirname(file[1]) for file in files}):
+        create_dir_recursive_if_not_exists(directory)
+
+    copy_files(
+        files,
+        overwrite=overwrite,
+        max_workers=max_workers,
+        progress_callback=progress_callback,
+    )
 
 
 def get_grandparent(dir_path: str) -> str:
@@ -0,0 +1,54 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility functions for iterating over paginated list results."""
+
+from typing import Any, Callable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def iterate_pages(
+    list_method: Callable[..., List[T]],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    **filters: Any,
+) -> Iterator[T]:
+    """Lazily iterates over all entities returned by a paginated list method.
+
+    The next page is only requested once all entities of the previous page
+    have been consumed, so only a single page is held in memory at any time.
+
+    Args:
+        list_method: The list method to call, e.g. `zen_store.list_runs`. It
+            must accept the `offset` and `limit` keyword arguments.
+        page_size: The number of entities to request per page.
+        **filters: Additional keyword arguments passed to the list method.
+
+    Yields:
+        The entities returned by the list method, page by page.
+
+    Raises:
+        ValueError: If the page size is not positive.
+    """
+    if page_size <= 0:
+        raise ValueError(f"Page size must be positive, got {page_size}.")
+
+    offset = 0
+    while True:
+        page = list_method(offset=offset, limit=page_size, **filters)
+        yield from page
+        if len(page) < page_size:
+            return
+        offset += page_size
@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Implementation of Docker image builds to run ZenML pipelines."""
 import contextlib
+import hashlib
 import itertools
 import os
 import subprocess
@@ -50,6 +51,8 @@ DEFAULT_DOCKER_PARENT_IMAGE = (
     f"py{sys.version_info.major}.{sys.version_info.minor}"
 )
 
+REUSABLE_IMAGE_TAG_PREFIX = "zenml-build-"
+
 
 @contextlib.contextmanager
 def _include_global_config(
@@ -129,12 +132,17 @@ class PipelineDockerImageBuilder:
             deployment=deployment, container_registry=container_registry
         )
 
-        self.build_docker_image(
+        reusable_image_name = self.build_docker_image(
             target_image_name=target_image_name,
             deployment=deployment,
             stack=stack,
             entrypoint=entrypoint,
+            check_registry=True,
         )
+        if reusable_image_name:
+            # Push the newly built image so later builds with the same content
+            # can reuse it, even if they run on a different machine
+            container_registry.push_image(reusable_image_name)
 
         repo_digest = container_registry.push_image(target_image_name)
         return repo_digest
@@ -173,15 +181,39 @@ class PipelineDockerImageBuilder:
 
         return target_image_name
 
+    @staticmethod
+    def get_reusable_image_name(target_image_name: str, build_hash: str) -> str:
+        """Returns the name of a reusable image.
+
+        Reusable images contain everything but the deployment configuration
+        and are tagged with a hash of their contents, which allows later
+        builds with the same contents to skip building and pushing them.
+
+        Args:
+            target_image_name: The name of the target image.
+            build_hash: The hash of the image contents.
+
+        Returns:
+            The name of the reusable image.
+        """
+        repository, _ = target_image_name.rsplit(":", maxsplit=1)
+        return f"{repository}:{REUSABLE_IMAGE_TAG_PREFIX}{build_hash}"
+
     def build_docker_image(
         self,
         target_image_name: str,
         deployment: "PipelineDeployment",
         stack: "Stack",
         entrypoint: Optional[str] = None,
-    ) -> None:
+        check_registry: bool = False,
+    ) -> Optional[str]:
         """Builds a Docker image to run a pipeline.
 
+        Unless disabled in the Docker settings, the image gets built on top of
+        a reusable image which contains everything but the deployment
+        configuration. If a reusable image with the same contents exists
+        already, it won't be built again.
+
         Args:
             target_image_name: The name of the image to build.
             deployment: The pipeline deployment for which the image should be
@@ -189,6 +221,11 @@ class PipelineDockerImageBuilder:
             stack: The stack on which the pipeline will be deployed.
             entrypoint: Entrypoint to use for the final image. If left empty,
                 no entrypoint will be included in the image.
+            check_registry: If `True`, reusable images that don't exist locally
+                will be looked up in their registry.
+
+        Returns:
+            The name of the reusable image if one was built, `None` otherwise.
 
         Raises:
             ValueError: If no Dockerfile and/or custom parent image is
@@ -284,9 +321,9 @@ class PipelineDockerImageBuilder:
                     parent_image
                 )
 
-            extra_files = requirement_files.copy()
-            extra_files.append(
-                (DOCKER_IMAGE_DEPLOYMENT_CONFIG_FILE, deployment.yaml())
+            deployment_config_file = (
+                DOCKER_IMAGE_DEPLOYMENT_CONFIG_FILE,
+                deployment.yaml(),
             )
 
             # Leave the build context empty if we don't want to copy any files
@@ -304,14 +341,125 @@ class PipelineDockerImageBuilder:
                 else contextlib.nullcontext()
             )
             with maybe_include_global_config:
-                docker_utils.build_image(
-                    image_name=target_image_name,
-                    dockerfile=dockerfile,
-                    build_context_root=build_context_root,
-                    dockerignore=docker_settings.dockerignore,
-                    extra_files=extra_files,
-                    pull=pull_parent_image,
+                build_hash = (
+                    None
+                    if docker_settings.prevent_build_reuse
+                    else self._compute_build_hash(
+                        parent_image=parent_image,
+                        pull_parent_image=pull_parent_image,
+                        dockerfile=dockerfile,
+                        requirements_files=requirement_files,
+                        build_context_root=build_context_root,
+                        dockerignore=docker_settings.dockerignore,
+                    )
                 )
+                if not build_hash:
+                    docker_utils.build_image(
+                        image_name=target_image_name,
+                        dockerfile=dockerfile,
+                        build_context_root=build_context_root,
+                        dockerignore=docker_settings.dockerignore,
+                        extra_files=[
+                            *requirement_files,
+                            deployment_config_file,
+                        ],
+                        pull=pull_parent_image,
+                    )
+                    return None
+
+                reusable_image_name = self.get_reusable_image_name(
+                    target_image_name=target_image_name, build_hash=build_hash
+                )
+                build_reusable_image = not docker_utils.image_exists(
+                    reusable_image_name, check_registry=check_registry
+                )
+                if build_reusable_image:
+                    docker_utils.build_image(
+                        image_name=reusable_image_name,
+                        dockerfile=dockerfile,
+                        build_context_root=build_context_root,
+                        dockerignore=docker_settings.dockerignore,
+                        extra_files=requirement_files,
+                        pull=pull_parent_image,
+                    )
+                else:
+                    logger.info(
+                        "Reusing existing Docker image `%s`.",
+                        reusable_image_name,
+                    )
+
+            # The deployment configuration changes for every pipeline run, so
+            # we add it in a separate image on top of the reusable one
+            final_dockerfile = [f"FROM {reusable_image_name}"]
+            if docker_settings.copy_files:
+                final_dockerfile.append(
+                    f"COPY {DOCKER_IMAGE_DEPLOYMENT_CONFIG_FILE} ."
+                )
+            docker_utils.build_image(
+                image_name=target_image_name,
+                dockerfile=final_dockerfile,
+                extra_files=[deployment_config_file],
+                pull=False,
+            )
+            return reusable_image_name if build_reusable_image else None
+
+        return None
+
+    @staticmethod
+    def _compute_build_hash(
+        parent_image: str,
+        pull_parent_image: bool,
+        dockerfile: Sequence[str],
+        requirements_files: Sequence[Tuple[str, str]],
+        build_context_root: Optional[str] = None,
+        dockerignore: Optional[str] = None,
+    ) -> Optional[str]:
+        """Computes a hash of all contents of an image build.
+
+        Args:
+            parent_image: The parent image of the build.
+            pull_parent_image: Whether the parent image needs to be pulled
+                from its registry.
+            dockerfile: Lines of the Dockerfile.
+            requirements_files: Tuples (filename, file_content) of all
+                requirements files.
+            build_context_root: Optional path to the build context root
+                directory.
+            dockerignore: Optional path to a dockerignore file.
+
+        Returns:
+            The hash or `None` if the digest of the parent image couldn't be
+            determined.
+        """
+        if parent_image == DEFAULT_DOCKER_PARENT_IMAGE:
+            # The default parent image is static for each ZenML version
+            parent_image_digest: Optional[str] = parent_image
+        elif pull_parent_image:
+            parent_image_digest = docker_utils.get_registry_digest(parent_image)
+        else:
+            parent_image_digest = docker_utils.get_image_id(parent_image)
+
+        if not parent_image_digest:
+            logger.info(
+                "Unable to get the digest of parent image `%s`, not reusing "
+                "any previously built images.",
+                parent_image,
+            )
+            return None
+
+        build_hash = hashlib.sha256()
+        build_hash.update(parent_image_digest.encode())
+        build_hash.update("\n".join(dockerfile).encode())
+        for file_name, file_content in requirements_files:
+            build_hash.update(file_name.encode())
+            build_hash.update(file_content.encode())
+        if build_context_root:
+            build_context_digest = docker_utils.get_build_context_digest(
+                build_context_root=build_context_root, dockerignore=dockerignore
+            )
+            build_hash.update(build_context_digest.encode())
+
+        return build_hash.hexdigest()
 
     @staticmethod
     def _gather_requirements_files(
@@ -0,0 +1,236 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Middleware for the ZenML Server."""
+
+import hashlib
+import zlib
+from typing import List, Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Maximum size of a decompressed request body
+MAX_DECOMPRESSED_REQUEST_SIZE = 100 * 1024 * 1024
+
+
+class GZipRequestMiddleware:
+    """Middleware that decompresses gzip encoded request bodies.
+
+    Clients can send compressed request bodies by setting the
+    `Content-Encoding: gzip` header. The body is decompressed before it is
+    passed on, so the endpoints don't need to know about the compression.
+
+    As this happens before any authentication, the body is decompressed
+    incrementally and requests that decompress to more than the maximum size
+    are rejected with a `413` response instead of being decompressed into
+    memory. Bodies that are not valid gzip data are rejected with a `400`
+    response.
+    """
+
+    def __init__(
+        self, app: ASGIApp, max_size: int = MAX_DECOMPRESSED_REQUEST_SIZE
+    ) -> None:
+        """Initializes the middleware.
+
+        Args:
+            app: The application to wrap.
+            max_size: The maximum size of a decompressed request body in
+                bytes.
+        """
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Decompresses the request body if it is gzip encoded.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        headers = dict(scope.get("headers", []))
+        if (
+            scope["type"] != "http"
+            or headers.get(b"content-encoding", b"").lower() != b"gzip"
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        chunks: List[bytes] = []
+        size = 0
+        # Adding 16 to the window bits makes zlib expect a gzip header
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        more_body = True
+        try:
+            while more_body:
+                message = await receive()
+                data = message.get("body", b"")
+                more_body = message.get("more_body", False)
+                while data:
+                    if decompressor.eof:
+                        # Concatenated gzip members, see `gzip.decompress`
+                        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                    # Never decompress more than one byte beyond the limit
+                    chunk = decompressor.decompress(
+                        data, self.max_size - size + 1
+                    )
+                    size += len(chunk)
+                    if size > self.max_size:
+                        await self._reject(
+                            scope,
+                            receive,
+                            send,
+                            status_code=413,
+                            detail="Decompressed request body too large.",
+                        )
+                        return
+                    chunks.append(chunk)
+                    data = decompressor.unconsumed_tail or (
+                        decompressor.unused_data if decompressor.eof else b""
+                    )
+            if not decompressor.eof:
+                raise EOFError("Compressed request body ended prematurely.")
+        except (OSError, EOFError, zlib.error):
+            await self._reject(
+                scope,
+                receive,
+                send,
+                status_code=400,
+                detail="Invalid gzip encoded request body.",
+            )
+            return
+        body = b"".join(chunks)
+
+        scope = dict(scope)
+        scope["headers"] = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ] + [(b"content-length", str(len(body)).encode("latin-1"))]
+
+        body_sent = False
+
+        async def _receive() -> Message:
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app(scope, _receive, send)
+
+    @staticmethod
+    async def _reject(
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        status_code: int,
+        detail: str,
+    ) -> None:
+        """Sends an error response without passing the request on.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+            status_code: The status code of the response.
+            detail: The error message.
+        """
+        response = JSONResponse({"detail": detail}, status_code=status_code)
+        await response(scope, receive, send)
+
+
+class ETagMiddleware:
+    """Middleware that adds entity tags to JSON responses of GET requests.
+
+    The entity tag is a hash of the response body. If a client sends the
+    entity tag of a previous response in the `If-None-Match` header and the
+    response didn't change since, an empty `304 Not Modified` response is
+    sent instead of the full body.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initializes the middleware.
+
+        Args:
+            app: The application to wrap.
+        """
+        self.app = app
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Adds an entity tag to the response and handles conditional requests.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = dict(scope.get("headers", [])).get(b"if-none-match")
+        start_message: Optional[Message] = None
+        passthrough = False
+        body = b""
+
+        async def _send(message: Message) -> None:
+            nonlocal start_message, passthrough, body
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                # Pass through everything that isn't a successful JSON
+                # response, e.g. streamed dashboard files
+                is_json = content_type.startswith("application/json")
+                passthrough = message["status"] != 200 or not is_json
+                if passthrough:
+                    await send(message)
+                else:
+                    start_message = message
+                return
+            if passthrough or start_message is None:
+                await send(message)
+                return
+
+            body += message.get("body", b"")
+            if message.get("more_body", False):
+                return
+
+            etag = f'"{hashlib.sha256(body).hexdigest()}"'
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers["ETag"] = etag
+            if if_none_match is not None and etag in if_none_match.decode(
+                "latin-1"
+            ):
+                del headers["content-length"]
+                del headers["content-type"]
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 304,
+                        "headers": headers.raw,
+                    }
+                )
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, _send)
@@ -90,28 +90,59 @@ class HydratedPipelineModel(PipelineModel):
         Returns:
             A hydrated model.
         """
+        return cls.from_models([pipeline_model], num_runs=num_runs)[0]
+
+    @classmethod
+    def from_models(
+        cls, pipeline_models: List[PipelineModel], num_runs: int = 3
+    ) -> List["HydratedPipelineModel"]:
+        """Hydrates multiple pipelines at once.
+
+        The projects, users and last runs of all pipelines as well as the
+        statuses of these runs are fetched in bulk instead of once per
+        pipeline.
+
+        Args:
+            pipeline_models: The pipeline models to hydrate.
+            num_runs: The number of latest runs to include per pipeline.
+
+        Returns:
+            The hydrated models, in the same order as the given ones.
+        """
         zen_store = GlobalConfiguration().zen_store
 
-        project = zen_store.get_project(pipeline_model.project)
-        user = zen_store.get_user(pipeline_model.user)
-        runs = zen_store.list_runs(pipeline_id=pipeline_model.id)
-        last_x_runs = runs[:num_runs]
-        status_last_x_runs = []
-        for run in last_x_runs:
-            status_last_x_runs.append(zen_store.get_run_status(run_id=run.id))
-
-        return cls(
-            id=pipeline_model.id,
-            name=pipeline_model.name,
-            project=project,
-            user=user,
-            runs=last_x_runs,
-            status=status_last_x_runs,
-            docstring=pipeline_model.docstring,
-            spec=pipeline_model.spec,
-            created=pipeline_model.created,
-            updated=pipeline_model.updated,
+        projects = zen_store.get_projects_by_ids(
+            {pipeline.project for pipeline in pipeline_models}
+        )
+        users = zen_store.get_users_by_ids(
+            {pipeline.user for pipeline in pipeline_models}
         )
+        last_x_runs = zen_store.get_latest_runs_by_pipeline_ids(
+            {pipeline.id for pipeline in pipeline_models}, num_runs=num_runs
+        )
+        statuses = zen_store.get_run_statuses(
+            run.id for runs in last_x_runs.values() for run in runs
+        )
+
+        return [
+            cls(
+                id=pipeline.id,
+                name=pipeline.name,
+                project=projects[pipeline.project],
+                user=users[pipeline.user],
+                runs=last_x_runs[pipeline.id],
+                status=[
+                    statuses[run.id]
+                    for run in last_x_runs[pipeline.id]
+                    if run.id in statuses
+                ],
+                docstring=pipeline.docstring,
+                spec=pipeline.spec,
+                created=pipeline.created,
+                updated=pipeline.updated,
+            )
+            for pipeline in pipeline_models
+        ]
 
 
 class HydratedPipelineRunModel(PipelineRunModel):
@@ -141,25 +172,45 @@ class HydratedPipelineRunModel(PipelineRunModel):
         Returns:
             A hydrated model.
         """
+        return cls.from_models([run_model])[0]
+
+    @classmethod
+    def from_models(
+        cls, run_models: List[PipelineRunModel]
+    ) -> List["HydratedPipelineRunModel"]:
+        """Hydrates multiple runs at once.
+
+        The statuses, pipelines, stacks and users referenced by the runs are
+        each fetched with a single bulk call instead of once per run.
+
+        Args:
+            run_models: The run models to hydrate.
+
+        Returns:
+            The hydrated models, in the same order as the given ones.
+        """
         zen_store = GlobalConfiguration().zen_store
 
-        status = zen_store.get_run_status(run_id=run_model.id)
-
-        pipeline = None
-        stack = None
-        user = None
-
-        if run_model.pipeline_id:
-            pipeline = zen_store.get_pipeline(run_model.pipeline_id)
-        if run_model.stack_id:
-            stack = zen_store.get_stack(run_model.stack_id)
-        if run_model.user:
-            user = zen_store.get_user(run_model.user)
-
-        return cls(
-            **run_model.dict(exclude={"user", "pipeline", "stack"}),
-            pipeline=pipeline,
-            stack=stack,
-            user=user,
-            status=status
+        statuses = zen_store.get_run_statuses(run.id for run in run_models)
+        pipelines = zen_store.get_pipelines_by_ids(
+            {run.pipeline_id for run in run_models if run.pipeline_id}
+        )
+        stacks = zen_store.get_stacks_by_ids(
+            {run.stack_id for run in run_models if run.stack_id}
         )
+        users = zen_store.get_users_by_ids(
+            {run.user for run in run_models if run.user}
+        )
+
+        return [
+            cls(
+                **run.dict(exclude={"user", "pipeline", "stack"}),
+                pipeline=pipelines.get(run.pipeline_id)
+                if run.pipeline_id
+                else None,
+                stack=stacks.get(run.stack_id) if run.stack_id else None,
+                user=users.get(run.user),
+                status=statuses[run.id],
+            )
+            for run in run_models
+        ]
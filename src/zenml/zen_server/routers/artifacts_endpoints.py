@@ -13,11 +13,12 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for steps (and artifacts) of pipeline runs."""
 
+from datetime import datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends
 
-from zenml.constants import API, ARTIFACTS, VERSION_1
+from zenml.constants import API, ARTIFACTS, COUNT, VERSION_1
 from zenml.models.pipeline_models import ArtifactModel
 from zenml.zen_server.auth import authorize
 from zenml.zen_server.utils import error_response, handle_exceptions, zen_store
@@ -38,13 +39,64 @@ router = APIRouter(
 @handle_exceptions
 def list_runs(
     artifact_uri: Optional[str] = None,
+    sort_by: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
 ) -> List[ArtifactModel]:
     """Get artifacts according to query filters.
 
     Args:
         artifact_uri: The URI of the artifact by which to filter.
+        sort_by: Name of the field to sort the artifacts by. Prefix it with `-`
+            to sort in descending order.
+        created_after: If provided, only return artifacts created after this
+            time.
+        created_before: If provided, only return artifacts created before this
+            time.
+        offset: Number of artifacts to skip.
+        limit: Maximum number of artifacts to return. If not provided, all
+            remaining artifacts are returned.
 
     Returns:
         The artifacts according to query filters.
     """
-    return zen_store.list_artifacts(artifact_uri=artifact_uri)
+    return zen_store.list_artifacts(
+        artifact_uri=artifact_uri,
+        sort_by=sort_by,
+        created_after=created_after,
+        created_before=created_before,
+        offset=offset,
+        limit=limit,
+    )
+
+
+@router.get(
+    COUNT,
+    response_model=int,
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def count_artifacts(
+    artifact_uri: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+) -> int:
+    """Count artifacts according to query filters.
+
+    Args:
+        artifact_uri: The URI of the artifact by which to filter.
+        created_after: If provided, only count artifacts created after this
+            time.
+        created_before: If provided, only count artifacts created before this
+            time.
+
+    Returns:
+        The number of artifacts matching the query filters.
+    """
+    return zen_store.count_artifacts(
+        artifact_uri=artifact_uri,
+        created_after=created_after,
+        created_before=created_before,
+    )
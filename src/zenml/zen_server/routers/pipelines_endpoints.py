@@ -12,6 +12,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """Endpoint definitions for pipelines."""
+from datetime import datetime
 from typing import List, Optional, Union
 from uuid import UUID
 
@@ -47,6 +48,11 @@ def list_pipelines(
     project_name_or_id: Optional[Union[str, UUID]] = None,
     user_name_or_id: Optional[Union[str, UUID]] = None,
     name: Optional[str] = None,
+    sort_by: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
     hydrated: bool = False,
 ) -> Union[List[HydratedPipelineModel], List[PipelineModel]]:
     """Gets a list of pipelines.
@@ -55,6 +61,15 @@ def list_pipelines(
         project_name_or_id: Name or ID of the project to get pipelines for.
         user_name_or_id: Optionally filter by name or ID of the user.
         name: Optionally filter by pipeline name
+        sort_by: Name of the field to sort the pipelines by. Prefix it with `-`
+            to sort in descending order.
+        created_after: If provided, only return pipelines created after this
+            time.
+        created_before: If provided, only return pipelines created before this
+            time.
+        offset: Number of pipelines to skip.
+        limit: Maximum number of pipelines to return. If not provided, all
+            remaining pipelines are returned.
         hydrated: Defines if stack components, users and projects will be
                   included by reference (FALSE) or as model (TRUE)
 
@@ -65,12 +80,14 @@ def list_pipelines(
         project_name_or_id=project_name_or_id,
         user_name_or_id=user_name_or_id,
         name=name,
+        sort_by=sort_by,
+        created_after=created_after,
+        created_before=created_before,
+        offset=offset,
+        limit=limit,
     )
     if hydrated:
-        return [
-            HydratedPipelineModel.from_model(pipeline)
-            for pipeline in pipelines_list
-        ]
+        return HydratedPipelineModel.from_models(pipelines_list)
     else:
         return pipelines_list
 
@@ -163,6 +180,11 @@ def list_pipeline_runs(
     run_name: Optional[str] = None,
     user_name_or_id: Optional[Union[str, UUID]] = None,
     component_id: Optional[UUID] = None,
+    sort_by: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
     hydrated: bool = False,
 ) -> Union[List[HydratedPipelineRunModel], List[PipelineRunModel]]:
     """Get pipeline runs according to query filters.
@@ -174,6 +196,15 @@ def list_pipeline_runs(
         run_name: Filter by run name if provided
         user_name_or_id: If provided, only return runs for this user.
         component_id: Filter by ID of a component that was used in the run.
+        sort_by: Name of the field to sort the runs by. Prefix it with `-`
+            to sort in descending order.
+        created_after: If provided, only return runs created after this
+            time.
+        created_before: If provided, only return runs created before this
+            time.
+        offset: Number of runs to skip.
+        limit: Maximum number of runs to return. If not provided, all
+            remaining runs are returned.
         hydrated: Defines if stack, user and pipeline will be
                   included by reference (FALSE) or as model (TRUE)
 
@@ -187,9 +218,14 @@ def list_pipeline_runs(
         component_id=component_id,
         user_name_or_id=user_name_or_id,
         pipeline_id=pipeline_id,
+        sort_by=sort_by,
+        created_after=created_after,
+        created_before=created_before,
+        offset=offset,
+        limit=limit,
     )
     if hydrated:
-        return [HydratedPipelineRunModel.from_model(run) for run in runs]
+        return HydratedPipelineRunModel.from_models(runs)
     else:
         return runs
 
@@ -222,7 +222,7 @@ def list_project_stacks(
         name=stack_name,
     )
     if hydrated:
-        return [stack.to_hydrated_model() for stack in stacks_list]
+        return HydratedStackModel.from_models(stacks_list)
     else:
         return stacks_list
 
@@ -305,7 +305,7 @@ def list_project_stack_components(
         flavor_name=flavor_name,
     )
     if hydrated:
-        return [comp.to_hydrated_model() for comp in components_list]
+        return HydratedComponentModel.from_models(components_list)
     else:
         return components_list
 
@@ -465,10 +465,7 @@ def list_project_pipelines(
         name=name,
     )
     if hydrated:
-        return [
-            HydratedPipelineModel.from_model(pipeline)
-            for pipeline in pipelines_list
-        ]
+        return HydratedPipelineModel.from_models(pipelines_list)
     else:
         return pipelines_list
 
@@ -530,7 +527,6 @@ def get_project_statistics(
     """
     # TODO: [server] instead of actually querying all the rows, we should
     #  use zen_store methods that just return counts
-    zen_store.list_runs()
     return {
         "stacks": len(
             zen_store.list_stacks(project_name_or_id=project_name_or_id)
@@ -543,5 +539,5 @@ def get_project_statistics(
         "pipelines": len(
             zen_store.list_pipelines(project_name_or_id=project_name_or_id)
         ),
-        "runs": len(zen_store.list_runs(project_name_or_id=project_name_or_id)),
+        "runs": zen_store.count_runs(project_name_or_id=project_name_or_id),
     }
@@ -12,6 +12,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """Endpoint definitions for pipeline runs."""
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
@@ -20,6 +21,7 @@ from fastapi import APIRouter, Depends
 from zenml.constants import (
     API,
     COMPONENT_SIDE_EFFECTS,
+    COUNT,
     GRAPH,
     PIPELINE_CONFIGURATION,
     RUNS,
@@ -58,6 +60,11 @@ def list_runs(
     component_id: Optional[UUID] = None,
     pipeline_id: Optional[UUID] = None,
     unlisted: bool = False,
+    sort_by: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
     hydrated: bool = False,
 ) -> Union[List[HydratedPipelineRunModel], List[PipelineRunModel]]:
     """Get pipeline runs according to query filters.
@@ -71,6 +78,15 @@ def list_runs(
         pipeline_id: ID of the pipeline for which to filter runs.
         unlisted: If True, only return unlisted runs that are not
             associated with any pipeline.
+        sort_by: Name of the field to sort the runs by. Prefix it with `-`
+            to sort in descending order.
+        created_after: If provided, only return runs created after this
+            time.
+        created_before: If provided, only return runs created before this
+            time.
+        offset: Number of runs to skip.
+        limit: Maximum number of runs to return. If not provided, all
+            remaining runs are returned.
         hydrated: Defines if stack, user and pipeline will be
                   included by reference (FALSE) or as model (TRUE)
 
@@ -85,13 +101,65 @@ def list_runs(
         user_name_or_id=user_name_or_id,
         pipeline_id=pipeline_id,
         unlisted=unlisted,
+        sort_by=sort_by,
+        created_after=created_after,
+        created_before=created_before,
+        offset=offset,
+        limit=limit,
     )
     if hydrated:
-        return [HydratedPipelineRunModel.from_model(run) for run in runs]
+        return HydratedPipelineRunModel.from_models(runs)
     else:
         return runs
 
 
+@router.get(
+    COUNT,
+    response_model=int,
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def count_runs(
+    project_name_or_id: Optional[Union[str, UUID]] = None,
+    stack_id: Optional[UUID] = None,
+    run_name: Optional[str] = None,
+    user_name_or_id: Optional[Union[str, UUID]] = None,
+    component_id: Optional[UUID] = None,
+    pipeline_id: Optional[UUID] = None,
+    unlisted: bool = False,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+) -> int:
+    """Count pipeline runs according to query filters.
+
+    Args:
+        project_name_or_id: Name or ID of the project for which to filter runs.
+        stack_id: ID of the stack for which to filter runs.
+        run_name: Filter by run name if provided
+        user_name_or_id: If provided, only count runs for this user.
+        component_id: Filter by ID of a component that was used in the run.
+        pipeline_id: ID of the pipeline for which to filter runs.
+        unlisted: If True, only count unlisted runs that are not
+            associated with any pipeline.
+        created_after: If provided, only count runs created after this time.
+        created_before: If provided, only count runs created before this time.
+
+    Returns:
+        The number of pipeline runs matching the query filters.
+    """
+    return zen_store.count_runs(
+        project_name_or_id=project_name_or_id,
+        run_name=run_name,
+        stack_id=stack_id,
+        component_id=component_id,
+        user_name_or_id=user_name_or_id,
+        pipeline_id=pipeline_id,
+        unlisted=unlisted,
+        created_after=created_after,
+        created_before=created_before,
+    )
+
+
 @router.get(
     "/{run_id}",
     response_model=Union[HydratedPipelineRunModel, PipelineRunModel],  # type: ignore[arg-type]
@@ -12,6 +12,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """Endpoint definitions for stack components."""
+from datetime import datetime
 from typing import List, Optional, Union
 from uuid import UUID
 
@@ -53,6 +54,11 @@ def list_stack_components(
     name: Optional[str] = None,
     flavor_name: Optional[str] = None,
     is_shared: Optional[bool] = None,
+    sort_by: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
     hydrated: bool = False,
 ) -> Union[List[ComponentModel], List[HydratedComponentModel]]:
     """Get a list of all stack components for a specific type.
@@ -64,6 +70,15 @@ def list_stack_components(
         type: Optionally filter by component type
         flavor_name: Optionally filter by flavor
         is_shared: Optionally filter by shared status of the component
+        sort_by: Name of the field to sort the stack components by. Prefix it
+            with `-` to sort in descending order.
+        created_after: If provided, only return stack components created after
+            this time.
+        created_before: If provided, only return stack components created
+            before this time.
+        offset: Number of stack components to skip.
+        limit: Maximum number of stack components to return. If not provided,
+            all remaining stack components are returned.
         hydrated: Defines if users and projects will be
                   included by reference (FALSE) or as model (TRUE)
 
@@ -77,9 +92,14 @@ def list_stack_components(
         name=name,
         flavor_name=flavor_name,
         is_shared=is_shared,
+        sort_by=sort_by,
+        created_after=created_after,
+        created_before=created_before,
+        offset=offset,
+        limit=limit,
     )
     if hydrated:
-        return [comp.to_hydrated_model() for comp in components_list]
+        return HydratedComponentModel.from_models(components_list)
     else:
         return components_list
 
@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for stacks."""
 
+from datetime import datetime
 from typing import List, Optional, Union
 from uuid import UUID
 
@@ -45,6 +46,11 @@ def list_stacks(
     component_id: Optional[UUID] = None,
     name: Optional[str] = None,
     is_shared: Optional[bool] = None,
+    sort_by: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
     hydrated: bool = False,
 ) -> Union[List[HydratedStackModel], List[StackModel]]:
     """Returns all stacks.
@@ -55,6 +61,15 @@ def list_stacks(
         component_id: Optionally filter by component that is part of the stack.
         name: Optionally filter by stack name
         is_shared: Optionally filter by shared status of the stack
+        sort_by: Name of the field to sort the stacks by. Prefix it with `-`
+            to sort in descending order.
+        created_after: If provided, only return stacks created after this
+            time.
+        created_before: If provided, only return stacks created before this
+            time.
+        offset: Number of stacks to skip.
+        limit: Maximum number of stacks to return. If not provided, all
+            remaining stacks are returned.
         hydrated: Defines if stack components, users and projects will be
                   included by reference (FALSE) or as model (TRUE)
 
@@ -67,9 +82,14 @@ def list_stacks(
         component_id=component_id,
         is_shared=is_shared,
         name=name,
+        sort_by=sort_by,
+        created_after=created_after,
+        created_before=created_before,
+        offset=offset,
+        limit=limit,
     )
     if hydrated:
-        return [stack.to_hydrated_model() for stack in stacks_list]
+        return HydratedStackModel.from_models(stacks_list)
     else:
         return stacks_list
 
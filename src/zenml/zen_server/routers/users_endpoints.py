@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for users."""
 
+from datetime import datetime
 from typing import List, Optional, Union
 from uuid import UUID
 
@@ -77,13 +78,36 @@ current_user_router = APIRouter(
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
-def list_users() -> List[UserModel]:
+def list_users(
+    sort_by: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> List[UserModel]:
     """Returns a list of all users.
 
+    Args:
+        sort_by: Name of the field to sort the users by. Prefix it with `-`
+            to sort in descending order.
+        created_after: If provided, only return users created after this
+            time.
+        created_before: If provided, only return users created before this
+            time.
+        offset: Number of users to skip.
+        limit: Maximum number of users to return. If not provided, all
+            remaining users are returned.
+
     Returns:
         A list of all users.
     """
-    return zen_store.list_users()
+    return zen_store.list_users(
+        sort_by=sort_by,
+        created_after=created_after,
+        created_before=created_before,
+        offset=offset,
+        limit=limit,
+    )
 
 
 @router.post(
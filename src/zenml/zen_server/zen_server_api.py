@@ -14,18 +14,23 @@
 """Zen Server API."""
 import os
 from asyncio.log import logger
+from genericpath import isfile
 from typing import Any, List
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi_utils.tasks import repeat_every
-from genericpath import isfile
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.responses import FileResponse
 
 import zenml
 from zenml.constants import API, HEALTH
+from zenml.zen_server.middleware import (
+    ETagMiddleware,
+    GZipRequestMiddleware,
+)
 from zenml.zen_server.routers import (
     artifacts_endpoints,
     auth_endpoints,
@@ -72,6 +77,12 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Support conditional GET requests, so clients can revalidate cached responses
+app.add_middleware(ETagMiddleware)
+# Compress larger responses for clients that accept gzip encoded bodies and
+# decompress gzip encoded request bodies
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+app.add_middleware(GZipRequestMiddleware)
 
 app.mount(
     "/static",
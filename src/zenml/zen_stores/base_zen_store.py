@@ -13,7 +13,19 @@
 #  permissions and limitations under the License.
 """Base Zen Store implementation."""
 import os
-from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -27,7 +39,7 @@ from zenml.constants import (
     ENV_ZENML_DEFAULT_USER_PASSWORD,
     ENV_ZENML_SERVER_DEPLOYMENT_TYPE,
 )
-from zenml.enums import StackComponentType, StoreType
+from zenml.enums import ExecutionStatus, StackComponentType, StoreType
 from zenml.exceptions import StackExistsError
 from zenml.logger import get_logger
 from zenml.models import (
@@ -39,7 +51,7 @@ from zenml.models import (
     TeamModel,
     UserModel,
 )
-from zenml.models.pipeline_models import PipelineModel
+from zenml.models.pipeline_models import PipelineModel, PipelineRunModel
 from zenml.models.server_models import (
     ServerDatabaseType,
     ServerDeploymentType,
@@ -60,6 +72,8 @@ DEFAULT_PASSWORD = ""
 DEFAULT_PROJECT_NAME = "default"
 DEFAULT_STACK_NAME = "default"
 
+T = TypeVar("T")
+
 
 class BaseZenStore(BaseModel, ZenStoreInterface, AnalyticsTrackerMixin):
     """Base class for accessing and persisting ZenML core objects.
@@ -460,6 +474,38 @@ class BaseZenStore(BaseModel, ZenStoreInterface, AnalyticsTrackerMixin):
             )
         return default_stacks[0]
 
+    def get_stacks_by_ids(
+        self, stack_ids: Iterable[UUID]
+    ) -> Dict[UUID, StackModel]:
+        """Get multiple stacks by their IDs.
+
+        Args:
+            stack_ids: The IDs of the stacks to get.
+
+        Returns:
+            A mapping from stack IDs to the stacks. IDs of stacks that don't
+            exist are left out.
+        """
+        return self._get_many_by_ids(self.get_stack, stack_ids)
+
+    # ----------------
+    # Stack components
+    # ----------------
+
+    def get_stack_components_by_ids(
+        self, component_ids: Iterable[UUID]
+    ) -> Dict[UUID, ComponentModel]:
+        """Get multiple stack components by their IDs.
+
+        Args:
+            component_ids: The IDs of the stack components to get.
+
+        Returns:
+            A mapping from component IDs to the stack components. IDs of
+            components that don't exist are left out.
+        """
+        return self._get_many_by_ids(self.get_stack_component, component_ids)
+
     # -----
     # Users
     # -----
@@ -484,6 +530,20 @@ class BaseZenStore(BaseModel, ZenStoreInterface, AnalyticsTrackerMixin):
         """
         return self.list_users()
 
+    def get_users_by_ids(
+        self, user_ids: Iterable[UUID]
+    ) -> Dict[UUID, UserModel]:
+        """Get multiple users by their IDs.
+
+        Args:
+            user_ids: The IDs of the users to get.
+
+        Returns:
+            A mapping from user IDs to the users. IDs of users that don't
+            exist are left out.
+        """
+        return self._get_many_by_ids(self.get_user, user_ids)
+
     @property
     def _default_user(self) -> UserModel:
         """Get the default user.
@@ -593,6 +653,20 @@ class BaseZenStore(BaseModel, ZenStoreInterface, AnalyticsTrackerMixin):
         logger.info(f"Creating default project '{project_name}' ...")
         return self.create_project(ProjectModel(name=project_name))
 
+    def get_projects_by_ids(
+        self, project_ids: Iterable[UUID]
+    ) -> Dict[UUID, ProjectModel]:
+        """Get multiple projects by their IDs.
+
+        Args:
+            project_ids: The IDs of the projects to get.
+
+        Returns:
+            A mapping from project IDs to the projects. IDs of projects that
+            don't exist are left out.
+        """
+        return self._get_many_by_ids(self.get_project, project_ids)
+
     # ------------
     # Repositories
     # ------------
@@ -626,14 +700,94 @@ class BaseZenStore(BaseModel, ZenStoreInterface, AnalyticsTrackerMixin):
             )
         return pipelines[0]
 
+    def get_pipelines_by_ids(
+        self, pipeline_ids: Iterable[UUID]
+    ) -> Dict[UUID, PipelineModel]:
+        """Get multiple pipelines by their IDs.
+
+        Args:
+            pipeline_ids: The IDs of the pipelines to get.
+
+        Returns:
+            A mapping from pipeline IDs to the pipelines. IDs of pipelines
+            that don't exist are left out.
+        """
+        return self._get_many_by_ids(self.get_pipeline, pipeline_ids)
+
     # -------------
     # Pipeline runs
     # -------------
 
+    def get_run_statuses(
+        self, run_ids: Iterable[UUID]
+    ) -> Dict[UUID, ExecutionStatus]:
+        """Gets the execution statuses of multiple pipeline runs.
+
+        Args:
+            run_ids: The IDs of the pipeline runs to get the statuses for.
+
+        Returns:
+            A mapping from run IDs to the statuses of the runs. IDs of runs
+            that don't exist are left out.
+        """
+        return self._get_many_by_ids(self.get_run_status, run_ids)
+
+    def get_latest_runs_by_pipeline_ids(
+        self, pipeline_ids: Iterable[UUID], num_runs: int
+    ) -> Dict[UUID, List[PipelineRunModel]]:
+        """Gets the latest runs of multiple pipelines.
+
+        Stores that can fetch the runs of multiple pipelines with a single
+        query should override this method.
+
+        Args:
+            pipeline_ids: The IDs of the pipelines to get the runs for.
+            num_runs: The maximum number of runs to get per pipeline.
+
+        Returns:
+            A mapping from pipeline IDs to their latest runs, newest first.
+        """
+        return {
+            pipeline_id: self.list_runs(
+                pipeline_id=pipeline_id, sort_by="-created", limit=num_runs
+            )
+            for pipeline_id in set(pipeline_ids)
+        }
+
     # ------------------
     # Pipeline run steps
     # ------------------
 
+    # ----------------
+    # Internal helpers
+    # ----------------
+
+    @staticmethod
+    def _get_many_by_ids(
+        get_method: Callable[[UUID], T], ids: Iterable[UUID]
+    ) -> Dict[UUID, T]:
+        """Fetches multiple resources by calling a get method once per ID.
+
+        Stores that can fetch multiple resources with a single query should
+        override the public methods calling this helper.
+
+        Args:
+            get_method: The method fetching a single resource by its ID.
+            ids: The IDs of the resources to fetch. Duplicate IDs are only
+                fetched once.
+
+        Returns:
+            A mapping from IDs to the fetched resources. IDs of resources that
+            don't exist are left out.
+        """
+        resources = {}
+        for id_ in set(ids):
+            try:
+                resources[id_] = get_method(id_)
+            except KeyError:
+                pass
+        return resources
+
     # ---------
     # Analytics
     # ---------
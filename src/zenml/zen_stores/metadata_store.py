@@ -13,16 +13,30 @@
 #  permissions and limitations under the License.
 """Base implementation of a metadata store."""
 
+import functools
 import json
-from collections import OrderedDict
+import time
+from collections import OrderedDict, defaultdict
 from json import JSONDecodeError
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
 from uuid import UUID
 
 from ml_metadata import proto
 from ml_metadata.metadata_store import metadata_store
 from ml_metadata.proto import metadata_store_pb2
 from pydantic import BaseModel, Extra
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Engine
 from tfx.dsl.compiler.constants import PIPELINE_RUN_CONTEXT_TYPE_NAME
 
 from zenml.artifacts.constants import (
@@ -34,6 +48,7 @@ from zenml.logger import get_logger
 from zenml.steps.utils import (
     INTERNAL_EXECUTION_PARAMETER_PREFIX,
     PARAM_PIPELINE_PARAMETER_NAME,
+    STEP_METRICS_PROPERTY_NAME,
 )
 from zenml.utils.proto_utils import (
     MLMD_CONTEXT_MODEL_IDS_PROPERTY_NAME,
@@ -46,6 +61,26 @@ logger = get_logger(__name__)
 
 ZENML_CONTEXT_TYPE_NAME = "zenml"
 
+# MLMD registers the context of a pipeline run right before the first execution
+# of that run. Contexts without any execution that are younger than this are
+# considered to be still in the process of being set up.
+RUN_CONTEXT_SETUP_TIMEOUT_SECONDS = 300
+
+# Orchestrators that retry a failed step record the time at which the retry
+# is scheduled in this custom property of the failed execution. If no new
+# execution of the step exists `RUN_CONTEXT_SETUP_TIMEOUT_SECONDS` after that
+# time, the retry is assumed to have never started.
+RETRY_SCHEDULED_AT_PROPERTY_NAME = "zenml_retry_scheduled_at"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Names of the MLMD methods to list all types of a kind.
+_TYPE_LIST_METHODS = {
+    "artifact": "get_artifact_types",
+    "context": "get_context_types",
+    "execution": "get_execution_types",
+}
+
 
 class MLMDPipelineRunModel(BaseModel):
     """Class that models a pipeline run response from the metadata store."""
@@ -60,6 +95,19 @@ class MLMDPipelineRunModel(BaseModel):
     num_steps: int
 
 
+class MLMDArtifactModel(BaseModel):
+    """Class that models an artifact response from the metadata store."""
+
+    mlmd_id: int
+    type: ArtifactType
+    uri: str
+    materializer: str
+    data_type: str
+    mlmd_parent_step_id: int
+    mlmd_producer_step_id: int
+    is_cached: bool
+
+
 class MLMDStepRunModel(BaseModel):
     """Class that models a step run response from the metadata store."""
 
@@ -69,36 +117,143 @@ class MLMDStepRunModel(BaseModel):
     name: str
     parameters: Dict[str, str]
     step_configuration: Dict[str, Any]
+    inputs: Dict[str, MLMDArtifactModel]
+    outputs: Dict[str, MLMDArtifactModel]
+    metrics: Dict[str, float] = {}
 
 
-class MLMDArtifactModel(BaseModel):
-    """Class that models an artifact response from the metadata store."""
+class _QueryCountingStore:
+    """Wrapper around an MLMD store that counts the queries made to it."""
 
-    mlmd_id: int
-    type: ArtifactType
-    uri: str
-    materializer: str
-    data_type: str
-    mlmd_parent_step_id: int
-    mlmd_producer_step_id: int
-    is_cached: bool
+    def __init__(self, store: metadata_store.MetadataStore) -> None:
+        """Initializes the wrapper.
+
+        Args:
+            store: The MLMD store to wrap.
+        """
+        self._store = store
+        self.query_count = 0
+
+    def __getattr__(self, name: str) -> Any:
+        """Gets an attribute of the wrapped store.
+
+        Args:
+            name: The name of the attribute.
+
+        Returns:
+            The attribute. Methods are wrapped to count their calls.
+        """
+        attribute = getattr(self._store, name)
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def _counting_wrapper(*args: Any, **kwargs: Any) -> Any:
+            self.query_count += 1
+            return attribute(*args, **kwargs)
+
+        return _counting_wrapper
+
+
+def track_queries(func: F) -> F:
+    """Decorator that records the number of MLMD queries of a method.
+
+    The number of queries made by the last call of the decorated method is
+    stored in `MetadataStore.query_counts` under the name of the method.
+
+    Args:
+        func: The `MetadataStore` method to decorate.
+
+    Returns:
+        The decorated method.
+    """
+
+    @functools.wraps(func)
+    def _wrapper(self: "MetadataStore", *args: Any, **kwargs: Any) -> Any:
+        start_count = self._counting_store.query_count
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            query_count = self._counting_store.query_count - start_count
+            self.query_counts[func.__name__] = query_count
+            logger.debug(
+                "Metadata store call `%s` made %d MLMD queries.",
+                func.__name__,
+                query_count,
+            )
+
+    return cast(F, _wrapper)
 
 
 class MetadataStore:
-    """ZenML MLMD metadata store."""
+    """ZenML MLMD metadata store.
+
+    Attributes:
+        store: The MLMD store.
+        query_counts: The number of MLMD queries made by the last call of each
+            high-level method of this class.
+    """
 
     upgrade_migration_enabled: bool = True
     store: metadata_store.MetadataStore
 
-    def __init__(self, config: metadata_store_pb2.ConnectionConfig) -> None:
+    def __init__(
+        self,
+        config: metadata_store_pb2.ConnectionConfig,
+        engine: Optional[Engine] = None,
+    ) -> None:
         """Initializes the metadata store.
 
         Args:
             config: The connection configuration for the metadata store.
+            engine: Optional SQLAlchemy engine connected to the database that
+                contains the MLMD tables. If given, it is used to read the
+                contexts of many executions at once, which MLMD has no API
+                for.
         """
-        self.store = metadata_store.MetadataStore(
-            config, enable_upgrade_migration=True
+        self._counting_store = _QueryCountingStore(
+            metadata_store.MetadataStore(config, enable_upgrade_migration=True)
         )
+        self.store = cast(metadata_store.MetadataStore, self._counting_store)
+        self._engine = engine
+        self.query_counts: Dict[str, int] = {}
+        self._type_mappings: Dict[str, Dict[int, str]] = {}
+
+    def _get_type_mapping(
+        self, kind: str, type_id: Optional[int] = None
+    ) -> Dict[int, str]:
+        """Gets a cached mapping from type IDs to type names.
+
+        MLMD types are never modified once registered, so the mappings only
+        get reloaded if they don't contain a requested type ID yet.
+
+        Args:
+            kind: The kind of the types, one of `artifact`, `context` or
+                `execution`.
+            type_id: Optional ID of a type that the mapping must contain.
+
+        Returns:
+            A mapping from type IDs to type names.
+        """
+        mapping = self._type_mappings.get(kind)
+        if mapping is None or (type_id is not None and type_id not in mapping):
+            types = getattr(self.store, _TYPE_LIST_METHODS[kind])()
+            mapping = {type_.id: type_.name for type_ in types}
+            self._type_mappings[kind] = mapping
+        return mapping
+
+    def _get_type_name(self, kind: str, type_id: int) -> str:
+        """Gets the name of a type.
+
+        Args:
+            kind: The kind of the type, one of `artifact`, `context` or
+                `execution`.
+            type_id: The ID of the type.
+
+        Returns:
+            The name of the type.
+        """
+        return self._get_type_mapping(kind, type_id=type_id)[type_id]
 
     @property
     def step_type_mapping(self) -> Dict[int, str]:
@@ -107,9 +262,7 @@ class MetadataStore:
         Returns:
             Dict[int, str]: a mapping from type_ids to step names.
         """
-        return {
-            type_.id: type_.name for type_ in self.store.get_execution_types()
-        }
+        return self._get_type_mapping("execution")
 
     def _check_if_executions_belong_to_pipeline(
         self,
@@ -137,16 +290,88 @@ class MetadataStore:
     def _get_zenml_execution_context_properties(
         self, execution: proto.Execution
     ) -> Any:
-        associated_contexts = self.store.get_contexts_by_execution(execution.id)
-        for context in associated_contexts:
-            context_type = self.store.get_context_types_by_id(
-                [context.type_id]
-            )[0].name
-            if context_type == ZENML_CONTEXT_TYPE_NAME:
-                return context.custom_properties
-        raise RuntimeError(
-            f"Could not find 'zenml' context for execution {execution.name}."
-        )
+        return self._get_zenml_execution_contexts_properties([execution])[
+            execution.id
+        ]
+
+    def _get_associated_contexts(
+        self, executions: List[proto.Execution]
+    ) -> Dict[int, List[proto.Context]]:
+        """Gets the contexts associated with executions.
+
+        MLMD only offers to get the contexts of a single execution. If the
+        database that contains the MLMD tables is accessible, the associations
+        of all executions are therefore read from the MLMD `Association` table
+        directly and the contexts are loaded with a single query.
+
+        Args:
+            executions: The executions to get the contexts for.
+
+        Returns:
+            The contexts associated with each execution, indexed by execution
+            ID.
+        """
+        if self._engine is None or len(executions) < 2:
+            return {
+                execution.id: self.store.get_contexts_by_execution(execution.id)
+                for execution in executions
+            }
+
+        query = text(
+            "SELECT execution_id, context_id FROM Association "
+            "WHERE execution_id IN :execution_ids"
+        ).bindparams(bindparam("execution_ids", expanding=True))
+        with self._engine.connect() as connection:
+            associations = connection.execute(
+                query,
+                {"execution_ids": [execution.id for execution in executions]},
+            ).all()
+        self._counting_store.query_count += 1
+
+        contexts = {
+            context.id: context
+            for context in self.store.get_contexts_by_id(
+                list({context_id for _, context_id in associations})
+            )
+        }
+        associated_contexts: Dict[int, List[proto.Context]] = {
+            execution.id: [] for execution in executions
+        }
+        for execution_id, context_id in associations:
+            associated_contexts[execution_id].append(contexts[context_id])
+        return associated_contexts
+
+    def _get_zenml_execution_contexts_properties(
+        self, executions: List[proto.Execution]
+    ) -> Dict[int, Any]:
+        """Gets the properties of the `zenml` contexts of executions.
+
+        Args:
+            executions: The executions to get the context properties for.
+
+        Returns:
+            The properties of the `zenml` context of each execution, indexed
+            by execution ID.
+
+        Raises:
+            RuntimeError: If an execution has no `zenml` context.
+        """
+        contexts_properties = {}
+        associated_contexts = self._get_associated_contexts(executions)
+        for execution in executions:
+            for context in associated_contexts[execution.id]:
+                context_type = self._get_type_name("context", context.type_id)
+                if context_type == ZENML_CONTEXT_TYPE_NAME:
+                    contexts_properties[
+                        execution.id
+                    ] = context.custom_properties
+                    break
+            else:
+                raise RuntimeError(
+                    "Could not find 'zenml' context for execution "
+                    f"{execution.name}."
+                )
+        return contexts_properties
 
     def _get_step_model_from_execution(
         self, execution: proto.Execution
@@ -158,25 +383,132 @@ class MetadataStore:
 
         Returns:
             Model of the original step derived from the proto.Execution.
+        """
+        return self._get_step_models_from_executions([execution])[execution.id]
+
+    def _get_step_models_from_executions(
+        self, executions: List[proto.Execution]
+    ) -> Dict[int, MLMDStepRunModel]:
+        """Get the original steps including their artifacts from executions.
+
+        All events, artifacts, contexts and types needed to build the models
+        are loaded from the metadata store in bulk and the models are then
+        assembled in memory.
+
+        Args:
+            executions: proto.Execution objects from mlmd store.
+
+        Returns:
+            Models of the original steps derived from the executions, indexed
+            by execution ID.
+        """
+        events = self.store.get_events_by_execution_ids(
+            [execution.id for execution in executions]
+        )
+        events_by_execution: Dict[int, List[proto.Event]] = defaultdict(list)
+        for event in events:
+            events_by_execution[event.execution_id].append(event)
+
+        artifact_ids = list({event.artifact_id for event in events})
+        artifacts = {
+            artifact.id: artifact
+            for artifact in self.store.get_artifacts_by_id(artifact_ids)
+        }
+
+        # All output events of the artifacts, including the ones of executions
+        # that are not part of `executions`, e.g. the steps of previous runs
+        # which originally produced cached artifacts.
+        output_events: Dict[int, List[proto.Event]] = defaultdict(list)
+        for event in self.store.get_events_by_artifact_ids(artifact_ids):
+            if event.type == event.OUTPUT:
+                output_events[event.artifact_id].append(event)
+
+        contexts_properties = self._get_zenml_execution_contexts_properties(
+            executions
+        )
+
+        steps: Dict[int, MLMDStepRunModel] = {}
+        for execution in executions:
+            impl_name = self._get_type_name(
+                "execution", execution.type_id
+            ).split(".")[-1]
+            (
+                step_name,
+                step_parameters,
+                step_metrics,
+            ) = self._parse_step_properties(execution)
+
+            step_configuration = json.loads(
+                contexts_properties[execution.id]
+                .get(MLMD_CONTEXT_STEP_CONFIG_PROPERTY_NAME)
+                .string_value
+            )
+
+            execution_events = events_by_execution[execution.id]
+            parents_step_ids = self._get_parent_step_ids(
+                execution, events=execution_events, output_events=output_events
+            )
+            inputs, outputs = self._get_step_artifacts(
+                execution,
+                events=execution_events,
+                artifacts=artifacts,
+                output_events=output_events,
+                parents_step_ids=parents_step_ids,
+            )
+
+            steps[execution.id] = MLMDStepRunModel(
+                mlmd_id=execution.id,
+                mlmd_parent_step_ids=list(parents_step_ids),
+                entrypoint_name=impl_name,
+                name=step_name,
+                parameters=step_parameters,
+                step_configuration=step_configuration,
+                inputs=inputs,
+                outputs=outputs,
+                metrics=step_metrics,
+            )
+
+        return steps
+
+    @staticmethod
+    def _get_step_name(execution: proto.Execution) -> str:
+        """Gets the name of the step that an execution belongs to.
+
+        Args:
+            execution: proto.Execution object from mlmd store.
+
+        Returns:
+            The step name.
 
         Raises:
             KeyError: If the execution is not associated with a step.
         """
-        impl_name = self.step_type_mapping[execution.type_id].split(".")[-1]
-
         step_name_property = execution.custom_properties.get(
             INTERNAL_EXECUTION_PARAMETER_PREFIX + PARAM_PIPELINE_PARAMETER_NAME,
             None,
         )
-        if step_name_property:
-            step_name = json.loads(step_name_property.string_value)
-        else:
+        if not step_name_property:
             raise KeyError(
                 f"Step name missing for execution with ID {execution.id}. "
                 f"This error probably occurs because you're using ZenML "
                 f"version 0.5.4 or newer but your metadata store contains "
                 f"data from previous versions."
             )
+        return cast(str, json.loads(step_name_property.string_value))
+
+    @classmethod
+    def _parse_step_properties(
+        cls, execution: proto.Execution
+    ) -> Tuple[str, Dict[str, str], Dict[str, float]]:
+        """Parses the name, parameters and metrics of a step execution.
+
+        Args:
+            execution: proto.Execution object from mlmd store.
+
+        Returns:
+            The step name, parameters and metrics.
+        """
+        step_name = cls._get_step_name(execution)
 
         step_parameters = {}
         for k, v in execution.custom_properties.items():
@@ -185,74 +517,139 @@ class MetadataStore:
                     json.loads(v.string_value)
                     step_parameters[k] = v.string_value
                 except JSONDecodeError:
-                    # this means there is a property in there that is neither
-                    # an internal one or one created by zenml. Therefore, we can
-                    # ignore it
+                    # this means there is a property in there that is
+                    # neither an internal one or one created by zenml.
+                    # Therefore, we can ignore it
                     pass
 
-        step_context_properties = self._get_zenml_execution_context_properties(
-            execution=execution,
-        )
-        step_configuration = json.loads(
-            step_context_properties.get(
-                MLMD_CONTEXT_STEP_CONFIG_PROPERTY_NAME
-            ).string_value
+        # Step metrics only exist for steps that finished successfully
+        step_metrics = {}
+        step_metrics_property = execution.custom_properties.get(
+            STEP_METRICS_PROPERTY_NAME, None
         )
+        if step_metrics_property:
+            step_metrics = json.loads(step_metrics_property.string_value)
 
-        # TODO [ENG-222]: This is a lot of querying to the metadata store. We
-        #  should refactor and make it nicer. Probably it makes more sense
-        #  to first get `executions_ids_for_current_run` and then filter on
-        #  `event.execution_id in execution_ids_for_current_run`.
-        # Core logic here is that we get the event of this particular execution
-        # id that gives us the artifacts of this execution. We then go through
-        # all `input` artifacts of this execution and get all events related to
-        # that artifact. This in turn gives us other events for which this
-        # artifact was an `output` artifact. Then we simply need to sort by
-        # time to get the most recent execution (i.e. step) that produced that
-        # particular artifact.
-        events_for_execution = self.store.get_events_by_execution_ids(
-            [execution.id]
-        )
+        return step_name, step_parameters, step_metrics
 
-        parents_step_ids = set()
-        for current_event in events_for_execution:
-            if current_event.type == current_event.INPUT:
-                # this means the artifact is an input artifact
-                events_for_input_artifact = [
-                    e
-                    for e in self.store.get_events_by_artifact_ids(
-                        [current_event.artifact_id]
-                    )
-                    # should be output type and should NOT be the same id as
-                    # the execution we are querying and it should be BEFORE
-                    # the time of the current event.
-                    if e.type == e.OUTPUT
-                    and e.execution_id != current_event.execution_id
-                    and e.milliseconds_since_epoch
-                    < current_event.milliseconds_since_epoch
-                ]
-
-                # sort by time
-                events_for_input_artifact.sort(
+    @staticmethod
+    def _get_parent_step_ids(
+        execution: proto.Execution,
+        events: List[proto.Event],
+        output_events: Dict[int, List[proto.Event]],
+    ) -> Set[int]:
+        """Gets the IDs of the parent steps of a step execution.
+
+        Core logic here is that we go through all `input` artifacts of this
+        execution and look at the events for which this artifact was an
+        `output` artifact. Then we simply need to sort by time to get the most
+        recent execution (i.e. step) that produced that particular artifact.
+
+        Args:
+            execution: proto.Execution object from mlmd store.
+            events: All events of the execution.
+            output_events: The output events of all artifacts of the
+                execution, indexed by artifact ID.
+
+        Returns:
+            The MLMD IDs of the parent steps.
+        """
+        parents_step_ids: Set[int] = set()
+        for event in events:
+            if event.type != event.INPUT:
+                continue
+            producer_events = [
+                e
+                for e in output_events[event.artifact_id]
+                # should NOT be the same id as the execution we are
+                # querying and it should be BEFORE the time of the
+                # current event.
+                if e.execution_id != execution.id
+                and e.milliseconds_since_epoch < event.milliseconds_since_epoch
+            ]
+            if producer_events:
+                producer_events.sort(
                     key=lambda x: x.milliseconds_since_epoch  # type: ignore[no-any-return] # noqa
                 )
-                # take the latest one and add execution to the parents.
-                parents_step_ids.add(events_for_input_artifact[-1].execution_id)
-
-        return MLMDStepRunModel(
-            mlmd_id=execution.id,
-            mlmd_parent_step_ids=list(parents_step_ids),
-            entrypoint_name=impl_name,
-            name=step_name,
-            parameters=step_parameters,
-            step_configuration=step_configuration,
-        )
+                parents_step_ids.add(producer_events[-1].execution_id)
+        return parents_step_ids
+
+    def _get_step_artifacts(
+        self,
+        execution: proto.Execution,
+        events: List[proto.Event],
+        artifacts: Dict[int, proto.Artifact],
+        output_events: Dict[int, List[proto.Event]],
+        parents_step_ids: Set[int],
+    ) -> Tuple[Dict[str, MLMDArtifactModel], Dict[str, MLMDArtifactModel]]:
+        """Gets the input and output artifacts of a step execution.
+
+        Args:
+            execution: proto.Execution object from mlmd store.
+            events: All events of the execution.
+            artifacts: All artifacts of the execution, indexed by ID.
+            output_events: The output events of all artifacts of the
+                execution, indexed by artifact ID.
+            parents_step_ids: The MLMD IDs of the parent steps.
+
+        Returns:
+            The input and output artifacts by name.
+        """
+        inputs: Dict[str, MLMDArtifactModel] = {}
+        outputs: Dict[str, MLMDArtifactModel] = {}
+        for event in events:
+            artifact_proto = artifacts[event.artifact_id]
+            artifact_output_events = output_events[event.artifact_id]
+
+            parent_step_id = execution.id
+            if event.type == event.INPUT:
+                # In the case that this is an input event, we actually
+                # need to resolve it via its parents outputs.
+                for parent_id in parents_step_ids:
+                    if any(
+                        e.execution_id == parent_id
+                        for e in artifact_output_events
+                    ):
+                        parent_step_id = parent_id
+
+            # The producer is the first step that created the artifact.
+            producer_step_id = min(
+                (e.execution_id for e in artifact_output_events),
+                default=execution.id,
+            )
+            artifact = MLMDArtifactModel(
+                mlmd_id=artifact_proto.id,
+                type=self._get_type_name("artifact", artifact_proto.type_id),
+                uri=artifact_proto.uri,
+                materializer=artifact_proto.properties[
+                    MATERIALIZER_PROPERTY_KEY
+                ].string_value,
+                data_type=artifact_proto.properties[
+                    DATATYPE_PROPERTY_KEY
+                ].string_value,
+                mlmd_parent_step_id=parent_step_id,
+                mlmd_producer_step_id=producer_step_id,
+                is_cached=parent_step_id != producer_step_id,
+            )
+
+            artifact_name = event.path.steps[0].key
+            if event.type == event.INPUT:
+                inputs[artifact_name] = artifact
+            elif event.type == event.OUTPUT:
+                outputs[artifact_name] = artifact
+        return inputs, outputs
 
     def _get_pipeline_run_model_from_context(
-        self, context: proto.Context
+        self,
+        context: proto.Context,
+        executions: Optional[List[proto.Execution]] = None,
     ) -> MLMDPipelineRunModel:
+        if executions is None:
+            executions = self.store.get_executions_by_context(
+                context_id=context.id
+            )
         context_properties = self._get_zenml_execution_context_properties(
-            self.store.get_executions_by_context(context_id=context.id)[-1]
+            executions[-1]
         )
         model_ids = json.loads(
             context_properties.get(
@@ -280,20 +677,176 @@ class MetadataStore:
             num_steps=num_steps,
         )
 
+    @track_queries
     def get_all_runs(self) -> Dict[str, MLMDPipelineRunModel]:
         """Gets a mapping run name -> ID for all runs registered in MLMD.
 
         Returns:
             A mapping run name -> ID for all runs registered in MLMD.
         """
-        all_pipeline_runs = self.store.get_contexts_by_type(
-            PIPELINE_RUN_CONTEXT_TYPE_NAME
+        runs, _ = self.get_new_runs()
+        return runs
+
+    @track_queries
+    def get_new_runs(
+        self,
+        min_mlmd_id: int = 0,
+        synced_mlmd_ids: Optional[Set[int]] = None,
+    ) -> Tuple[Dict[str, MLMDPipelineRunModel], int]:
+        """Gets all runs that were registered in MLMD after a high-water mark.
+
+        Runs are returned in the order in which they were registered. Run
+        contexts without any executions can't be synced yet: If such a
+        context is younger than `RUN_CONTEXT_SETUP_TIMEOUT_SECONDS`, it is most
+        likely still being set up and no runs registered after it are
+        returned. Older contexts without executions belong to runs that were
+        abandoned before their first step started, so they are skipped and
+        the high-water mark advances past them.
+
+        Args:
+            min_mlmd_id: Only return runs with an MLMD context ID strictly
+                greater than this value.
+            synced_mlmd_ids: MLMD IDs of runs that were already synced and
+                should not be returned again.
+
+        Returns:
+            A mapping run name -> run of all new runs and the new high-water
+            mark to use for subsequent calls.
+        """
+        synced_mlmd_ids = synced_mlmd_ids or set()
+        contexts = sorted(
+            self.store.get_contexts(
+                list_options=metadata_store.ListOptions(
+                    filter_query=(
+                        f"type = '{PIPELINE_RUN_CONTEXT_TYPE_NAME}' "
+                        f"AND id > {int(min_mlmd_id)}"
+                    )
+                )
+            ),
+            key=lambda context: context.id,  # type: ignore[no-any-return]
         )
-        return {
-            run.name: self._get_pipeline_run_model_from_context(run)
-            for run in all_pipeline_runs
-        }
 
+        runs: Dict[str, MLMDPipelineRunModel] = OrderedDict()
+        high_water_mark = min_mlmd_id
+        for context in contexts:
+            if context.id not in synced_mlmd_ids:
+                executions = self.store.get_executions_by_context(
+                    context_id=context.id
+                )
+                if not executions:
+                    age = time.time() - context.create_time_since_epoch / 1000
+                    if age < RUN_CONTEXT_SETUP_TIMEOUT_SECONDS:
+                        logger.debug(
+                            "Pipeline run '%s' is still being set up, "
+                            "postponing the sync of all subsequent runs.",
+                            context.name,
+                        )
+                        break
+                    logger.debug(
+                        "Skipping abandoned pipeline run '%s' without any "
+                        "executions.",
+                        context.name,
+                    )
+                    high_water_mark = context.id
+                    continue
+                runs[context.name] = self._get_pipeline_run_model_from_context(
+                    context, executions=executions
+                )
+            high_water_mark = context.id
+        return runs, high_water_mark
+
+    @track_queries
+    def get_run_step_statuses(self, run_id: int) -> List[ExecutionStatus]:
+        """Gets the execution statuses of all steps of a pipeline run.
+
+        Orchestrators can retry failed steps, which creates a new execution
+        for each attempt. The status of a step is therefore the status of its
+        latest execution. A failed step for which the orchestrator recorded a
+        retry (see `record_step_retry`) is reported as running until the
+        retry should have started.
+
+        Args:
+            run_id: The ID of the pipeline run to get the step statuses for.
+
+        Returns:
+            The statuses of all steps that were started as part of the run.
+        """
+        step_statuses = []
+        for execution in self._get_latest_step_executions(run_id).values():
+            status = self._get_execution_status(execution)
+            if status == ExecutionStatus.FAILED:
+                retry_scheduled_at = execution.custom_properties.get(
+                    RETRY_SCHEDULED_AT_PROPERTY_NAME, None
+                )
+                if (
+                    retry_scheduled_at
+                    and time.time()
+                    < retry_scheduled_at.int_value
+                    + RUN_CONTEXT_SETUP_TIMEOUT_SECONDS
+                ):
+                    status = ExecutionStatus.RUNNING
+            step_statuses.append(status)
+        return step_statuses
+
+    @track_queries
+    def record_step_retry(
+        self, run_name: str, step_name: str, retry_time: float
+    ) -> bool:
+        """Records that a failed step of a pipeline run will be retried.
+
+        This is called by orchestrators once they decided to retry a step, so
+        the run isn't considered failed while waiting for the retry.
+
+        Args:
+            run_name: The name of the pipeline run.
+            step_name: The name of the step.
+            retry_time: The time at which the retry starts in seconds since
+                the epoch.
+
+        Returns:
+            `True` if the retry was recorded, `False` if the step has no
+            failed execution in the run.
+        """
+        run_context = self.store.get_context_by_type_and_name(
+            PIPELINE_RUN_CONTEXT_TYPE_NAME, run_name
+        )
+        if run_context is None:
+            return False
+        execution = self._get_latest_step_executions(run_context.id).get(
+            step_name
+        )
+        if (
+            execution is None
+            or self._get_execution_status(execution) != ExecutionStatus.FAILED
+        ):
+            return False
+
+        execution.custom_properties[
+            RETRY_SCHEDULED_AT_PROPERTY_NAME
+        ].int_value = int(retry_time)
+        self.store.put_executions([execution])
+        return True
+
+    def _get_latest_step_executions(
+        self, run_id: int
+    ) -> Dict[str, proto.Execution]:
+        """Gets the latest execution of each step of a pipeline run.
+
+        Args:
+            run_id: The ID of the pipeline run.
+
+        Returns:
+            A mapping from step names to their latest executions.
+        """
+        latest_executions: Dict[str, proto.Execution] = {}
+        for execution in sorted(
+            self.store.get_executions_by_context(run_id),
+            key=lambda execution: execution.id,  # type: ignore[no-any-return]
+        ):
+            latest_executions[self._get_step_name(execution)] = execution
+        return latest_executions
+
+    @track_queries
     def get_pipeline_run_steps(
         self, run_id: int
     ) -> Dict[str, MLMDStepRunModel]:
@@ -308,13 +861,17 @@ class MetadataStore:
         steps: Dict[str, MLMDStepRunModel] = OrderedDict()
         # reverse the executions as they get returned in reverse chronological
         # order from the metadata store
-        executions = self.store.get_executions_by_context(run_id)
-        for execution in reversed(executions):  # noqa
-            step = self._get_step_model_from_execution(execution)
+        executions = list(
+            reversed(self.store.get_executions_by_context(run_id))
+        )
+        step_models = self._get_step_models_from_executions(executions)
+        for execution in executions:
+            step = step_models[execution.id]
             steps[step.name] = step
         logger.debug(f"Fetched {len(steps)} steps for pipeline run '{run_id}'.")
         return steps
 
+    @track_queries
     def get_step_by_id(self, step_id: int) -> MLMDStepRunModel:
         """Gets a step by its ID.
 
@@ -327,6 +884,7 @@ class MetadataStore:
         execution = self.store.get_executions_by_id([step_id])[0]
         return self._get_step_model_from_execution(execution)
 
+    @track_queries
     def get_step_status(self, step_id: int) -> ExecutionStatus:
         """Gets the execution status of a single step.
 
@@ -336,103 +894,54 @@ class MetadataStore:
         Returns:
             ExecutionStatus: The status of the step.
         """
-        proto = self.store.get_executions_by_id([step_id])[0]  # noqa
-        state = proto.last_known_state
+        execution = self.store.get_executions_by_id([step_id])[0]
+        return self._get_execution_status(execution)
+
+    @staticmethod
+    def _get_execution_status(execution: proto.Execution) -> ExecutionStatus:
+        """Converts the state of an MLMD execution to an execution status.
+
+        Args:
+            execution: The MLMD execution.
+
+        Returns:
+            The status of the execution.
+        """
+        state = execution.last_known_state
 
-        if state == proto.COMPLETE:
+        if state == execution.COMPLETE:
             return ExecutionStatus.COMPLETED
-        elif state == proto.RUNNING:
+        elif state == execution.RUNNING:
             return ExecutionStatus.RUNNING
-        elif state == proto.CACHED:
+        elif state == execution.CACHED:
             return ExecutionStatus.CACHED
         else:
             return ExecutionStatus.FAILED
 
+    @track_queries
     def get_step_artifacts(
-        self, step_id: int, step_parent_step_ids: List[int], step_name: str
+        self, step_id: int
     ) -> Tuple[Dict[str, MLMDArtifactModel], Dict[str, MLMDArtifactModel]]:
         """Returns input and output artifacts for the given step.
 
         Args:
             step_id: The ID of the step to get the artifacts for.
-            step_parent_step_ids: The IDs of the parent steps of the given step.
-            step_name: The name of the step.
 
         Returns:
             A tuple (inputs, outputs) where inputs and outputs are both Dicts mapping artifact names to the input and output artifacts respectively.
         """
-        # maps artifact types to their string representation
-        artifact_type_mapping = {
-            type_.id: type_.name for type_ in self.store.get_artifact_types()
-        }
-
-        events = self.store.get_events_by_execution_ids([step_id])  # noqa
-        artifacts = self.store.get_artifacts_by_id(
-            [event.artifact_id for event in events]
-        )
-
-        inputs: Dict[str, MLMDArtifactModel] = {}
-        outputs: Dict[str, MLMDArtifactModel] = {}
-
-        # sort them according to artifact_id's so that the zip works.
-        events.sort(key=lambda x: x.artifact_id)
-        artifacts.sort(key=lambda x: x.id)
-
-        for event_proto, artifact_proto in zip(events, artifacts):
-            artifact_type = artifact_type_mapping[artifact_proto.type_id]
-            artifact_name = event_proto.path.steps[0].key
-
-            materializer = artifact_proto.properties[
-                MATERIALIZER_PROPERTY_KEY
-            ].string_value
-
-            data_type = artifact_proto.properties[
-                DATATYPE_PROPERTY_KEY
-            ].string_value
-
-            parent_step_id = step_id
-            if event_proto.type == event_proto.INPUT:
-                # In the case that this is an input event, we actually need
-                # to resolve it via its parents outputs.
-                for parent_id in step_parent_step_ids:
-                    parent_step = self.get_step_by_id(parent_id)
-                    parent_outputs = self.get_step_artifacts(
-                        step_id=parent_id,
-                        step_parent_step_ids=parent_step.mlmd_parent_step_ids,
-                        step_name=parent_step.entrypoint_name,
-                    )[1]
-                    for parent_output in parent_outputs.values():
-                        if artifact_proto.id == parent_output.mlmd_id:
-                            parent_step_id = parent_id
-
-            artifact_id = event_proto.artifact_id
-            producer_step = self.get_producer_step_from_artifact(artifact_id)
-            producer_step_id = producer_step.mlmd_id
-            artifact = MLMDArtifactModel(
-                mlmd_id=artifact_id,
-                type=artifact_type,
-                uri=artifact_proto.uri,
-                materializer=materializer,
-                data_type=data_type,
-                mlmd_parent_step_id=parent_step_id,
-                mlmd_producer_step_id=producer_step_id,
-                is_cached=parent_step_id != producer_step_id,
-            )
-
-            if event_proto.type == event_proto.INPUT:
-                inputs[artifact_name] = artifact
-            elif event_proto.type == event_proto.OUTPUT:
-                outputs[artifact_name] = artifact
+        step = self.get_step_by_id(step_id)
 
         logger.debug(
             "Fetched %d inputs and %d outputs for step '%s'.",
-            len(inputs),
-            len(outputs),
-            step_name,
+            len(step.inputs),
+            len(step.outputs),
+            step.entrypoint_name,
         )
 
-        return inputs, outputs
+        return step.inputs, step.outputs
 
+    @track_queries
     def get_producer_step_from_artifact(
         self, artifact_id: int
     ) -> MLMDStepRunModel:
@@ -449,8 +958,7 @@ class MetadataStore:
             for event in self.store.get_events_by_artifact_ids([artifact_id])
             if event.type == event.OUTPUT
         )
-        execution = self.store.get_executions_by_id(executions_ids)[0]
-        return self._get_step_model_from_execution(execution)
+        return self.get_step_by_id(min(executions_ids))
 
     class Config:
         """Pydantic configuration class."""
@@ -13,23 +13,33 @@
 #  permissions and limitations under the License.
 """REST Zen Store implementation."""
 
+import gzip
 import os
+import random
 import re
+import socket
+import time
+from datetime import datetime
 from pathlib import Path, PurePath
 from typing import Any, ClassVar, Dict, List, Optional, Type, TypeVar, Union
+from urllib.parse import urlencode
 from uuid import UUID
 
 import requests
 import urllib3
 from google.protobuf.json_format import Parse
 from ml_metadata.proto.metadata_store_pb2 import ConnectionConfig
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, PrivateAttr, validator
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
 from zenml.config.global_config import GlobalConfiguration
 from zenml.config.store_config import StoreConfiguration
 from zenml.constants import (
     API,
     ARTIFACTS,
+    COUNT,
     EMAIL_ANALYTICS,
     FLAVORS,
     INFO,
@@ -116,6 +126,20 @@ AnyProjectScopedModel = TypeVar(
     "AnyProjectScopedModel", bound=ProjectScopedDomainModel
 )
 
+# Only requests with these methods are retried automatically because repeating
+# them has no additional side effects
+IDEMPOTENT_HTTP_METHODS = frozenset(["GET", "HEAD", "PUT", "DELETE", "OPTIONS"])
+# Status codes of transient server errors for which requests are retried
+RETRY_STATUS_CODES = frozenset([502, 503, 504])
+# Responses of these read-mostly resources are cached by the client
+CACHED_ROUTES = frozenset(
+    [STACKS, STACK_COMPONENTS, FLAVORS, USERS, TEAMS, ROLES, PROJECTS]
+)
+UUID_PATH_SEGMENT_REGEX = re.compile(
+    r"/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+    re.IGNORECASE,
+)
+
 
 class RestZenStoreConfiguration(StoreConfiguration):
     """REST ZenML store configuration.
@@ -126,12 +150,34 @@ class RestZenStoreConfiguration(StoreConfiguration):
         verify_ssl: Either a boolean, in which case it controls whether we
             verify the server's TLS certificate, or a string, in which case it
             must be a path to a CA bundle to use or the CA bundle value itself.
+        pool_size: The maximum number of connections to the server that are
+            kept open and reused for subsequent requests.
+        max_retries: How often idempotent requests are retried after a
+            connection error or a transient server error.
+        retry_backoff_factor: Base of the exponential backoff between retries
+            in seconds. The actual wait time is randomly jittered between zero
+            and the exponential backoff.
+        compress_requests: Whether to gzip request bodies. This requires a
+            server that is able to decompress them.
+        tcp_keep_alive: Whether to enable TCP keep-alive probes on the
+            connections to the server, so idle pooled connections aren't
+            silently dropped by proxies or load balancers.
+        cache_ttl: How many seconds cached responses of read-mostly resources
+            like stacks or users are used without asking the server. Older
+            responses are revalidated with a conditional request. Set this to
+            zero to revalidate cached responses on every request.
     """
 
     type: StoreType = StoreType.REST
     username: str
     password: str = ""
     verify_ssl: Union[bool, str] = True
+    pool_size: int = 10
+    max_retries: int = 3
+    retry_backoff_factor: float = 0.5
+    compress_requests: bool = False
+    tcp_keep_alive: bool = True
+    cache_ttl: float = 10.0
 
     @validator("url")
     def validate_url(cls, url: str) -> str:
@@ -190,6 +236,65 @@ class RestZenStoreConfiguration(StoreConfiguration):
 
         return verify_ssl
 
+    @validator("pool_size")
+    def validate_pool_size(cls, pool_size: int) -> int:
+        """Validates that the connection pool size is positive.
+
+        Args:
+            pool_size: The pool size to be validated.
+
+        Returns:
+            The validated pool size.
+
+        Raises:
+            ValueError: If the pool size is not positive.
+        """
+        if pool_size <= 0:
+            raise ValueError(
+                f"Connection pool size must be positive, got {pool_size}."
+            )
+        return pool_size
+
+    @validator("cache_ttl")
+    def validate_cache_ttl(cls, cache_ttl: float) -> float:
+        """Validates that the cache TTL is not negative.
+
+        Args:
+            cache_ttl: The cache TTL to be validated.
+
+        Returns:
+            The validated cache TTL.
+
+        Raises:
+            ValueError: If the cache TTL is negative.
+        """
+        if cache_ttl < 0:
+            raise ValueError(
+                f"Cache TTL must not be negative, got {cache_ttl}."
+            )
+        return cache_ttl
+
+    @validator("max_retries", "retry_backoff_factor")
+    def validate_retry_settings(
+        cls, value: Union[int, float]
+    ) -> Union[int, float]:
+        """Validates that the retry settings are not negative.
+
+        Args:
+            value: The retry setting to be validated.
+
+        Returns:
+            The validated retry setting.
+
+        Raises:
+            ValueError: If the retry setting is negative.
+        """
+        if value < 0:
+            raise ValueError(
+                f"Retry settings must not be negative, got {value}."
+            )
+        return value
+
     class Config:
         """Pydantic configuration class."""
 
@@ -201,6 +306,87 @@ class RestZenStoreConfiguration(StoreConfiguration):
         extra = "forbid"
 
 
+class JitteredRetry(Retry):
+    """Retry policy with a randomly jittered exponential backoff.
+
+    Jittering the backoff prevents many clients, e.g. all pods of a pipeline,
+    from retrying their requests against the server at the same time.
+    """
+
+    def get_backoff_time(self) -> float:
+        """Gets a random backoff time between zero and the exponential backoff.
+
+        Returns:
+            The time to wait before the next retry in seconds.
+        """
+        backoff = float(super().get_backoff_time())
+        return random.uniform(0, backoff) if backoff > 0 else 0.0
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that enables TCP keep-alive probes on its connections."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Initializes the pool manager with TCP keep-alive socket options.
+
+        Args:
+            *args: Positional arguments to pass to the pool manager.
+            **kwargs: Keyword arguments to pass to the pool manager.
+        """
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+
+class RequestMetrics(BaseModel):
+    """Latency metrics of the requests made to a single API route.
+
+    Attributes:
+        count: The number of requests made.
+        total_duration: The total duration of all requests in seconds.
+        max_duration: The duration of the slowest request in seconds.
+    """
+
+    count: int = 0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+
+    @property
+    def average_duration(self) -> float:
+        """The average duration of the requests in seconds.
+
+        Returns:
+            The average request duration.
+        """
+        return self.total_duration / self.count if self.count else 0.0
+
+    def record(self, duration: float) -> None:
+        """Records the duration of a request.
+
+        Args:
+            duration: The duration of the request in seconds.
+        """
+        self.count += 1
+        self.total_duration += duration
+        self.max_duration = max(self.max_duration, duration)
+
+
+class CachedResponse(BaseModel):
+    """Cached body of a GET response.
+
+    Attributes:
+        body: The parsed response body.
+        etag: The entity tag the server sent with the response, if any.
+        timestamp: Monotonic time at which the response was last received or
+            revalidated.
+    """
+
+    body: Any
+    etag: Optional[str] = None
+    timestamp: float
+
+
 class RestZenStore(BaseZenStore):
     """Store implementation for accessing data from a REST API."""
 
@@ -209,6 +395,12 @@ class RestZenStore(BaseZenStore):
     CONFIG_TYPE: ClassVar[Type[StoreConfiguration]] = RestZenStoreConfiguration
     _api_token: Optional[str] = None
     _session: Optional[requests.Session] = None
+    _request_metrics: Dict[str, RequestMetrics] = PrivateAttr(
+        default_factory=dict
+    )
+    _response_cache: Dict[str, CachedResponse] = PrivateAttr(
+        default_factory=dict
+    )
 
     def _initialize_database(self) -> None:
         """Initialize the database."""
@@ -388,6 +580,11 @@ class RestZenStore(BaseZenStore):
         component_id: Optional[UUID] = None,
         name: Optional[str] = None,
         is_shared: Optional[bool] = None,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[StackModel]:
         """List all stacks matching the given filter criteria.
 
@@ -399,6 +596,15 @@ class RestZenStore(BaseZenStore):
             name: Optionally filter stacks by their name
             is_shared: Optionally filter out stacks by whether they are shared
                 or not
+            sort_by: Name of the field to sort the stacks by. Prefix it with
+                `-` to sort in descending order.
+            created_after: If provided, only return stacks created after this
+                time.
+            created_before: If provided, only return stacks created before
+                this time.
+            offset: Number of stacks to skip.
+            limit: Maximum number of stacks to return. If not provided, all
+                remaining stacks are returned.
 
         Returns:
             A list of all stacks matching the filter criteria.
@@ -489,6 +695,11 @@ class RestZenStore(BaseZenStore):
         flavor_name: Optional[str] = None,
         name: Optional[str] = None,
         is_shared: Optional[bool] = None,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[ComponentModel]:
         """List all stack components matching the given filter criteria.
 
@@ -501,6 +712,15 @@ class RestZenStore(BaseZenStore):
             name: Optionally filter stack component by name
             is_shared: Optionally filter out stack component by whether they are
                 shared or not
+            sort_by: Name of the field to sort the stack components by. Prefix
+                it with `-` to sort in descending order.
+            created_after: If provided, only return stack components created
+                after this time.
+            created_before: If provided, only return stack components created
+                before this time.
+            offset: Number of stack components to skip.
+            limit: Maximum number of stack components to return. If not
+                provided, all remaining stack components are returned.
 
         Returns:
             A list of all stack components matching the filter criteria.
@@ -705,9 +925,27 @@ class RestZenStore(BaseZenStore):
         )
 
     # TODO: [ALEX] add filtering param(s)
-    def list_users(self) -> List[UserModel]:
+    def list_users(
+        self,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[UserModel]:
         """List all users.
 
+        Args:
+            sort_by: Name of the field to sort the users by. Prefix it with
+                `-` to sort in descending order.
+            created_after: If provided, only return users created after this
+                time.
+            created_before: If provided, only return users created before
+                this time.
+            offset: Number of users to skip.
+            limit: Maximum number of users to return. If not provided, all
+                remaining users are returned.
+
         Returns:
             A list of all users.
         """
@@ -1175,6 +1413,11 @@ class RestZenStore(BaseZenStore):
         project_name_or_id: Optional[Union[str, UUID]] = None,
         user_name_or_id: Optional[Union[str, UUID]] = None,
         name: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[PipelineModel]:
         """List all pipelines in the project.
 
@@ -1182,6 +1425,15 @@ class RestZenStore(BaseZenStore):
             project_name_or_id: If provided, only list pipelines in this project.
             user_name_or_id: If provided, only list pipelines from this user.
             name: If provided, only list pipelines with this name.
+            sort_by: Name of the field to sort the pipelines by. Prefix it with
+                `-` to sort in descending order.
+            created_after: If provided, only return pipelines created after
+                this time.
+            created_before: If provided, only return pipelines created before
+                this time.
+            offset: Number of pipelines to skip.
+            limit: Maximum number of pipelines to return. If not provided, all
+                remaining pipelines are returned.
 
         Returns:
             A list of pipelines.
@@ -1278,6 +1530,11 @@ class RestZenStore(BaseZenStore):
         user_name_or_id: Optional[Union[str, UUID]] = None,
         pipeline_id: Optional[UUID] = None,
         unlisted: bool = False,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[PipelineRunModel]:
         """Gets all pipeline runs.
 
@@ -1291,6 +1548,15 @@ class RestZenStore(BaseZenStore):
             pipeline_id: If provided, only return runs for this pipeline.
             unlisted: If True, only return unlisted runs that are not
                 associated with any pipeline (filter by `pipeline_id==None`).
+            sort_by: Name of the field to sort the runs by. Prefix it with
+                `-` to sort in descending order.
+            created_after: If provided, only return runs created after this
+                time.
+            created_before: If provided, only return runs created before
+                this time.
+            offset: Number of runs to skip.
+            limit: Maximum number of runs to return. If not provided, all
+                remaining runs are returned.
 
         Returns:
             A list of all pipeline runs.
@@ -1303,6 +1569,42 @@ class RestZenStore(BaseZenStore):
             **filters,
         )
 
+    def count_runs(
+        self,
+        project_name_or_id: Optional[Union[str, UUID]] = None,
+        stack_id: Optional[UUID] = None,
+        component_id: Optional[UUID] = None,
+        run_name: Optional[str] = None,
+        user_name_or_id: Optional[Union[str, UUID]] = None,
+        pipeline_id: Optional[UUID] = None,
+        unlisted: bool = False,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> int:
+        """Counts the pipeline runs matching the given filter criteria.
+
+        Args:
+            project_name_or_id: If provided, only count runs for this project.
+            stack_id: If provided, only count runs for this stack.
+            component_id: Optionally filter for runs that used the
+                          component
+            run_name: Run name if provided
+            user_name_or_id: If provided, only count runs for this user.
+            pipeline_id: If provided, only count runs for this pipeline.
+            unlisted: If True, only count unlisted runs that are not
+                associated with any pipeline (filter by `pipeline_id==None`).
+            created_after: If provided, only count runs created after this
+                time.
+            created_before: If provided, only count runs created before this
+                time.
+
+        Returns:
+            The number of pipeline runs matching the filter criteria.
+        """
+        filters = locals()
+        filters.pop("self")
+        return self._count_resources(route=RUNS, **filters)
+
     def get_run_status(self, run_id: UUID) -> ExecutionStatus:
         """Gets the execution status of a pipeline run.
 
@@ -1403,13 +1705,28 @@ class RestZenStore(BaseZenStore):
         )
 
     def list_artifacts(
-        self, artifact_uri: Optional[str] = None
+        self,
+        artifact_uri: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[ArtifactModel]:
         """Lists all artifacts.
 
         Args:
             artifact_uri: If specified, only artifacts with the given URI will
                 be returned.
+            sort_by: Name of the field to sort the artifacts by. Prefix it with
+                `-` to sort in descending order.
+            created_after: If provided, only return artifacts created after
+                this time.
+            created_before: If provided, only return artifacts created before
+                this time.
+            offset: Number of artifacts to skip.
+            limit: Maximum number of artifacts to return. If not provided, all
+                remaining artifacts are returned.
 
         Returns:
             A list of all artifacts.
@@ -1422,13 +1739,39 @@ class RestZenStore(BaseZenStore):
             **filters,
         )
 
+    def count_artifacts(
+        self,
+        artifact_uri: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> int:
+        """Counts the artifacts matching the given filter criteria.
+
+        Args:
+            artifact_uri: If specified, only artifacts with the given URI will
+                be counted.
+            created_after: If provided, only count artifacts created after
+                this time.
+            created_before: If provided, only count artifacts created before
+                this time.
+
+        Returns:
+            The number of artifacts matching the filter criteria.
+        """
+        filters = locals()
+        filters.pop("self")
+        return self._count_resources(route=ARTIFACTS, **filters)
+
     # =======================
     # Internal helper methods
     # =======================
 
-    def _get_auth_token(self) -> str:
+    def _get_auth_token(self, session: requests.Session) -> str:
         """Get the authentication token for the REST store.
 
+        Args:
+            session: The unauthenticated session to log in with.
+
         Returns:
             The authentication token.
 
@@ -1437,7 +1780,7 @@ class RestZenStore(BaseZenStore):
         """
         if self._api_token is None:
             response = self._handle_response(
-                requests.post(
+                session.post(
                     self.url + API + VERSION_1 + LOGIN,
                     data={
                         "username": self.config.username,
@@ -1454,6 +1797,38 @@ class RestZenStore(BaseZenStore):
             self._api_token = response["access_token"]
         return self._api_token
 
+    def _create_session(self) -> requests.Session:
+        """Creates a session with a pooled and retrying connection adapter.
+
+        Returns:
+            The unauthenticated session.
+        """
+        if self.config.verify_ssl is False:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+        retry = JitteredRetry(
+            total=self.config.max_retries,
+            backoff_factor=self.config.retry_backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=IDEMPOTENT_HTTP_METHODS,
+            # Let `_handle_response` raise the error of the last response
+            raise_on_status=False,
+        )
+        adapter_class = (
+            KeepAliveHTTPAdapter if self.config.tcp_keep_alive else HTTPAdapter
+        )
+        adapter = adapter_class(
+            pool_connections=self.config.pool_size,
+            pool_maxsize=self.config.pool_size,
+            max_retries=retry,
+        )
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.verify = self.config.verify_ssl
+        return session
+
     @property
     def session(self) -> requests.Session:
         """Authenticate to the ZenML server.
@@ -1462,18 +1837,39 @@ class RestZenStore(BaseZenStore):
             A requests session with the authentication token.
         """
         if self._session is None:
-            if self.config.verify_ssl is False:
-                urllib3.disable_warnings(
-                    urllib3.exceptions.InsecureRequestWarning
-                )
-
-            self._session = requests.Session()
-            self._session.verify = self.config.verify_ssl
-            token = self._get_auth_token()
-            self._session.headers.update({"Authorization": "Bearer " + token})
+            session = self._create_session()
+            token = self._get_auth_token(session)
+            session.headers.update({"Authorization": "Bearer " + token})
+            self._session = session
             logger.debug("Authenticated to ZenML server.")
         return self._session
 
+    @property
+    def request_metrics(self) -> Dict[str, RequestMetrics]:
+        """Latency metrics of the requests made to the server.
+
+        The keys are the HTTP method and API route of the requests, with the
+        IDs in the route replaced by a placeholder, e.g. `GET /runs/{id}`.
+
+        Returns:
+            The request metrics per route.
+        """
+        return self._request_metrics
+
+    def _record_request(self, method: str, url: str, duration: float) -> None:
+        """Records the duration of a request in the request metrics.
+
+        Args:
+            method: The HTTP method of the request.
+            url: The URL of the request.
+            duration: The duration of the request in seconds.
+        """
+        route = url[len(self.url + API + VERSION_1) :]
+        route = UUID_PATH_SEGMENT_REGEX.sub("/{id}", route)
+        key = f"{method} {route}"
+        self._request_metrics.setdefault(key, RequestMetrics()).record(duration)
+        logger.debug("%s request took %.3f seconds.", key, duration)
+
     def _handle_response(self, response: requests.Response) -> Json:
         """Handle API response, translating http status codes to Exception.
 
@@ -1561,14 +1957,14 @@ class RestZenStore(BaseZenStore):
                 f"{response.status_code} with body:\n{response.text}"
             )
 
-    def _request(
+    def _send(
         self,
         method: str,
         url: str,
         params: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
-    ) -> Json:
-        """Make a request to the REST API.
+    ) -> requests.Response:
+        """Send a request to the REST API without handling the response.
 
         Args:
             method: The HTTP method to use.
@@ -1577,27 +1973,125 @@ class RestZenStore(BaseZenStore):
             kwargs: Additional keyword arguments to pass to the request.
 
         Returns:
-            The parsed response.
+            The raw response.
         """
         params = {k: str(v) for k, v in params.items()} if params else {}
+        data = kwargs.get("data")
+        if self.config.compress_requests and isinstance(data, str):
+            kwargs["data"] = gzip.compress(data.encode("utf-8"))
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                "Content-Encoding": "gzip",
+            }
+
+        start_time = time.perf_counter()
         try:
-            return self._handle_response(
-                self.session.request(
+            response = self.session.request(
+                method,
+                url,
+                params=params,
+                verify=self.config.verify_ssl,
+                **kwargs,
+            )
+            if response.status_code == 401:
+                # The authentication token could have expired; refresh it and
+                # try again
+                self.session.close()
+                self._session = None
+                response = self.session.request(
                     method,
                     url,
                     params=params,
                     verify=self.config.verify_ssl,
                     **kwargs,
                 )
-            )
-        except AuthorizationException:
-            # The authentication token could have expired; refresh it and try
-            # again
-            self._session = None
-            return self._handle_response(
-                self.session.request(method, url, **kwargs)
+            return response
+        finally:
+            self._record_request(
+                method, url, duration=time.perf_counter() - start_time
             )
 
+    def _request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Json:
+        """Make a request to the REST API.
+
+        Any request that is not a GET request can modify resources on the
+        server, so it clears the response cache.
+
+        Args:
+            method: The HTTP method to use.
+            url: The URL to request.
+            params: The query parameters to pass to the endpoint.
+            kwargs: Additional keyword arguments to pass to the request.
+
+        Returns:
+            The parsed response.
+        """
+        if method != "GET":
+            self._response_cache.clear()
+        return self._handle_response(
+            self._send(method, url, params=params, **kwargs)
+        )
+
+    def _cached_get(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Json:
+        """Make a GET request whose response body is cached.
+
+        Cached responses are returned without contacting the server until
+        they are older than the configured cache TTL. Afterwards, they are
+        revalidated with a conditional request, so the server only sends the
+        response body again if it changed.
+
+        Args:
+            path: The path to the endpoint.
+            params: The query parameters to pass to the endpoint.
+
+        Returns:
+            The response body.
+        """
+        params = params or {}
+        key = (
+            path
+            + "?"
+            + urlencode(sorted((k, str(v)) for k, v in params.items()))
+        )
+        entry = self._response_cache.get(key)
+        if (
+            entry is not None
+            and time.monotonic() - entry.timestamp < self.config.cache_ttl
+        ):
+            logger.debug(f"Using cached response for GET request to {path}.")
+            return entry.body
+
+        headers = {}
+        if entry is not None and entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+
+        logger.debug(f"Sending GET request to {path}...")
+        response = self._send(
+            "GET",
+            self.url + API + VERSION_1 + path,
+            params=params,
+            headers=headers,
+        )
+        if response.status_code == 304 and entry is not None:
+            entry.timestamp = time.monotonic()
+            return entry.body
+
+        body = self._handle_response(response)
+        self._response_cache[key] = CachedResponse(
+            body=body,
+            etag=response.headers.get("ETag"),
+            timestamp=time.monotonic(),
+        )
+        return body
+
     def get(
         self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any
     ) -> Json:
@@ -1766,7 +2260,11 @@ class RestZenStore(BaseZenStore):
         Returns:
             The retrieved resource.
         """
-        body = self.get(f"{route}/{str(resource_id)}")
+        path = f"{route}/{str(resource_id)}"
+        if route in CACHED_ROUTES:
+            body = self._cached_get(path)
+        else:
+            body = self.get(path)
         return resource_model.parse_obj(body)
 
     def _list_resources(
@@ -1790,13 +2288,38 @@ class RestZenStore(BaseZenStore):
         """
         # leave out filter params that are not supplied
         params = dict(filter(lambda x: x[1] is not None, filters.items()))
-        body = self.get(f"{route}", params=params)
+        if route in CACHED_ROUTES:
+            body = self._cached_get(f"{route}", params=params)
+        else:
+            body = self.get(f"{route}", params=params)
         if not isinstance(body, list):
             raise ValueError(
                 f"Bad API Response. Expected list, got {type(body)}"
             )
         return [resource_model.parse_obj(entry) for entry in body]
 
+    def _count_resources(self, route: str, **filters: Any) -> int:
+        """Count the resources matching some filter criteria.
+
+        Args:
+            route: The resource REST API route to use.
+            filters: Filter parameters to use in the query.
+
+        Returns:
+            The number of resources matching the filter criteria.
+
+        Raises:
+            ValueError: If the value returned by the server is not an integer.
+        """
+        # leave out filter params that are not supplied
+        params = dict(filter(lambda x: x[1] is not None, filters.items()))
+        body = self.get(f"{route}{COUNT}", params=params)
+        if not isinstance(body, int):
+            raise ValueError(
+                f"Bad API Response. Expected int, got {type(body)}"
+            )
+        return body
+
     def _update_resource(
         self,
         resource: AnyModel,
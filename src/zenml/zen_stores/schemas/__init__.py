@@ -18,6 +18,7 @@ from zenml.zen_stores.schemas.flavor_schemas import FlavorSchema
 from zenml.zen_stores.schemas.pipeline_schemas import (
     ArtifactSchema,
     PipelineRunSchema,
+    PipelineRunSyncSchema,
     PipelineSchema,
     StepInputArtifactSchema,
     StepRunOrderSchema,
@@ -38,6 +39,7 @@ __all__ = [
     "StackComponentSchema",
     "FlavorSchema",
     "PipelineRunSchema",
+    "PipelineRunSyncSchema",
     "PipelineSchema",
     "ProjectSchema",
     "StackSchema",
@@ -18,11 +18,11 @@ from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
 
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index
 from sqlmodel import Field, Relationship, SQLModel
 
 from zenml.config.pipeline_configurations import PipelineSpec
-from zenml.enums import ArtifactType
+from zenml.enums import ArtifactType, ExecutionStatus
 from zenml.models import PipelineModel, PipelineRunModel
 from zenml.models.pipeline_models import ArtifactModel, StepRunModel
 
@@ -112,29 +112,44 @@ class PipelineSchema(SQLModel, table=True):
 class PipelineRunSchema(SQLModel, table=True):
     """SQL Model for pipeline runs."""
 
+    __table_args__ = (
+        # Used to list the latest runs of a pipeline
+        Index(
+            "ix_pipelinerunschema_pipeline_id_created", "pipeline_id", "created"
+        ),
+    )
+
     id: UUID = Field(primary_key=True)
-    name: str
+    name: str = Field(index=True)
 
     project_id: UUID = Field(
-        sa_column=Column(ForeignKey("projectschema.id", ondelete="CASCADE"))
+        sa_column=Column(
+            ForeignKey("projectschema.id", ondelete="CASCADE"), index=True
+        )
     )
     project: "ProjectSchema" = Relationship(back_populates="runs")
 
     user_id: UUID = Field(
         nullable=False,
-        sa_column=Column(ForeignKey("userschema.id", ondelete="CASCADE")),
+        sa_column=Column(
+            ForeignKey("userschema.id", ondelete="CASCADE"), index=True
+        ),
     )
     user: "UserSchema" = Relationship(back_populates="runs")
 
     stack_id: Optional[UUID] = Field(
         nullable=True,
-        sa_column=Column(ForeignKey("stackschema.id", ondelete="SET NULL")),
+        sa_column=Column(
+            ForeignKey("stackschema.id", ondelete="SET NULL"), index=True
+        ),
     )
     stack: "StackSchema" = Relationship(back_populates="runs")
 
     pipeline_id: Optional[UUID] = Field(
         nullable=True,
-        sa_column=Column(ForeignKey("pipelineschema.id", ondelete="SET NULL")),
+        sa_column=Column(
+            ForeignKey("pipelineschema.id", ondelete="SET NULL"), index=True
+        ),
     )
     pipeline: PipelineSchema = Relationship(back_populates="runs")
 
@@ -143,10 +158,16 @@ class PipelineRunSchema(SQLModel, table=True):
     zenml_version: str
     git_sha: Optional[str] = Field(nullable=True)
 
-    created: datetime = Field(default_factory=datetime.now)
+    created: datetime = Field(default_factory=datetime.now, index=True)
     updated: datetime = Field(default_factory=datetime.now)
 
-    mlmd_id: int = Field(default=None, nullable=True)
+    mlmd_id: int = Field(default=None, nullable=True, index=True)
+
+    # Final status of the run. This is only set once the run has finished and
+    # all its steps and artifacts have been synced from MLMD.
+    status: Optional[ExecutionStatus] = Field(
+        default=None, nullable=True, index=True
+    )
 
     @classmethod
     def from_create_model(
@@ -219,20 +240,41 @@ class PipelineRunSchema(SQLModel, table=True):
         )
 
 
+class PipelineRunSyncSchema(SQLModel, table=True):
+    """SQL Model for the state of the sync of pipeline runs from MLMD.
+
+    The table contains a single row which stores the MLMD ID up to which all
+    run contexts were synced.
+    """
+
+    id: int = Field(default=0, primary_key=True)
+    mlmd_high_water_mark: int
+
+
 class StepRunSchema(SQLModel, table=True):
     """SQL Model for steps of pipeline runs."""
 
+    __table_args__ = (
+        # Used to look up a step of a run by its name
+        Index(
+            "ix_steprunschema_pipeline_run_id_name", "pipeline_run_id", "name"
+        ),
+    )
+
     id: UUID = Field(primary_key=True)
     name: str
 
-    pipeline_run_id: UUID = Field(foreign_key="pipelinerunschema.id")
+    pipeline_run_id: UUID = Field(
+        foreign_key="pipelinerunschema.id", index=True
+    )
 
     entrypoint_name: str
     parameters: str = Field(max_length=4096)
     step_configuration: str = Field(max_length=4096)
     docstring: Optional[str] = Field(max_length=4096, nullable=True)
+    metrics: Optional[str] = Field(max_length=4096, nullable=True)
 
-    mlmd_id: int = Field(default=None, nullable=True)
+    mlmd_id: int = Field(default=None, nullable=True, index=True)
 
     created: datetime = Field(default_factory=datetime.now)
     updated: datetime = Field(default_factory=datetime.now)
@@ -256,6 +298,7 @@ class StepRunSchema(SQLModel, table=True):
             parameters=json.dumps(model.parameters),
             step_configuration=json.dumps(model.step_configuration),
             docstring=model.docstring,
+            metrics=json.dumps(model.metrics),
             mlmd_id=model.mlmd_id,
         )
 
@@ -280,6 +323,7 @@ class StepRunSchema(SQLModel, table=True):
             parameters=json.loads(self.parameters),
             step_configuration=json.loads(self.step_configuration),
             docstring=self.docstring,
+            metrics=json.loads(self.metrics) if self.metrics else {},
             mlmd_id=self.mlmd_id,
             mlmd_parent_step_ids=mlmd_parent_step_ids,
             created=self.created,
@@ -291,20 +335,33 @@ class StepRunOrderSchema(SQLModel, table=True):
     """SQL Model that defines the order of steps."""
 
     parent_id: UUID = Field(foreign_key="steprunschema.id", primary_key=True)
-    child_id: UUID = Field(foreign_key="steprunschema.id", primary_key=True)
+    # The primary key only covers lookups by parent, so children need their
+    # own index.
+    child_id: UUID = Field(
+        foreign_key="steprunschema.id", primary_key=True, index=True
+    )
 
 
 class ArtifactSchema(SQLModel, table=True):
     """SQL Model for artifacts of steps."""
 
+    __table_args__ = (
+        # Used to resolve the artifact output by a specific MLMD step
+        Index(
+            "ix_artifactschema_mlmd_id_mlmd_parent_step_id",
+            "mlmd_id",
+            "mlmd_parent_step_id",
+        ),
+    )
+
     id: UUID = Field(primary_key=True)
     name: str  # Name of the output in the parent step
 
-    parent_step_id: UUID = Field(foreign_key="steprunschema.id")
-    producer_step_id: UUID = Field(foreign_key="steprunschema.id")
+    parent_step_id: UUID = Field(foreign_key="steprunschema.id", index=True)
+    producer_step_id: UUID = Field(foreign_key="steprunschema.id", index=True)
 
     type: ArtifactType
-    uri: str
+    uri: str = Field(index=True)
     materializer: str
     data_type: str
     is_cached: bool
@@ -313,7 +370,7 @@ class ArtifactSchema(SQLModel, table=True):
     mlmd_parent_step_id: int = Field(default=None, nullable=True)
     mlmd_producer_step_id: int = Field(default=None, nullable=True)
 
-    created: datetime = Field(default_factory=datetime.now)
+    created: datetime = Field(default_factory=datetime.now, index=True)
     updated: datetime = Field(default_factory=datetime.now)
 
     @classmethod
@@ -369,5 +426,9 @@ class StepInputArtifactSchema(SQLModel, table=True):
     """SQL Model that defines which artifacts are inputs to which step."""
 
     step_id: UUID = Field(foreign_key="steprunschema.id", primary_key=True)
-    artifact_id: UUID = Field(foreign_key="artifactschema.id", primary_key=True)
+    # The primary key only covers lookups by step, so artifacts need their own
+    # index.
+    artifact_id: UUID = Field(
+        foreign_key="artifactschema.id", primary_key=True, index=True
+    )
     name: str  # Name of the input in the step
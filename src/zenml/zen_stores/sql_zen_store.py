@@ -13,18 +13,23 @@
 #  permissions and limitations under the License.
 """SQL Zen Store implementation."""
 
+import json
 import os
 import re
+from collections import defaultdict
+from datetime import datetime
 from pathlib import Path, PurePath
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
     Dict,
+    Iterable,
     List,
     Optional,
     Tuple,
     Type,
+    TypeVar,
     Union,
     cast,
 )
@@ -35,11 +40,13 @@ from ml_metadata.proto.metadata_store_pb2 import (
     MySQLDatabaseConfig,
 )
 from pydantic import root_validator
+from sqlalchemy import func, inspect, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.exc import ArgumentError, NoResultFound
+from sqlalchemy.orm import aliased, selectinload
 from sqlalchemy.sql.operators import is_
-from sqlmodel import Session, SQLModel, create_engine, or_, select
+from sqlmodel import Session, SQLModel, col, create_engine, or_, select
 from sqlmodel.sql.expression import Select, SelectOfScalar
 from tfx.orchestration import metadata
 
@@ -78,6 +85,7 @@ from zenml.zen_stores.schemas import (
     ArtifactSchema,
     FlavorSchema,
     PipelineRunSchema,
+    PipelineRunSyncSchema,
     PipelineSchema,
     ProjectSchema,
     RoleSchema,
@@ -95,7 +103,10 @@ from zenml.zen_stores.schemas import (
 from zenml.zen_stores.schemas.stack_schemas import StackCompositionSchema
 
 if TYPE_CHECKING:
-    from zenml.zen_stores.metadata_store import MetadataStore
+    from zenml.zen_stores.metadata_store import (
+        MetadataStore,
+        MLMDStepRunModel,
+    )
 
 # Enable SQL compilation caching to remove the https://sqlalche.me/e/14/cprf
 # warning
@@ -106,6 +117,11 @@ logger = get_logger(__name__)
 
 ZENML_SQLITE_DB_FILENAME = "zenml.db"
 
+# Columns that list results can never be sorted by
+UNSORTABLE_COLUMNS = {"password", "activation_token"}
+
+AnySchema = TypeVar("AnySchema", bound=SQLModel)
+
 
 class SQLDatabaseDriver(StrEnum):
     """SQL database drivers supported by the SQL ZenML store."""
@@ -467,14 +483,61 @@ class SqlZenStore(BaseZenStore):
 
         logger.debug("Initializing SqlZenStore at %s", self.config.url)
 
-        metadata_config = self.config.get_metadata_config()
-        self._metadata_store = MetadataStore(config=metadata_config)
-
         url, connect_args, engine_args = self.config.get_sqlmodel_config()
         self._engine = create_engine(
             url=url, connect_args=connect_args, **engine_args
         )
+
+        # MLMD stores its tables in the same database
+        metadata_config = self.config.get_metadata_config()
+        self._metadata_store = MetadataStore(
+            config=metadata_config, engine=self._engine
+        )
         SQLModel.metadata.create_all(self._engine)
+        self._migrate_database()
+
+    def _migrate_database(self) -> None:
+        """Adds columns and indexes that are missing in existing tables.
+
+        `SQLModel.metadata.create_all` only creates tables that don't exist yet,
+        so this adds all columns and indexes that were introduced in a schema
+        after its table was created. Columns added to existing schemas
+        therefore always need to be nullable.
+        """
+        inspector = inspect(self.engine)
+        for table in SQLModel.metadata.sorted_tables:
+            existing_columns = {
+                column["name"] for column in inspector.get_columns(table.name)
+            }
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=self.engine.dialect)
+                logger.debug(
+                    "Adding missing column '%s' to table '%s'.",
+                    column.name,
+                    table.name,
+                )
+                with self.engine.begin() as connection:
+                    connection.execute(
+                        text(
+                            f"ALTER TABLE {table.name} ADD COLUMN "
+                            f"{column.name} {column_type}"
+                        )
+                    )
+
+            existing_indexes = {
+                index["name"] for index in inspector.get_indexes(table.name)
+            }
+            for index in table.indexes:
+                if index.name in existing_indexes:
+                    continue
+                logger.debug(
+                    "Adding missing index '%s' to table '%s'.",
+                    index.name,
+                    table.name,
+                )
+                index.create(bind=self.engine)
 
     @staticmethod
     def get_local_url(path: str) -> str:
@@ -663,6 +726,26 @@ class SqlZenStore(BaseZenStore):
                 raise KeyError(f"Stack with ID {stack_id} not found.")
             return stack.to_model()
 
+    def get_stacks_by_ids(
+        self, stack_ids: Iterable[UUID]
+    ) -> Dict[UUID, StackModel]:
+        """Get multiple stacks by their IDs with a single query.
+
+        Args:
+            stack_ids: The IDs of the stacks to get.
+
+        Returns:
+            A mapping from stack IDs to the stacks. IDs of stacks that
+            don't exist are left out.
+        """
+        with Session(self.engine) as session:
+            stacks = session.exec(
+                select(StackSchema)
+                .options(selectinload(StackSchema.components))
+                .where(col(StackSchema.id).in_(set(stack_ids)))
+            ).all()
+            return {stack.id: stack.to_model() for stack in stacks}
+
     def list_stacks(
         self,
         project_name_or_id: Optional[Union[str, UUID]] = None,
@@ -670,6 +753,11 @@ class SqlZenStore(BaseZenStore):
         component_id: Optional[UUID] = None,
         name: Optional[str] = None,
         is_shared: Optional[bool] = None,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[StackModel]:
         """List all stacks matching the given filter criteria.
 
@@ -681,13 +769,24 @@ class SqlZenStore(BaseZenStore):
             name: Optionally filter stacks by their name
             is_shared: Optionally filter out stacks by whether they are shared
                 or not
+            sort_by: Name of the field to sort the stacks by. Prefix it with
+                `-` to sort in descending order.
+            created_after: If provided, only return stacks created after this
+                time.
+            created_before: If provided, only return stacks created before
+                this time.
+            offset: Number of stacks to skip.
+            limit: Maximum number of stacks to return. If not provided, all
+                remaining stacks are returned.
 
         Returns:
             A list of all stacks matching the filter criteria.
         """
         with Session(self.engine) as session:
-            # Get a list of all stacks
-            query = select(StackSchema)
+            # Get a list of all stacks and load their components eagerly
+            query = select(StackSchema).options(
+                selectinload(StackSchema.components)
+            )
             # TODO: prettify
             if project_name_or_id:
                 project = self._get_project_schema(
@@ -705,7 +804,17 @@ class SqlZenStore(BaseZenStore):
                 query = query.where(StackSchema.name == name)
             if is_shared is not None:
                 query = query.where(StackSchema.is_shared == is_shared)
-            stacks = session.exec(query.order_by(StackSchema.name)).all()
+            query = self._filter_by_creation_time(
+                query, StackSchema, created_after, created_before
+            )
+            query = self._sort_and_paginate(
+                query,
+                StackSchema,
+                sort_by=sort_by or "name",
+                offset=offset,
+                limit=limit,
+            )
+            stacks = session.exec(query).all()
 
             return [stack.to_model() for stack in stacks]
 
@@ -969,6 +1078,29 @@ class SqlZenStore(BaseZenStore):
 
         return stack_component.to_model()
 
+    def get_stack_components_by_ids(
+        self, component_ids: Iterable[UUID]
+    ) -> Dict[UUID, ComponentModel]:
+        """Get multiple stack components by their IDs with a single query.
+
+        Args:
+            component_ids: The IDs of the stack components to get.
+
+        Returns:
+            A mapping from stack component IDs to the stack components. IDs of stack components that
+            don't exist are left out.
+        """
+        with Session(self.engine) as session:
+            stack_components = session.exec(
+                select(StackComponentSchema).where(
+                    col(StackComponentSchema.id).in_(set(component_ids))
+                )
+            ).all()
+            return {
+                component.id: component.to_model()
+                for component in stack_components
+            }
+
     def list_stack_components(
         self,
         project_name_or_id: Optional[Union[str, UUID]] = None,
@@ -977,6 +1109,11 @@ class SqlZenStore(BaseZenStore):
         flavor_name: Optional[str] = None,
         name: Optional[str] = None,
         is_shared: Optional[bool] = None,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[ComponentModel]:
         """List all stack components matching the given filter criteria.
 
@@ -989,6 +1126,15 @@ class SqlZenStore(BaseZenStore):
             name: Optionally filter stack component by name
             is_shared: Optionally filter out stack component by whether they are
                 shared or not
+            sort_by: Name of the field to sort the stack components by. Prefix
+                it with `-` to sort in descending order.
+            created_after: If provided, only return stack components created
+                after this time.
+            created_before: If provided, only return stack components created
+                before this time.
+            offset: Number of stack components to skip.
+            limit: Maximum number of stack components to return. If not
+                provided, all remaining stack components are returned.
 
         Returns:
             A list of all stack components matching the filter criteria.
@@ -1014,6 +1160,16 @@ class SqlZenStore(BaseZenStore):
                 query = query.where(StackComponentSchema.name == name)
             if is_shared is not None:
                 query = query.where(StackComponentSchema.is_shared == is_shared)
+            query = self._filter_by_creation_time(
+                query, StackComponentSchema, created_after, created_before
+            )
+            query = self._sort_and_paginate(
+                query,
+                StackComponentSchema,
+                sort_by=sort_by,
+                offset=offset,
+                limit=limit,
+            )
 
             list_of_stack_components_in_db = session.exec(query).all()
 
@@ -1474,14 +1630,56 @@ class SqlZenStore(BaseZenStore):
             user = self._get_user_schema(user_name_or_id, session=session)
         return user.to_model()
 
-    def list_users(self) -> List[UserModel]:
+    def get_users_by_ids(
+        self, user_ids: Iterable[UUID]
+    ) -> Dict[UUID, UserModel]:
+        """Get multiple users by their IDs with a single query.
+
+        Args:
+            user_ids: The IDs of the users to get.
+
+        Returns:
+            A mapping from user IDs to the users. IDs of users that
+            don't exist are left out.
+        """
+        with Session(self.engine) as session:
+            users = session.exec(
+                select(UserSchema).where(col(UserSchema.id).in_(set(user_ids)))
+            ).all()
+            return {user.id: user.to_model() for user in users}
+
+    def list_users(
+        self,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[UserModel]:
         """List all users.
 
+        Args:
+            sort_by: Name of the field to sort the users by. Prefix it with
+                `-` to sort in descending order.
+            created_after: If provided, only return users created after this
+                time.
+            created_before: If provided, only return users created before
+                this time.
+            offset: Number of users to skip.
+            limit: Maximum number of users to return. If not provided, all
+                remaining users are returned.
+
         Returns:
             A list of all users.
         """
         with Session(self.engine) as session:
-            users = session.exec(select(UserSchema)).all()
+            query = self._filter_by_creation_time(
+                select(UserSchema), UserSchema, created_after, created_before
+            )
+            query = self._sort_and_paginate(
+                query, UserSchema, sort_by=sort_by, offset=offset, limit=limit
+            )
+            users = session.exec(query).all()
 
         return [user.to_model() for user in users]
 
@@ -2253,6 +2451,26 @@ class SqlZenStore(BaseZenStore):
             )
         return project.to_model()
 
+    def get_projects_by_ids(
+        self, project_ids: Iterable[UUID]
+    ) -> Dict[UUID, ProjectModel]:
+        """Get multiple projects by their IDs with a single query.
+
+        Args:
+            project_ids: The IDs of the projects to get.
+
+        Returns:
+            A mapping from project IDs to the projects. IDs of projects that
+            don't exist are left out.
+        """
+        with Session(self.engine) as session:
+            projects = session.exec(
+                select(ProjectSchema).where(
+                    col(ProjectSchema.id).in_(set(project_ids))
+                )
+            ).all()
+            return {project.id: project.to_model() for project in projects}
+
     def list_projects(self) -> List[ProjectModel]:
         """List all projects.
 
@@ -2392,11 +2610,36 @@ class SqlZenStore(BaseZenStore):
 
             return pipeline.to_model()
 
+    def get_pipelines_by_ids(
+        self, pipeline_ids: Iterable[UUID]
+    ) -> Dict[UUID, PipelineModel]:
+        """Get multiple pipelines by their IDs with a single query.
+
+        Args:
+            pipeline_ids: The IDs of the pipelines to get.
+
+        Returns:
+            A mapping from pipeline IDs to the pipelines. IDs of pipelines that
+            don't exist are left out.
+        """
+        with Session(self.engine) as session:
+            pipelines = session.exec(
+                select(PipelineSchema).where(
+                    col(PipelineSchema.id).in_(set(pipeline_ids))
+                )
+            ).all()
+            return {pipeline.id: pipeline.to_model() for pipeline in pipelines}
+
     def list_pipelines(
         self,
         project_name_or_id: Optional[Union[str, UUID]] = None,
         user_name_or_id: Optional[Union[str, UUID]] = None,
         name: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[PipelineModel]:
         """List all pipelines in the project.
 
@@ -2405,6 +2648,15 @@ class SqlZenStore(BaseZenStore):
                 project.
             user_name_or_id: If provided, only list pipelines from this user.
             name: If provided, only list pipelines with this name.
+            sort_by: Name of the field to sort the pipelines by. Prefix it with
+                `-` to sort in descending order.
+            created_after: If provided, only return pipelines created after
+                this time.
+            created_before: If provided, only return pipelines created before
+                this time.
+            offset: Number of pipelines to skip.
+            limit: Maximum number of pipelines to return. If not provided, all
+                remaining pipelines are returned.
 
         Returns:
             A list of pipelines.
@@ -2425,6 +2677,17 @@ class SqlZenStore(BaseZenStore):
             if name:
                 query = query.where(PipelineSchema.name == name)
 
+            query = self._filter_by_creation_time(
+                query, PipelineSchema, created_after, created_before
+            )
+            query = self._sort_and_paginate(
+                query,
+                PipelineSchema,
+                sort_by=sort_by,
+                offset=offset,
+                limit=limit,
+            )
+
             # Get all pipelines in the project
             pipelines = session.exec(query).all()
             return [pipeline.to_model() for pipeline in pipelines]
@@ -2551,6 +2814,11 @@ class SqlZenStore(BaseZenStore):
         user_name_or_id: Optional[Union[str, UUID]] = None,
         pipeline_id: Optional[UUID] = None,
         unlisted: bool = False,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[PipelineRunModel]:
         """Gets all pipeline runs.
 
@@ -2564,6 +2832,15 @@ class SqlZenStore(BaseZenStore):
             pipeline_id: If provided, only return runs for this pipeline.
             unlisted: If True, only return unlisted runs that are not
                 associated with any pipeline (filter by pipeline_id==None).
+            sort_by: Name of the field to sort the runs by. Prefix it with
+                `-` to sort in descending order.
+            created_after: If provided, only return runs created after this
+                time.
+            created_before: If provided, only return runs created before
+                this time.
+            offset: Number of runs to skip.
+            limit: Maximum number of runs to return. If not provided, all
+                remaining runs are returned.
 
         Returns:
             A list of all pipeline runs.
@@ -2571,62 +2848,251 @@ class SqlZenStore(BaseZenStore):
         if not self.runs_inside_server:
             self._sync_runs()  # Sync with MLMD
         with Session(self.engine) as session:
-            query = select(PipelineRunSchema)
-            if project_name_or_id is not None:
-                project = self._get_project_schema(
-                    project_name_or_id, session=session
-                )
-                query = query.where(StackSchema.project_id == project.id)
-                query = query.where(
-                    PipelineRunSchema.stack_id == StackSchema.id
-                )
-            if stack_id is not None:
-                query = query.where(PipelineRunSchema.stack_id == stack_id)
-            if component_id:
-                query = query.where(
-                    StackCompositionSchema.stack_id
-                    == PipelineRunSchema.stack_id
-                ).where(StackCompositionSchema.component_id == component_id)
-            if run_name is not None:
-                query = query.where(PipelineRunSchema.name == run_name)
-            if pipeline_id is not None:
-                query = query.where(
-                    PipelineRunSchema.pipeline_id == pipeline_id
-                )
-            elif unlisted:
-                query = query.where(is_(PipelineRunSchema.pipeline_id, None))
-            if user_name_or_id is not None:
-                user = self._get_user_schema(user_name_or_id, session=session)
-                query = query.where(PipelineRunSchema.user_id == user.id)
-                query = query.order_by(PipelineRunSchema.created)
+            query = self._get_runs_query(
+                project_name_or_id=project_name_or_id,
+                stack_id=stack_id,
+                component_id=component_id,
+                run_name=run_name,
+                user_name_or_id=user_name_or_id,
+                pipeline_id=pipeline_id,
+                unlisted=unlisted,
+                created_after=created_after,
+                created_before=created_before,
+                session=session,
+            )
+            query = self._sort_and_paginate(
+                query,
+                PipelineRunSchema,
+                sort_by=sort_by,
+                offset=offset,
+                limit=limit,
+            )
             runs = session.exec(query).all()
             return [run.to_model() for run in runs]
 
+    def count_runs(
+        self,
+        project_name_or_id: Optional[Union[str, UUID]] = None,
+        stack_id: Optional[UUID] = None,
+        component_id: Optional[UUID] = None,
+        run_name: Optional[str] = None,
+        user_name_or_id: Optional[Union[str, UUID]] = None,
+        pipeline_id: Optional[UUID] = None,
+        unlisted: bool = False,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> int:
+        """Counts the pipeline runs matching the given filter criteria.
+
+        Args:
+            project_name_or_id: If provided, only count runs for this project.
+            stack_id: If provided, only count runs for this stack.
+            component_id: Optionally filter for runs that used the
+                          component
+            run_name: Run name if provided
+            user_name_or_id: If provided, only count runs for this user.
+            pipeline_id: If provided, only count runs for this pipeline.
+            unlisted: If True, only count unlisted runs that are not
+                associated with any pipeline (filter by pipeline_id==None).
+            created_after: If provided, only count runs created after this
+                time.
+            created_before: If provided, only count runs created before this
+                time.
+
+        Returns:
+            The number of pipeline runs matching the filter criteria.
+        """
+        if not self.runs_inside_server:
+            self._sync_runs()  # Sync with MLMD
+        with Session(self.engine) as session:
+            query = self._get_runs_query(
+                project_name_or_id=project_name_or_id,
+                stack_id=stack_id,
+                component_id=component_id,
+                run_name=run_name,
+                user_name_or_id=user_name_or_id,
+                pipeline_id=pipeline_id,
+                unlisted=unlisted,
+                created_after=created_after,
+                created_before=created_before,
+                session=session,
+            )
+            return self._count(query, session=session)
+
+    def _get_runs_query(
+        self,
+        session: Session,
+        project_name_or_id: Optional[Union[str, UUID]] = None,
+        stack_id: Optional[UUID] = None,
+        component_id: Optional[UUID] = None,
+        run_name: Optional[str] = None,
+        user_name_or_id: Optional[Union[str, UUID]] = None,
+        pipeline_id: Optional[UUID] = None,
+        unlisted: bool = False,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> SelectOfScalar[PipelineRunSchema]:
+        """Builds the query selecting all runs matching the filter criteria.
+
+        Args:
+            session: The database session to use.
+            project_name_or_id: If provided, only select runs for this project.
+            stack_id: If provided, only select runs for this stack.
+            component_id: Optionally filter for runs that used the
+                          component
+            run_name: Run name if provided
+            user_name_or_id: If provided, only select runs for this user.
+            pipeline_id: If provided, only select runs for this pipeline.
+            unlisted: If True, only select unlisted runs that are not
+                associated with any pipeline (filter by pipeline_id==None).
+            created_after: If provided, only select runs created after this
+                time.
+            created_before: If provided, only select runs created before this
+                time.
+
+        Returns:
+            The query selecting the runs.
+        """
+        query = select(PipelineRunSchema)
+        if project_name_or_id is not None:
+            project = self._get_project_schema(
+                project_name_or_id, session=session
+            )
+            query = query.where(StackSchema.project_id == project.id)
+            query = query.where(PipelineRunSchema.stack_id == StackSchema.id)
+        if stack_id is not None:
+            query = query.where(PipelineRunSchema.stack_id == stack_id)
+        if component_id:
+            query = query.where(
+                StackCompositionSchema.stack_id == PipelineRunSchema.stack_id
+            ).where(StackCompositionSchema.component_id == component_id)
+        if run_name is not None:
+            query = query.where(PipelineRunSchema.name == run_name)
+        if pipeline_id is not None:
+            query = query.where(PipelineRunSchema.pipeline_id == pipeline_id)
+        elif unlisted:
+            query = query.where(is_(PipelineRunSchema.pipeline_id, None))
+        if user_name_or_id is not None:
+            user = self._get_user_schema(user_name_or_id, session=session)
+            query = query.where(PipelineRunSchema.user_id == user.id)
+        return self._filter_by_creation_time(
+            query, PipelineRunSchema, created_after, created_before
+        )
+
     def get_run_status(self, run_id: UUID) -> ExecutionStatus:
         """Gets the execution status of a pipeline run.
 
+        The final status of finished runs is stored in the database, so only
+        the status of runs that are still running is computed from MLMD.
+
         Args:
             run_id: The ID of the pipeline run to get the status for.
 
         Returns:
             The status of the pipeline run.
+
+        Raises:
+            KeyError: if the pipeline run doesn't exist.
         """
-        steps = self.list_run_steps(run_id)
+        with Session(self.engine) as session:
+            run = session.exec(
+                select(PipelineRunSchema).where(PipelineRunSchema.id == run_id)
+            ).first()
+            if run is None:
+                raise KeyError(
+                    f"Unable to get status for pipeline run with ID {run_id}: "
+                    f"No pipeline run with this ID found."
+                )
+        return self._get_status_of_run(run)
 
-        # If any step is failed or running, return that status respectively
-        for step in steps:
-            step_status = self.get_run_step_status(step.id)
-            if step_status == ExecutionStatus.FAILED:
-                return ExecutionStatus.FAILED
-            if step_status == ExecutionStatus.RUNNING:
-                return ExecutionStatus.RUNNING
+    def get_run_statuses(
+        self, run_ids: Iterable[UUID]
+    ) -> Dict[UUID, ExecutionStatus]:
+        """Gets the execution statuses of multiple pipeline runs.
 
-        # If not all steps have started yet, return running
-        if len(steps) < self.get_run(run_id).num_steps:
-            return ExecutionStatus.RUNNING
+        All runs are loaded with a single query. Only the statuses of runs
+        that are still running need to be computed from MLMD.
 
-        # Otherwise, return succeeded
-        return ExecutionStatus.COMPLETED
+        Args:
+            run_ids: The IDs of the pipeline runs to get the statuses for.
+
+        Returns:
+            A mapping from run IDs to the statuses of the runs. IDs of runs
+            that don't exist are left out.
+        """
+        with Session(self.engine) as session:
+            runs = session.exec(
+                select(PipelineRunSchema).where(
+                    col(PipelineRunSchema.id).in_(set(run_ids))
+                )
+            ).all()
+        return {run.id: self._get_status_of_run(run) for run in runs}
+
+    def get_latest_runs_by_pipeline_ids(
+        self, pipeline_ids: Iterable[UUID], num_runs: int
+    ) -> Dict[UUID, List[PipelineRunModel]]:
+        """Gets the latest runs of multiple pipelines with a single query.
+
+        Args:
+            pipeline_ids: The IDs of the pipelines to get the runs for.
+            num_runs: The maximum number of runs to get per pipeline.
+
+        Returns:
+            A mapping from pipeline IDs to their latest runs, newest first.
+        """
+        pipeline_ids = set(pipeline_ids)
+        latest_runs: Dict[UUID, List[PipelineRunModel]] = {
+            pipeline_id: [] for pipeline_id in pipeline_ids
+        }
+        if not pipeline_ids or num_runs <= 0:
+            return latest_runs
+
+        if not self.runs_inside_server:
+            self._sync_runs()  # Sync with MLMD
+        # Number the runs of each pipeline from newest to oldest
+        run_rank = (
+            func.row_number()
+            .over(
+                partition_by=PipelineRunSchema.pipeline_id,
+                order_by=col(PipelineRunSchema.created).desc(),
+            )
+            .label("run_rank")
+        )
+        ranked_runs = (
+            select(PipelineRunSchema.id, run_rank)
+            .where(col(PipelineRunSchema.pipeline_id).in_(pipeline_ids))
+            .subquery()
+        )
+        with Session(self.engine) as session:
+            runs = session.exec(
+                select(PipelineRunSchema)
+                .join(ranked_runs, ranked_runs.c.id == PipelineRunSchema.id)
+                .where(ranked_runs.c.run_rank <= num_runs)
+                .order_by(col(PipelineRunSchema.created).desc())
+            ).all()
+            for run in runs:
+                latest_runs[run.pipeline_id].append(run.to_model())
+        return latest_runs
+
+    def _get_status_of_run(self, run: PipelineRunSchema) -> ExecutionStatus:
+        """Gets the execution status of a pipeline run.
+
+        Args:
+            run: The pipeline run to get the status for.
+
+        Returns:
+            The status of the pipeline run.
+        """
+        if run.status is not None:
+            return run.status
+
+        step_statuses = self.metadata_store.get_run_step_statuses(run.mlmd_id)
+        if not self.runs_inside_server and self._get_final_run_status(
+            step_statuses, run.num_steps
+        ):
+            # Sync the finished run so its final status gets stored.
+            self._sync_run_steps(run.id)
+        return self._get_run_status(step_statuses, run.num_steps)
 
     # ------------------
     # Pipeline run steps
@@ -2750,21 +3216,31 @@ class SqlZenStore(BaseZenStore):
         if not self.runs_inside_server:
             self._sync_run_steps(run_id)
         with Session(self.engine) as session:
-            steps = session.exec(
-                select(StepRunSchema).where(
-                    StepRunSchema.pipeline_run_id == run_id
-                )
-            ).all()
-            return [self.get_run_step(step.id) for step in steps]
+            return self._list_run_steps(run_id, session=session)
 
     def list_artifacts(
-        self, artifact_uri: Optional[str] = None
+        self,
+        artifact_uri: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[ArtifactModel]:
         """Lists all artifacts.
 
         Args:
             artifact_uri: If specified, only artifacts with the given URI will
                 be returned.
+            sort_by: Name of the field to sort the artifacts by. Prefix it with
+                `-` to sort in descending order.
+            created_after: If provided, only return artifacts created after
+                this time.
+            created_before: If provided, only return artifacts created before
+                this time.
+            offset: Number of artifacts to skip.
+            limit: Maximum number of artifacts to return. If not provided, all
+                remaining artifacts are returned.
 
         Returns:
             A list of all artifacts.
@@ -2772,16 +3248,178 @@ class SqlZenStore(BaseZenStore):
         if not self.runs_inside_server:
             self._sync_runs()
         with Session(self.engine) as session:
-            query = select(ArtifactSchema)
-            if artifact_uri is not None:
-                query = query.where(ArtifactSchema.uri == artifact_uri)
+            query = self._get_artifacts_query(
+                artifact_uri=artifact_uri,
+                created_after=created_after,
+                created_before=created_before,
+            )
+            query = self._sort_and_paginate(
+                query,
+                ArtifactSchema,
+                sort_by=sort_by,
+                offset=offset,
+                limit=limit,
+            )
             artifacts = session.exec(query).all()
             return [artifact.to_model() for artifact in artifacts]
 
+    def count_artifacts(
+        self,
+        artifact_uri: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> int:
+        """Counts the artifacts matching the given filter criteria.
+
+        Args:
+            artifact_uri: If specified, only artifacts with the given URI will
+                be counted.
+            created_after: If provided, only count artifacts created after
+                this time.
+            created_before: If provided, only count artifacts created before
+                this time.
+
+        Returns:
+            The number of artifacts matching the filter criteria.
+        """
+        if not self.runs_inside_server:
+            self._sync_runs()
+        with Session(self.engine) as session:
+            query = self._get_artifacts_query(
+                artifact_uri=artifact_uri,
+                created_after=created_after,
+                created_before=created_before,
+            )
+            return self._count(query, session=session)
+
+    def _get_artifacts_query(
+        self,
+        artifact_uri: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> SelectOfScalar[ArtifactSchema]:
+        """Builds the query selecting all artifacts matching the filters.
+
+        Args:
+            artifact_uri: If specified, only select artifacts with this URI.
+            created_after: If provided, only select artifacts created after
+                this time.
+            created_before: If provided, only select artifacts created before
+                this time.
+
+        Returns:
+            The query selecting the artifacts.
+        """
+        query = select(ArtifactSchema)
+        if artifact_uri is not None:
+            query = query.where(ArtifactSchema.uri == artifact_uri)
+        return self._filter_by_creation_time(
+            query, ArtifactSchema, created_after, created_before
+        )
+
     # =======================
     # Internal helper methods
     # =======================
 
+    @staticmethod
+    def _filter_by_creation_time(
+        query: SelectOfScalar[AnySchema],
+        schema_class: Type[AnySchema],
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> SelectOfScalar[AnySchema]:
+        """Restricts a query to entities created in a given time window.
+
+        Args:
+            query: The query to restrict.
+            schema_class: The schema class selected by the query. Must have a
+                `created` column.
+            created_after: If provided, only select entities created after
+                this time.
+            created_before: If provided, only select entities created before
+                this time.
+
+        Returns:
+            The restricted query.
+        """
+        created = getattr(schema_class, "created")
+        if created_after is not None:
+            query = query.where(created > created_after)
+        if created_before is not None:
+            query = query.where(created < created_before)
+        return query
+
+    @staticmethod
+    def _sort_and_paginate(
+        query: SelectOfScalar[AnySchema],
+        schema_class: Type[AnySchema],
+        sort_by: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> SelectOfScalar[AnySchema]:
+        """Sorts a query and restricts it to a single page of results.
+
+        The ID of the entities is always used as the last sort key, so that
+        pages are stable even if multiple entities share the same sort value.
+
+        Args:
+            query: The query to sort and paginate.
+            schema_class: The schema class selected by the query.
+            sort_by: Name of the column to sort by. Prefix it with `-` to sort
+                in descending order. Defaults to the creation time.
+            offset: Number of entities to skip.
+            limit: Maximum number of entities to select. If not provided, all
+                remaining entities are selected.
+
+        Returns:
+            The sorted and paginated query.
+
+        Raises:
+            ValueError: If the column to sort by does not exist or if the
+                offset or limit are negative.
+        """
+        sort_by = sort_by or "created"
+        descending = sort_by.startswith("-")
+        column_name = sort_by.lstrip("-")
+        table = getattr(schema_class, "__table__")
+        if (
+            column_name not in table.columns
+            or column_name in UNSORTABLE_COLUMNS
+        ):
+            raise ValueError(
+                f"Unable to sort by '{column_name}': Invalid field name."
+            )
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError(
+                f"Invalid pagination parameters: offset={offset}, "
+                f"limit={limit}. Both must be non-negative."
+            )
+
+        column = getattr(schema_class, column_name)
+        query = query.order_by(
+            column.desc() if descending else column,
+            getattr(schema_class, "id"),
+        )
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+    @staticmethod
+    def _count(query: SelectOfScalar[AnySchema], session: Session) -> int:
+        """Counts the rows selected by a query.
+
+        Args:
+            query: The query to count the rows of.
+            session: The database session to use.
+
+        Returns:
+            The number of rows selected by the query.
+        """
+        count_query = select(func.count()).select_from(query.subquery())
+        return int(session.exec(count_query).one())
+
     def _get_schema_by_name_or_id(
         self,
         object_name_or_id: Union[str, UUID],
@@ -2996,46 +3634,127 @@ class SqlZenStore(BaseZenStore):
                 )
             return artifact.id
 
+    def _list_run_steps(
+        self, run_id: UUID, session: Session
+    ) -> List[StepRunModel]:
+        """Gets all steps in a pipeline run including their parent steps.
+
+        The steps and all their parent step assignments are fetched with one
+        query each, independent of the number of steps in the run.
+
+        Args:
+            run_id: The ID of the pipeline run for which to list steps.
+            session: The database session to use.
+
+        Returns:
+            The models of all steps in the run.
+        """
+        steps = session.exec(
+            select(StepRunSchema).where(StepRunSchema.pipeline_run_id == run_id)
+        ).all()
+
+        # Parent steps can be part of other runs, e.g. for cached steps, so
+        # only the child steps are restricted to this run.
+        child_step = aliased(StepRunSchema)
+        parent_steps: Dict[UUID, List[StepRunSchema]] = defaultdict(list)
+        parent_assignments = session.exec(
+            select(StepRunOrderSchema, StepRunSchema)
+            .join(
+                StepRunSchema,
+                StepRunSchema.id == StepRunOrderSchema.parent_id,
+            )
+            .join(child_step, child_step.id == StepRunOrderSchema.child_id)
+            .where(child_step.pipeline_run_id == run_id)
+        ).all()
+        for assignment, parent_step in parent_assignments:
+            parent_steps[assignment.child_id].append(parent_step)
+
+        return [
+            step.to_model(
+                parent_step_ids=[parent.id for parent in parent_steps[step.id]],
+                mlmd_parent_step_ids=[
+                    parent.mlmd_id for parent in parent_steps[step.id]
+                ],
+            )
+            for step in steps
+        ]
+
     def _sync_runs(self) -> None:
         """Sync runs from MLMD into the database.
 
-        This queries all runs from MLMD, checks for each whether it already
-        exists in the database, and if not, creates it.
+        This is an incremental sync: only run contexts that were registered in
+        MLMD after a stored high-water mark are queried and created. The mark
+        never advances past run contexts that are still being set up, so these
+        are picked up by a later sync. Afterwards, the steps of all runs that
+        haven't finished yet are synced. Finished runs never change anymore
+        and are therefore skipped.
         """
-        # Get all runs from ZenML.
         with Session(self.engine) as session:
-            zenml_runs_list = session.exec(select(PipelineRunSchema)).all()
-        zenml_runs = {run.name: run.to_model() for run in zenml_runs_list}
+            sync_state = session.get(PipelineRunSyncSchema, 0)
+            if sync_state:
+                high_water_mark = sync_state.mlmd_high_water_mark
+            else:
+                # Stores created before the sync state was introduced
+                high_water_mark = (
+                    session.exec(
+                        select(func.max(PipelineRunSchema.mlmd_id))
+                    ).one()
+                    or 0
+                )
+            # Runs that were synced concurrently by another server
+            synced_mlmd_ids = set(
+                session.exec(
+                    select(PipelineRunSchema.mlmd_id).where(
+                        PipelineRunSchema.mlmd_id > high_water_mark
+                    )
+                ).all()
+            )
 
-        # Get all runs from MLMD.
-        mlmd_runs = self.metadata_store.get_all_runs()
+        # Get all new runs from MLMD.
+        mlmd_runs, new_high_water_mark = self.metadata_store.get_new_runs(
+            min_mlmd_id=high_water_mark, synced_mlmd_ids=synced_mlmd_ids
+        )
 
-        # Sync all MLMD runs that don't exist in ZenML.
+        # Create all new MLMD runs in ZenML.
         for run_name, mlmd_run in mlmd_runs.items():
+            new_run = PipelineRunModel(
+                name=run_name,
+                mlmd_id=mlmd_run.mlmd_id,
+                project=mlmd_run.project,
+                user=mlmd_run.user,
+                stack_id=mlmd_run.stack_id,
+                pipeline_id=mlmd_run.pipeline_id,
+                pipeline_configuration=mlmd_run.pipeline_configuration,
+                num_steps=mlmd_run.num_steps,
+            )
+            self._create_run(new_run)
 
-            # If the run is in MLMD but not in ZenML, we create it
-            if run_name not in zenml_runs:
-                new_run = PipelineRunModel(
-                    name=run_name,
-                    mlmd_id=mlmd_run.mlmd_id,
-                    project=mlmd_run.project,
-                    user=mlmd_run.user,
-                    stack_id=mlmd_run.stack_id,
-                    pipeline_id=mlmd_run.pipeline_id,
-                    pipeline_configuration=mlmd_run.pipeline_configuration,
-                    num_steps=mlmd_run.num_steps,
+        if sync_state is None or new_high_water_mark != high_water_mark:
+            with Session(self.engine) as session:
+                session.merge(
+                    PipelineRunSyncSchema(
+                        id=0, mlmd_high_water_mark=new_high_water_mark
+                    )
                 )
-                new_run = self._create_run(new_run)
-                zenml_runs[run_name] = new_run
+                session.commit()
 
-        for run_ in zenml_runs.values():
-            self._sync_run_steps(run_.id)
+        # Sync the steps of all runs that haven't finished yet.
+        with Session(self.engine) as session:
+            unfinished_run_ids = session.exec(
+                select(PipelineRunSchema.id).where(
+                    is_(PipelineRunSchema.status, None)
+                )
+            ).all()
+        for run_id in unfinished_run_ids:
+            self._sync_run_steps(run_id)
 
     def _sync_run_steps(self, run_id: UUID) -> None:
         """Sync run steps from MLMD into the database.
 
         Since we do not allow to create steps in the database directly, this is
-        a one-way sync from MLMD to the database.
+        a one-way sync from MLMD to the database. Once a run has finished and
+        all its steps were synced, its final status is stored in the database
+        and the run is not synced anymore.
 
         Args:
             run_id: The ID of the pipeline run to sync steps for.
@@ -3053,15 +3772,26 @@ class SqlZenStore(BaseZenStore):
                     f"Unable to sync run steps for run with ID {run_id}: "
                     f"No run with this ID found."
                 )
-            zenml_steps_list = session.exec(
-                select(StepRunSchema).where(
-                    StepRunSchema.pipeline_run_id == run_id
-                )
-            ).all()
-        zenml_steps = {
-            step.name: self.get_run_step(step.id) for step in zenml_steps_list
+            if run.status is not None:
+                # The run has finished and was already fully synced.
+                return
+            zenml_steps = {
+                step.name: step
+                for step in self._list_run_steps(run_id, session=session)
+            }
+        step_ids_by_mlmd_id = {
+            step.mlmd_id: step.id for step in zenml_steps.values()
         }
 
+        # Fetch the step statuses before syncing the steps, so the run only
+        # gets marked as finished if all steps were synced after it finished.
+        final_status = self._get_final_run_status(
+            step_statuses=self.metadata_store.get_run_step_statuses(
+                run.mlmd_id
+            ),
+            num_steps=run.num_steps,
+        )
+
         # Get all steps from MLMD.
         mlmd_steps = self.metadata_store.get_pipeline_run_steps(run.mlmd_id)
 
@@ -3077,27 +3807,109 @@ class SqlZenStore(BaseZenStore):
                     parameters=mlmd_step.parameters,
                     step_configuration=mlmd_step.step_configuration,
                     docstring=docstring,
+                    metrics=mlmd_step.metrics,
                     pipeline_run_id=run_id,
                     parent_step_ids=[
-                        self._resolve_mlmd_step_id(parent_step_id)
+                        step_ids_by_mlmd_id[parent_step_id]
+                        if parent_step_id in step_ids_by_mlmd_id
+                        else self._resolve_mlmd_step_id(parent_step_id)
                         for parent_step_id in mlmd_step.mlmd_parent_step_ids
                     ],
                 )
                 new_step = self._create_run_step(new_step)
                 zenml_steps[step_name] = new_step
+                step_ids_by_mlmd_id[new_step.mlmd_id] = new_step.id
 
-        # Save parent step IDs into the database.
-        for step in zenml_steps.values():
-            for parent_step_id in step.parent_step_ids:
-                self._set_parent_step(
-                    child_id=step.id, parent_id=parent_step_id
+                # Save parent step IDs into the database.
+                for parent_step_id in new_step.parent_step_ids:
+                    self._set_parent_step(
+                        child_id=new_step.id, parent_id=parent_step_id
+                    )
+            elif mlmd_step.mlmd_id != zenml_steps[step_name].mlmd_id or (
+                mlmd_step.metrics and not zenml_steps[step_name].metrics
+            ):
+                # The step was synced while it was still running or before it
+                # got retried. The metrics only get published once it
+                # finished and every retry is a new MLMD execution.
+                step_ids_by_mlmd_id[mlmd_step.mlmd_id] = zenml_steps[
+                    step_name
+                ].id
+                zenml_steps[step_name] = self._update_run_step(
+                    step_id=zenml_steps[step_name].id,
+                    mlmd_id=mlmd_step.mlmd_id,
+                    metrics=mlmd_step.metrics,
                 )
 
         # Sync Artifacts.
-        for step in zenml_steps.values():
-            self._sync_run_step_artifacts(step.id)
+        for step_name, step in zenml_steps.items():
+            self._sync_run_step_artifacts(step.id, mlmd_steps[step_name])
+
+        # Store the final status of finished runs.
+        if final_status is not None:
+            with Session(self.engine) as session:
+                run = session.exec(
+                    select(PipelineRunSchema).where(
+                        PipelineRunSchema.id == run_id
+                    )
+                ).one()
+                run.status = final_status
+                session.add(run)
+                session.commit()
+
+    @staticmethod
+    def _get_run_status(
+        step_statuses: List[ExecutionStatus], num_steps: int
+    ) -> ExecutionStatus:
+        """Computes the status of a pipeline run.
+
+        Args:
+            step_statuses: The statuses of all steps that were started as part
+                of the run.
+            num_steps: The total number of steps of the run.
+
+        Returns:
+            The status of the run.
+        """
+        # If any step is failed or running, return that status respectively
+        if ExecutionStatus.FAILED in step_statuses:
+            return ExecutionStatus.FAILED
+        if ExecutionStatus.RUNNING in step_statuses:
+            return ExecutionStatus.RUNNING
+
+        # If not all steps have started yet, return running
+        if len(step_statuses) < num_steps:
+            return ExecutionStatus.RUNNING
 
-    def _sync_run_step_artifacts(self, run_step_id: UUID) -> None:
+        # Otherwise, return succeeded
+        return ExecutionStatus.COMPLETED
+
+    @classmethod
+    def _get_final_run_status(
+        cls, step_statuses: List[ExecutionStatus], num_steps: int
+    ) -> Optional[ExecutionStatus]:
+        """Computes the final status of a pipeline run.
+
+        Args:
+            step_statuses: The statuses of all steps that were started as part
+                of the run.
+            num_steps: The total number of steps of the run.
+
+        Returns:
+            The final status of the run or `None` if the run hasn't finished
+            yet.
+        """
+        if ExecutionStatus.RUNNING in step_statuses:
+            # Other steps might still be running or get retried even if a
+            # step failed.
+            return None
+        status = cls._get_run_status(step_statuses, num_steps)
+        if status == ExecutionStatus.RUNNING:
+            return None
+        return status
+
+    def _sync_run_step_artifacts(
+        self, run_step_id: UUID, mlmd_step: "MLMDStepRunModel"
+    ) -> None:
         """Sync run step artifacts from MLMD into the database.
 
         Since we do not allow to create artifacts in the database directly, this
@@ -3105,18 +3917,14 @@ class SqlZenStore(BaseZenStore):
 
         Args:
             run_step_id: The ID of the step run to sync artifacts for.
+            mlmd_step: The MLMD model of the step run, including its artifacts.
         """
         # Get all ZenML artifacts.
         zenml_inputs = self.get_run_step_inputs(run_step_id)
         zenml_outputs = self.get_run_step_outputs(run_step_id)
 
         # Get all MLMD artifacts.
-        step_model = self.get_run_step(run_step_id)
-        mlmd_inputs, mlmd_outputs = self.metadata_store.get_step_artifacts(
-            step_id=step_model.mlmd_id,
-            step_parent_step_ids=step_model.mlmd_parent_step_ids,
-            step_name=step_model.entrypoint_name,
-        )
+        mlmd_inputs, mlmd_outputs = mlmd_step.inputs, mlmd_step.outputs
 
         # For each output in MLMD, sync it into ZenML if it doesn't exist yet.
         for output_name, mlmd_artifact in mlmd_outputs.items():
@@ -3308,6 +4116,38 @@ class SqlZenStore(BaseZenStore):
                 mlmd_parent_step_ids=step.mlmd_parent_step_ids,
             )
 
+    def _update_run_step(
+        self, step_id: UUID, mlmd_id: int, metrics: Dict[str, float]
+    ) -> StepRunModel:
+        """Updates the MLMD ID and metrics of a step.
+
+        Args:
+            step_id: The ID of the step to update.
+            mlmd_id: The ID of the latest MLMD execution of the step.
+            metrics: The metrics of the step.
+
+        Returns:
+            The updated step.
+
+        Raises:
+            KeyError: if the step doesn't exist.
+        """
+        with Session(self.engine) as session:
+            step = session.exec(
+                select(StepRunSchema).where(StepRunSchema.id == step_id)
+            ).first()
+            if step is None:
+                raise KeyError(
+                    f"Unable to update step with ID {step_id}: "
+                    f"No step with this ID found."
+                )
+            step.mlmd_id = mlmd_id
+            step.metrics = json.dumps(metrics)
+            session.add(step)
+            session.commit()
+
+        return self.get_run_step(step_id)
+
     def _set_parent_step(self, child_id: UUID, parent_id: UUID) -> None:
         """Sets the parent step for a step.
 
@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """ZenML Store interface."""
 from abc import ABC, abstractmethod
+from datetime import datetime
 from pathlib import PurePath
 from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
@@ -60,7 +61,11 @@ class ZenStoreInterface(ABC):
          return a resource and raise an exception if the resource does not exist.
        * list methods - retrieve a list of resources from the store. These
          methods should accept a set of filter parameters that can be used to
-         filter the list of resources retrieved from the store.
+         filter the list of resources retrieved from the store. List methods
+         of resources that can grow without bounds (e.g. pipeline runs or
+         artifacts) should additionally accept the `sort_by`, `created_after`,
+         `created_before`, `offset` and `limit` parameters, so that callers
+         can retrieve them page by page.
        * update methods - update an existing resource in the store. These
          methods should expect the updated resource to be correctly identified
          by its unique key or identifier and raise an exception if the resource
@@ -227,6 +232,11 @@ class ZenStoreInterface(ABC):
         component_id: Optional[UUID] = None,
         name: Optional[str] = None,
         is_shared: Optional[bool] = None,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[StackModel]:
         """List all stacks matching the given filter criteria.
 
@@ -238,7 +248,15 @@ class ZenStoreInterface(ABC):
             name: Optionally filter stacks by their name
             is_shared: Optionally filter out stacks by whether they are shared
                 or not
-
+            sort_by: Name of the field to sort the stacks by. Prefix it with
+                `-` to sort in descending order.
+            created_after: If provided, only return stacks created after this
+                time.
+            created_before: If provided, only return stacks created before
+                this time.
+            offset: Number of stacks to skip.
+            limit: Maximum number of stacks to return. If not provided, all
+                remaining stacks are returned.
 
         Returns:
             A list of all stacks matching the filter criteria.
@@ -306,6 +324,11 @@ class ZenStoreInterface(ABC):
         flavor_name: Optional[str] = None,
         name: Optional[str] = None,
         is_shared: Optional[bool] = None,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[ComponentModel]:
         """List all stack components matching the given filter criteria.
 
@@ -318,6 +341,15 @@ class ZenStoreInterface(ABC):
             name: Optionally filter stack component by name
             is_shared: Optionally filter out stack component by whether they are
                 shared or not
+            sort_by: Name of the field to sort the stack components by. Prefix
+                it with `-` to sort in descending order.
+            created_after: If provided, only return stack components created
+                after this time.
+            created_before: If provided, only return stack components created
+                before this time.
+            offset: Number of stack components to skip.
+            limit: Maximum number of stack components to return. If not
+                provided, all remaining stack components are returned.
 
         Returns:
             A list of all stack components matching the filter criteria.
@@ -517,9 +549,27 @@ class ZenStoreInterface(ABC):
 
     # TODO: [ALEX] add filtering param(s)
     @abstractmethod
-    def list_users(self) -> List[UserModel]:
+    def list_users(
+        self,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[UserModel]:
         """List all users.
 
+        Args:
+            sort_by: Name of the field to sort the users by. Prefix it with
+                `-` to sort in descending order.
+            created_after: If provided, only return users created after this
+                time.
+            created_before: If provided, only return users created before
+                this time.
+            offset: Number of users to skip.
+            limit: Maximum number of users to return. If not provided, all
+                remaining users are returned.
+
         Returns:
             A list of all users.
         """
@@ -948,6 +998,11 @@ class ZenStoreInterface(ABC):
         project_name_or_id: Optional[Union[str, UUID]] = None,
         user_name_or_id: Optional[Union[str, UUID]] = None,
         name: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[PipelineModel]:
         """List all pipelines in the project.
 
@@ -955,6 +1010,15 @@ class ZenStoreInterface(ABC):
             project_name_or_id: If provided, only list pipelines in this project.
             user_name_or_id: If provided, only list pipelines from this user.
             name: If provided, only list pipelines with this name.
+            sort_by: Name of the field to sort the pipelines by. Prefix it with
+                `-` to sort in descending order.
+            created_after: If provided, only return pipelines created after
+                this time.
+            created_before: If provided, only return pipelines created before
+                this time.
+            offset: Number of pipelines to skip.
+            limit: Maximum number of pipelines to return. If not provided, all
+                remaining pipelines are returned.
 
         Returns:
             A list of pipelines.
@@ -1055,6 +1119,11 @@ class ZenStoreInterface(ABC):
         user_name_or_id: Optional[Union[str, UUID]] = None,
         pipeline_id: Optional[UUID] = None,
         unlisted: bool = False,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[PipelineRunModel]:
         """Gets all pipeline runs.
 
@@ -1068,11 +1137,54 @@ class ZenStoreInterface(ABC):
             pipeline_id: If provided, only return runs for this pipeline.
             unlisted: If True, only return unlisted runs that are not
                 associated with any pipeline (filter by `pipeline_id==None`).
+            sort_by: Name of the field to sort the runs by. Prefix it with
+                `-` to sort in descending order.
+            created_after: If provided, only return runs created after this
+                time.
+            created_before: If provided, only return runs created before
+                this time.
+            offset: Number of runs to skip.
+            limit: Maximum number of runs to return. If not provided, all
+                remaining runs are returned.
 
         Returns:
             A list of all pipeline runs.
         """
 
+    @abstractmethod
+    def count_runs(
+        self,
+        project_name_or_id: Optional[Union[str, UUID]] = None,
+        stack_id: Optional[UUID] = None,
+        component_id: Optional[UUID] = None,
+        run_name: Optional[str] = None,
+        user_name_or_id: Optional[Union[str, UUID]] = None,
+        pipeline_id: Optional[UUID] = None,
+        unlisted: bool = False,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> int:
+        """Counts the pipeline runs matching the given filter criteria.
+
+        Args:
+            project_name_or_id: If provided, only count runs for this project.
+            stack_id: If provided, only count runs for this stack.
+            component_id: Optionally filter for runs that used the
+                          component
+            run_name: Run name if provided
+            user_name_or_id: If provided, only count runs for this user.
+            pipeline_id: If provided, only count runs for this pipeline.
+            unlisted: If True, only count unlisted runs that are not
+                associated with any pipeline (filter by `pipeline_id==None`).
+            created_after: If provided, only count runs created after this
+                time.
+            created_before: If provided, only count runs created before this
+                time.
+
+        Returns:
+            The number of pipeline runs matching the filter criteria.
+        """
+
     @abstractmethod
     def get_run_status(self, run_id: UUID) -> ExecutionStatus:
         """Gets the execution status of a pipeline run.
@@ -1148,18 +1260,54 @@ class ZenStoreInterface(ABC):
 
     @abstractmethod
     def list_artifacts(
-        self, artifact_uri: Optional[str] = None
+        self,
+        artifact_uri: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[ArtifactModel]:
         """Lists all artifacts.
 
         Args:
             artifact_uri: If specified, only artifacts with the given URI will
                 be returned.
+            sort_by: Name of the field to sort the artifacts by. Prefix it with
+                `-` to sort in descending order.
+            created_after: If provided, only return artifacts created after
+                this time.
+            created_before: If provided, only return artifacts created before
+                this time.
+            offset: Number of artifacts to skip.
+            limit: Maximum number of artifacts to return. If not provided, all
+                remaining artifacts are returned.
 
         Returns:
             A list of all artifacts.
         """
 
+    @abstractmethod
+    def count_artifacts(
+        self,
+        artifact_uri: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> int:
+        """Counts the artifacts matching the given filter criteria.
+
+        Args:
+            artifact_uri: If specified, only artifacts with the given URI will
+                be counted.
+            created_after: If provided, only count artifacts created after
+                this time.
+            created_before: If provided, only count artifacts created before
+                this time.
+
+        Returns:
+            The number of artifacts matching the filter criteria.
+        """
+
     @abstractmethod
     def _sync_runs(self) -> None:
         """Syncs runs from MLMD."""
@@ -0,0 +1,121 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+from pathlib import Path
+
+import pytest
+
+from zenml.artifact_stores.artifact_cache import (
+    ArtifactCache,
+    get_artifact_cache,
+)
+from zenml.constants import (
+    ENV_ZENML_ARTIFACT_CACHE_PATH,
+    ENV_ZENML_ARTIFACT_CACHE_SIZE_MB,
+)
+
+
+def _get_download(content: bytes, downloads: list):
+    """Creates a download function that writes the given content."""
+
+    def download(local_path: str) -> None:
+        downloads.append(local_path)
+        Path(local_path).write_bytes(content)
+
+    return download
+
+
+def test_artifact_cache_downloads_files_only_once(tmp_path: Path):
+    """Tests that cached files are reused as long as the fingerprint matches."""
+    cache = ArtifactCache(directory=str(tmp_path), max_size=100)
+    downloads = []
+    download = _get_download(b"content", downloads)
+
+    path = cache.get("s3://bucket/file", "etag:7", 7, download)
+    assert Path(path).read_bytes() == b"content"
+    assert cache.get("s3://bucket/file", "etag:7", 7, download) == path
+    assert len(downloads) == 1
+
+    assert cache.get("s3://bucket/file", "other_etag:7", 7, download) != path
+    assert len(downloads) == 2
+
+
+def test_artifact_cache_evicts_least_recently_used_files(tmp_path: Path):
+    """Tests that the least recently used files are evicted."""
+    cache = ArtifactCache(directory=str(tmp_path), max_size=10)
+    download = _get_download(b"12345", [])
+
+    first = cache.get("s3://bucket/first", "", 5, download)
+    second = cache.get("s3://bucket/second", "", 5, download)
+    os.utime(first, (1, 1))
+    os.utime(second, (2, 2))
+    # Using the first file makes the second one the least recently used
+    cache.get("s3://bucket/first", "", 5, download)
+
+    third = cache.get("s3://bucket/third", "", 5, download)
+    assert os.path.exists(first)
+    assert not os.path.exists(second)
+    assert os.path.exists(third)
+
+
+def test_artifact_cache_skips_large_files(tmp_path: Path):
+    """Tests that files larger than the cache are not cached."""
+    cache = ArtifactCache(directory=str(tmp_path), max_size=4)
+    downloads = []
+
+    assert (
+        cache.get("s3://bucket/file", "", 5, _get_download(b"12345", downloads))
+        is None
+    )
+    assert not downloads
+
+
+def test_artifact_cache_removes_failed_downloads(tmp_path: Path):
+    """Tests that partially downloaded files don't end up in the cache."""
+    cache = ArtifactCache(directory=str(tmp_path), max_size=100)
+
+    def download(local_path: str) -> None:
+        Path(local_path).write_bytes(b"partial")
+        raise RuntimeError()
+
+    with pytest.raises(RuntimeError):
+        cache.get("s3://bucket/file", "", 7, download)
+    assert os.listdir(tmp_path) == []
+
+
+def test_artifact_cache_is_opt_in(monkeypatch, tmp_path: Path):
+    """Tests that the cache is only enabled if a size is configured."""
+    monkeypatch.delenv(ENV_ZENML_ARTIFACT_CACHE_SIZE_MB, raising=False)
+    assert get_artifact_cache() is None
+
+    monkeypatch.setenv(ENV_ZENML_ARTIFACT_CACHE_SIZE_MB, "2")
+    monkeypatch.setenv(ENV_ZENML_ARTIFACT_CACHE_PATH, str(tmp_path))
+    cache = get_artifact_cache()
+    assert cache.directory == str(tmp_path)
+    assert cache.max_size == 2 * 1024 * 1024
+
+
+def test_artifact_cache_lookup_never_downloads(tmp_path: Path):
+    """Tests that looking up a file only returns files that are cached."""
+    cache = ArtifactCache(directory=str(tmp_path), max_size=100)
+    downloads = []
+
+    assert cache.lookup("s3://bucket/file", "etag:7") is None
+    path = cache.get(
+        "s3://bucket/file", "etag:7", 7, _get_download(b"content", downloads)
+    )
+    assert cache.lookup("s3://bucket/file", "etag:7") == path
+    assert cache.lookup("s3://bucket/file", "other_etag:7") is None
+    assert len(downloads) == 1
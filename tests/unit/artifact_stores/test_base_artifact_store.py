@@ -11,3 +11,93 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, ClassVar, List, Set
+from uuid import uuid4
+
+from tfx.dsl.io.filesystem_registry import DEFAULT_FILESYSTEM_REGISTRY
+
+from zenml.artifact_stores import BaseArtifactStoreConfig, LocalArtifactStore
+from zenml.artifact_stores.artifact_cache import reading_whole_files
+from zenml.constants import (
+    ENV_ZENML_ARTIFACT_CACHE_PATH,
+    ENV_ZENML_ARTIFACT_CACHE_SIZE_MB,
+)
+from zenml.enums import StackComponentType
+from zenml.io import fileio
+
+
+class _RemoteTestArtifactStoreConfig(BaseArtifactStoreConfig):
+    """Config of an artifact store with a remote path."""
+
+    SUPPORTED_SCHEMES: ClassVar[Set[str]] = {"hdfs://"}
+
+
+class _RemoteTestArtifactStore(LocalArtifactStore):
+    """Artifact store with a remote path that stores its files locally."""
+
+    local_root: str = ""
+    opened_paths: List[str] = []
+
+    @property
+    def path(self) -> str:
+        return self.config.path
+
+    def _get_local_path(self, path: Any) -> str:
+        return os.path.join(self.local_root, str(path)[len("hdfs://") :])
+
+    def open(self, name: Any, mode: str = "r") -> Any:
+        self.opened_paths.append(str(name))
+        return open(self._get_local_path(name), mode)
+
+    def stat(self, path: Any) -> Any:
+        local_path = self._get_local_path(path)
+        return {"type": "file", "size": os.path.getsize(local_path)}
+
+
+def test_artifact_store_caches_files_read_as_a_whole(
+    mocker, monkeypatch, tmp_path: Path
+):
+    """Tests that files opened to be read as a whole are cached."""
+    monkeypatch.setenv(ENV_ZENML_ARTIFACT_CACHE_SIZE_MB, "1")
+    monkeypatch.setenv(ENV_ZENML_ARTIFACT_CACHE_PATH, str(tmp_path / "cache"))
+    mock_register = mocker.patch.object(DEFAULT_FILESYSTEM_REGISTRY, "register")
+    artifact_store = _RemoteTestArtifactStore(
+        name="",
+        id=uuid4(),
+        config=_RemoteTestArtifactStoreConfig(path="hdfs://bucket"),
+        flavor="test",
+        type=StackComponentType.ARTIFACT_STORE,
+        user=uuid4(),
+        project=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+    )
+    artifact_store.local_root = str(tmp_path / "store")
+    artifact_store.opened_paths = []
+    (tmp_path / "store").mkdir()
+    (tmp_path / "store" / "artifact").write_bytes(b"content")
+    mocker.patch.object(
+        DEFAULT_FILESYSTEM_REGISTRY,
+        "get_filesystem_for_path",
+        return_value=mock_register.call_args[0][0],
+    )
+
+    # Partial reads never download the file into the cache
+    with fileio.open("hdfs://bucket/artifact", "rb") as f:
+        assert f.read(3) == b"con"
+    assert len(artifact_store.opened_paths) == 1
+
+    for _ in range(2):
+        with reading_whole_files():
+            with fileio.open("hdfs://bucket/artifact", "rb") as f:
+                assert f.read() == b"content"
+    # The second read is served from the cache
+    assert len(artifact_store.opened_paths) == 2
+
+    with fileio.open("hdfs://bucket/artifact", "rb") as f:
+        assert f.read(3) == b"con"
+    assert len(artifact_store.opened_paths) == 2
@@ -95,3 +95,40 @@ def test_local_artifact_store_only_supports_local_paths():
         updated=datetime.now(),
     )
     assert artifact_store.path == os.getcwd()
+
+
+def test_local_artifact_store_copies_files_concurrently(tmp_path):
+    """Tests that the local artifact store copies multiple files and reports
+    the progress."""
+    artifact_store = LocalArtifactStore(
+        name="",
+        id=uuid4(),
+        config=LocalArtifactStoreConfig(
+            path=str(tmp_path / "store"), max_copy_workers=2
+        ),
+        flavor="default",
+        type=StackComponentType.ARTIFACT_STORE,
+        user=uuid4(),
+        project=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+    )
+    files = []
+    for i in range(5):
+        source = tmp_path / f"source_{i}"
+        source.write_text(str(i))
+        files.append((str(source), str(tmp_path / f"destination_{i}")))
+
+    progress = []
+    artifact_store.copy_files(
+        files, progress_callback=lambda done, total: progress.append(done)
+    )
+
+    for i in range(5):
+        assert (tmp_path / f"destination_{i}").read_text() == str(i)
+    assert sorted(progress) == [1, 2, 3, 4, 5]
+
+    with pytest.raises(FileExistsError):
+        artifact_store.copy_files(files)
+
+    artifact_store.copy_files(files, overwrite=True)
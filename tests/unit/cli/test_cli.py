@@ -11,13 +11,19 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import importlib
+import subprocess
+import sys
 
 import click
 import pytest
 from click.testing import CliRunner
+from click.utils import make_default_short_help
 
-from zenml.cli.cli import ZenMLCLI, cli
+import zenml.cli
+from zenml.cli.cli import LAZY_COMMANDS, TagGroup, ZenMLCLI, cli
 from zenml.cli.formatter import ZenFormatter
+from zenml.enums import CliCategories
 
 
 @pytest.fixture(scope="function")
@@ -45,3 +51,72 @@ def test_ZenMLCLI_formatter():
     context = click.Context(zencli)
     formatter = ZenFormatter(context)
     assert isinstance(formatter, ZenFormatter)
+
+
+def test_lazy_commands_cover_all_registered_commands():
+    """Tests that all commands registered by the command modules are lazy."""
+    for module in zenml.cli._COMMAND_MODULES:
+        importlib.import_module(module)
+
+    assert set(cli.commands) == set(LAZY_COMMANDS)
+    assert cli.list_commands(click.Context(cli)) == sorted(LAZY_COMMANDS)
+
+
+def test_lazy_commands_match_registered_commands():
+    """Tests that the help of lazy commands matches the registered commands."""
+    for module in zenml.cli._COMMAND_MODULES:
+        importlib.import_module(module)
+
+    for name, lazy_command in LAZY_COMMANDS.items():
+        command = cli.commands[name]
+        assert lazy_command.hidden == command.hidden
+        assert make_default_short_help(
+            lazy_command.help, 80
+        ) == command.get_short_help_str(limit=80)
+        category = (
+            command.tag
+            if isinstance(command, TagGroup)
+            else CliCategories.OTHER_COMMANDS
+        )
+        assert lazy_command.category == category
+
+
+def test_cli_only_imports_modules_of_invoked_command():
+    """Tests that running a command doesn't import unrelated command modules."""
+    code = (
+        "import sys; from zenml.cli.cli import cli; "
+        "cli(['version'], standalone_mode=False); "
+        "print(sorted(m for m in sys.modules if m.startswith('zenml.cli.')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    imported_modules = result.stdout.strip().splitlines()[-1]
+    assert "zenml.cli.version" in imported_modules
+    assert "zenml.cli.stack" not in imported_modules
+    assert "zenml.cli.server" not in imported_modules
+
+
+def test_cli_help_does_not_import_command_modules():
+    """Tests that the CLI help lists all commands without importing them."""
+    code = (
+        "import sys; from zenml.cli.cli import cli; "
+        "cli(['--help'], standalone_mode=False); "
+        "print(sorted(m for m in sys.modules if m.startswith('zenml.cli.')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    output, imported_modules = result.stdout.strip().rsplit("\n", 1)
+    assert "artifact-store" in output
+    assert "Version of ZenML." in output
+    for module in zenml.cli._COMMAND_MODULES:
+        assert module not in imported_modules
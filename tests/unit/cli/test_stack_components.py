@@ -20,6 +20,7 @@ from uuid import uuid4
 import pytest
 from click.testing import CliRunner
 
+import zenml.cli.stack_components  # noqa: F401
 import zenml.cli.utils as cli_utils
 from tests.unit.test_flavor import AriaOrchestratorFlavor
 from zenml.cli.cli import cli
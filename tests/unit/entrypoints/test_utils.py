@@ -0,0 +1,65 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from types import SimpleNamespace
+
+from zenml.entrypoints.utils import activate_integrations_for_steps
+from zenml.integrations.registry import integration_registry
+from zenml.integrations.sklearn import SklearnIntegration
+from zenml.materializers.built_in_materializer import (
+    BuiltInContainerMaterializer,
+)
+from zenml.utils import source_utils
+
+
+def _get_step(materializer_source: str) -> SimpleNamespace:
+    """Creates a step with a single output using the given materializer."""
+    output = SimpleNamespace(
+        artifact_source="zenml.artifacts.data_artifact.DataArtifact",
+        materializer_source=materializer_source,
+    )
+    return SimpleNamespace(
+        spec=SimpleNamespace(source="my_module.my_step"),
+        config=SimpleNamespace(inputs={}, outputs={"output": output}),
+    )
+
+
+def test_activating_integrations_for_steps(mocker):
+    """Tests that only the integrations of the step materializers are used."""
+    mock_activate = mocker.patch.object(
+        integration_registry, "activate_integrations"
+    )
+    step = _get_step(
+        "zenml.integrations.sklearn.materializers.sklearn_materializer."
+        "SklearnMaterializer"
+    )
+
+    activate_integrations_for_steps(
+        [step], stack=SimpleNamespace(components={})
+    )
+
+    mock_activate.assert_called_once_with({SklearnIntegration.NAME})
+
+
+def test_activating_integrations_for_steps_with_container_artifacts(mocker):
+    """Tests that container materializers lead to activating everything."""
+    mock_activate = mocker.patch.object(
+        integration_registry, "activate_integrations"
+    )
+    step = _get_step(source_utils.resolve_class(BuiltInContainerMaterializer))
+
+    activate_integrations_for_steps(
+        [step], stack=SimpleNamespace(components={})
+    )
+
+    mock_activate.assert_called_once_with()
@@ -0,0 +1,141 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import threading
+
+import pytest
+from kubernetes import client as k8s_client
+
+from zenml.integrations.kubernetes.orchestrators import kube_utils
+
+
+def _get_pod(name: str, phase: str) -> k8s_client.V1Pod:
+    """Helper function to get a pod in a phase."""
+    return k8s_client.V1Pod(
+        metadata=k8s_client.V1ObjectMeta(name=name),
+        status=k8s_client.V1PodStatus(phase=phase),
+    )
+
+
+def test_pod_watcher_waits_for_exit_condition(mocker) -> None:
+    """Test that the pod watcher returns once a pod meets the exit
+    condition."""
+    watcher = kube_utils.PodWatcher(core_api=mocker.Mock(), namespace="zenml")
+    watcher._update_pod(_get_pod("pod", "Running"), deleted=False)
+
+    def _finish_pod() -> None:
+        watcher._update_pod(_get_pod("other_pod", "Failed"), deleted=False)
+        watcher._update_pod(_get_pod("pod", "Succeeded"), deleted=False)
+
+    threading.Timer(0.05, _finish_pod).start()
+    pod = watcher.wait(
+        pod_name="pod", exit_condition_lambda=kube_utils.pod_is_done
+    )
+    assert pod.status.phase == "Succeeded"
+
+
+def test_pod_watcher_raises_if_pod_failed_or_timed_out(mocker) -> None:
+    """Test that waiting for a pod fails if the pod failed or the timeout
+    passed."""
+    watcher = kube_utils.PodWatcher(core_api=mocker.Mock(), namespace="zenml")
+    watcher._update_pod(_get_pod("failed_pod", "Failed"), deleted=False)
+
+    with pytest.raises(RuntimeError, match="failed"):
+        watcher.wait(
+            pod_name="failed_pod",
+            exit_condition_lambda=kube_utils.pod_is_done,
+        )
+    with pytest.raises(RuntimeError, match="timed out"):
+        watcher.wait(
+            pod_name="missing_pod",
+            exit_condition_lambda=kube_utils.pod_is_done,
+            timeout_sec=0.05,
+        )
+
+
+def test_pod_watcher_relists_pods_if_resource_version_expired(mocker) -> None:
+    """Test that the pod watcher lists the pods again if the watch ends
+    early, which is how the Kubernetes client handles expired resource
+    versions."""
+    core_api = mocker.Mock()
+    core_api.list_namespaced_pod.side_effect = [
+        k8s_client.V1PodList(
+            items=[_get_pod("pod", "Running")],
+            metadata=k8s_client.V1ListMeta(resource_version="1"),
+        ),
+        k8s_client.V1PodList(
+            items=[_get_pod("pod", "Succeeded")],
+            metadata=k8s_client.V1ListMeta(resource_version="2"),
+        ),
+    ]
+    mock_watch = mocker.patch.object(kube_utils.k8s_watch, "Watch")
+    watch_requests = []
+    stopped = threading.Event()
+
+    def _stream(*args, **kwargs):
+        watch_requests.append(kwargs["resource_version"])
+        if len(watch_requests) > 1:
+            # Block like a healthy watch until the test finished
+            stopped.wait()
+        return iter([])
+
+    mock_watch.return_value.stream.side_effect = _stream
+    mocker.patch.object(kube_utils, "RECONNECT_INTERVAL_SECONDS", 0)
+
+    with kube_utils.PodWatcher(core_api=core_api, namespace="zenml") as watcher:
+        pod = watcher.wait(
+            pod_name="pod",
+            exit_condition_lambda=kube_utils.pod_is_done,
+            timeout_sec=5,
+        )
+        stopped.set()
+
+    assert pod.status.phase == "Succeeded"
+    assert watch_requests == ["1", "2"]
+
+
+def test_follow_pod_logs_resumes_without_duplicates(mocker) -> None:
+    """Test that following logs resumes dropped streams and skips lines that
+    were already logged."""
+    streams = [
+        [
+            "2022-10-10T12:00:00.1Z first",
+            "2022-10-10T12:00:00.25Z second",
+        ],
+        [
+            "2022-10-10T12:00:00.100Z first",
+            "2022-10-10T12:00:00.250000Z second",
+            "2022-10-10T12:00:01Z third",
+        ],
+    ]
+    mock_watch = mocker.patch.object(kube_utils.k8s_watch, "Watch")
+    mock_watch.return_value.stream.side_effect = streams
+    mocker.patch.object(kube_utils, "RECONNECT_INTERVAL_SECONDS", 0)
+    mock_logger = mocker.patch.object(kube_utils, "logger")
+
+    kube_utils.follow_pod_logs(
+        core_api=mocker.Mock(),
+        pod_name="pod",
+        namespace="zenml",
+        is_finished=mocker.Mock(side_effect=[False, True]),
+    )
+
+    logged = [args[0] for args, _ in mock_logger.info.call_args_list]
+    assert logged == ["first", "second", "third"]
+    (_, first_request), (
+        _,
+        resumed_request,
+    ) = mock_watch.return_value.stream.call_args_list
+    assert first_request["follow"] is True
+    assert first_request["since_seconds"] is None
+    assert resumed_request["since_seconds"] > 0
@@ -25,6 +25,12 @@ from zenml.integrations.kubernetes.flavors.kubernetes_orchestrator_flavor import
     KubernetesOrchestratorConfig,
 )
 from zenml.integrations.kubernetes.orchestrators import KubernetesOrchestrator
+from zenml.integrations.kubernetes.orchestrators.kubernetes_orchestrator_entrypoint import (
+    parse_args,
+)
+from zenml.integrations.kubernetes.orchestrators.kubernetes_orchestrator_entrypoint_configuration import (
+    KubernetesOrchestratorEntrypointConfiguration,
+)
 from zenml.stack import Stack
 
 
@@ -71,3 +77,43 @@ def test_kubernetes_orchestrator_local_stack(
             artifact_store=local_artifact_store,
             container_registry=local_container_registry,
         ).validate()
+
+
+def test_kubernetes_orchestrator_config_validates_scheduling_settings() -> None:
+    """Test that invalid step scheduling settings are rejected."""
+    with pytest.raises(ValueError):
+        KubernetesOrchestratorConfig(max_parallelism=0)
+    with pytest.raises(ValueError):
+        KubernetesOrchestratorConfig(max_step_retries=-1)
+    with pytest.raises(ValueError):
+        KubernetesOrchestratorConfig(step_retry_backoff=-1)
+
+
+def test_kubernetes_orchestrator_entrypoint_arguments() -> None:
+    """Test that the step scheduling settings are passed to the orchestrator
+    pod."""
+    args = (
+        KubernetesOrchestratorEntrypointConfiguration.get_entrypoint_arguments(
+            run_name="run",
+            image_name="image",
+            kubernetes_namespace="zenml",
+            max_parallelism=4,
+            fail_fast=True,
+            max_step_retries=2,
+            step_retry_backoff=5.0,
+        )
+    )
+    parsed_args = parse_args(args)
+    assert parsed_args.max_parallelism == 4
+    assert parsed_args.fail_fast is True
+    assert parsed_args.max_step_retries == 2
+    assert parsed_args.step_retry_backoff == 5.0
+
+    args = (
+        KubernetesOrchestratorEntrypointConfiguration.get_entrypoint_arguments(
+            run_name="run", image_name="image", kubernetes_namespace="zenml"
+        )
+    )
+    parsed_args = parse_args(args)
+    assert parsed_args.max_parallelism is None
+    assert parsed_args.fail_fast is False
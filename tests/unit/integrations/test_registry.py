@@ -0,0 +1,56 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from zenml.integrations.integration import requirement_is_installed
+from zenml.integrations.registry import integration_registry
+from zenml.integrations.sklearn import SklearnIntegration
+
+
+def test_requirement_is_installed():
+    """Tests that requirements are checked against the installed packages."""
+    assert requirement_is_installed("pydantic")
+    assert requirement_is_installed("pydantic>=1.0")
+    assert not requirement_is_installed("pydantic<1.0")
+    assert not requirement_is_installed("some-package-that-does-not-exist")
+    assert not requirement_is_installed("not a valid requirement")
+    assert requirement_is_installed(
+        "some-package-that-does-not-exist; python_version < '3.0'"
+    )
+
+
+def test_get_integrations_for_sources():
+    """Tests that sources are mapped to the integrations containing them."""
+    sources = [
+        "zenml.integrations.sklearn.materializers.sklearn_materializer."
+        "SklearnMaterializer",
+        "zenml.materializers.built_in_materializer.BuiltInMaterializer",
+        "zenml.integrations.sklearn_extra.SomeClass",
+        "my_module.my_step",
+    ]
+    assert integration_registry.get_integrations_for_sources(sources) == {
+        SklearnIntegration.NAME
+    }
+
+
+def test_activate_integrations_only_activates_once(mocker):
+    """Tests that integrations are only activated once."""
+    mocker.patch.object(
+        SklearnIntegration, "check_installation", return_value=True
+    )
+    mock_activate = mocker.patch.object(SklearnIntegration, "activate")
+    mocker.patch.object(integration_registry, "_activated_integrations", set())
+
+    integration_registry.activate_integrations([SklearnIntegration.NAME])
+    integration_registry.activate_integrations([SklearnIntegration.NAME])
+
+    mock_activate.assert_called_once()
@@ -14,10 +14,18 @@
 import os
 import shutil
 
+import pytest
+
 from zenml.artifacts.data_artifact import DataArtifact
+from zenml.materializers.built_in_materializer import (
+    BuiltInContainerMaterializer,
+    LazyMapping,
+    LazySequence,
+)
 from zenml.materializers.default_materializer_registry import (
     default_materializer_registry,
 )
+from zenml.utils import yaml_utils
 
 
 def _test_materialization(
@@ -149,3 +157,117 @@ def test_none_values():
     """Tests serialization of `None` values in container types."""
     _test_materialization(type_=list, example=[1, "a", None])
     _test_materialization(type_=dict, example={"key": None})
+
+
+def _get_container_materializer(
+    artifact_uri: str,
+) -> BuiltInContainerMaterializer:
+    """Creates a container materializer for the given artifact URI."""
+    artifact = DataArtifact()
+    artifact.uri = artifact_uri
+    return BuiltInContainerMaterializer(artifact)
+
+
+def test_small_elements_are_packed_into_chunks(mocker, tmp_path):
+    """Tests that elements of basic types are packed into chunk files."""
+    mocker.patch(
+        "zenml.materializers.built_in_materializer.ELEMENT_CHUNK_SIZE", 2
+    )
+    example = [b"0", 1, "2", None, True, 5.0, [b"6"]]
+    materializer = _get_container_materializer(str(tmp_path))
+    materializer.handle_return(example)
+
+    assert sorted(os.listdir(tmp_path)) == [
+        "6",
+        "chunk_0.json",
+        "chunk_1.json",
+        "chunk_2.json",
+        "metadata.json",
+    ]
+    assert materializer.handle_input(list) == example
+
+
+def test_lazy_sequence_loads_elements_on_access(mocker, tmp_path):
+    """Tests that lazy sequences only load the elements that are accessed."""
+    example = [b"0", [b"1"], (b"2",), {b"3"}]
+    materializer = _get_container_materializer(str(tmp_path))
+    materializer.handle_return(example)
+
+    handle_input = mocker.spy(BuiltInContainerMaterializer, "handle_input")
+    lazy_sequence = materializer.handle_input(LazySequence)
+    assert isinstance(lazy_sequence, LazySequence)
+    assert len(lazy_sequence) == 4
+    assert handle_input.call_count == 1
+
+    assert lazy_sequence[0] == b"0"
+    assert lazy_sequence[-1] == {b"3"}
+    assert handle_input.call_count == 2
+    assert lazy_sequence[1:3] == [[b"1"], (b"2",)]
+    assert list(lazy_sequence) == example
+    with pytest.raises(IndexError):
+        lazy_sequence[4]
+
+
+def test_lazy_mapping_loads_values_on_access(tmp_path):
+    """Tests that lazy mappings can be read from all kinds of dicts."""
+    for example in [{"a": 0, "b": 1}, {"a": b"0", "b": [b"1"]}]:
+        artifact_uri = tmp_path / str(len(os.listdir(tmp_path)))
+        artifact_uri.mkdir()
+        materializer = _get_container_materializer(str(artifact_uri))
+        materializer.handle_return(example)
+
+        lazy_mapping = materializer.handle_input(LazyMapping)
+        assert isinstance(lazy_mapping, LazyMapping)
+        assert list(lazy_mapping) == list(example)
+        assert lazy_mapping["b"] == example["b"]
+        assert dict(lazy_mapping) == example
+
+
+def test_lazy_containers_can_be_returned(tmp_path):
+    """Tests that lazy containers get materialized like lists and dicts."""
+    (tmp_path / "input").mkdir()
+    (tmp_path / "output").mkdir()
+    input_materializer = _get_container_materializer(str(tmp_path / "input"))
+    input_materializer.handle_return({"a": b"0", "b": [b"1"]})
+
+    output_materializer = _get_container_materializer(str(tmp_path / "output"))
+    output_materializer.handle_return(
+        input_materializer.handle_input(LazyMapping)
+    )
+    assert output_materializer.handle_input(dict) == {"a": b"0", "b": [b"1"]}
+
+
+def test_reading_legacy_container_artifacts(tmp_path):
+    """Tests that containers without packed elements can still be read."""
+    for i, element in enumerate([b"0", b"1"]):
+        (tmp_path / str(i)).mkdir()
+        (tmp_path / str(i) / "data.txt").write_bytes(element)
+    yaml_utils.write_json(
+        str(tmp_path / "metadata.json"),
+        {
+            "length": 2,
+            "paths": [str(tmp_path / "0"), str(tmp_path / "1")],
+            "types": [str(bytes), str(bytes)],
+        },
+    )
+
+    materializer = _get_container_materializer(str(tmp_path))
+    assert materializer.handle_input(list) == [b"0", b"1"]
+    assert list(materializer.handle_input(LazySequence)) == [b"0", b"1"]
+
+
+def test_failed_writes_are_cleaned_up(mocker, tmp_path):
+    """Tests that all files are removed if materializing an element fails."""
+
+    def _write_element(materializer, element, element_path):
+        os.mkdir(element_path)
+        raise RuntimeError()
+
+    mocker.patch(
+        "zenml.materializers.built_in_materializer._write_element",
+        side_effect=_write_element,
+    )
+    materializer = _get_container_materializer(str(tmp_path))
+    with pytest.raises(RuntimeError):
+        materializer.handle_return([1, [b"0"]])
+    assert os.listdir(tmp_path) == []
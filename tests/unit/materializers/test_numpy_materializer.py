@@ -0,0 +1,97 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from zenml.artifacts.data_artifact import DataArtifact
+from zenml.materializers.numpy_materializer import (
+    DATA_FILENAME,
+    DATA_VAR,
+    NUMPY_FILENAME,
+    SHAPE_FILENAME,
+    NumpyMaterializer,
+)
+from zenml.utils import yaml_utils
+
+
+def _get_materializer(artifact_uri: Path) -> NumpyMaterializer:
+    """Creates a numpy materializer for the given artifact URI."""
+    artifact = DataArtifact()
+    artifact.uri = str(artifact_uri)
+    return NumpyMaterializer(artifact)
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(12, dtype=np.int32).reshape(3, 4),
+        np.arange(12).reshape(3, 4).T,
+        np.array(["2022-01-01", "2022-10-17"], dtype="datetime64[D]"),
+        np.zeros(3, dtype=[("a", "i4"), ("b", "f8")]),
+        np.zeros((0, 3)),
+    ],
+)
+def test_numpy_materializer_native_format(tmp_path: Path, array):
+    """Tests that arrays are stored in the native format and read back with
+    their dtype and shape."""
+    materializer = _get_materializer(tmp_path)
+    materializer.handle_return(array)
+
+    assert os.listdir(tmp_path) == [NUMPY_FILENAME]
+
+    loaded_array = materializer.handle_input(np.ndarray)
+    assert isinstance(loaded_array, np.memmap)
+    assert loaded_array.dtype == array.dtype
+    assert loaded_array.shape == array.shape
+    assert np.array_equal(loaded_array, array)
+
+
+def test_numpy_materializer_does_not_modify_stored_array(tmp_path: Path):
+    """Tests that in-place modifications of a memory-mapped array don't
+    change the stored artifact."""
+    materializer = _get_materializer(tmp_path)
+    materializer.handle_return(np.ones(5))
+
+    loaded_array = materializer.handle_input(np.ndarray)
+    loaded_array += 1
+
+    assert np.array_equal(materializer.handle_input(np.ndarray), np.ones(5))
+
+
+def test_numpy_materializer_object_arrays(tmp_path: Path):
+    """Tests that arrays with object dtype are stored as parquet."""
+    array = np.array(["a", "bc", "def"], dtype=object)
+    materializer = _get_materializer(tmp_path)
+    materializer.handle_return(array)
+
+    assert sorted(os.listdir(tmp_path)) == [DATA_FILENAME, SHAPE_FILENAME]
+    assert np.array_equal(materializer.handle_input(np.ndarray), array)
+
+
+def test_numpy_materializer_reads_legacy_parquet_artifacts(tmp_path: Path):
+    """Tests that arrays stored as parquet by older versions can be read."""
+    array = np.arange(6).reshape(2, 3)
+    yaml_utils.write_json(str(tmp_path / SHAPE_FILENAME), {"0": 2, "1": 3})
+    pq.write_table(
+        pa.table({DATA_VAR: array.flatten()}), str(tmp_path / DATA_FILENAME)
+    )
+
+    loaded_array = _get_materializer(tmp_path).handle_input(np.ndarray)
+    assert np.array_equal(loaded_array, array)
@@ -0,0 +1,88 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from zenml.artifacts.data_artifact import DataArtifact
+from zenml.materializers.pandas_materializer import (
+    DataFrameReader,
+    PandasMaterializer,
+)
+
+
+def _get_materializer(artifact_uri: Path) -> PandasMaterializer:
+    """Creates a pandas materializer for the given artifact URI."""
+    artifact = DataArtifact()
+    artifact.uri = str(artifact_uri)
+    return PandasMaterializer(artifact)
+
+
+def test_pandas_materializer_dataframe_and_series(tmp_path: Path):
+    """Tests that dataframes and series can be written and read back."""
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    materializer = _get_materializer(tmp_path / "df")
+    (tmp_path / "df").mkdir()
+    materializer.handle_return(df)
+    pd.testing.assert_frame_equal(materializer.handle_input(pd.DataFrame), df)
+
+    series = pd.Series([1.0, 2.0], name="series")
+    materializer = _get_materializer(tmp_path / "series")
+    (tmp_path / "series").mkdir()
+    materializer.handle_return(series)
+    pd.testing.assert_series_equal(materializer.handle_input(pd.Series), series)
+
+
+def test_dataframe_reader_reads_subsets(mocker, tmp_path: Path):
+    """Tests that the reader only loads the requested parts of a dataframe."""
+    mocker.patch("zenml.materializers.pandas_materializer.ROW_GROUP_SIZE", 2)
+    df = pd.DataFrame({"a": range(6), "b": [str(i) for i in range(6)]})
+    materializer = _get_materializer(tmp_path)
+    materializer.handle_return(df)
+
+    reader = materializer.handle_input(DataFrameReader)
+    assert isinstance(reader, DataFrameReader)
+    assert reader.num_rows == 6
+    assert reader.num_row_groups == 3
+    assert {"a", "b"} <= set(reader.columns)
+
+    assert list(reader.read(columns=["b"]).columns) == ["b"]
+    assert list(reader.read(row_groups=[1])["a"]) == [2, 3]
+    assert list(reader.read(filters=[("a", ">", 3)])["a"]) == [4, 5]
+    batches = list(reader.iter_batches(batch_size=4, columns=["a"]))
+    assert all(len(batch) <= 4 for batch in batches)
+    assert list(pd.concat(batches)["a"]) == list(range(6))
+
+    with pytest.raises(ValueError):
+        reader.read(row_groups=[0], filters=[("a", ">", 3)])
+
+
+def test_dataframe_reader_output_is_copied(tmp_path: Path):
+    """Tests that returning a reader from a step copies the dataframe."""
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    (tmp_path / "input").mkdir()
+    (tmp_path / "output").mkdir()
+    input_materializer = _get_materializer(tmp_path / "input")
+    input_materializer.handle_return(df)
+
+    output_materializer = _get_materializer(tmp_path / "output")
+    output_materializer.handle_return(
+        input_materializer.handle_input(DataFrameReader)
+    )
+
+    pd.testing.assert_frame_equal(
+        output_materializer.handle_input(pd.DataFrame), df
+    )
@@ -14,8 +14,13 @@
 from datetime import datetime
 from uuid import uuid4
 
+import pytest
+
 from zenml.enums import StackComponentType
 from zenml.orchestrators import LocalOrchestrator
+from zenml.orchestrators.local.local_orchestrator import (
+    LocalOrchestratorConfig,
+)
 from zenml.stack.stack_component import StackComponentConfig
 
 
@@ -35,3 +40,13 @@ def test_local_orchestrator_attributes():
     )
     assert orchestrator.type == StackComponentType.ORCHESTRATOR
     assert orchestrator.flavor == "default"
+
+
+def test_local_orchestrator_config_validates_max_parallelism():
+    """Tests that the maximum parallelism of the local orchestrator needs to
+    be positive."""
+    assert LocalOrchestratorConfig().max_parallelism == 1
+    assert LocalOrchestratorConfig(max_parallelism=4).max_parallelism == 4
+
+    with pytest.raises(ValueError):
+        LocalOrchestratorConfig(max_parallelism=0)
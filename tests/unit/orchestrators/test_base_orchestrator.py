@@ -11,3 +11,76 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+
+import threading
+
+from tfx.proto.orchestration.pipeline_pb2 import Pipeline as Pb2Pipeline
+
+from zenml.orchestrators.base_orchestrator import RunExecutionContext
+
+
+def test_run_execution_context_resolves_resources_once(mocker):
+    """Tests that the run execution context only resolves its resources
+    once."""
+    mock_client = mocker.patch("zenml.orchestrators.base_orchestrator.Client")
+    context = RunExecutionContext(Pb2Pipeline())
+    mock_client.assert_not_called()
+
+    assert context.stack is context.stack
+    assert (
+        context.metadata_connection_config is context.metadata_connection_config
+    )
+    assert mock_client.call_count == 2
+    mock_client.return_value.zen_store.get_metadata_config.assert_called_once()
+
+
+def test_run_execution_context_uses_given_stack(mocker):
+    """Tests that the run execution context uses the stack it was created
+    with."""
+    mock_client = mocker.patch("zenml.orchestrators.base_orchestrator.Client")
+    stack = mocker.Mock()
+
+    assert RunExecutionContext(Pb2Pipeline(), stack=stack).stack is stack
+    mock_client.assert_not_called()
+
+
+def test_run_execution_context_pools_mlmd_connections(mocker):
+    """Tests that steps borrow MLMD connections from a pool."""
+    mocker.patch("zenml.orchestrators.base_orchestrator.Client")
+    mocker.patch(
+        "zenml.orchestrators.base_orchestrator._PersistentMetadata",
+        side_effect=lambda config: mocker.Mock(),
+    )
+    context = RunExecutionContext(Pb2Pipeline())
+    with context.borrow_mlmd_connection() as connection:
+        # Steps running at the same time get different connections
+        with context.borrow_mlmd_connection() as parallel_connection:
+            assert parallel_connection is not connection
+
+    # Steps in other threads reuse the connections of finished steps
+    thread_connections = []
+
+    def _run_step() -> None:
+        with context.borrow_mlmd_connection() as thread_connection:
+            thread_connections.append(thread_connection)
+
+    thread = threading.Thread(target=_run_step)
+    thread.start()
+    thread.join()
+    assert thread_connections[0] in (connection, parallel_connection)
+
+    context.close()
+    connection.close.assert_called_once()
+    parallel_connection.close.assert_called_once()
+
+
+def test_run_execution_context_indexes_step_nodes():
+    """Tests that the run execution context maps step names to nodes."""
+    pb2_pipeline = Pb2Pipeline()
+    for step_name in ("aria", "axl"):
+        node = pb2_pipeline.nodes.add()
+        node.pipeline_node.node_info.id = step_name
+
+    step_nodes = RunExecutionContext(pb2_pipeline).step_nodes
+    assert set(step_nodes) == {"aria", "axl"}
+    assert step_nodes["axl"].node_info.id == "axl"
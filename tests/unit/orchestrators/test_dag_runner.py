@@ -0,0 +1,220 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import threading
+import time
+from contextlib import ExitStack as does_not_raise
+from typing import Dict, List
+
+import pytest
+
+from zenml.orchestrators.dag_runner import (
+    ThreadedDagRunner,
+    get_critical_path_lengths,
+    reverse_dag,
+)
+
+
+def test_reverse_dag():
+    """Test `dag_runner.reverse_dag()`."""
+    dag = {1: [7], 2: [], 3: [2, 5], 5: [1, 7], 7: []}
+    assert reverse_dag(dag) == {1: [5], 2: [3], 3: [], 5: [3], 7: [1, 5]}
+
+
+def test_critical_path_lengths():
+    """Test `dag_runner.get_critical_path_lengths()`."""
+    # 1->2->3, 1->4, 5
+    dag = {1: [], 2: [1], 3: [2], 4: [1], 5: []}
+    assert get_critical_path_lengths(dag) == {1: 3, 2: 2, 3: 1, 4: 1, 5: 1}
+    assert get_critical_path_lengths({1: [2], 2: [1]}) == {}
+
+
+class MockRunFn:
+    """Stateful function that iteratively does `r=(r+1)*f(x)`."""
+
+    def __init__(self) -> None:
+        self.result = 0
+
+    def __call__(self, node) -> None:
+        self.result = (self.result + 1) * int(node)
+
+
+def _test_runner(dag: Dict[str, List[str]], correct_results: List[int]):
+    """Utility function to test running a given DAG."""
+    run_fn = MockRunFn()
+    with does_not_raise():
+        ThreadedDagRunner(dag, run_fn).run()
+    assert run_fn.result in correct_results
+
+
+def test_dag_runner_empty():  # {}
+    """Test running a DAG with no nodes."""
+    _test_runner(dag={}, correct_results=[0])
+
+
+def test_dag_runner_single():  # 42
+    """Test running a DAG with a single node."""
+    _test_runner(dag={42: []}, correct_results=[42])
+
+
+def test_dag_runner_linear():  # 5->2->7
+    """Test running a linear DAG."""
+    _test_runner(dag={2: [5], 5: [], 7: [2]}, correct_results=[91])
+
+
+def test_dag_runner_multi_path():  # 3->(2, 5)->1
+    """Test running a DAG will multiple paths."""
+    _test_runner(
+        dag={1: [2, 5], 2: [3], 3: [], 5: [3]},
+        correct_results=[43, 46],  # 3->5->2->1 or 3->2->5->1
+    )
+
+
+def test_dag_runner_cyclic():
+    """Test that nothing happens for cyclic graphs, and no error is raised."""
+    _test_runner({1: [2], 2: [1]}, correct_results=[0])
+
+
+def test_dag_runner_respects_max_parallelism():
+    """Test that no more than `max_parallelism` nodes run at the same time."""
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def run_fn(node: str) -> None:
+        with lock:
+            running.append(node)
+            max_running.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(node)
+
+    dag = {node: [] for node in range(6)}
+    ThreadedDagRunner(dag, run_fn, max_parallelism=2).run()
+    assert len(max_running) == 6
+    assert max(max_running) <= 2
+
+
+def test_dag_runner_raises_error_of_failed_node():
+    """Test that downstream nodes of a failed node are skipped."""
+    completed = []
+
+    def run_fn(node: int) -> None:
+        if node == 2:
+            raise ValueError("Node 2 failed.")
+        completed.append(node)
+
+    # 1->2->3, 1->4
+    dag = {1: [], 2: [1], 3: [2], 4: [1]}
+    with pytest.raises(ValueError):
+        ThreadedDagRunner(dag, run_fn).run()
+    assert sorted(completed) == [1, 4]
+
+
+def test_dag_runner_fails_with_invalid_max_parallelism():
+    """Test that the maximum parallelism needs to be positive."""
+    with pytest.raises(ValueError):
+        ThreadedDagRunner({}, lambda node: None, max_parallelism=0)
+
+
+def test_dag_runner_starts_nodes_on_critical_path_first():
+    """Test that nodes with the longest downstream path are started first."""
+    order = []
+
+    # 1, 2, 3->4->5
+    dag = {1: [], 2: [], 3: [], 4: [3], 5: [4]}
+    ThreadedDagRunner(dag, order.append, max_parallelism=1).run()
+    assert order == [3, 4, 1, 2, 5]
+
+
+def test_dag_runner_fails_fast():
+    """Test that no new nodes are started after a node failed when failing
+    fast."""
+    completed = []
+
+    def run_fn(node: int) -> None:
+        if node == 1:
+            raise ValueError("Node 1 failed.")
+        completed.append(node)
+
+    dag = {1: [], 2: [], 3: []}
+    with pytest.raises(ValueError):
+        ThreadedDagRunner(dag, run_fn, max_parallelism=1, fail_fast=True).run()
+    assert completed == []
+
+
+def test_dag_runner_retries_failed_nodes():
+    """Test that failed nodes are retried with a backoff."""
+    attempts = []
+
+    def run_fn(node: int) -> None:
+        attempts.append((node, time.monotonic()))
+        if node == 1 and len(attempts) < 3:
+            raise ValueError("Node 1 failed.")
+
+    dag = {1: [], 2: [1]}
+    ThreadedDagRunner(dag, run_fn, max_retries=2, retry_backoff=0.05).run()
+    assert [node for node, _ in attempts] == [1, 1, 1, 2]
+    # The backoff doubles with every retry
+    assert attempts[1][1] - attempts[0][1] >= 0.05
+    assert attempts[2][1] - attempts[1][1] >= 0.1
+
+    attempts.clear()
+    with pytest.raises(ValueError):
+        ThreadedDagRunner(dag, run_fn, max_retries=1, retry_backoff=0).run()
+    assert [node for node, _ in attempts] == [1, 1]
+
+
+def test_dag_runner_notifies_about_retries():
+    """Test that retries are reported, but only if they happen."""
+    retries = []
+
+    def run_fn(node: int) -> None:
+        raise ValueError(f"Node {node} failed.")
+
+    def on_retry(node: int, backoff: float) -> None:
+        retries.append((node, backoff))
+        raise RuntimeError("Recording the retry failed.")
+
+    with pytest.raises(ValueError):
+        ThreadedDagRunner(
+            {1: []}, run_fn, max_retries=2, retry_backoff=0, on_retry=on_retry
+        ).run()
+    assert retries == [(1, 0), (1, 0)]
+
+    # Node 2 fails after node 1 failed permanently, so it isn't retried
+    def run_fn_with_slow_node(node: int) -> None:
+        if node == 2:
+            time.sleep(0.2)
+        run_fn(node)
+
+    retries.clear()
+    with pytest.raises(ValueError):
+        ThreadedDagRunner(
+            {1: [], 2: []},
+            run_fn_with_slow_node,
+            fail_fast=True,
+            max_retries=1,
+            retry_backoff=0,
+            on_retry=on_retry,
+        ).run()
+    assert retries == [(1, 0)]
+
+
+def test_dag_runner_fails_with_negative_retry_settings():
+    """Test that the retry settings must not be negative."""
+    with pytest.raises(ValueError):
+        ThreadedDagRunner({}, lambda node: None, max_retries=-1)
+    with pytest.raises(ValueError):
+        ThreadedDagRunner({}, lambda node: None, retry_backoff=-1)
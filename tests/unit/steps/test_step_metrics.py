@@ -0,0 +1,89 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import sys
+import threading
+
+import pytest
+
+from zenml.steps.step_metrics import (
+    PEAK_RSS_METRIC,
+    READ_BYTES_METRIC,
+    STACK_PREPARATION_PHASE,
+    STEP_FUNCTION_PHASE,
+    WRITE_BYTES_METRIC,
+    StepMetricsRecorder,
+    record_pending_phase,
+)
+
+
+def test_recorder_sums_up_phase_durations(mocker):
+    """Tests that the durations of repeated phases are summed up."""
+    mocker.patch(
+        "zenml.steps.step_metrics.time.perf_counter",
+        side_effect=[0.0, 1.0, 10.0, 12.5],
+    )
+    recorder = StepMetricsRecorder()
+    with recorder.phase(STEP_FUNCTION_PHASE):
+        pass
+    with recorder.phase(STEP_FUNCTION_PHASE):
+        pass
+
+    assert recorder.get_metrics()["step_function_duration"] == 3.5
+
+
+def test_recorder_records_duration_of_failing_phase():
+    """Tests that the duration of a phase is recorded if it raises."""
+    recorder = StepMetricsRecorder()
+    with pytest.raises(RuntimeError):
+        with recorder.phase(STEP_FUNCTION_PHASE):
+            raise RuntimeError()
+
+    assert "step_function_duration" in recorder.get_metrics()
+
+
+def test_recorder_takes_over_pending_phases_of_its_thread():
+    """Tests that pending phases are only handed over within a thread."""
+    record_pending_phase(STACK_PREPARATION_PHASE, 2.0)
+
+    other_thread_metrics = {}
+    thread = threading.Thread(
+        target=lambda: other_thread_metrics.update(
+            StepMetricsRecorder().get_metrics()
+        )
+    )
+    thread.start()
+    thread.join()
+    assert "stack_preparation_duration" not in other_thread_metrics
+
+    assert StepMetricsRecorder().get_metrics()[
+        "stack_preparation_duration"
+    ] == pytest.approx(2.0)
+    # The pending phases are only handed over once
+    assert (
+        "stack_preparation_duration" not in StepMetricsRecorder().get_metrics()
+    )
+
+
+@pytest.mark.skipif(
+    sys.platform != "linux", reason="Resource metrics are read from procfs."
+)
+def test_recorder_measures_resource_usage(tmp_path):
+    """Tests that the recorder measures the memory and IO of the process."""
+    recorder = StepMetricsRecorder()
+    (tmp_path / "file").write_bytes(b"0" * 1000)
+
+    metrics = recorder.get_metrics()
+    assert metrics[PEAK_RSS_METRIC] > 0
+    assert metrics[READ_BYTES_METRIC] >= 0
+    assert metrics[WRITE_BYTES_METRIC] >= 1000
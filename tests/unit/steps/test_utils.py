@@ -15,7 +15,9 @@ from typing import Dict, List, Set
 
 from numpy import ndarray
 
-from zenml.steps.utils import resolve_type_annotation
+from zenml.materializers import BuiltInMaterializer
+from zenml.steps import BaseParameters, Output, StepContext, step
+from zenml.steps.utils import get_executor_class, resolve_type_annotation
 
 
 def test_type_annotation_resolving():
@@ -26,3 +28,51 @@ def test_type_annotation_resolving():
 
     assert resolve_type_annotation(set) is set
     assert resolve_type_annotation(ndarray) is ndarray
+
+
+def test_executor_class_caches_parsed_step_function_signature():
+    """Tests that the executor class resolves the step function signature
+    when it is created."""
+
+    class Params(BaseParameters):
+        value: int = 1
+
+    @step
+    def some_step(
+        params: Params, context: StepContext
+    ) -> Output(a=Dict[str, int], b=int):
+        return {}, 1
+
+    step_instance = some_step()
+    step_instance()
+
+    executor_class = get_executor_class(step_instance.name)
+    assert executor_class._INPUT_TYPES == {
+        "params": Params,
+        "context": StepContext,
+    }
+    assert executor_class._OUTPUT_TYPES == {"a": dict, "b": int}
+
+
+def test_executor_class_caches_parsed_step_configuration():
+    """Tests that the executor class only parses the step configuration again
+    if the step was reconfigured."""
+
+    @step
+    def some_step() -> int:
+        return 1
+
+    step_instance = some_step()
+    step_instance()
+
+    executor_class = get_executor_class(step_instance.name)
+    executor = executor_class()
+    configuration = executor.configuration
+    assert executor.configuration is configuration
+    assert executor._load_output_materializers() == {
+        "output": BuiltInMaterializer
+    }
+
+    step_instance.configure(extra={"key": "value"})
+    assert executor.configuration is not configuration
+    assert executor.configuration.extra == {"key": "value"}
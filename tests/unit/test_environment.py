@@ -12,7 +12,10 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import contextvars
 import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -90,6 +93,64 @@ def test_environment_component_activation():
         Environment()["foo"]
 
 
+def test_environment_components_of_threads_are_isolated():
+    """Tests that components activated in a thread are only visible there."""
+
+    class Foo(BaseEnvironmentComponent):
+        NAME = "foo"
+
+    main_thread_foo = Foo()
+    thread_foos = {}
+
+    def _activate_foo_in_thread(name: str) -> None:
+        with Foo() as foo:
+            thread_foos[name] = (foo, Environment().get_component("foo"))
+
+    with main_thread_foo:
+        threads = [
+            threading.Thread(target=_activate_foo_in_thread, args=(name,))
+            for name in ("aria", "axl")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert Environment().get_component("foo") is main_thread_foo
+
+    for foo, registered_foo in thread_foos.values():
+        assert registered_foo is foo
+        assert registered_foo is not main_thread_foo
+
+
+def test_environment_components_are_visible_in_copied_contexts():
+    """Tests that threads running in a copied context see its components."""
+
+    class Foo(BaseEnvironmentComponent):
+        NAME = "foo"
+
+    registered_foos = {}
+
+    def _get_foo(name: str) -> None:
+        registered_foos[name] = Environment().get_component("foo")
+
+    def _activate_foo_in_thread() -> None:
+        with Foo() as foo:
+            registered_foos["step"] = foo
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(_get_foo, "plain").result()
+                executor.submit(
+                    contextvars.copy_context().run, _get_foo, "copied"
+                ).result()
+
+    thread = threading.Thread(target=_activate_foo_in_thread)
+    thread.start()
+    thread.join()
+
+    assert registered_foos["plain"] is None
+    assert registered_foos["copied"] is registered_foos["step"]
+
+
 def test_ipython_terminal_detection_when_not_installed():
     """Tests that we detect if the Python process is running in an IPython
     terminal when not installed."""
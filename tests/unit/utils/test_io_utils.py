@@ -0,0 +1,55 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from pathlib import Path
+
+import pytest
+
+from zenml.utils import io_utils
+
+
+def test_copy_dir_copies_nested_files(tmp_path: Path):
+    """Tests that all nested files of a directory get copied."""
+    source = tmp_path / "source"
+    (source / "a" / "b").mkdir(parents=True)
+    (source / "file").write_text("file")
+    (source / "a" / "b" / "nested_file").write_text("nested_file")
+
+    destination = tmp_path / "destination"
+    progress = []
+    io_utils.copy_dir(
+        str(source),
+        str(destination),
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+
+    assert (destination / "file").read_text() == "file"
+    assert (destination / "a" / "b" / "nested_file").read_text() == (
+        "nested_file"
+    )
+    assert sorted(progress) == [(1, 2), (2, 2)]
+
+
+def test_copy_files_concurrently_raises_copy_errors():
+    """Tests that errors while copying a file are raised."""
+
+    def _copy(source: str, destination: str, overwrite: bool) -> None:
+        if source == "fail":
+            raise RuntimeError()
+
+    io_utils.copy_files_concurrently([("a", "b")], copy_function=_copy)
+    with pytest.raises(RuntimeError):
+        io_utils.copy_files_concurrently(
+            [("a", "b"), ("fail", "c")], copy_function=_copy
+        )
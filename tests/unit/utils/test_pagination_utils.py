@@ -0,0 +1,54 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from typing import List, Optional
+
+import pytest
+
+from zenml.utils import pagination_utils
+
+
+def test_iterate_pages_fetches_pages_lazily() -> None:
+    """Tests that pages are only requested once they're needed."""
+    entities = list(range(7))
+    requests = []
+
+    def list_method(offset: int, limit: Optional[int]) -> List[int]:
+        requests.append((offset, limit))
+        return entities[offset : offset + limit]
+
+    iterator = pagination_utils.iterate_pages(list_method, page_size=3)
+    assert requests == []
+
+    assert next(iterator) == 0
+    assert requests == [(0, 3)]
+
+    assert list(iterator) == entities[1:]
+    assert requests == [(0, 3), (3, 3), (6, 3)]
+
+
+def test_iterate_pages_passes_filters() -> None:
+    """Tests that filters are passed to the list method."""
+
+    def list_method(offset: int, limit: Optional[int], name: str) -> List[str]:
+        return [name] if offset == 0 else []
+
+    iterator = pagination_utils.iterate_pages(list_method, name="aria")
+    assert list(iterator) == ["aria"]
+
+
+def test_iterate_pages_fails_for_invalid_page_size() -> None:
+    """Tests that a non-positive page size is rejected."""
+    with pytest.raises(ValueError):
+        list(pagination_utils.iterate_pages(lambda **_: [], page_size=0))
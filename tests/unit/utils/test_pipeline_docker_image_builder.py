@@ -17,6 +17,7 @@ from pathlib import Path
 from zenml.config import DockerSettings
 from zenml.integrations.sklearn import SKLEARN, SklearnIntegration
 from zenml.utils.pipeline_docker_image_builder import (
+    DEFAULT_DOCKER_PARENT_IMAGE,
     DOCKER_IMAGE_ZENML_CONFIG_DIR,
     PipelineDockerImageBuilder,
     _include_global_config,
@@ -126,3 +127,136 @@ def test_requirements_file_generation(mocker, local_stack, tmp_path: Path):
         sorted(SklearnIntegration.REQUIREMENTS + ["stack_requirements"])
     )
     assert files[2][1] == expected_integration_requirements
+
+
+def test_reusable_image_name():
+    """Tests that the reusable image name keeps the registry and repository
+    of the target image."""
+    assert (
+        PipelineDockerImageBuilder.get_reusable_image_name(
+            "localhost:5000/zenml:pipeline", build_hash="abc"
+        )
+        == "localhost:5000/zenml:zenml-build-abc"
+    )
+
+
+def test_build_hash_depends_on_build_contents(tmp_path: Path):
+    """Tests that the build hash changes if any of the image contents
+    change."""
+    (tmp_path / "step.py").write_text("step")
+    (tmp_path / "ignored.txt").write_text("ignored")
+    (tmp_path / ".dockerignore").write_text("ignored.txt")
+
+    def _compute_build_hash(**kwargs):
+        arguments = dict(
+            parent_image=DEFAULT_DOCKER_PARENT_IMAGE,
+            pull_parent_image=False,
+            dockerfile=["FROM image"],
+            requirements_files=[(".zenml_user_requirements", "numpy")],
+            build_context_root=str(tmp_path),
+        )
+        arguments.update(kwargs)
+        return PipelineDockerImageBuilder._compute_build_hash(**arguments)
+
+    build_hash = _compute_build_hash()
+    assert build_hash == _compute_build_hash()
+
+    # Files excluded by the dockerignore don't matter
+    (tmp_path / "ignored.txt").write_text("changed")
+    assert build_hash == _compute_build_hash()
+
+    assert build_hash != _compute_build_hash(dockerfile=["FROM other_image"])
+    assert build_hash != _compute_build_hash(
+        requirements_files=[(".zenml_user_requirements", "pandas")]
+    )
+    assert build_hash != _compute_build_hash(parent_image="other_image:tag")
+
+    (tmp_path / "step.py").write_text("changed")
+    assert build_hash != _compute_build_hash()
+
+
+def test_build_hash_uses_parent_image_digest(mocker):
+    """Tests that the build hash depends on the digest of custom parent
+    images and isn't computed if the digest is unknown."""
+    mocker.patch(
+        "zenml.utils.docker_utils.get_registry_digest", return_value=None
+    )
+    assert (
+        PipelineDockerImageBuilder._compute_build_hash(
+            parent_image="image:tag",
+            pull_parent_image=True,
+            dockerfile=[],
+            requirements_files=[],
+        )
+        is None
+    )
+
+    mock_get_image_id = mocker.patch(
+        "zenml.utils.docker_utils.get_image_id", return_value="sha256:1"
+    )
+    build_hash = PipelineDockerImageBuilder._compute_build_hash(
+        parent_image="image:tag",
+        pull_parent_image=False,
+        dockerfile=[],
+        requirements_files=[],
+    )
+    mock_get_image_id.return_value = "sha256:2"
+    assert build_hash != PipelineDockerImageBuilder._compute_build_hash(
+        parent_image="image:tag",
+        pull_parent_image=False,
+        dockerfile=[],
+        requirements_files=[],
+    )
+
+
+def test_build_reuses_existing_image(mocker, local_stack, tmp_path: Path):
+    """Tests that existing images with the same contents are reused and only
+    the deployment configuration is added on top of them."""
+    mocker.patch(
+        "zenml.utils.source_utils.get_source_root_path",
+        return_value=str(tmp_path),
+    )
+    mock_build_image = mocker.patch("zenml.utils.docker_utils.build_image")
+    mock_image_exists = mocker.patch(
+        "zenml.utils.docker_utils.image_exists", return_value=False
+    )
+    deployment = mocker.MagicMock()
+    deployment.pipeline.name = "pipeline"
+    deployment.pipeline.docker_settings = DockerSettings(
+        install_stack_requirements=False, copy_global_config=False
+    )
+    deployment.yaml.return_value = "deployment_config"
+
+    builder = PipelineDockerImageBuilder()
+    reusable_image_name = builder.build_docker_image(
+        target_image_name="zenml:pipeline",
+        deployment=deployment,
+        stack=local_stack,
+    )
+
+    assert reusable_image_name.startswith("zenml:zenml-build-")
+    assert mock_build_image.call_count == 2
+    _, reusable_build_kwargs = mock_build_image.call_args_list[0]
+    assert reusable_build_kwargs["image_name"] == reusable_image_name
+    _, final_build_kwargs = mock_build_image.call_args_list[1]
+    assert final_build_kwargs["image_name"] == "zenml:pipeline"
+    assert final_build_kwargs["dockerfile"][0] == f"FROM {reusable_image_name}"
+
+    mock_build_image.reset_mock()
+    mock_image_exists.return_value = True
+    deployment.yaml.return_value = "other_deployment_config"
+
+    assert (
+        builder.build_docker_image(
+            target_image_name="zenml:pipeline",
+            deployment=deployment,
+            stack=local_stack,
+        )
+        is None
+    )
+    mock_build_image.assert_called_once()
+    _, final_build_kwargs = mock_build_image.call_args
+    assert final_build_kwargs["image_name"] == "zenml:pipeline"
+    assert final_build_kwargs["extra_files"] == [
+        (".zenml_deployment_config.yaml", "other_deployment_config")
+    ]
@@ -0,0 +1,104 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import gzip
+from typing import List
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from zenml.zen_server.middleware import ETagMiddleware, GZipRequestMiddleware
+
+
+def test_gzip_request_middleware_decompresses_request_bodies():
+    """Tests that gzip encoded request bodies are decompressed."""
+    app = FastAPI()
+    app.add_middleware(GZipRequestMiddleware)
+
+    @app.post("/echo")
+    async def echo(request: Request) -> str:
+        return (await request.body()).decode()
+
+    client = TestClient(app)
+    response = client.post(
+        "/echo",
+        data=gzip.compress(b"aria"),
+        headers={"Content-Encoding": "gzip"},
+    )
+    assert response.json() == "aria"
+
+    response = client.post("/echo", data=b"aria")
+    assert response.json() == "aria"
+
+
+def test_etag_middleware_handles_conditional_requests():
+    """Tests that unchanged responses are answered with a 304."""
+    app = FastAPI()
+    app.add_middleware(ETagMiddleware)
+    names = ["aria"]
+
+    @app.get("/names")
+    def list_names() -> List[str]:
+        return names
+
+    client = TestClient(app)
+    response = client.get("/names")
+    etag = response.headers["ETag"]
+    assert response.json() == ["aria"]
+
+    response = client.get("/names", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    names.append("axl")
+    response = client.get("/names", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json() == ["aria", "axl"]
+    assert response.headers["ETag"] != etag
+
+
+def test_gzip_request_middleware_rejects_invalid_request_bodies():
+    """Tests that invalid and oversized gzip bodies are rejected."""
+    app = FastAPI()
+    app.add_middleware(GZipRequestMiddleware, max_size=10)
+
+    @app.post("/echo")
+    async def echo(request: Request) -> str:
+        return (await request.body()).decode()
+
+    client = TestClient(app)
+    headers = {"Content-Encoding": "gzip"}
+    response = client.post(
+        "/echo", data=gzip.compress(b"a" * 10), headers=headers
+    )
+    assert response.json() == "a" * 10
+
+    response = client.post(
+        "/echo", data=gzip.compress(b"a" * 11), headers=headers
+    )
+    assert response.status_code == 413
+
+    response = client.post("/echo", data=b"aria", headers=headers)
+    assert response.status_code == 400
+
+    response = client.post(
+        "/echo", data=gzip.compress(b"aria")[:-4], headers=headers
+    )
+    assert response.status_code == 400
+
+    response = client.post(
+        "/echo",
+        data=gzip.compress(b"ar") + gzip.compress(b"ia"),
+        headers=headers,
+    )
+    assert response.json() == "aria"
@@ -0,0 +1,116 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import time
+
+from ml_metadata.proto import metadata_store_pb2
+
+from zenml.enums import ExecutionStatus
+from zenml.zen_stores.base_zen_store import BaseZenStore
+
+
+def test_metadata_store_records_query_counts(
+    sql_store_with_run: BaseZenStore,
+):
+    """Tests that the metadata store records the queries of each call."""
+    metadata_store = sql_store_with_run["store"].metadata_store
+    run = sql_store_with_run["pipeline_run"]
+
+    # The fixture already resolved the steps of the run, so start without
+    # any cached type mappings
+    metadata_store._type_mappings.clear()
+
+    metadata_store.get_pipeline_run_steps(run.mlmd_id)
+    # executions, events, artifacts, artifact events, context associations
+    # and contexts plus the execution, context and artifact types
+    assert metadata_store.query_counts["get_pipeline_run_steps"] == 6 + 3
+
+    # The type mappings are cached now, so the second call needs fewer queries
+    metadata_store.get_pipeline_run_steps(run.mlmd_id)
+    assert metadata_store.query_counts["get_pipeline_run_steps"] == 6
+
+
+def test_metadata_store_query_count_does_not_grow_with_steps(
+    sql_store_with_run: BaseZenStore,
+    mocker,
+):
+    """Tests that resolving the steps of a run doesn't query per step."""
+    metadata_store = sql_store_with_run["store"].metadata_store
+    run = sql_store_with_run["pipeline_run"]
+
+    steps = metadata_store.get_pipeline_run_steps(run.mlmd_id)
+    assert len(steps) > 1
+    # executions, events, artifacts, artifact events, context associations
+    # and contexts are loaded in bulk
+    assert metadata_store.query_counts["get_pipeline_run_steps"] == 6
+
+    # Without access to the MLMD tables, the contexts are loaded per step
+    mocker.patch.object(metadata_store, "_engine", None)
+    metadata_store.get_pipeline_run_steps(run.mlmd_id)
+    assert metadata_store.query_counts["get_pipeline_run_steps"] == 4 + len(
+        steps
+    )
+
+
+def test_run_step_statuses_use_latest_execution_of_each_step(
+    sql_store_with_run: BaseZenStore,
+    mocker,
+):
+    """Tests that failed attempts of retried steps are not counted twice."""
+    metadata_store = sql_store_with_run["store"].metadata_store
+    run = sql_store_with_run["pipeline_run"]
+    num_steps = len(metadata_store.get_run_step_statuses(run.mlmd_id))
+
+    # Add a failed retry attempt of one of the steps
+    mlmd_store = metadata_store.store
+    execution = mlmd_store.get_executions_by_context(run.mlmd_id)[0]
+    retry = type(execution)()
+    retry.CopyFrom(execution)
+    retry.ClearField("id")
+    retry.ClearField("name")
+    retry.last_known_state = execution.FAILED
+    [retry_id] = mlmd_store.put_executions([retry])
+    mlmd_store.put_attributions_and_associations(
+        [],
+        [
+            metadata_store_pb2.Association(
+                context_id=context.id, execution_id=retry_id
+            )
+            for context in mlmd_store.get_contexts_by_execution(execution.id)
+        ],
+    )
+
+    step_statuses = metadata_store.get_run_step_statuses(run.mlmd_id)
+    assert len(step_statuses) == num_steps
+    assert step_statuses.count(ExecutionStatus.FAILED) == 1
+
+    # The orchestrator recorded that it retries the step
+    step_name = metadata_store._get_step_name(execution)
+    assert metadata_store.record_step_retry(
+        run_name=run.name, step_name=step_name, retry_time=time.time()
+    )
+    step_statuses = metadata_store.get_run_step_statuses(run.mlmd_id)
+    assert ExecutionStatus.FAILED not in step_statuses
+    assert ExecutionStatus.RUNNING in step_statuses
+
+    # The retry never started
+    mocker.patch(
+        "zenml.zen_stores.metadata_store.RUN_CONTEXT_SETUP_TIMEOUT_SECONDS", 0
+    )
+    step_statuses = metadata_store.get_run_step_statuses(run.mlmd_id)
+    assert step_statuses.count(ExecutionStatus.FAILED) == 1
+
+    assert not metadata_store.record_step_retry(
+        run_name="not_a_run", step_name=step_name, retry_time=time.time()
+    )
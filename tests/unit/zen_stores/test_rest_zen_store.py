@@ -0,0 +1,48 @@
+#  Copyright (c) ZenML GmbH 2022. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import pytest
+from urllib3.util.retry import Retry
+
+from zenml.zen_stores.rest_zen_store import JitteredRetry, RequestMetrics
+
+
+def test_jittered_retry_backoff_is_bounded_by_exponential_backoff():
+    """Tests that the jittered backoff never exceeds the exponential one."""
+    retry = JitteredRetry(total=5, backoff_factor=1)
+    for _ in range(3):
+        retry = retry.increment(method="GET", url="/runs")
+
+    exponential_backoff = Retry.get_backoff_time(retry)
+    for _ in range(100):
+        assert 0 <= retry.get_backoff_time() <= exponential_backoff
+
+
+def test_jittered_retry_keeps_its_type_when_incremented():
+    """Tests that the jittered retry policy is kept for later retries."""
+    retry = JitteredRetry(total=2, backoff_factor=1)
+    assert isinstance(retry.increment(method="GET", url="/runs"), JitteredRetry)
+
+
+def test_request_metrics_aggregate_durations():
+    """Tests that the request metrics aggregate the request durations."""
+    metrics = RequestMetrics()
+    assert metrics.average_duration == 0
+
+    metrics.record(1.0)
+    metrics.record(3.0)
+
+    assert metrics.count == 2
+    assert metrics.total_duration == 4.0
+    assert metrics.max_duration == 3.0
+    assert metrics.average_duration == pytest.approx(2.0)
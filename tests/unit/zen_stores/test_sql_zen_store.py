@@ -14,9 +14,12 @@
 
 import uuid
 from contextlib import ExitStack as does_not_raise
+from datetime import datetime, timedelta
+from typing import Set
 
 import pytest
 from ml_metadata.proto.metadata_store_pb2 import ConnectionConfig
+from sqlalchemy import inspect, text
 
 from zenml.config.pipeline_configurations import PipelineSpec
 from zenml.enums import ExecutionStatus, StackComponentType
@@ -36,6 +39,7 @@ from zenml.models import (
 from zenml.models.pipeline_models import PipelineModel
 from zenml.models.stack_models import StackModel
 from zenml.zen_stores.base_zen_store import BaseZenStore
+from zenml.zen_stores.sql_zen_store import SqlZenStore
 
 DEFAULT_NAME = "default"
 
@@ -351,6 +355,37 @@ def test_deleting_user_succeeds(sql_store: BaseZenStore):
     assert len(sql_store["store"].users) == 1
 
 
+def test_listing_users_with_pagination_and_sorting(sql_store: BaseZenStore):
+    """Tests listing users page by page in a given order."""
+    store = sql_store["store"]
+    for name in ["aria", "blupus", "axl"]:
+        store.create_user(UserModel(name=name))
+
+    users = store.list_users(sort_by="name")
+    assert [user.name for user in users] == sorted(user.name for user in users)
+
+    first_page = store.list_users(sort_by="name", limit=2)
+    second_page = store.list_users(sort_by="name", offset=2, limit=2)
+    assert len(first_page) == 2
+    assert len(second_page) == 2
+    assert first_page + second_page == users
+
+    descending_users = store.list_users(sort_by="-name")
+    assert descending_users == list(reversed(users))
+
+
+def test_listing_users_with_invalid_sorting_fails(sql_store: BaseZenStore):
+    """Tests that listing users sorted by an invalid field fails."""
+    with pytest.raises(ValueError):
+        sql_store["store"].list_users(sort_by="not_a_field")
+
+    with pytest.raises(ValueError):
+        sql_store["store"].list_users(sort_by="password")
+
+    with pytest.raises(ValueError):
+        sql_store["store"].list_users(limit=-1)
+
+
 #  .------.
 # | ROLES |
 # '-------'
@@ -551,6 +586,15 @@ def test_list_stacks_succeeds(
     assert len(sql_store["store"].list_stacks()) == 1
 
 
+def test_get_stacks_by_ids_succeeds(
+    sql_store: BaseZenStore,
+):
+    """Tests getting multiple stacks by their IDs."""
+    stack = sql_store["default_stack"]
+    stacks = sql_store["store"].get_stacks_by_ids([stack.id, uuid.uuid4()])
+    assert stacks == {stack.id: stack}
+
+
 def test_list_stacks_fails_with_nonexistent_project(
     sql_store: BaseZenStore,
 ):
@@ -958,6 +1002,142 @@ def test_list_runs_returns_nothing_when_no_runs_exist(
     assert len(false_pipeline_runs) == 0
 
 
+def test_list_runs_filters_by_creation_time(
+    sql_store_with_run: BaseZenStore,
+):
+    """Tests listing runs created before or after a given time."""
+    store = sql_store_with_run["store"]
+    run = sql_store_with_run["pipeline_run"]
+
+    one_second = timedelta(seconds=1)
+    assert store.list_runs(created_after=run.created - one_second) == [run]
+    assert store.list_runs(created_before=run.created + one_second) == [run]
+    assert store.list_runs(created_after=run.created + one_second) == []
+    assert store.list_runs(created_before=run.created - one_second) == []
+    assert store.list_runs(created_before=datetime.now(), offset=1) == []
+
+
+def test_count_runs_succeeds(
+    sql_store_with_run: BaseZenStore,
+):
+    """Tests counting runs."""
+    store = sql_store_with_run["store"]
+    run = sql_store_with_run["pipeline_run"]
+    assert store.count_runs() == 1
+    assert store.count_runs(pipeline_id=run.pipeline_id) == 1
+    assert store.count_runs(stack_id=uuid.uuid4()) == 0
+    assert store.count_runs(created_after=datetime.now()) == 0
+
+
+def test_get_latest_runs_by_pipeline_ids_succeeds(
+    sql_store_with_run: BaseZenStore,
+):
+    """Tests getting the latest runs of multiple pipelines at once."""
+    store = sql_store_with_run["store"]
+    run = sql_store_with_run["pipeline_run"]
+    other_pipeline_id = uuid.uuid4()
+
+    latest_runs = store.get_latest_runs_by_pipeline_ids(
+        [run.pipeline_id, other_pipeline_id], num_runs=3
+    )
+    assert latest_runs == {run.pipeline_id: [run], other_pipeline_id: []}
+
+    latest_runs = store.get_latest_runs_by_pipeline_ids(
+        [run.pipeline_id], num_runs=0
+    )
+    assert latest_runs == {run.pipeline_id: []}
+
+
+def test_sync_runs_skips_finished_runs(
+    sql_store_with_run: BaseZenStore,
+    mocker,
+):
+    """Tests that finished runs are not synced from MLMD again."""
+    store = sql_store_with_run["store"]
+    mock_get_new_runs = mocker.spy(store.metadata_store, "get_new_runs")
+    mock_sync_run_steps = mocker.patch.object(SqlZenStore, "_sync_run_steps")
+
+    store._sync_runs()
+
+    mock_get_new_runs.assert_called_once_with(
+        min_mlmd_id=sql_store_with_run["pipeline_run"].mlmd_id,
+        synced_mlmd_ids=set(),
+    )
+    mock_sync_run_steps.assert_not_called()
+
+
+def test_sync_runs_advances_past_abandoned_runs(
+    sql_store_with_run: BaseZenStore,
+    mocker,
+):
+    """Tests that only run contexts that are being set up are checked again."""
+    store = sql_store_with_run["store"]
+    mlmd_store = store.metadata_store.store
+    run_context = mlmd_store.get_contexts_by_id(
+        [sql_store_with_run["pipeline_run"].mlmd_id]
+    )[0]
+    empty_context = type(run_context)(
+        type_id=run_context.type_id, name="run_without_executions"
+    )
+    [empty_context_id] = mlmd_store.put_contexts([empty_context])
+    mock_get_new_runs = mocker.spy(store.metadata_store, "get_new_runs")
+
+    store._sync_runs()
+    store._sync_runs()
+    # The context is younger than the setup timeout and is checked again
+    for _, kwargs in mock_get_new_runs.call_args_list:
+        assert kwargs["min_mlmd_id"] < empty_context_id
+
+    mocker.patch(
+        "zenml.zen_stores.metadata_store.RUN_CONTEXT_SETUP_TIMEOUT_SECONDS", 0
+    )
+    store._sync_runs()
+    store._sync_runs()
+
+    assert mock_get_new_runs.call_count == 4
+    assert (
+        mock_get_new_runs.call_args_list[-1][1]["min_mlmd_id"]
+        == empty_context_id
+    )
+    assert len(store.list_runs()) == 1
+
+
+def test_get_run_status_of_finished_run_uses_stored_status(
+    sql_store_with_run: BaseZenStore,
+    mocker,
+):
+    """Tests that the status of finished runs doesn't get queried from MLMD."""
+    store = sql_store_with_run["store"]
+    mock_get_step_statuses = mocker.spy(
+        store.metadata_store, "get_run_step_statuses"
+    )
+
+    status = store.get_run_status(sql_store_with_run["pipeline_run"].id)
+
+    assert status == ExecutionStatus.COMPLETED
+    mock_get_step_statuses.assert_not_called()
+
+
+def test_get_run_status_fails_when_run_does_not_exist(
+    sql_store: BaseZenStore,
+):
+    """Tests getting run status fails when run does not exist."""
+    with pytest.raises(KeyError):
+        sql_store["store"].get_run_status(uuid.uuid4())
+
+
+def test_get_run_statuses_succeeds(
+    sql_store_with_run: BaseZenStore,
+):
+    """Tests getting the statuses of multiple runs at once."""
+    store = sql_store_with_run["store"]
+    run = sql_store_with_run["pipeline_run"]
+
+    statuses = store.get_run_statuses([run.id, run.id, uuid.uuid4()])
+    assert statuses == {run.id: ExecutionStatus.COMPLETED}
+    assert store.get_run_statuses([]) == {}
+
+
 # ------------------
 # Pipeline run steps
 # ------------------
@@ -1046,6 +1226,22 @@ def test_list_run_steps_succeeds(
     assert run_steps[1] == sql_store_with_run["step"]
 
 
+def test_list_run_steps_includes_parent_steps(
+    sql_store_with_run: BaseZenStore,
+):
+    """Tests that listed run steps contain the same parents as single steps."""
+    store = sql_store_with_run["store"]
+    run_steps = store.list_run_steps(
+        run_id=sql_store_with_run["pipeline_run"].id
+    )
+    steps_by_name = {step.name: step for step in run_steps}
+    assert steps_by_name["step_two"].parent_step_ids == [
+        steps_by_name["step_one"].id
+    ]
+    for step in run_steps:
+        assert step == store.get_run_step(step.id)
+
+
 # ----------------
 # Stack components
 # ----------------
@@ -1382,3 +1578,29 @@ def test_list_flavors_fails_with_nonexistent_project(
             project_name_or_id="nonexistent",
             component_type=StackComponentType.ORCHESTRATOR,
         )
+
+
+#  .----------
+# | MIGRATIONS
+# '-----------
+
+
+def test_migration_adds_missing_indexes(sql_store: BaseZenStore):
+    """Tests that the migration recreates indexes missing in the database."""
+    store = sql_store["store"]
+    index_name = "ix_pipelinerunschema_pipeline_id_created"
+
+    def _get_index_names() -> Set[str]:
+        return {
+            index["name"]
+            for index in inspect(store.engine).get_indexes("pipelinerunschema")
+        }
+
+    assert index_name in _get_index_names()
+
+    with store.engine.begin() as connection:
+        connection.execute(text(f"DROP INDEX {index_name}"))
+    assert index_name not in _get_index_names()
+
+    store._migrate_database()
+    assert index_name in _get_index_names()